@@ -0,0 +1 @@
+"""Offline microbenchmarks; run e.g. `python -m benchmarks.bench_menu_embeds`."""
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import timeit
+from types import SimpleNamespace
+
+import discord
+
+from features.menu_embeds import (
+    PUBLIC_DISCUSSION_TIPS,
+    build_admin_tool_embed,
+    build_help_embed,
+    build_home_menu_embed,
+    build_quick_bar_embed,
+)
+from features.menu_helpers import MENU_COLOR, apply_bartender_thumbnail, build_menu_file
+from features.menu_views import QuickBarView, menu_view
+
+
+def legacy_quick_bar_embed(user: discord.abc.User) -> discord.Embed:
+    # 舊版每次由零砌 embed，留低做對照
+    embed = discord.Embed(
+        title="🍸 Con9sole Bartender",
+        description=(
+            f"歡迎回來，{user.mention}。\n\n"
+            "**想快速做些甚麼？**"
+        ),
+        color=MENU_COLOR,
+    )
+    embed.add_field(
+        name="⚡ Quick Bar",
+        value="常用功能已放在下面。想查看完整入口，可以按「Menu」。",
+        inline=False,
+    )
+    embed.add_field(
+        name="🌊 探索公海區",
+        value="進入「Menu」後按「探索公海」，即可了解如何瀏覽及參與遊戲以外的話題。",
+        inline=False,
+    )
+    apply_bartender_thumbnail(embed)
+    embed.set_footer(text=f"💡 {random.choice(PUBLIC_DISCUSSION_TIPS)} 前往 Menu → 探索公海看看吧。")
+    return embed
+
+
+def _report(name: str, func, number: int) -> None:
+    best = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{name:<34} {best * 1e6:8.2f} µs/op")
+
+
+async def _run(number: int) -> None:
+    user = SimpleNamespace(mention="<@123456789012345678>", display_name="bench")
+    cog = SimpleNamespace()
+
+    _report("quick_bar embed (legacy build)", lambda: legacy_quick_bar_embed(user), number)
+    _report("quick_bar embed (template)", lambda: build_quick_bar_embed(user), number)
+    _report("home_menu embed (template)", lambda: build_home_menu_embed(user), number)
+    _report("help embed (template)", lambda: build_help_embed(user), number)
+    _report("admin_tool embed (template)", lambda: build_admin_tool_embed(user), number)
+
+    # mention menu：embed + Quick Bar view + 圖片（以 to_dict / to_components 模擬送出前 serialize）
+    def legacy_mention_menu() -> None:
+        legacy_quick_bar_embed(user).to_dict()
+        QuickBarView(cog).to_components()
+        build_menu_file()
+
+    def mention_menu() -> None:
+        build_quick_bar_embed(user).to_dict()
+        menu_view("quick", cog=cog).to_components()
+        build_menu_file()
+
+    _report("mention menu payload (legacy)", legacy_mention_menu, number // 10)
+    _report("mention menu payload (prebuilt)", mention_menu, number // 10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.number))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from core.message_router import MessageRouter, is_pure_mention
+
+BOT_ID = 424242
+
+
+def _messages(count: int, channels: int) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=index,
+            content="just chatting",
+            channel=SimpleNamespace(id=1_000_000 + index % channels),
+            author=SimpleNamespace(id=index % 97, bot=False),
+            guild=object(),
+        )
+        for index in range(count)
+    ]
+
+
+async def _noop(message) -> None:
+    return None
+
+
+async def _fan_out(messages: list[SimpleNamespace], features: int, pending: int) -> float:
+    """Baseline: every listener gets a task per message and every wait_for check runs."""
+    relay_channels = set(range(features))
+    checks = [
+        (lambda message, user_id=user_id, channel_id=channel_id: (
+            not message.author.bot and message.author.id == user_id and message.channel.id == channel_id
+        ))
+        for user_id, channel_id in ((10_000 + n, n) for n in range(pending))
+    ]
+
+    async def relay_listener(message) -> None:
+        if message.channel.id in relay_channels:
+            await _noop(message)
+
+    async def mention_listener(message) -> None:
+        if is_pure_mention(message.content, BOT_ID):
+            await _noop(message)
+
+    listeners = [relay_listener] * features + [mention_listener]
+    started = time.perf_counter()
+    for message in messages:
+        for listener in listeners:
+            asyncio.create_task(listener(message))
+        for check in checks:
+            check(message)
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    return time.perf_counter() - started
+
+
+async def _routed(messages: list[SimpleNamespace], features: int, pending: int) -> float:
+    router = MessageRouter()
+    for n in range(features):
+        router.add_channel_route(n, f"feature-{n}", _noop)
+    router.set_mention_handler(_noop)
+    for n in range(pending):
+        router.add_reply_route(n, 10_000 + n, lambda message: None)
+
+    started = time.perf_counter()
+    for message in messages:
+        router.dispatch(message, BOT_ID)
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    return time.perf_counter() - started
+
+
+async def _run(count: int) -> None:
+    messages = _messages(count, channels=50)
+    print(f"{'features':>8} {'pending':>8} {'fan-out msg/s':>14} {'router msg/s':>14}")
+    for features, pending in ((1, 0), (4, 10), (16, 100), (64, 1000)):
+        fan_out = await _fan_out(messages, features, pending)
+        routed = await _routed(messages, features, pending)
+        print(f"{features:>8} {pending:>8} {count / fan_out:>14,.0f} {count / routed:>14,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="on_message throughput: listener fan-out vs MessageRouter")
+    parser.add_argument("--messages", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.messages))
+
+
+if __name__ == "__main__":
+    main()
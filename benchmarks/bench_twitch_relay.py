@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import time
+from types import SimpleNamespace
+
+import discord
+
+import config
+from cogs import twitch_relay
+from cogs.twitch_relay import TwitchRelay
+from core.metrics import METRICS
+from features.twitch_channels import TwitchJoinScheduler
+from features.twitch_coalesce import DiscordCoalescer
+from features.twitch_metrics import D2T, METRIC_PREFIX, T2D, relay_metric
+from features.twitch_outbound import SlidingWindowLimiter, TwitchOutbound
+
+BOT_NICK = "bartender"
+DISCORD_CHANNEL_BASE = 9_000_000
+
+
+class _FakeTwitchChannel:
+    def __init__(self, name: str, latency: float) -> None:
+        self.name = name
+        self.latency = latency
+        self.sent = 0
+
+    async def send(self, text: str) -> None:
+        await asyncio.sleep(self.latency)
+        self.sent += 1
+
+
+class _FakeTwitchClient:
+    """Stands in for twitchio.Client: always connected, joins answer after one round trip."""
+
+    def __init__(self, latency: float) -> None:
+        self.nick = BOT_NICK
+        self.latency = latency
+        self._connection = SimpleNamespace(is_alive=True)
+        self.joins: TwitchJoinScheduler | None = None
+
+    async def connect(self) -> None:
+        self._connection.is_alive = True
+
+    async def join_channels(self, names: list[str]) -> None:
+        async def confirm(name: str) -> None:
+            await asyncio.sleep(self.latency)
+            if self.joins is not None:
+                self.joins.on_joined(_FakeTwitchChannel(name, self.latency))
+
+        for name in names:
+            asyncio.create_task(confirm(name))
+
+
+class _FakeDiscordChannel(discord.abc.Messageable):
+    """Discord text channel with the 5 messages / 5 s per-channel limit."""
+
+    def __init__(self, channel_id: int, latency: float) -> None:
+        self.id = channel_id
+        self.name = f"relay-{channel_id - DISCORD_CHANNEL_BASE}"
+        self.latency = latency
+        self.limiter = SlidingWindowLimiter(5, 5.0)
+        self.sent = 0
+
+    async def _get_channel(self):
+        return self
+
+    async def send(self, content: str, **kwargs) -> None:
+        await self.limiter.acquire()
+        await asyncio.sleep(self.latency)
+        self.sent += 1
+
+
+def _build_relay(channels: int, latency: float) -> tuple[TwitchRelay, _FakeTwitchClient, dict[int, _FakeDiscordChannel]]:
+    discord_channels = {
+        DISCORD_CHANNEL_BASE + n: _FakeDiscordChannel(DISCORD_CHANNEL_BASE + n, latency) for n in range(channels)
+    }
+
+    async def fetch_channel(channel_id: int):
+        return discord_channels[channel_id]
+
+    relay = object.__new__(TwitchRelay)
+    relay.bot = SimpleNamespace(get_channel=discord_channels.get, fetch_channel=fetch_channel)
+    relay.d2t_map = {DISCORD_CHANNEL_BASE + n: f"streamer{n}" for n in range(channels)}
+    relay.t2d_map = {name: channel_id for channel_id, name in relay.d2t_map.items()}
+
+    client = _FakeTwitchClient(latency)
+    relay.twitch_bot = client
+    relay.joins = TwitchJoinScheduler(lambda: relay.twitch_bot)
+    client.joins = relay.joins
+    relay.outbound = TwitchOutbound(lambda: relay.twitch_bot, relay.joins)
+    relay.coalescer = DiscordCoalescer(lambda channel_id: fetch_channel(channel_id))
+    return relay, client, discord_channels
+
+
+def _twitch_message(index: int, channels: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        echo=False,
+        content=f"gg {index}",
+        author=SimpleNamespace(name=f"viewer{index % 37}", display_name=f"Viewer{index % 37}"),
+        channel=SimpleNamespace(name=f"streamer{index % channels}"),
+        tags={"id": f"msg-{index}"},
+    )
+
+
+def _discord_message(index: int, channels: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        content=f"hello {index}",
+        author=SimpleNamespace(bot=False, name=f"member{index % 23}"),
+        guild=object(),
+        channel=SimpleNamespace(id=DISCORD_CHANNEL_BASE + index % channels, name="relay"),
+    )
+
+
+async def _drive(rate: float, seconds: float, channels: int, latency: float, drain: float) -> dict[str, float]:
+    METRICS.reset()
+    twitch_relay._recent_td.clear()
+    twitch_relay._recent_tw_ids.clear()
+    relay, _, discord_channels = _build_relay(channels, latency)
+    relay.joins.on_ready(relay.t2d_map)
+
+    # 一齊喺兩個方向以 rate 條 / 秒送入
+    started = time.monotonic()
+    for index in itertools.count():
+        due = started + index / rate
+        if due - started >= seconds:
+            break
+        if (delay := due - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        await relay._twitch_to_discord(_twitch_message(index, channels), BOT_NICK)
+        await relay._discord_to_twitch(_discord_message(index, channels))
+
+    deadline = time.monotonic() + drain
+    while (relay.coalescer.depth() or relay.outbound.depth()) and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(latency * 2)
+
+    result = {
+        "discord_messages": sum(channel.sent for channel in discord_channels.values()),
+        "t2d_pending": relay.coalescer.depth(),
+        "d2t_pending": relay.outbound.depth(),
+        **{name: metric["value"] for name, metric in METRICS.snapshot(METRIC_PREFIX).items() if "value" in metric},
+    }
+    for direction in (T2D, D2T):
+        lag = METRICS.histogram(relay_metric(direction, "lag_seconds"))
+        result[f"{direction}_p50"] = lag.quantile(0.5)
+        result[f"{direction}_p95"] = lag.quantile(0.95)
+
+    relay.outbound.stop()
+    relay.coalescer.stop()
+    relay.joins.stop()
+    return result
+
+
+async def _run(rates: list[float], seconds: float, channels: int, latency: float, drain: float) -> None:
+    print(
+        f"{'dir':>4} {'rate/s':>7} {'recv':>6} {'dedup':>6} {'sent':>6} {'fail':>5} {'merged':>7}"
+        f" {'dropped':>8} {'pending':>8} {'p50 s':>7} {'p95 s':>7} {'posts':>6}"
+    )
+    for rate in rates:
+        result = await _drive(rate, seconds, channels, latency, drain)
+        for direction in (T2D, D2T):
+            def value(name: str) -> float:
+                return result.get(relay_metric(direction, name), 0)
+
+            posts = result["discord_messages"] if direction == T2D else value("sent") - value("merged")
+            print(
+                f"{direction:>4} {rate:>7g} {value('received'):>6.0f} {value('deduped'):>6.0f} {value('sent'):>6.0f}"
+                f" {value('failed'):>5.0f} {value('merged'):>7.0f} {value('dropped'):>8.0f}"
+                f" {result[f'{direction}_pending']:>8} {result[f'{direction}_p50']:>7.2f}"
+                f" {result[f'{direction}_p95']:>7.2f} {posts:>6.0f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Twitch relay throughput and lag against fake Twitch / Discord clients")
+    parser.add_argument("--rates", default="1,5,20", help="comma-separated messages per second, per direction")
+    parser.add_argument("--seconds", type=float, default=5.0, help="how long to send at each rate")
+    parser.add_argument("--channels", type=int, default=2, help="number of relay channel pairs")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake API round trip in seconds")
+    parser.add_argument("--drain", type=float, default=15.0, help="max seconds to wait for queues to empty")
+    parser.add_argument("--coalesce", type=float, default=None, help="override TWITCH_RELAY_COALESCE_SECONDS")
+    parser.add_argument("--twitch-rate", type=int, default=None, help="override TWITCH_SEND_RATE (per 30 s)")
+    args = parser.parse_args()
+
+    if args.coalesce is not None:
+        config.TWITCH_RELAY_COALESCE_SECONDS = args.coalesce
+    if args.twitch_rate is not None:
+        config.TWITCH_SEND_RATE = args.twitch_rate
+
+    rates = [float(rate) for rate in args.rates.split(",") if rate.strip()]
+    asyncio.run(_run(rates, args.seconds, args.channels, args.latency, args.drain))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from types import SimpleNamespace
+
+from features.voice_transitions import classify_voice_update
+
+
+def _trace(count: int, *, members: int, channels: int, toggle_ratio: float, seed: int) -> list[tuple[object, object]]:
+    """(before_channel, after_channel) pairs; toggles keep the member in the same channel."""
+    rng = random.Random(seed)
+    rooms = [SimpleNamespace(id=n) for n in range(channels)]
+    where: dict[int, object] = {}
+    events: list[tuple[object, object]] = []
+    for _ in range(count):
+        member = rng.randrange(members)
+        before = where.get(member)
+        if before is not None and rng.random() < toggle_ratio:
+            events.append((before, before))
+            continue
+        after = None if before is not None and rng.random() < 0.3 else rng.choice(rooms)
+        where[member] = after
+        events.append((before, after))
+    return events
+
+
+async def _replay(events: list[tuple[object, object]], *, skip_in_place: bool) -> tuple[int, int, float]:
+    """Replay the trace against a stand-in deletion timer; returns (timer resets, audit logs, seconds)."""
+    timers: dict[int, asyncio.Task[None]] = {}
+    resets = logs = 0
+
+    started = time.perf_counter()
+    for before, after in events:
+        if skip_in_place:
+            transition = classify_voice_update(before, after)
+            if transition == "in_place":
+                continue
+            logs += 1
+        elif before is not after:
+            logs += 1
+
+        if before is not None:
+            old = timers.pop(before.id, None)
+            if old is not None:
+                old.cancel()
+            timers[before.id] = asyncio.create_task(asyncio.sleep(3600))
+            resets += 1
+        if after is not None:
+            old = timers.pop(after.id, None)
+            if old is not None:
+                old.cancel()
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+
+    for task in timers.values():
+        task.cancel()
+    await asyncio.sleep(0)
+    return resets, logs, elapsed
+
+
+async def _run(count: int, seed: int) -> None:
+    print(f"{'toggles':>8} {'old resets':>11} {'new resets':>11} {'old logs':>9} {'new logs':>9} {'old ms':>8} {'new ms':>8}")
+    for toggle_ratio in (0.0, 0.5, 0.8, 0.95):
+        events = _trace(count, members=200, channels=20, toggle_ratio=toggle_ratio, seed=seed)
+        old_resets, old_logs, old_elapsed = await _replay(events, skip_in_place=False)
+        new_resets, new_logs, new_elapsed = await _replay(events, skip_in_place=True)
+        print(
+            f"{toggle_ratio:>8.0%} {old_resets:>11,} {new_resets:>11,} {old_logs:>9,} {new_logs:>9,}"
+            f" {old_elapsed * 1000:>8.1f} {new_elapsed * 1000:>8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TempVC voice event replay: deletion timer churn before/after in-place filtering")
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    asyncio.run(_run(args.events, args.seed))
+
+
+if __name__ == "__main__":
+    main()
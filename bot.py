@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import time
+
+_BOOT_STARTED = time.perf_counter()  # 要喺其他 import 之前，量度 import 時間
+
 import asyncio
 import logging
 import os
@@ -11,8 +15,20 @@ from discord.ext import commands
 
 import config
 from core.app_command_errors import handle_app_command_error
+from core.boot_profiler import EXTENSION_PHASE_PREFIX, BootProfiler, append_boot_report
+from core.command_sync import force_sync_requested, sync_command_tree
 from core.config_validation import validate_config
+from core.extension_loader import ExtensionLoader, discover_extensions
 from core.logging_config import configure_logging
+from core.message_router import MessageRouter
+from core.pending_replies import PendingReplyRegistry
+from core.storage_paths import BOOT_REPORTS_PATH, COMMAND_SYNC_STATE_PATH
+from features.menu_views import bind_menu_cog, unbind_menu_cog
+
+# ---------- Boot profiling ----------
+boot_profiler = BootProfiler(started_at=_BOOT_STARTED)
+boot_profiler.record("imports", time.perf_counter() - _BOOT_STARTED)
+BOOT_REPORT_WAIT_SECONDS = 120.0
 
 # ---------- Logging ----------
 configure_logging()
@@ -42,10 +58,25 @@ class Bot(commands.Bot):
             command_prefix=commands.when_mentioned_or("/"),
             intents=intents,
             tree_cls=Con9soleCommandTree,
+            # 全部都係 slash command；唔登記預設 help，all_commands 先會係空
+            help_command=None,
         )
+        self.boot_profiler = boot_profiler
+        self.extension_loader: ExtensionLoader | None = None
+        self._post_ready_task: asyncio.Task | None = None
+        self.message_router = MessageRouter()
+        self.pending_replies = PendingReplyRegistry(self.message_router)
+
+    def _record_extension_durations(self) -> None:
+        if self.extension_loader is None:
+            return
+        for name, seconds in self.extension_loader.durations.items():
+            self.boot_profiler.record(f"{EXTENSION_PHASE_PREFIX}{name}", seconds)
 
     async def setup_hook(self) -> None:
-        for warning in validate_config():
+        with self.boot_profiler.measure("validate_config"):
+            warnings = validate_config()
+        for warning in warnings:
             log.warning("Configuration issue: %s", warning)
 
         # 自動載入 cogs：只掃真 .py，避免 .py.old / .bak
@@ -57,114 +88,97 @@ class Bot(commands.Bot):
         if not cogs_dir.exists():
             log.warning("cogs directory not found at %s", cogs_dir)
         else:
-            for fn in sorted(os.listdir(cogs_dir)):
-                if not fn.endswith(".py"):
-                    continue
-                if fn.startswith("_"):
-                    continue
-
-                stem = fn[:-3]  # 去掉 .py
-
-                # 防止 message_audit.py.old / xxx.bak.py 呢類帶點號檔名被誤讀
-                if "." in stem:
-                    continue
-
-                full = f"cogs.{stem}"
-                try:
-                    await self.load_extension(full)
-                    loaded.append(full)
-                    log.info("Loaded extension: %s", full)
-                except Exception as e:
-                    log.exception("Failed loading %s: %r", full, e)
+            # 獨立 cogs 同一批並行載入；EXTENSION_LAZY / EXTENSION_REQUIRED_ENV 見 core.extension_loader
+            self.extension_loader = ExtensionLoader(self, discover_extensions(cogs_dir))
+            with self.boot_profiler.measure("extensions_eager"):
+                loaded = await self.extension_loader.load_eager()
+            self._record_extension_durations()
 
         if not loaded:
             log.warning("No cogs loaded from %s", cogs_dir)
 
-        # Slash 指令同步
-        # 重要：清走舊 global commands，避免 bot.py 舊 /ping 或其他歷史 global command 留喺 Discord UI。
-        try:
-            self.tree.clear_commands(guild=None)
-            await self.tree.sync()
-            log.info("Global app commands cleared")
-        except Exception as e:
-            log.exception("Global app command clear failed: %r", e)
+        # Lazy cogs 同 slash 指令同步放喺 on_ready 之後，唔阻住登入
+        self._post_ready_task = asyncio.create_task(self._post_ready_startup())
+        self.boot_profiler.mark("setup_hook_done")
 
+    async def _post_ready_startup(self) -> None:
+        await self.wait_until_ready()
+
+        if self.extension_loader is not None:
+            try:
+                with self.boot_profiler.measure("extensions_lazy"):
+                    await self.extension_loader.load_lazy()
+            except Exception as e:
+                log.exception("Lazy extension loading failed: %r", e)
+            self._record_extension_durations()
+
+        # Slash 指令同步：要等 lazy cogs 載入完先計 hash；command tree 冇變就唔再 call Discord
+        # （FORCE_COMMAND_SYNC=1 可強制）
         try:
-            if getattr(config, "GUILD_ID", None):
-                guild_obj = discord.Object(id=config.GUILD_ID)
-                await self.tree.sync(guild=guild_obj)
-                log.info("App commands synced to guild %s", config.GUILD_ID)
-            else:
-                await self.tree.sync()
-                log.info("App commands synced globally")
+            with self.boot_profiler.measure("command_sync"):
+                await sync_command_tree(
+                    self.tree,
+                    application_id=self.application_id,
+                    guild_id=getattr(config, "GUILD_ID", None),
+                    state_path=COMMAND_SYNC_STATE_PATH,
+                    force=force_sync_requested(),
+                )
         except Exception as e:
             log.exception("Slash command sync failed: %r", e)
 
+        await self._write_boot_report()
+
+    async def _write_boot_report(self) -> None:
+        profiler = self.boot_profiler
+        if profiler.written:
+            return
+
+        # 等 cog 自己記錄嘅 phase（例如 tempvc_bootstrap）
+        await profiler.wait_for_expected(BOOT_REPORT_WAIT_SECONDS)
+        profiler.written = True
+        report = profiler.report()
+        try:
+            append_boot_report(BOOT_REPORTS_PATH, report)
+        except OSError:
+            log.exception("Failed to write boot report: path=%s", BOOT_REPORTS_PATH)
+            return
+        log.info(
+            "Boot report written: on_ready=%.2fs total=%.2fs",
+            report["milestones"].get("on_ready", 0.0),
+            report["total_seconds"],
+        )
+
     async def on_ready(self) -> None:
+        if "on_ready" not in self.boot_profiler.milestones:
+            ready_at = self.boot_profiler.mark("on_ready")
+            setup_done = self.boot_profiler.milestones.get("setup_hook_done")
+            if setup_done is not None:
+                self.boot_profiler.record("gateway_connect", ready_at - setup_done)
         log.info("✅ Logged in as %s (%s)", self.user, self.user and self.user.id)
 
+    async def add_cog(self, cog: commands.Cog, /, **kwargs) -> None:
+        await super().add_cog(cog, **kwargs)
+        # Menu dispatch table 直接指住 bound method，cog 一換（load / reload）就要跟住換
+        bind_menu_cog(cog)
+
+    async def remove_cog(self, name: str, /, **kwargs) -> commands.Cog | None:
+        removed = await super().remove_cog(name, **kwargs)
+        if removed is not None:
+            unbind_menu_cog(removed.qualified_name)
+        return removed
+
     async def on_message(self, message: discord.Message) -> None:
-        """全局 fallback：純 tag bot 時叫出 Menu。
+        """所有訊息只喺度分類一次，再交畀有登記興趣嘅 feature（見 core.message_router）。
 
-        放喺 bot.py 主 Bot class，比單靠 Cog listener 更穩陣。
-        注意：最後一定要 process_commands，避免影響 prefix / hybrid commands。
+        純 tag bot 出 Menu、Twitch relay 頻道、等緊 tag 對象嘅回覆，都係 dict lookup；
+        冇 prefix command 就唔行 process_commands。
         """
         if message.author.bot:
             return
 
-        if message.guild is None:
-            await self.process_commands(message)
-            return
-
-        if self.user is None:
-            await self.process_commands(message)
+        decision = self.message_router.dispatch(message, self.user.id if self.user else None)
+        if decision.mention or not self.all_commands:
             return
-
-        bot_was_mentioned = self.user in message.mentions
-
-        if bot_was_mentioned:
-            raw_content = (message.content or "").strip()
-            mention_forms = {
-                f"<@{self.user.id}>",
-                f"<@!{self.user.id}>",
-            }
-
-            # 只接受純 tag bot，例如：@Con9sole-Bartender
-            # 避免「@Bot hello」呢類普通對話都彈 Menu。
-            is_pure_mention = False
-            if raw_content in mention_forms:
-                is_pure_mention = True
-            else:
-                cleaned = raw_content
-                for mention_text in mention_forms:
-                    cleaned = cleaned.replace(mention_text, "")
-                if cleaned.strip() == "":
-                    is_pure_mention = True
-
-            if is_pure_mention:
-                menu_cog = self.get_cog("Menu")
-
-                if menu_cog and hasattr(menu_cog, "send_mention_menu"):
-                    try:
-                        await menu_cog.send_mention_menu(message)
-                        return
-                    except Exception:
-                        log.exception("Failed to send mention menu via Menu.send_mention_menu")
-
-                # 後備方案：如果 menu.py 未有 send_mention_menu，都盡量直接用現有 helper 出 Menu。
-                try:
-                    import cogs.menu as menu_module
-
-                    await message.reply(
-                        embed=menu_module.build_main_menu_embed(message.author),
-                        view=menu_module.MainMenuView(menu_cog) if menu_cog else None,
-                        file=menu_module.build_menu_file(),
-                        mention_author=False,
-                    )
-                    return
-                except Exception:
-                    log.exception("Failed to send mention menu fallback")
-
         await self.process_commands(message)
 
 
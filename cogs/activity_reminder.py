@@ -3,22 +3,28 @@
 # - Remind at T-5 mins and at start time (minute precision)
 # - Activities can have multiple schedules (same activity, different time slots)
 # - Helper can add/remove activities/schedules and set ping role/channel
-# - Persistent storage in JSON (no DB)
+# - Persistent storage in SQLite (old JSON file is imported once on first run)
 
 import asyncio
 import logging
-import os
 import re
-from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta, date
 from typing import Dict, List, Optional, Tuple
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 
 import config
-from core.json_storage import atomic_write_json, load_json_object
+from core.metrics import METRICS
+from features.activity_schedule import (
+    KIND_PRE,
+    REMIND_BEFORE_MINUTES,
+    DueReminder,
+    ReminderIndex,
+    get_catch_up_grace,
+)
+from features.activity_storage import Activity, ActivityStore, Schedule
 
 log = logging.getLogger("con9sole-bartender.activity-reminder")
 
@@ -28,8 +34,12 @@ TARGET_GUILD = discord.Object(id=config.GUILD_ID)
 # IMPORTANT: set your helper role id here (same as cogs/role.py)
 HELPER_ROLE_ID = 1279071042249162856
 
-# Remind minutes before
-REMIND_BEFORE_MINUTES = 5
+SEND_LAG_METRIC = "activity_reminder.send_lag_seconds"
+SENT_METRIC = "activity_reminder.sent"
+SEND_FAILED_METRIC = "activity_reminder.send_failed"
+
+# Longest single sleep of the reminder loop (guards against wall-clock jumps)
+MAX_IDLE_SECONDS = 3600
 
 # Your server timezone (UTC+8)
 # If you prefer "Asia/Hong_Kong", also works; both are UTC+8
@@ -52,22 +62,6 @@ def user_is_admin_or_helper(inter: discord.Interaction) -> bool:
     return m.guild_permissions.administrator or user_is_helper(m)
 
 
-# --------- Data model ---------
-@dataclass
-class Schedule:
-    # weekdays: 0=Mon ... 6=Sun
-    weekdays: List[int]
-    time_hhmm: str  # "HH:MM"
-
-@dataclass
-class Activity:
-    id: str
-    name: str
-    channel_id: int
-    ping_role_id: int
-    schedules: List[Schedule]
-
-
 # --------- Parsing helpers ---------
 _WEEKDAY_MAP = {
     "mon": 0, "monday": 0, "一": 0, "週一": 0, "星期一": 0,
@@ -185,94 +179,37 @@ class ActivityReminder(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-        # Store reminders on the Fly.io volume by default so deploys/restarts do not erase them.
-        # Local development can override this with ACTIVITY_REMINDER_PATH.
-        self.data_file = os.getenv(
-            "ACTIVITY_REMINDER_PATH",
-            "/data/activity_reminders.json",
-        )
-        self.data_dir = os.path.dirname(self.data_file) or "."
-
+        # Activities, schedules and sent markers live in the stats DB on the Fly.io volume.
+        self.store = ActivityStore()
         self.activities: Dict[str, Activity] = {}
-        # sent_cache key: f"{activity_id}|{schedule_idx}|{yyyy-mm-dd}|{kind}"
-        # kind: "pre" or "start"
-        self.sent_cache: Dict[str, str] = {}
+
+        # next fire time of every schedule; only the edited activity gets recomputed
+        self._index = ReminderIndex()
+        self._reschedule = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+        self._pruned_on: Optional[date] = None
 
         self._load()
-        self._tick.start()
+
+    async def cog_load(self):
+        self._runner = asyncio.create_task(self._run_reminders())
 
     def cog_unload(self):
-        self._tick.cancel()
+        if self._runner is not None:
+            self._runner.cancel()
+            self._runner = None
 
     # ---------- Storage ----------
-    def _ensure_dir(self):
-        os.makedirs(self.data_dir, exist_ok=True)
-
     def _load(self):
-        self._ensure_dir()
-        if not os.path.exists(self.data_file):
-            self._save()
-            return
+        self.store.init()
+        self.store.import_legacy_json()
+        self.activities = {act.id: act for act in self.store.load_activities()}
 
-        raw = load_json_object(
-            self.data_file,
-            lambda: {"activities": [], "sent_cache": {}},
-        )
-
-        self.activities = {}
-        for a in raw.get("activities", []):
-            try:
-                schedules = [Schedule(**s) for s in a.get("schedules", [])]
-                act = Activity(
-                    id=a["id"],
-                    name=a["name"],
-                    channel_id=int(a["channel_id"]),
-                    ping_role_id=int(a["ping_role_id"]),
-                    schedules=schedules,
-                )
-                self.activities[act.id] = act
-            except Exception:
-                continue
-
-        self.sent_cache = raw.get("sent_cache", {}) or {}
-
-        # prune cache older than 3 days to keep file small
+        # drop sent markers older than 3 days
         self._prune_cache(days=3)
-        self._save()
-
-    def _save(self):
-        self._ensure_dir()
-        raw = {
-            "activities": [
-                {
-                    "id": a.id,
-                    "name": a.name,
-                    "channel_id": a.channel_id,
-                    "ping_role_id": a.ping_role_id,
-                    "schedules": [asdict(s) for s in a.schedules],
-                }
-                for a in self.activities.values()
-            ],
-            "sent_cache": self.sent_cache,
-        }
-        atomic_write_json(self.data_file, raw)
 
     def _prune_cache(self, days: int = 3):
-        # keep only recent days
-        cutoff = _today() - timedelta(days=days)
-        keep: Dict[str, str] = {}
-        for k, v in self.sent_cache.items():
-            # key: activity|idx|yyyy-mm-dd|kind
-            parts = k.split("|")
-            if len(parts) != 4:
-                continue
-            try:
-                d = date.fromisoformat(parts[2])
-            except Exception:
-                continue
-            if d >= cutoff:
-                keep[k] = v
-        self.sent_cache = keep
+        self.store.prune_sent(before=_today() - timedelta(days=days))
 
     # ---------- ID ----------
     def _new_activity_id(self) -> str:
@@ -287,56 +224,99 @@ class ActivityReminder(commands.Cog):
         return f"{base}_{i}"
 
     # ---------- Reminder loop ----------
-    @tasks.loop(seconds=60)
-    async def _tick(self):
-        # wait until bot ready
-        if not self.bot.is_ready():
+    def _reindex(self, act: Activity):
+        self._index.refresh(act, since=_minute_floor(_now()))
+        self._reschedule.set()
+
+    def _unindex(self, activity_id: str):
+        self._index.remove(activity_id)
+        self._reschedule.set()
+
+    async def _run_reminders(self):
+        await self.bot.wait_until_ready()
+
+        # catch up reminders missed while the bot was down, within the grace window
+        self._index.rebuild(self.activities.values(), since=_minute_floor(_now()) - get_catch_up_grace())
+
+        while True:
+            self._reschedule.clear()
+            next_at = self._index.next_fire_at()
+            delay = MAX_IDLE_SECONDS if next_at is None else (next_at - _now()).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._reschedule.wait(), timeout=min(delay, MAX_IDLE_SECONDS))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self._fire_due(self._index.pop_due(_now()))
+            except Exception:
+                log.exception("Activity reminder tick failed")
+
+            # prune daily
+            if self._pruned_on != _today():
+                self._prune_cache(days=3)
+                self._pruned_on = _today()
+
+    async def _fire_due(self, due: List[DueReminder]):
+        now = _now()
+        on_time_from = _minute_floor(now) - get_catch_up_grace()
+
+        guild = self.bot.get_guild(int(config.GUILD_ID))
+        if guild is None:
             return
 
-        now = _minute_floor(_now())
-        # trigger time points
-        t_start = now
-        t_pre = now + timedelta(minutes=REMIND_BEFORE_MINUTES)
+        # resolve each channel / role once per tick, however many activities share it
+        channels: Dict[int, Optional[discord.abc.GuildChannel]] = {}
+        roles: Dict[int, Optional[discord.Role]] = {}
+        batches: Dict[int, List[Tuple[Activity, discord.Role, DueReminder]]] = {}
 
-        # prune daily
-        if now.minute == 0 and now.hour == 0:
-            self._prune_cache(days=3)
-            self._save()
+        for item in due:
+            if item.fire_at < on_time_from:
+                log.info("Skipping stale activity reminder: %s", item.sent_key)
+                continue
+            # a late "pre" after the start time is pointless; the "start" one covers it
+            if item.kind == KIND_PRE and item.event_dt <= _minute_floor(now):
+                continue
 
-        for act in list(self.activities.values()):
-            guild = self.bot.get_guild(int(config.GUILD_ID))
-            if guild is None:
+            act = self.activities.get(item.activity_id)
+            if act is None or item.schedule_idx >= len(act.schedules):
                 continue
 
-            channel = guild.get_channel(act.channel_id)
-            if not isinstance(channel, discord.abc.Messageable):
+            if act.channel_id not in channels:
+                channels[act.channel_id] = guild.get_channel(act.channel_id)
+            if not isinstance(channels[act.channel_id], discord.abc.Messageable):
                 continue
 
-            role = guild.get_role(act.ping_role_id)
+            if act.ping_role_id not in roles:
+                roles[act.ping_role_id] = guild.get_role(act.ping_role_id)
+            role = roles[act.ping_role_id]
             if role is None:
                 continue
 
-            for idx, sch in enumerate(act.schedules):
-                # check if today matches for "start" or "pre"
-                # For "start", compare to now date/time
-                if self._matches_datetime(sch, t_start):
-                    await self._send_if_needed(guild, channel, role, act, idx, t_start, kind="start")
-
-                # For "pre", compare to (now + 5) date/time, but message is sent at now
-                if self._matches_datetime(sch, t_pre):
-                    await self._send_if_needed(guild, channel, role, act, idx, t_pre, kind="pre")
+            batches.setdefault(act.channel_id, []).append((act, role, item))
 
-    @_tick.before_loop
-    async def _before_tick(self):
-        await self.bot.wait_until_ready()
-        # align loop closer to minute boundary
-        await asyncio.sleep(1)
+        # different channels in parallel; same channel stays in fire order
+        results = await asyncio.gather(
+            *(self._send_batch(guild, channels[channel_id], batch) for channel_id, batch in batches.items()),
+            return_exceptions=True,
+        )
+        for channel_id, result in zip(batches, results):
+            if isinstance(result, Exception):
+                log.error("Activity reminder batch failed: channel=%s", channel_id, exc_info=result)
 
-    def _matches_datetime(self, sch: Schedule, dt: datetime) -> bool:
-        # weekday: dt.weekday() 0..6
-        if dt.weekday() not in sch.weekdays:
-            return False
-        return dt.strftime("%H:%M") == sch.time_hhmm
+    async def _send_batch(
+        self,
+        guild: discord.Guild,
+        channel: discord.abc.Messageable,
+        batch: List[Tuple[Activity, discord.Role, DueReminder]],
+    ):
+        for act, role, item in batch:
+            await self._send_if_needed(
+                guild, channel, role, act, item.schedule_idx, item.event_dt,
+                kind=item.kind, scheduled_at=item.fire_at,
+            )
 
     async def _send_if_needed(
         self,
@@ -347,9 +327,9 @@ class ActivityReminder(commands.Cog):
         schedule_idx: int,
         event_dt: datetime,
         kind: str,  # "pre" or "start"
+        scheduled_at: Optional[datetime] = None,
     ):
-        k = f"{act.id}|{schedule_idx}|{event_dt.date().isoformat()}|{kind}"
-        if k in self.sent_cache:
+        if self.store.was_sent(act.id, schedule_idx, event_dt.date(), kind):
             return
 
         # Build message
@@ -369,11 +349,15 @@ class ActivityReminder(commands.Cog):
 
         try:
             await channel.send(content)
-            self.sent_cache[k] = _now().isoformat()
-            self._save()
         except Exception:
-            # do not spam save; just ignore send failure
+            # just ignore send failure; it is not marked as sent
+            METRICS.counter(SEND_FAILED_METRIC).inc()
             return
+        sent_at = _now()
+        self.store.mark_sent(act.id, schedule_idx, event_dt.date(), kind, sent_at=sent_at)
+        METRICS.counter(SENT_METRIC).inc()
+        if scheduled_at is not None:
+            METRICS.histogram(SEND_LAG_METRIC).observe(max(0.0, (sent_at - scheduled_at).total_seconds()))
 
     # ---------- Autocomplete ----------
     async def activity_autocomplete(self, inter: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
@@ -421,7 +405,8 @@ class ActivityReminder(commands.Cog):
             schedules=[Schedule(weekdays=wd, time_hhmm=hhmm)],
         )
         self.activities[act.id] = act
-        self._save()
+        self.store.save_activity(act)
+        self._reindex(act)
 
         await inter.response.send_message(
             f"✅ 已新增活動：**{act.name}**\n"
@@ -462,7 +447,8 @@ class ActivityReminder(commands.Cog):
 
         new_s = Schedule(weekdays=wd, time_hhmm=hhmm)
         act.schedules.append(new_s)
-        self._save()
+        self.store.save_activity(act)
+        self._reindex(act)
 
         await inter.response.send_message(
             f"✅ 已為 **{act.name}** 新增時段：{self._format_schedule(new_s)}",
@@ -503,7 +489,8 @@ class ActivityReminder(commands.Cog):
         if name is not None and name.strip():
             act.name = name.strip()
 
-        self._save()
+        self.store.save_activity(act)
+        self._reindex(act)
 
         await inter.response.send_message(
             f"✅ 已更新活動：**{act.name}**\n"
@@ -536,7 +523,8 @@ class ActivityReminder(commands.Cog):
             return
 
         removed = act.schedules.pop(index - 1)
-        self._save()
+        self.store.save_activity(act)
+        self._reindex(act)
 
         await inter.response.send_message(
             f"✅ 已刪除 **{act.name}** 時段 #{index}：{self._format_schedule(removed)}",
@@ -555,9 +543,9 @@ class ActivityReminder(commands.Cog):
             return
 
         del self.activities[activity_id]
-        # cleanup sent_cache related keys
-        self.sent_cache = {k: v for k, v in self.sent_cache.items() if not k.startswith(f"{activity_id}|")}
-        self._save()
+        # schedules and sent markers are removed with it
+        self.store.delete_activity(activity_id)
+        self._unindex(activity_id)
 
         await inter.response.send_message(f"✅ 已刪除活動：**{act.name}**", ephemeral=True)
 
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import asyncio
 import logging
-import random
 import time
-from dataclasses import dataclass
 from typing import Optional
 
 import discord
@@ -12,33 +9,24 @@ from discord import app_commands
 from discord.ext import commands
 
 from config import GUILD_ID
+from core.pending_replies import PendingReply, get_pending_replies, pending_busy_message
 from core.permissions import is_admin_or_helper
 from core.safe_send import send_or_followup
-from data.cheers_quotes import (
-    BARTENDER_ATTACHMENT_NAME,
-    CHEERS_COOLDOWN_SECONDS,
-    CHEERS_QUOTES,
-    CheerQuote,
-)
+from data.cheers_quotes import CHEERS_COOLDOWN_SECONDS, CheerQuote, random_cheer_quote
 from features.daily_bar import complete_daily_bar_task
-from features.menu_helpers import build_menu_file
+from features.menu_helpers import attach_bartender_thumbnail
 from features.menu_views import build_full_menu_view
 
 log = logging.getLogger("con9sole-bartender.cheers")
 
+# cheers_quotes 好大，on_ready 之後或者第一次撳 menu 先載入
+EXTENSION_LAZY = True
+EXTENSION_DEPENDS = ("cogs.menu",)
+
 CHEERS_USER_COOLDOWNS: dict[int, float] = {}
 CHEER_TARGET_TIMEOUT_SECONDS = 60.0
 
 
-@dataclass
-class CheerTargetPending:
-    started_at: float
-    cancel_event: asyncio.Event
-
-
-PENDING_CHEER_TARGET_REQUESTS: dict[int, CheerTargetPending] = {}
-
-
 def get_cheers_retry_after(user_id: int) -> float:
     last_used = CHEERS_USER_COOLDOWNS.get(user_id, 0.0)
     elapsed = time.time() - last_used
@@ -50,21 +38,8 @@ def touch_cheers_cooldown(user_id: int) -> None:
     CHEERS_USER_COOLDOWNS[user_id] = time.time()
 
 
-def cleanup_pending_cheer_requests() -> None:
-    now = time.time()
-    expired_user_ids = [
-        user_id
-        for user_id, pending in PENDING_CHEER_TARGET_REQUESTS.items()
-        if now - pending.started_at >= CHEER_TARGET_TIMEOUT_SECONDS
-    ]
-    for user_id in expired_user_ids:
-        pending = PENDING_CHEER_TARGET_REQUESTS.pop(user_id, None)
-        if pending is not None and not pending.cancel_event.is_set():
-            pending.cancel_event.set()
-
-
 def pick_quote() -> CheerQuote:
-    return random.choice(CHEERS_QUOTES)
+    return random_cheer_quote()
 
 
 def build_result_payload(interaction: discord.Interaction, result_embed: discord.Embed) -> dict[str, object]:
@@ -74,9 +49,8 @@ def build_result_payload(interaction: discord.Interaction, result_embed: discord
     if menu_view is not None:
         payload["view"] = menu_view
 
-    menu_file = build_menu_file()
+    menu_file = attach_bartender_thumbnail(result_embed)
     if menu_file is not None:
-        result_embed.set_thumbnail(url=f"attachment://{BARTENDER_ATTACHMENT_NAME}")
         payload["file"] = menu_file
 
     return payload
@@ -97,10 +71,10 @@ def build_cheer_target_prompt_embed(user: discord.abc.User) -> discord.Embed:
 
 
 class CheerTargetCancelView(discord.ui.View):
-    def __init__(self, *, owner_id: int, cancel_event: asyncio.Event) -> None:
+    def __init__(self, *, owner_id: int, pending: PendingReply) -> None:
         super().__init__(timeout=CHEER_TARGET_TIMEOUT_SECONDS)
         self.owner_id = owner_id
-        self.cancel_event = cancel_event
+        self.pending = pending
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.owner_id:
@@ -110,11 +84,10 @@ class CheerTargetCancelView(discord.ui.View):
 
     @discord.ui.button(label="取消", emoji="❌", style=discord.ButtonStyle.secondary)
     async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
-        if self.cancel_event.is_set():
+        if not self.pending.cancel():
             await interaction.response.send_message("幫人打氣操作已經取消或逾時。", ephemeral=True)
             return
 
-        self.cancel_event.set()
         for item in self.children:
             if isinstance(item, discord.ui.Button):
                 item.disabled = True
@@ -194,77 +167,56 @@ class Cheers(commands.Cog):
             await send_or_followup(interaction, content="❌ 搵唔到目前 channel，請重新試一次。", ephemeral=True)
             return None
 
-        cleanup_pending_cheer_requests()
-        if interaction.user.id in PENDING_CHEER_TARGET_REQUESTS:
-            await send_or_followup(
-                interaction,
-                content="⏳ 你已經有一個等待 tag 對象嘅幫人打氣操作。請先完成，或者撳該訊息嘅取消按鈕。",
-                ephemeral=True,
-            )
+        registry = get_pending_replies(self.bot)
+        if registry is None:
+            await send_or_followup(interaction, content="❌ 暫時未能讀取訊息，請稍後再試。", ephemeral=True)
+            return None
+
+        existing = registry.get(interaction.channel_id, interaction.user.id)
+        if existing is not None:
+            await send_or_followup(interaction, content=pending_busy_message(existing.kind), ephemeral=True)
             return None
 
         ok = await self._check_cheers_cooldown(interaction)
         if not ok:
             return None
 
-        cancel_event = asyncio.Event()
-        PENDING_CHEER_TARGET_REQUESTS[interaction.user.id] = CheerTargetPending(
-            started_at=time.time(),
-            cancel_event=cancel_event,
+        # 下一個訊息由 message router 用 (channel_id, user_id) 直接交過嚟；逾時由 registry 統一處理
+        pending = registry.expect(
+            interaction.channel_id,
+            interaction.user.id,
+            timeout=CHEER_TARGET_TIMEOUT_SECONDS,
+            kind="cheer",
         )
-
-        view = CheerTargetCancelView(owner_id=interaction.user.id, cancel_event=cancel_event)
-        await send_or_followup(
-            interaction,
-            embed=build_cheer_target_prompt_embed(interaction.user),
-            view=view,
-            ephemeral=True,
-        )
-
-        def check(message: discord.Message) -> bool:
-            if message.author.bot:
-                return False
-            if message.author.id != interaction.user.id:
-                return False
-            if message.channel.id != interaction.channel_id:
-                return False
-            return True
-
-        message_task = asyncio.create_task(
-            self.bot.wait_for(
-                "message",
-                check=check,
-                timeout=CHEER_TARGET_TIMEOUT_SECONDS,
+        if pending is None:
+            existing = registry.get(interaction.channel_id, interaction.user.id)
+            await send_or_followup(
+                interaction,
+                content=pending_busy_message(existing.kind if existing is not None else "cheer"),
+                ephemeral=True,
             )
-        )
-        cancel_task = asyncio.create_task(cancel_event.wait())
+            return None
 
+        view = CheerTargetCancelView(owner_id=interaction.user.id, pending=pending)
         try:
-            done, pending_tasks = await asyncio.wait(
-                {message_task, cancel_task},
-                timeout=CHEER_TARGET_TIMEOUT_SECONDS,
-                return_when=asyncio.FIRST_COMPLETED,
+            await send_or_followup(
+                interaction,
+                embed=build_cheer_target_prompt_embed(interaction.user),
+                view=view,
+                ephemeral=True,
             )
-
-            for task in pending_tasks:
-                task.cancel()
-
-            if cancel_task in done and cancel_event.is_set():
-                return None
-
-            if message_task not in done:
-                await interaction.followup.send("⏳ 已逾時，幫人打氣已取消。", ephemeral=True)
-                return None
-
-            try:
-                message = message_task.result()
-            except asyncio.TimeoutError:
-                await interaction.followup.send("⏳ 已逾時，幫人打氣已取消。", ephemeral=True)
-                return None
+            message = await pending.wait()
         finally:
-            PENDING_CHEER_TARGET_REQUESTS.pop(interaction.user.id, None)
+            pending.cancel()
             view.stop()
 
+        if pending.outcome == "cancelled":
+            return None
+
+        if message is None:
+            await interaction.followup.send("⏳ 已逾時，幫人打氣已取消。", ephemeral=True)
+            return None
+
         if message.content.strip().casefold() in {"cancel", "取消", "stop"}:
             await interaction.followup.send("已取消幫人打氣。", ephemeral=True)
             return None
@@ -7,6 +7,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from config import GUILD_ID
+from core.extension_loader import get_or_load_cog
 from core.safe_send import send_or_followup
 from features.daily_bar import (
     build_daily_bar_embed,
@@ -43,7 +44,7 @@ class DailyBarActionButton(discord.ui.Button):
             return
 
         cog_name, method_name = TASK_ACTIONS[self.task_key]
-        target = interaction.client.get_cog(cog_name)
+        target = await get_or_load_cog(interaction.client, cog_name)
         if target is None:
             await interaction.response.send_message(f"❌ `{cog_name}` 功能未載入。", ephemeral=True)
             return
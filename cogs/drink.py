@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import asyncio
 import logging
-import time
 from collections import defaultdict, deque
-from dataclasses import dataclass
 from typing import Deque, Dict
 
 import discord
@@ -12,9 +9,9 @@ from discord import app_commands
 from discord.ext import commands
 
 from config import GUILD_ID
+from core.pending_replies import get_pending_replies, pending_busy_message
 from core.safe_send import send_or_followup
 from data.drink_data import (
-    BARTENDER_ATTACHMENT_NAME,
     DrinkEntry,
     ICON_MAP,
     RARITY_STYLE,
@@ -59,28 +56,6 @@ from features.drink_views import (
 log = logging.getLogger("con9sole-bartender.drink")
 
 
-@dataclass
-class GiftDrinkPending:
-    started_at: float
-    cancel_event: asyncio.Event
-
-
-PENDING_GIFT_DRINK_REQUESTS: dict[int, GiftDrinkPending] = {}
-
-
-def cleanup_pending_gift_requests() -> None:
-    now = time.time()
-    expired_user_ids = [
-        user_id
-        for user_id, pending in PENDING_GIFT_DRINK_REQUESTS.items()
-        if now - pending.started_at >= GIFT_DRINK_TARGET_TIMEOUT_SECONDS
-    ]
-    for user_id in expired_user_ids:
-        pending = PENDING_GIFT_DRINK_REQUESTS.pop(user_id, None)
-        if pending is not None and not pending.cancel_event.is_set():
-            pending.cancel_event.set()
-
-
 class Drink(commands.Cog):
     """/drink：以 bartender 風格隨機為指定對象點一款酒。"""
 
@@ -183,77 +158,56 @@ class Drink(commands.Cog):
             await send_or_followup(interaction, content="❌ 搵唔到目前 channel，請重新試一次。", ephemeral=True)
             return None
 
-        cleanup_pending_gift_requests()
-        if interaction.user.id in PENDING_GIFT_DRINK_REQUESTS:
-            await send_or_followup(
-                interaction,
-                content="⏳ 你已經有一個等待 tag 對象嘅賜酒操作。請先完成，或者撳該訊息嘅取消按鈕。",
-                ephemeral=True,
-            )
+        registry = get_pending_replies(self.bot)
+        if registry is None:
+            await send_or_followup(interaction, content="❌ 暫時未能讀取訊息，請稍後再試。", ephemeral=True)
+            return None
+
+        existing = registry.get(interaction.channel_id, interaction.user.id)
+        if existing is not None:
+            await send_or_followup(interaction, content=pending_busy_message(existing.kind), ephemeral=True)
             return None
 
         ok = await self._check_gift_drink_cooldown(interaction)
         if not ok:
             return None
 
-        cancel_event = asyncio.Event()
-        PENDING_GIFT_DRINK_REQUESTS[interaction.user.id] = GiftDrinkPending(
-            started_at=time.time(),
-            cancel_event=cancel_event,
+        # 下一個訊息由 message router 用 (channel_id, user_id) 直接交過嚟；逾時由 registry 統一處理
+        pending = registry.expect(
+            interaction.channel_id,
+            interaction.user.id,
+            timeout=GIFT_DRINK_TARGET_TIMEOUT_SECONDS,
+            kind="gift",
         )
-
-        view = GiftDrinkCancelView(owner_id=interaction.user.id, cancel_event=cancel_event)
-        await send_or_followup(
-            interaction,
-            embed=build_gift_prompt_embed(interaction.user),
-            view=view,
-            ephemeral=True,
-        )
-
-        def check(message: discord.Message) -> bool:
-            if message.author.bot:
-                return False
-            if message.author.id != interaction.user.id:
-                return False
-            if message.channel.id != interaction.channel_id:
-                return False
-            return True
-
-        message_task = asyncio.create_task(
-            self.bot.wait_for(
-                "message",
-                check=check,
-                timeout=GIFT_DRINK_TARGET_TIMEOUT_SECONDS,
+        if pending is None:
+            existing = registry.get(interaction.channel_id, interaction.user.id)
+            await send_or_followup(
+                interaction,
+                content=pending_busy_message(existing.kind if existing is not None else "gift"),
+                ephemeral=True,
             )
-        )
-        cancel_task = asyncio.create_task(cancel_event.wait())
+            return None
 
+        view = GiftDrinkCancelView(owner_id=interaction.user.id, pending=pending)
         try:
-            done, pending_tasks = await asyncio.wait(
-                {message_task, cancel_task},
-                timeout=GIFT_DRINK_TARGET_TIMEOUT_SECONDS,
-                return_when=asyncio.FIRST_COMPLETED,
+            await send_or_followup(
+                interaction,
+                embed=build_gift_prompt_embed(interaction.user),
+                view=view,
+                ephemeral=True,
             )
-
-            for task in pending_tasks:
-                task.cancel()
-
-            if cancel_task in done and cancel_event.is_set():
-                return None
-
-            if message_task not in done:
-                await interaction.followup.send("⏳ 已逾時，賜酒已取消。", ephemeral=True)
-                return None
-
-            try:
-                message = message_task.result()
-            except asyncio.TimeoutError:
-                await interaction.followup.send("⏳ 已逾時，賜酒已取消。", ephemeral=True)
-                return None
+            message = await pending.wait()
         finally:
-            PENDING_GIFT_DRINK_REQUESTS.pop(interaction.user.id, None)
+            pending.cancel()
             view.stop()
 
+        if pending.outcome == "cancelled":
+            return None
+
+        if message is None:
+            await interaction.followup.send("⏳ 已逾時，賜酒已取消。", ephemeral=True)
+            return None
+
         if message.content.strip().casefold() in {"cancel", "取消", "stop"}:
             await interaction.followup.send("已取消賜酒。", ephemeral=True)
             return None
@@ -335,11 +289,7 @@ class Drink(commands.Cog):
         )
         result_embed.set_footer(text="Con9sole Bartender｜⬅️ Menu 返回吧枱主頁")
 
-        send_kwargs = build_bartender_result_payload(
-            interaction,
-            result_embed,
-            attachment_name=BARTENDER_ATTACHMENT_NAME,
-        )
+        send_kwargs = build_bartender_result_payload(interaction, result_embed)
 
         if interaction.response.is_done():
             await interaction.followup.send(**send_kwargs)
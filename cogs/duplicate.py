@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import Any
 
 import discord
@@ -8,10 +9,13 @@ from discord import app_commands
 from discord.ext import commands
 
 import config
-from utils import copy_forum_tags, make_private_overwrites
+from utils import apply_forum_tags, clone_forum_tags, copy_forum_tags, make_private_overwrites
 
 log = logging.getLogger("con9sole-bartender.duplicate")
 
+# 只係 admin 偶爾用，on_ready 之後先載入
+EXTENSION_LAZY = True
+
 
 def user_is_section_admin(interaction: discord.Interaction) -> bool:
     return isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator
@@ -195,30 +199,107 @@ async def add_game_version(
     )
 
 
-async def add_new_game(
+@dataclass(frozen=True)
+class TemplateChannelSnapshot:
+    kind: type[discord.abc.GuildChannel]
+    name: str
+    position: int
+    kwargs: dict[str, Any]
+    overwrites: dict[discord.abc.Snowflake, discord.PermissionOverwrite]
+    forum_tags: tuple[discord.ForumTag, ...] = ()
+
+
+@dataclass(frozen=True)
+class TemplateSnapshot:
+    category_id: int
+    channels: tuple[TemplateChannelSnapshot, ...]
+
+
+_TEMPLATE_KWARG_BUILDERS: dict[type[discord.abc.GuildChannel], Any] = {
+    discord.TextChannel: _build_text_kwargs,
+    discord.VoiceChannel: _build_voice_kwargs,
+    discord.StageChannel: _build_stage_kwargs,
+    discord.ForumChannel: _build_forum_kwargs,
+}
+
+# guild_id -> 模板快照；模板 Category 或其子頻道有變動時由 listener 清走
+_TEMPLATE_SNAPSHOTS: dict[int, TemplateSnapshot] = {}
+
+
+def _snapshot_channel(channel: discord.abc.GuildChannel) -> TemplateChannelSnapshot | None:
+    for kind, builder in _TEMPLATE_KWARG_BUILDERS.items():
+        if isinstance(channel, kind):
+            break
+    else:
+        return None
+
+    forum_tags: tuple[discord.ForumTag, ...] = ()
+    if isinstance(channel, discord.ForumChannel):
+        forum_tags = tuple(clone_forum_tags(channel.available_tags))
+
+    return TemplateChannelSnapshot(
+        kind=kind,
+        name=channel.name,
+        position=getattr(channel, "position", 0),
+        kwargs=builder(channel),
+        overwrites=dict(channel.overwrites),
+        forum_tags=forum_tags,
+    )
+
+
+async def get_template_snapshot(
     client: discord.Client,
     guild: discord.Guild,
-    game_name: str,
-) -> str:
+) -> TemplateSnapshot:
+    """Return the cached template layout, fetching it from Discord only once."""
+    cached = _TEMPLATE_SNAPSHOTS.get(guild.id)
+    if cached is not None:
+        return cached
+
     template_category = await _get_template_category(client, guild)
     all_channels = await guild.fetch_channels()
-    template_children = sorted(
+    children = sorted(
         (
             channel
             for channel in all_channels
             if getattr(channel, "category_id", None) == template_category.id
-            and isinstance(
-                channel,
-                (
-                    discord.TextChannel,
-                    discord.VoiceChannel,
-                    discord.StageChannel,
-                    discord.ForumChannel,
-                ),
-            )
         ),
         key=lambda channel: getattr(channel, "position", 0),
     )
+    snapshot = TemplateSnapshot(
+        category_id=template_category.id,
+        channels=tuple(
+            entry for channel in children if (entry := _snapshot_channel(channel)) is not None
+        ),
+    )
+    _TEMPLATE_SNAPSHOTS[guild.id] = snapshot
+    log.info(
+        "Cached template snapshot: guild=%s category=%s channels=%s",
+        guild.id,
+        snapshot.category_id,
+        len(snapshot.channels),
+    )
+    return snapshot
+
+
+def invalidate_template_snapshot(guild_id: int | None = None) -> None:
+    if guild_id is None:
+        _TEMPLATE_SNAPSHOTS.clear()
+    else:
+        _TEMPLATE_SNAPSHOTS.pop(guild_id, None)
+
+
+def _touches_template(channel: discord.abc.GuildChannel) -> bool:
+    template_id = config.TEMPLATE_CATEGORY_ID
+    return channel.id == template_id or getattr(channel, "category_id", None) == template_id
+
+
+async def add_new_game(
+    client: discord.Client,
+    guild: discord.Guild,
+    game_name: str,
+) -> str:
+    snapshot = await get_template_snapshot(client, guild)
 
     role_name = config.ROLE_NAME_PATTERN.format(game=game_name)
     new_role = discord.utils.get(guild.roles, name=role_name)
@@ -240,29 +321,30 @@ async def add_new_game(
     await new_category.edit(overwrites=private_overwrites)
 
     created_forum: discord.ForumChannel | None = None
-    first_source_forum: discord.ForumChannel | None = None
+    first_source_forum: TemplateChannelSnapshot | None = None
+    created_names: set[str] = set()
 
-    for source in template_children:
-        if isinstance(source, discord.TextChannel):
+    for source in snapshot.channels:
+        if source.kind is discord.TextChannel:
             created = await guild.create_text_channel(
                 source.name,
                 category=new_category,
                 overwrites=private_overwrites,
-                **_build_text_kwargs(source),
+                **source.kwargs,
             )
-        elif isinstance(source, discord.VoiceChannel):
+        elif source.kind is discord.VoiceChannel:
             created = await guild.create_voice_channel(
                 source.name,
                 category=new_category,
                 overwrites=private_overwrites,
-                **_build_voice_kwargs(source),
+                **source.kwargs,
             )
-        elif isinstance(source, discord.StageChannel):
+        elif source.kind is discord.StageChannel:
             created = await guild.create_stage_channel(
                 source.name,
                 category=new_category,
                 overwrites=private_overwrites,
-                **_build_stage_kwargs(source),
+                **source.kwargs,
             )
         else:
             if first_source_forum is None:
@@ -271,28 +353,26 @@ async def add_new_game(
                 source.name,
                 category=new_category,
                 overwrites=private_overwrites,
-                **_build_forum_kwargs(source),
+                **source.kwargs,
             )
             created = created_forum
+        created_names.add(created.name)
 
         try:
             await created.edit(position=source.position)
         except Exception:
             log.exception("Failed to position duplicated channel: channel=%s", created.id)
 
-    if first_source_forum is not None and created_forum is not None:
+    if first_source_forum is not None and created_forum is not None and first_source_forum.forum_tags:
         try:
-            await copy_forum_tags(first_source_forum, created_forum)
+            await apply_forum_tags(created_forum, list(first_source_forum.forum_tags))
         except Exception:
             log.exception("Failed to copy tags to duplicated forum: forum=%s", created_forum.id)
 
     fallback = getattr(config, "FALLBACK_CHANNELS", {}) or {}
     if fallback:
-        current_names = {
-            channel.name
-            for channel in await guild.fetch_channels()
-            if getattr(channel, "category_id", None) == new_category.id
-        }
+        # 新 Category 入面嘅頻道全部由上面建立，唔使再 fetch 一次
+        current_names = created_names
         for name in fallback.get("text", []) or []:
             if name not in current_names:
                 await guild.create_text_channel(
@@ -321,6 +401,28 @@ class Duplicate(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
 
+    def cog_unload(self) -> None:
+        invalidate_template_snapshot()
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        if _touches_template(channel):
+            invalidate_template_snapshot(channel.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self,
+        before: discord.abc.GuildChannel,
+        after: discord.abc.GuildChannel,
+    ) -> None:
+        if _touches_template(before) or _touches_template(after):
+            invalidate_template_snapshot(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        if _touches_template(channel):
+            invalidate_template_snapshot(channel.guild.id)
+
     @app_commands.command(
         name="add_new_game",
         description="建立全新遊戲 Category、角色及模板頻道",
@@ -5,6 +5,7 @@ from discord import app_commands
 from discord.ext import commands
 
 import config
+from core.message_router import get_message_router
 from core.safe_send import send_or_followup
 from features.admin_actions import (
     admin_ping_from_button as run_admin_ping_from_button,
@@ -24,7 +25,9 @@ from features.menu_actions import (
     open_threads_menu as run_open_threads_menu,
     send_mention_quick_bar as run_send_mention_quick_bar,
 )
+from features.menu_embeds import reset_embed_templates
 from features.menu_helpers import (
+    BARTENDER_ASSET,
     can_use_admin,
     claim_mention_message,
     get_retry_after,
@@ -36,6 +39,8 @@ from features.menu_views import (
     HelpMenuView,
     HomeMenuView,
     QuickBarView,
+    build_menu_dispatch,
+    reset_menu_views,
 )
 from features.role_tools import RoleActionState, RoleToolsView
 from features.role_tools_actions import (
@@ -129,8 +134,13 @@ class Menu(commands.Cog):
         await run_send_mention_quick_bar(self, message)
 
     async def cog_load(self) -> None:
+        build_menu_dispatch(self.bot, self)
+        router = get_message_router(self.bot)
+        if router is not None:
+            router.set_mention_handler(self.send_mention_menu)
         if self._views_registered:
             return
+        # 每個 layer 只註冊一次 persistent view；所有 menu message（包括重啟前發出嘅）都靠 custom_id 交畀佢哋處理
         self.bot.add_view(QuickBarView(self))
         self.bot.add_view(HomeMenuView(self))
         self.bot.add_view(HelpMenuView(self))
@@ -138,18 +148,23 @@ class Menu(commands.Cog):
         self.bot.add_view(RoleToolsView(self))
         self._views_registered = True
 
-    @commands.Cog.listener("on_message")
-    async def on_message_mention_menu(self, message: discord.Message) -> None:
-        if message.author.bot or message.guild is None or self.bot.user is None:
+    async def cog_unload(self) -> None:
+        router = get_message_router(self.bot)
+        if router is not None:
+            router.set_mention_handler(None)
+        reset_menu_views()
+        reset_embed_templates()
+
+    @commands.Cog.listener("on_ready")
+    async def on_ready_build_dispatch(self) -> None:
+        # cog_load 時其他 cog 未必載入完，ready 之後再解析一次
+        build_menu_dispatch(self.bot, self)
+
+    @commands.Cog.listener("on_ready")
+    async def on_ready_upload_assets(self) -> None:
+        if BARTENDER_ASSET.url() is not None:
             return
-        bot_id = self.bot.user.id
-        direct_mention = f"<@{bot_id}>" in message.content or f"<@!{bot_id}>" in message.content
-        if not direct_mention:
-            return
-        cleaned = message.content.replace(f"<@{bot_id}>", "").replace(f"<@!{bot_id}>", "").strip()
-        if cleaned:
-            return
-        await self.send_mention_menu(message)
+        await BARTENDER_ASSET.ensure_uploaded(self.bot, config.ASSET_STORAGE_CHANNEL_ID)
 
     @app_commands.command(name="menu", description="顯示 Con9sole Bartender 快捷吧枱")
     @app_commands.guilds(discord.Object(id=config.GUILD_ID))
@@ -8,8 +8,14 @@ from discord import app_commands
 from discord.ext import commands
 
 import config
+from core.boot_profiler import format_boot_reports, load_boot_reports
+from core.command_sync import sync_command_tree
+from core.extension_loader import discover_extensions
+from core.storage_paths import BOOT_REPORTS_PATH, COMMAND_SYNC_STATE_PATH
+from features.menu_embeds import reset_embed_templates
 
 COGS_DIR = Path(__file__).resolve().parent
+BOOT_REPORT_MAX_COUNT = 10
 
 HELPER_ROLE_IDS = set(getattr(config, "HELPER_ROLE_IDS", []))
 HELPER_ROLE_NAMES = set(getattr(config, "HELPER_ROLE_NAMES", ["Helper", "helper", "helpers"]))
@@ -34,18 +40,12 @@ def can_use_reload(member: discord.Member | discord.User) -> bool:
 
 
 def _list_cogs_package() -> list[str]:
-    """Return reloadable cog module names under cogs/."""
-    names: list[str] = []
-
-    for path in sorted(COGS_DIR.glob("*.py")):
-        name = path.stem
-
-        if name.startswith("_") or name == "__init__":
-            continue
-
-        names.append(name)
-
-    return names
+    """Return reloadable cog module names under cogs/, skipping unconfigured ones."""
+    return [
+        spec.name.removeprefix("cogs.")
+        for spec in discover_extensions(COGS_DIR)
+        if spec.enabled()
+    ]
 
 
 def _normalize_cog_name(cog: str | None) -> str | None:
@@ -110,6 +110,9 @@ class Reload(commands.Cog):
             else:
                 fail_list.append(f"{name} -> {fail}")
 
+        # menu / help embed template 下次用時按最新 registry 同 config 重砌
+        if ok_list:
+            reset_embed_templates()
         return ok_list, fail_list
 
     def _format_result(self, ok_list: list[str], fail_list: list[str]) -> str:
@@ -139,6 +142,63 @@ class Reload(commands.Cog):
         ok_list, fail_list = await self._reload_many(cog)
         await inter.followup.send(self._format_result(ok_list, fail_list), ephemeral=True)
 
+    @app_commands.command(name="sync_commands", description="強制同步 Slash 指令到 Discord（Admin/Helper）")
+    @app_commands.guilds(discord.Object(id=config.GUILD_ID))
+    async def sync_commands_cmd(self, inter: discord.Interaction):
+        if not can_use_reload(inter.user):
+            await inter.response.send_message(
+                "❌ 你需要 `Manage Server` 權限或 helpers role 先可以使用 `/sync_commands`。",
+                ephemeral=True,
+            )
+            return
+
+        await inter.response.defer(ephemeral=True, thinking=True)
+
+        try:
+            await sync_command_tree(
+                self.bot.tree,
+                application_id=self.bot.application_id,
+                guild_id=getattr(config, "GUILD_ID", None),
+                state_path=COMMAND_SYNC_STATE_PATH,
+                force=True,
+            )
+        except Exception as exc:
+            await inter.followup.send(f"❌ 同步失敗：{type(exc).__name__}: {exc}", ephemeral=True)
+            return
+
+        await inter.followup.send("✅ Slash 指令已強制同步。", ephemeral=True)
+
+    @app_commands.command(name="boot_report", description="查看最近幾次啟動各階段用時（Admin/Helper）")
+    @app_commands.guilds(discord.Object(id=config.GUILD_ID))
+    @app_commands.describe(count=f"顯示最近幾次啟動（1-{BOOT_REPORT_MAX_COUNT}，預設 5）")
+    async def boot_report_cmd(
+        self,
+        inter: discord.Interaction,
+        count: app_commands.Range[int, 1, BOOT_REPORT_MAX_COUNT] = 5,
+    ):
+        if not can_use_reload(inter.user):
+            await inter.response.send_message(
+                "❌ 你需要 `Manage Server` 權限或 helpers role 先可以使用 `/boot_report`。",
+                ephemeral=True,
+            )
+            return
+
+        # 多讀一筆，等最舊嗰次都有 delta 可以比較
+        reports = load_boot_reports(BOOT_REPORTS_PATH, count + 1)
+        lines = format_boot_reports(reports, limit=count)
+
+        if not lines:
+            await inter.response.send_message("⚠️ 暫時未有啟動紀錄。", ephemeral=True)
+            return
+
+        embed = discord.Embed(
+            title="🚀 Boot Report",
+            description="\n".join(lines)[:4000],
+            color=0x5865F2,
+        )
+        embed.set_footer(text="括號內係同上一次啟動比較（秒）")
+        await inter.response.send_message(embed=embed, ephemeral=True)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(Reload(bot))
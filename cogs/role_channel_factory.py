@@ -8,10 +8,19 @@
 #   * Read-only access to ALL older version roles
 # - @everyone is NEVER touched at channel level
 
+import asyncio
+import logging
+import time
+from collections.abc import Collection
+from dataclasses import dataclass
+
 import discord
 from discord.ext import commands
 from discord import app_commands
 
+# Admin-only and rarely used: load after on_ready (see core.extension_loader)
+EXTENSION_LAZY = True
+
 SUPPORTED_TYPES = (
     discord.ChannelType.text,
     discord.ChannelType.forum,
@@ -28,6 +37,111 @@ READ_ONLY = discord.PermissionOverwrite(
     # read_message_history is inherited from category (EA FC Player)
 )
 
+log = logging.getLogger("con9sole-bartender.role-channel-factory")
+
+BATCH_CONCURRENCY = 3
+BATCH_MAX_ITEMS = 10
+
+
+@dataclass
+class VersionResult:
+    role_name: str
+    channel: discord.abc.GuildChannel | None = None
+    role: discord.Role | None = None
+    error: str | None = None
+    elapsed: float = 0.0
+
+
+def find_sample_role(source_channel: discord.abc.GuildChannel) -> discord.Role:
+    """Return the ONE version role overwrite on the source channel."""
+    sample_role: discord.Role | None = None
+    for target in source_channel.overwrites:
+        if not isinstance(target, discord.Role):
+            continue
+        if target.is_default():
+            continue
+        if target.permissions.administrator:
+            continue
+        if sample_role is not None:
+            raise ValueError("Source channel must contain exactly ONE version role overwrite")
+        sample_role = target
+
+    if sample_role is None:
+        raise ValueError("No version role found in source channel")
+    return sample_role
+
+
+def is_legacy_version_role(role: discord.Role, sample_role: discord.Role) -> bool:
+    prefix = sample_role.name.split()[0]
+    return role != sample_role and not role.permissions.administrator and prefix in role.name
+
+
+def legacy_version_roles(
+    guild: discord.Guild,
+    sample_role: discord.Role,
+    *,
+    exclude: Collection[discord.Role] = (),
+) -> list[discord.Role]:
+    return [
+        role
+        for role in guild.roles
+        if role not in exclude and is_legacy_version_role(role, sample_role)
+    ]
+
+
+def build_version_overwrites(
+    base: dict[discord.abc.Snowflake, discord.PermissionOverwrite],
+    *,
+    sample_role: discord.Role,
+    new_role: discord.Role,
+    legacy_roles: list[discord.Role],
+) -> dict[discord.abc.Snowflake, discord.PermissionOverwrite]:
+    overwrites = dict(base)
+
+    # Full access for new version role (copied from sample)
+    overwrites[new_role] = base[sample_role]
+
+    # Read-only for ALL other legacy version roles
+    for role in legacy_roles:
+        if role == new_role:
+            continue
+        overwrites[role] = READ_ONLY
+
+    # Remove sample role overwrite
+    overwrites.pop(sample_role, None)
+
+    # NEVER touch @everyone
+    return overwrites
+
+
+def parse_version_names(raw: str) -> list[str]:
+    names: list[str] = []
+    for part in raw.split(","):
+        name = part.strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+async def clone_version_channel(
+    source_channel: discord.abc.GuildChannel,
+    *,
+    channel_name: str,
+    overwrites: dict[discord.abc.Snowflake, discord.PermissionOverwrite],
+) -> discord.abc.GuildChannel:
+    """Clone the source channel and apply version overwrites, rolling back on failure."""
+    new_channel = await source_channel.clone(
+        name=channel_name,
+        reason="Version upgrade: clone channel",
+    )
+    try:
+        await new_channel.edit(overwrites=overwrites)
+    except Exception:
+        await new_channel.delete(reason="Rollback: overwrite failure")
+        raise
+    return new_channel
+
+
 class RoleChannelFactory(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -60,27 +174,10 @@ class RoleChannelFactory(commands.Cog):
             return
 
         # Identify sample version role (exactly ONE)
-        sample_role: discord.Role | None = None
-        for target in source_channel.overwrites:
-            if not isinstance(target, discord.Role):
-                continue
-            if target.is_default():
-                continue
-            if target.permissions.administrator:
-                continue
-            if sample_role is not None:
-                await interaction.response.send_message(
-                    "❌ Source channel must contain exactly ONE version role overwrite",
-                    ephemeral=True,
-                )
-                return
-            sample_role = target
-
-        if sample_role is None:
-            await interaction.response.send_message(
-                "❌ No version role found in source channel",
-                ephemeral=True,
-            )
+        try:
+            sample_role = find_sample_role(source_channel)
+        except ValueError as e:
+            await interaction.response.send_message(f"❌ {e}", ephemeral=True)
             return
 
         # Ensure new role does not exist
@@ -103,54 +200,168 @@ class RoleChannelFactory(commands.Cog):
             await interaction.followup.send(f"❌ Failed to create role: {e}")
             return
 
-        # ---------- Clone channel ----------
+        # ---------- Clone channel + overwrites ----------
         channel_name = new_channel_name or f"{source_channel.name}_temp"
+        overwrites = build_version_overwrites(
+            source_channel.overwrites,
+            sample_role=sample_role,
+            new_role=new_role,
+            legacy_roles=legacy_version_roles(guild, sample_role),
+        )
         try:
-            new_channel = await source_channel.clone(
-                name=channel_name,
-                reason="Version upgrade: clone channel",
+            new_channel = await clone_version_channel(
+                source_channel,
+                channel_name=channel_name,
+                overwrites=overwrites,
             )
         except Exception as e:
             await new_role.delete(reason="Rollback: channel clone failed")
             await interaction.followup.send(f"❌ Failed to clone channel: {e}")
             return
 
-        # ---------- Build overwrites ----------
-        try:
-            overwrites = new_channel.overwrites
+        # ---------- Success ----------
+        await interaction.followup.send(
+            f"✅ New version channel created: {new_channel.mention}\n"
+            f"➕ New role created: `{new_role.name}`\n"
+            f"🔒 Legacy versions set to read-only"
+        )
 
-            # Full access for new version role (copied from sample)
-            overwrites[new_role] = overwrites[sample_role]
+    @app_commands.command(
+        name="role_channel_batch",
+        description="Clone a versioned channel for several new version roles at once",
+    )
+    @app_commands.describe(
+        source_channel="Sample version channel",
+        new_role_names="Comma-separated new version role names, oldest first",
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def role_channel_batch(
+        self,
+        interaction: discord.Interaction,
+        source_channel: discord.abc.GuildChannel,
+        new_role_names: str,
+    ):
+        guild = interaction.guild
 
-            # Read-only for ALL other legacy version roles
-            prefix = sample_role.name.split()[0]
-            for role in guild.roles:
-                if role == new_role or role == sample_role:
-                    continue
-                if role.permissions.administrator:
-                    continue
-                if prefix not in role.name:
-                    continue
-                overwrites[role] = READ_ONLY
+        # ---------- Validation ----------
+        if source_channel.type not in SUPPORTED_TYPES:
+            await interaction.response.send_message(
+                "❌ Unsupported channel type",
+                ephemeral=True,
+            )
+            return
 
-            # Remove sample role overwrite
-            overwrites.pop(sample_role, None)
+        names = parse_version_names(new_role_names)
+        if not names:
+            await interaction.response.send_message("❌ No role names given", ephemeral=True)
+            return
+        if len(names) > BATCH_MAX_ITEMS:
+            await interaction.response.send_message(
+                f"❌ At most {BATCH_MAX_ITEMS} versions per batch",
+                ephemeral=True,
+            )
+            return
 
-            # NEVER touch @everyone
+        existing = [name for name in names if discord.utils.get(guild.roles, name=name)]
+        if existing:
+            await interaction.response.send_message(
+                "❌ Role already exists: " + ", ".join(f"`{name}`" for name in existing),
+                ephemeral=True,
+            )
+            return
 
-            await new_channel.edit(overwrites=overwrites)
-        except Exception as e:
-            await new_channel.delete(reason="Rollback: overwrite failure")
-            await new_role.delete(reason="Rollback: overwrite failure")
-            await interaction.followup.send(f"❌ Failed to apply permissions: {e}")
+        try:
+            sample_role = find_sample_role(source_channel)
+        except ValueError as e:
+            await interaction.response.send_message(f"❌ {e}", ephemeral=True)
             return
 
-        # ---------- Success ----------
-        await interaction.followup.send(
-            f"✅ New version channel created: {new_channel.mention}\n"
-            f"➕ New role created: `{new_role.name}`\n"
-            f"🔒 Legacy versions set to read-only"
-        )
+        await interaction.response.defer(ephemeral=True)
+
+        # Source overwrites are read ONCE for the whole batch
+        base_overwrites = source_channel.overwrites
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        results = [VersionResult(role_name=name) for name in names]
+
+        # ---------- Phase 1: create roles ----------
+        async def create_role(result: VersionResult) -> None:
+            started = time.perf_counter()
+            async with semaphore:
+                try:
+                    result.role = await guild.create_role(
+                        name=result.role_name,
+                        reason="Version upgrade: create new version role",
+                    )
+                except Exception as e:
+                    result.error = f"Failed to create role: {e}"
+            result.elapsed += time.perf_counter() - started
+
+        await asyncio.gather(*(create_role(result) for result in results))
+
+        # Legacy roles are walked after phase 1; batch roles are left out here
+        # and only added to LATER channels below, so an older version never
+        # gets an overwrite for a newer one.
+        batch_roles = [result.role for result in results if result.role is not None]
+        legacy_roles = legacy_version_roles(guild, sample_role, exclude=batch_roles)
+
+        # ---------- Phase 2: clone channels ----------
+        # Earlier versions in the batch become read-only in later channels,
+        # exactly as if the single command had been run in order.
+        async def create_channel(index: int, result: VersionResult) -> None:
+            if result.role is None:
+                return
+            started = time.perf_counter()
+            async with semaphore:
+                # Read after the semaphore so items that already failed are skipped
+                earlier_roles = [
+                    r.role
+                    for r in results[:index]
+                    if r.role is not None
+                    and r.error is None
+                    and is_legacy_version_role(r.role, sample_role)
+                ]
+                overwrites = build_version_overwrites(
+                    base_overwrites,
+                    sample_role=sample_role,
+                    new_role=result.role,
+                    legacy_roles=legacy_roles + earlier_roles,
+                )
+                try:
+                    result.channel = await clone_version_channel(
+                        source_channel,
+                        channel_name=result.role_name.lower().replace(" ", "-"),
+                        overwrites=overwrites,
+                    )
+                except Exception as e:
+                    result.error = f"Failed to clone channel: {e}"
+            result.elapsed += time.perf_counter() - started
+
+        await asyncio.gather(*(create_channel(i, r) for i, r in enumerate(results)))
+
+        # ---------- Rollback ----------
+        # Roles of failed items are deleted only after every clone has finished,
+        # so no in-flight clone can carry an overwrite for a deleted role.
+        for result in results:
+            if result.role is None or result.error is None:
+                continue
+            try:
+                await result.role.delete(reason="Rollback: channel clone failed")
+            except Exception:
+                log.warning("Rollback failed: could not delete role %s", result.role_name, exc_info=True)
+            result.role = None
+
+        # ---------- Summary ----------
+        lines = []
+        for result in results:
+            if result.error is None and result.channel is not None:
+                lines.append(
+                    f"✅ `{result.role_name}` → {result.channel.mention} ({result.elapsed:.2f}s)"
+                )
+            else:
+                lines.append(f"❌ `{result.role_name}`: {result.error} ({result.elapsed:.2f}s)")
+        succeeded = sum(1 for result in results if result.error is None)
+        lines.append(f"\n{succeeded}/{len(results)} versions created; legacy versions set to read-only")
+        await interaction.followup.send("\n".join(lines))
 
 
 async def setup(bot: commands.Bot):
@@ -9,7 +9,7 @@ import discord
 from discord.ext import commands
 
 from features.menu_embeds import build_main_menu_embed
-from features.menu_views import MainMenuView
+from features.menu_views import menu_view
 
 log = logging.getLogger("con9sole-bartender.teams")
 
@@ -227,7 +227,7 @@ class CancelledTeamView(discord.ui.View):
         try:
             await interaction.response.send_message(
                 embed=build_main_menu_embed(interaction.user),
-                view=MainMenuView(menu_cog),
+                view=menu_view("home", cog=menu_cog),
                 ephemeral=True,
             )
         except Exception:
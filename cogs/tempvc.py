@@ -23,10 +23,15 @@ from features.tempvc_settings import (
     get_vc_limit_max,
     get_vc_limit_min,
     get_vc_limit_user_cooldown_seconds,
-    next_temp_channel_name,
     normalize_limit,
     parse_manual_limit,
 )
+from features.tempvc_names import TEMP_VC_NAMES
+from features.tempvc_pool import TEMP_VC_POOL, pool_key
+from features.tempvc_queue import HubCreationQueue
+from features.tempvc_registry import TEMP_VC_REGISTRY
+from features.voice_sessions import VOICE_LEDGER, build_voice_rollup, build_voice_stats_embed
+from features.voice_transitions import TRANSITION_LOG_STYLE, classify_voice_update
 from utils import (
     emb,
     send_log,
@@ -36,9 +41,6 @@ from utils import (
     clear_delete_task,
     cancel_delete_task,
     cancel_all_delete_tasks,
-    track_temp_vc,
-    untrack_temp_vc,
-    bootstrap_track_temp_vcs,
 )
 
 log = logging.getLogger("con9sole-bartender.tempvc")
@@ -164,10 +166,9 @@ def _is_hub_channel(channel: Optional[discord.abc.GuildChannel]) -> bool:
     return channel.name.strip() == get_hub_channel_name()
 
 
-def _next_temp_channel_name_in_category(category: Optional[discord.CategoryChannel], guild: discord.Guild) -> str:
-    channels = category.channels if category else guild.channels
-    names = [channel.name for channel in channels if isinstance(channel, discord.VoiceChannel)]
-    return next_temp_channel_name(names)
+def _legacy_temp_vc_ids(guild: discord.Guild) -> list[int]:
+    prefixes = tuple(get_name_prefixes())
+    return [ch.id for ch in guild.voice_channels if ch.name and ch.name.startswith(prefixes)]
 
 
 async def schedule_delete_if_empty(channel: discord.VoiceChannel, *, force: bool = False) -> None:
@@ -200,7 +201,7 @@ async def schedule_delete_if_empty(channel: discord.VoiceChannel, *, force: bool
 
             if isinstance(fresh, discord.VoiceChannel) and len(fresh.members) == 0 and is_temp_vc_id(ch_id):
                 log.info("Deleting empty temp VC: channel=%s name=%s", ch_id, fresh.name)
-                untrack_temp_vc(ch_id)
+                TEMP_VC_REGISTRY.discard(ch_id)
                 try:
                     await fresh.delete(reason="Temp VC idle timeout")
                 except discord.Forbidden:
@@ -354,6 +355,7 @@ class TempVCLimitView(discord.ui.View):
                 self.category,
                 name=self.room_name,
                 limit=limit,
+                creator_id=interaction.user.id,
             )
         except discord.Forbidden:
             await interaction.followup.send("❌ 建立失敗：Bot 缺少 `Manage Channels` 權限。", ephemeral=True)
@@ -646,12 +648,31 @@ class TempVC(commands.Cog):
         self.bot = bot
         self._bootstrapped = False
         self._sweeper_task: Optional[asyncio.Task] = None
-        self._creating_for_members: set[int] = set()
+        self._hub_queue = HubCreationQueue(self._serve_hub_group)
 
-    def cog_unload(self) -> None:
+        profiler = getattr(bot, "boot_profiler", None)
+        if profiler is not None:
+            profiler.expect("tempvc_bootstrap")
+
+    async def cog_load(self) -> None:
+        # /reload 之後唔會再有 on_ready；bot 已經 ready 就即刻重新 bootstrap
+        if self.bot.is_ready():
+            await self._bootstrap()
+
+    async def cog_unload(self) -> None:
         if self._sweeper_task and not self._sweeper_task.done():
             self._sweeper_task.cancel()
         cancel_all_delete_tasks()
+        # unload 期間收唔到 channel event，reload 後由 cache 重新 seed
+        TEMP_VC_NAMES.reset()
+        TEMP_VC_POOL.reset()
+        self._hub_queue.cancel_all()
+        await VOICE_LEDGER.stop()
+        # unload 之後收唔到 voice event；仲開住嘅 session 而家收咗，reload 後 bootstrap 會重新開
+        try:
+            await asyncio.to_thread(VOICE_LEDGER.close_open_sessions)
+        except Exception:
+            log.exception("Failed to close voice sessions on unload")
 
     async def menu_entry(self, interaction: discord.Interaction) -> None:
         """Unified entrypoint for data/menu_registry.py."""
@@ -694,40 +715,47 @@ class TempVC(commands.Cog):
         *,
         name: Optional[str] = None,
         limit: Optional[int] = None,
+        creator_id: Optional[int] = None,
     ) -> discord.VoiceChannel:
         base = get_temp_channel_base_name()
-        vc_name = f"{base} {name.strip()}" if name and name.strip() else _next_temp_channel_name_in_category(category, guild)
+        number: Optional[int] = None
+        if name and name.strip():
+            vc_name = f"{base} {name.strip()}"
+        else:
+            vc_name, number = TEMP_VC_NAMES.reserve_name(guild, category)
 
         kwargs: Dict[str, object] = {"bitrate": guild.bitrate_limit}
         kwargs["user_limit"] = normalize_limit(limit, default=32)
 
-        ch = await guild.create_voice_channel(
-            vc_name,
-            category=category,
-            reason="Create temp VC (bartender)",
-            **kwargs,
-        )
-        track_temp_vc(ch.id)
+        try:
+            ch = await guild.create_voice_channel(
+                vc_name,
+                category=category,
+                reason="Create temp VC (bartender)",
+                **kwargs,
+            )
+        except BaseException:
+            if number is not None:
+                TEMP_VC_NAMES.cancel(guild, category, number)
+            raise
+        TEMP_VC_NAMES.on_channel_create(ch)
+        TEMP_VC_REGISTRY.add(ch.id, guild_id=guild.id, creator_id=creator_id, user_limit=ch.user_limit or None)
+        VOICE_LEDGER.record_temp_vc_created(ch.id, guild_id=guild.id, hub_id=None, creator_id=creator_id)
         log.info("Created temp VC: channel=%s name=%s category=%s", ch.id, ch.name, category.id if category else None)
         await schedule_delete_if_empty(ch, force=False)
         return ch
 
     async def _teardown_temp_vc(self, target: discord.VoiceChannel) -> None:
-        untrack_temp_vc(target.id)
+        TEMP_VC_REGISTRY.discard(target.id)
         cancel_delete_task(target.id)
         log.info("Deleting temp VC manually: channel=%s name=%s", target.id, target.name)
         await target.delete(reason="Manual teardown temp VC")
 
     async def get_all_temp_vcs(self, guild: discord.Guild) -> list[discord.VoiceChannel]:
-        try:
-            await bootstrap_track_temp_vcs(guild, name_prefixes=get_name_prefixes())
-        except Exception:
-            log.exception("Failed to bootstrap temp VC admin list")
-
         channels = [
             ch
-            for ch in guild.voice_channels
-            if isinstance(ch, discord.VoiceChannel) and is_temp_vc_id(ch.id)
+            for ch in map(guild.get_channel, TEMP_VC_REGISTRY.channel_ids(guild.id))
+            if isinstance(ch, discord.VoiceChannel)
         ]
         return sorted(channels, key=_channel_sort_key)
 
@@ -894,29 +922,64 @@ class TempVC(commands.Cog):
     ) -> Optional[discord.VoiceChannel]:
         guild = member.guild
         category = source_channel.category
-        vc_name = _next_temp_channel_name_in_category(category, guild)
+        # 同步預留號碼，同一時間多人入 hub 都唔會撞名
+        vc_name, number = TEMP_VC_NAMES.reserve_name(guild, category)
         kwargs: Dict[str, object] = {"bitrate": guild.bitrate_limit}
 
         default_limit = get_auto_vc_user_limit()
         if default_limit is not None:
             kwargs["user_limit"] = default_limit
 
+        if TEMP_VC_POOL.enabled():
+            TEMP_VC_POOL.record_join(pool_key(guild, category))
+            TEMP_VC_POOL.watch(guild, category)
+
+        ch: Optional[discord.VoiceChannel] = None
+        pooled = TEMP_VC_POOL.take(guild, category)
+        if pooled is not None:
+            try:
+                ch = await TEMP_VC_POOL.claim(
+                    pooled,
+                    name=vc_name,
+                    creator_id=member.id,
+                    user_limit=default_limit,
+                    reason=f"Claim pooled temp VC for {member} via hub channel",
+                )
+            except discord.HTTPException:
+                log.warning("Failed to claim pooled temp VC; creating a new one: channel=%s", pooled.id, exc_info=True)
+                # take() 已經攞咗出 pool，唔處理就會一直收埋喺度
+                await TEMP_VC_POOL.scrap(guild, pooled)
+
         try:
-            ch = await guild.create_voice_channel(
-                vc_name,
-                category=category,
-                reason=f"Auto create temp VC for {member} via hub channel",
-                **kwargs,
-            )
+            if ch is None:
+                ch = await guild.create_voice_channel(
+                    vc_name,
+                    category=category,
+                    reason=f"Auto create temp VC for {member} via hub channel",
+                    **kwargs,
+                )
+                TEMP_VC_REGISTRY.add(ch.id, guild_id=guild.id, creator_id=member.id, user_limit=default_limit)
         except discord.Forbidden:
+            TEMP_VC_NAMES.cancel(guild, category, number)
             log.error("Missing permission to create automatic temp VC: member=%s", member.id)
             return None
         except Exception:
+            TEMP_VC_NAMES.cancel(guild, category, number)
             log.exception("Failed to create automatic temp VC: member=%s", member.id)
             return None
+        except asyncio.CancelledError:
+            TEMP_VC_NAMES.cancel(guild, category, number)
+            raise
 
-        track_temp_vc(ch.id)
-        log.info("Created automatic temp VC: channel=%s member=%s hub=%s", ch.id, member.id, source_channel.id)
+        TEMP_VC_NAMES.on_channel_create(ch)
+        VOICE_LEDGER.record_temp_vc_created(ch.id, guild_id=guild.id, hub_id=source_channel.id, creator_id=member.id)
+        log.info(
+            "Created automatic temp VC: channel=%s member=%s hub=%s pooled=%s",
+            ch.id,
+            member.id,
+            source_channel.id,
+            pooled is not None and pooled.id == ch.id,
+        )
 
         try:
             await member.move_to(ch, reason="Moved to newly auto-created temp VC")
@@ -934,30 +997,44 @@ class TempVC(commands.Cog):
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
+        await self._bootstrap()
+
+    async def _bootstrap(self) -> None:
         if self._bootstrapped:
             return
 
         self._bootstrapped = True
+        bootstrap_started = time.perf_counter()
 
+        TEMP_VC_REGISTRY.load()
+        await self._bootstrap_voice_ledger()
         for guild in self.bot.guilds:
             try:
-                ids = await bootstrap_track_temp_vcs(guild, name_prefixes=get_name_prefixes())
-                for cid in ids:
+                # 以 registry 為準；名稱前綴掃描只喺每個 guild 第一次啟動時做一次
+                TEMP_VC_REGISTRY.reconcile(
+                    guild.id,
+                    existing_channel_ids=[ch.id for ch in guild.voice_channels],
+                    legacy_channel_ids=_legacy_temp_vc_ids(guild) if TEMP_VC_REGISTRY.needs_reconcile(guild.id) else (),
+                )
+                for cid in TEMP_VC_REGISTRY.channel_ids(guild.id):
                     ch = guild.get_channel(cid)
-                    if ch is None:
-                        try:
-                            ch = await guild.fetch_channel(cid)
-                        except discord.NotFound:
-                            continue
-                        except Exception:
-                            log.exception("Failed to fetch temp VC during bootstrap: channel=%s", cid)
-                            continue
-
-                    if isinstance(ch, discord.VoiceChannel) and is_temp_vc_id(ch.id):
+                    if isinstance(ch, discord.VoiceChannel):
                         await schedule_delete_if_empty(ch, force=True)
             except Exception:
                 log.exception("Temp VC bootstrap failed: guild=%s", guild.id)
 
+            if TEMP_VC_POOL.enabled():
+                TEMP_VC_POOL.adopt(guild)
+                for hub in guild.voice_channels:
+                    if _is_hub_channel(hub):
+                        TEMP_VC_POOL.watch(guild, hub.category)
+
+        profiler = getattr(self.bot, "boot_profiler", None)
+        if profiler is not None:
+            profiler.record("tempvc_bootstrap", time.perf_counter() - bootstrap_started)
+
+        TEMP_VC_POOL.start(self.bot)
+
         interval = get_sweep_interval_seconds()
         if interval > 0:
             self._sweeper_task = asyncio.create_task(self._sweeper_loop(interval))
@@ -965,6 +1042,25 @@ class TempVC(commands.Cog):
         else:
             log.info("Temp VC safety sweeper disabled")
 
+    async def _bootstrap_voice_ledger(self) -> None:
+        # 重啟時已經喺語音房嘅人，由而家開始計。要喺 await 之前排隊，
+        # 期間有人入 / 出房，record_transition 嘅 op 先會排喺後面，唔會重複開 session
+        for guild in self.bot.guilds:
+            for channel in guild.voice_channels:
+                for member in channel.members:
+                    if not member.bot:
+                        VOICE_LEDGER.open_session(guild.id, member.id, channel.id, is_temp_vc=is_temp_vc_id(channel.id))
+
+        # 只會改 DB 入面嘅舊 session；上面排緊隊嘅 op 要等 worker 起咗先寫入
+        try:
+            closed = await asyncio.to_thread(VOICE_LEDGER.close_open_sessions)
+        except Exception:
+            log.exception("Failed to close voice sessions left open by the last run")
+            closed = 0
+        if closed:
+            log.info("Closed voice sessions left open by the last run: sessions=%s", closed)
+        VOICE_LEDGER.start()
+
     async def _sweeper_loop(self, interval: float) -> None:
         await self.bot.wait_until_ready()
 
@@ -973,18 +1069,14 @@ class TempVC(commands.Cog):
                 await asyncio.sleep(interval)
                 for guild in self.bot.guilds:
                     try:
-                        ids = await bootstrap_track_temp_vcs(guild, name_prefixes=get_name_prefixes())
-                        for cid in ids:
+                        for cid in TEMP_VC_REGISTRY.channel_ids(guild.id):
                             ch = guild.get_channel(cid)
                             if ch is None:
-                                try:
-                                    ch = await guild.fetch_channel(cid)
-                                except discord.NotFound:
-                                    continue
-                                except Exception:
-                                    continue
-
-                            if isinstance(ch, discord.VoiceChannel) and is_temp_vc_id(ch.id) and len(ch.members) == 0:
+                                # 錯過咗 delete event（例如斷線期間）就喺度補返
+                                TEMP_VC_REGISTRY.discard(cid)
+                                continue
+
+                            if isinstance(ch, discord.VoiceChannel) and len(ch.members) == 0:
                                 await schedule_delete_if_empty(ch, force=True)
                     except Exception:
                         log.exception("Temp VC sweep failed: guild=%s", guild.id)
@@ -993,6 +1085,24 @@ class TempVC(commands.Cog):
             except Exception:
                 log.exception("Temp VC sweeper loop failed")
 
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        TEMP_VC_NAMES.on_channel_create(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel) -> None:
+        TEMP_VC_NAMES.on_channel_update(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        TEMP_VC_NAMES.on_channel_delete(channel)
+        TEMP_VC_POOL.forget(channel.id)
+        if isinstance(channel, discord.VoiceChannel):
+            VOICE_LEDGER.record_temp_vc_deleted(channel.id)
+        if TEMP_VC_REGISTRY.discard(channel.id) is not None:
+            cancel_delete_task(channel.id)
+            log.info("Temp VC deleted: channel=%s", channel.id)
+
     @commands.Cog.listener()
     async def on_voice_state_update(
         self,
@@ -1003,14 +1113,21 @@ class TempVC(commands.Cog):
         if member.bot:
             return
 
-        if before.channel != after.channel:
-            mtxt = await mention_or_id(member.guild, member)
-            if not before.channel and after.channel:
-                await send_log(member.guild, emb("Voice Join", f"{mtxt} {voice_arrow(before.channel, after.channel)}", 0x57F287))
-            elif before.channel and not after.channel:
-                await send_log(member.guild, emb("Voice Leave", f"{mtxt} {voice_arrow(before.channel, after.channel)}", 0xED4245))
-            else:
-                await send_log(member.guild, emb("Voice Move", f"{mtxt} {voice_arrow(before.channel, after.channel)}", 0x5865F2))
+        transition = classify_voice_update(before.channel, after.channel)
+        if transition == "in_place":
+            # 靜音 / 拒聽 / 開 stream 等唔涉及轉房，唔使重設刪除計時，亦唔使寫 audit log
+            return
+
+        VOICE_LEDGER.record_transition(
+            member,
+            before.channel,
+            after.channel,
+            after_is_temp_vc=after.channel is not None and is_temp_vc_id(after.channel.id),
+        )
+
+        title, color = TRANSITION_LOG_STYLE[transition]
+        mtxt = await mention_or_id(member.guild, member)
+        await send_log(member.guild, emb(title, f"{mtxt} {voice_arrow(before.channel, after.channel)}", color))
 
         if before.channel and is_temp_vc_id(before.channel.id):
             await schedule_delete_if_empty(before.channel, force=True)
@@ -1018,22 +1135,25 @@ class TempVC(commands.Cog):
         if after.channel and is_temp_vc_id(after.channel.id):
             cancel_delete_task(after.channel.id)
 
-        if (
-            after.channel
-            and _is_hub_channel(after.channel)
-            and before.channel != after.channel
-            and member.id not in self._creating_for_members
-        ):
-            self._creating_for_members.add(member.id)
+        if after.channel and _is_hub_channel(after.channel):
+            # 排隊開房：每個伺服器有上限咁多個同時建立，先到先得
+            self._hub_queue.submit(member, after.channel)
+
+    async def _serve_hub_group(self, members: list[discord.Member], hub: discord.VoiceChannel) -> None:
+        created = await self._create_temp_vc_for_member(members[0], hub)
+        if created is not None:
+            for companion in members[1:]:
+                try:
+                    await companion.move_to(created, reason="Grouped into auto-created temp VC")
+                except Exception:
+                    log.warning("Failed to move grouped member into temp VC: member=%s channel=%s", companion.id, created.id)
+            return
+
+        for member in members:
             try:
-                created = await self._create_temp_vc_for_member(member, after.channel)
-                if created is None:
-                    try:
-                        await member.send("我剛剛想幫你開臨時語音房，但建立失敗。請通知管理員檢查 Bot 權限設定。")
-                    except Exception:
-                        log.debug("Could not DM member after temp VC creation failure: member=%s", member.id)
-            finally:
-                self._creating_for_members.discard(member.id)
+                await member.send("我剛剛想幫你開臨時語音房，但建立失敗。請通知管理員檢查 Bot 權限設定。")
+            except Exception:
+                log.debug("Could not DM member after temp VC creation failure: member=%s", member.id)
 
     @app_commands.command(name="vc_new", description="建立一個臨時語音房（空房 120 秒自動刪除）")
     @app_commands.guilds(discord.Object(id=config.GUILD_ID))
@@ -1051,7 +1171,13 @@ class TempVC(commands.Cog):
         await inter.response.defer(ephemeral=False)
 
         final_limit = normalize_limit(limit, default=32)
-        ch = await self._create_manual_temp_vc(inter.guild, category, name=name, limit=final_limit)
+        ch = await self._create_manual_temp_vc(
+            inter.guild,
+            category,
+            name=name,
+            limit=final_limit,
+            creator_id=inter.user.id,
+        )
         await inter.followup.send(_build_created_message(ch, final_limit), view=TempVCControlView(self, channel_id=ch.id))
 
     @app_commands.command(name="vc_teardown", description="Admin/Helper：選擇並刪除由 Bot 建立的臨時語音房")
@@ -1059,6 +1185,24 @@ class TempVC(commands.Cog):
     async def vc_teardown(self, inter: discord.Interaction) -> None:
         await self.open_admin_teardown_panel(inter)
 
+    @app_commands.command(name="vc_stats", description="Admin/Helper：查看語音房使用數據")
+    @app_commands.guilds(discord.Object(id=config.GUILD_ID))
+    @app_commands.describe(days="統計最近幾多日（預設 7）")
+    async def vc_stats(self, inter: discord.Interaction, days: app_commands.Range[int, 1, 90] = 7) -> None:
+        if not inter.guild or not isinstance(inter.user, discord.Member) or not user_can_admin_teardown(inter.user):
+            await inter.response.send_message("❌ 你需要 Admin / Helper / Manage Channels 權限先可以使用。", ephemeral=True)
+            return
+
+        await inter.response.defer(ephemeral=True)
+        # 先寫低未 flush 嘅事件，統計先會包埋最近幾秒
+        await VOICE_LEDGER.flush()
+        rollup = await asyncio.to_thread(
+            build_voice_rollup,
+            inter.guild.id,
+            since=time.time() - days * 86400,
+        )
+        await inter.followup.send(embed=build_voice_stats_embed(rollup, guild=inter.guild, days=days), ephemeral=True)
+
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(TempVC(bot))
@@ -1,16 +1,37 @@
 # cogs/twitch_relay.py — Unified Twitch Bot (Auto-Reconnect + de-dup + loopback-safe)
 
-import os, json, asyncio, logging, time, aiohttp
+import os, json, asyncio, logging, time
 from typing import Dict, Tuple, Optional, Union
 
 import discord
+from discord import app_commands
 from discord.ext import commands
 from discord.abc import Messageable
 from discord import TextChannel, VoiceChannel, StageChannel
 from twitchio.ext import commands as twitch_commands
 
+import config
+from core.message_router import get_message_router
+from core.metrics import METRICS
+from core.permissions import is_admin_or_helper
+from features.twitch_channels import TwitchJoinScheduler
+from features.twitch_coalesce import DiscordCoalescer
+from features.twitch_metrics import (
+    D2T,
+    DEDUPED,
+    METRIC_PREFIX,
+    RECEIVED,
+    T2D,
+    build_relay_stats_embed,
+    count,
+)
+from features.twitch_outbound import TwitchOutbound
+
 log = logging.getLogger("twitch-relay")
 
+# 冇 TWITCH_BOT_OAUTH 就唔載入（連 twitchio 都唔 import），見 core.extension_loader
+EXTENSION_REQUIRED_ENV = ("TWITCH_BOT_OAUTH",)
+
 # ---------- Load secrets ----------
 BOT_USERNAME = os.getenv("TWITCH_BOT_USERNAME", "").strip()
 BOT_OAUTH    = os.getenv("TWITCH_BOT_OAUTH", "").strip()
@@ -24,6 +45,8 @@ except Exception as e:
     log.error("❌ 讀取 TWITCH_RELAY_CONFIG 失敗：%s", e)
     RELAY_CONFIG = []
 
+ROUTER_OWNER = "twitch_relay"
+
 TAG_TWITCH  = "[Twitch]"
 TAG_DISCORD = "[Discord]"
 
@@ -81,6 +104,12 @@ class TwitchRelay(commands.Cog):
         self._connect_task: Optional[asyncio.Task] = None
         self.d2t_map: Dict[int, str] = {}
         self.t2d_map: Dict[str, int] = {}
+        # Discord → Twitch 排隊發送；重連 / join 都喺 worker 做，唔會卡住 Discord listener
+        # 已 join 頻道 index + 分批 join（唔好一次過 join 晒爆 rate limit）
+        self.joins = TwitchJoinScheduler(lambda: self.twitch_bot)
+        self.outbound = TwitchOutbound(lambda: self.twitch_bot, self.joins)
+        # Twitch → Discord 短時間內嘅 chat 合併成一條，避開 Discord 5 條 / 5 秒限制
+        self.coalescer = DiscordCoalescer(lambda channel_id: _safe_get_messageable_channel(self.bot, channel_id))
 
         for i, e in enumerate(RELAY_CONFIG, start=1):
             try:
@@ -105,66 +134,29 @@ class TwitchRelay(commands.Cog):
         class _UnifiedTwitchBot(twitch_commands.Bot):
             async def event_ready(self_inner):
                 log.info("🟣 [T] Connected as %s", self_inner.nick)
-                try:
-                    await self_inner.join_channels(initial)
-                    log.info("🔁 確認 join_channels：%s", ",".join(initial))
-                except Exception as e:
-                    log.warning("⚠️ join_channels 失敗：%s", e)
+                self.joins.on_ready(initial)
 
-            async def event_message(self_inner, message):
-                if getattr(message, "echo", False):
-                    return
-                try:
-                    if (message.author and message.author.name and self_inner.nick and
-                            message.author.name.lower() == self_inner.nick.lower()):
-                        return
-                except Exception:
-                    pass
-
-                text = _norm_text(message.content or "")
-                if text.startswith(TAG_DISCORD):
-                    return
+            async def event_channel_joined(self_inner, channel):
+                self.joins.on_joined(channel)
 
-                try:
-                    ch_name = (getattr(message.channel, "name", "") or "").lower()
-                except Exception:
-                    ch_name = ""
-                if ch_name not in self.t2d_map:
-                    return
+            async def event_channel_join_failure(self_inner, channel):
+                self.joins.on_join_failed(channel)
 
-                msg_id = None
+            async def event_part(self_inner, user):
                 try:
-                    tags = getattr(message, "tags", {}) or {}
-                    msg_id = str(tags.get("id")) if "id" in tags else None
+                    if not (user.name and self_inner.nick and user.name.lower() == self_inner.nick.lower()):
+                        return
+                    self.joins.on_parted(user.channel.name)
                 except Exception:
-                    msg_id = None
-                if _seen_recent_tw(msg_id or f"{ch_name}:{message.author.name}:{text}"):
-                    log.info("⏩ [T→D] duplicate skipped (tw)")
-                    return
-
-                dch_id = self.t2d_map.get(ch_name)
-                dch = await _safe_get_messageable_channel(self.bot, dch_id)
-                if not dch:
-                    log.error("❌ [T→D] 找不到 Discord 頻道 id=%s", dch_id)
-                    return
-
-                author = message.author.display_name or message.author.name
-                content = f"{TAG_TWITCH} {author}: {text}"
+                    log.debug("Could not handle Twitch part event", exc_info=True)
 
-                if _seen_recent_td(dch_id, content):
-                    log.info("⏩ [T→D] duplicate skipped (td)")
-                    return
-
-                try:
-                    await dch.send(content)
-                    log.info("✅ [T→D] -> %s(id=%s): %s", getattr(dch, 'name', 'unknown'), dch_id, content)
-                except Exception as e:
-                    log.exception("❌ [T→D] send 失敗：%s", e)
+            async def event_message(self_inner, message):
+                await self._twitch_to_discord(message, self_inner.nick)
 
         self.twitch_bot = _UnifiedTwitchBot(
             token=BOT_OAUTH,
             prefix="!",
-            initial_channels=initial or None
+            initial_channels=None,  # 由 event_ready 交俾 join scheduler 分批 join
         )
 
         self._connect_task = asyncio.create_task(self.twitch_bot.connect())
@@ -187,6 +179,14 @@ class TwitchRelay(commands.Cog):
 
     async def cog_unload(self) -> None:
         """Close Twitch and await background-task cleanup before a reload."""
+        router = get_message_router(self.bot)
+        if router is not None:
+            router.remove_channel_routes(ROUTER_OWNER)
+
+        self.outbound.stop()
+        self.coalescer.stop()
+        self.joins.stop()
+
         twitch_bot = self.twitch_bot
         self.twitch_bot = None
 
@@ -205,8 +205,61 @@ class TwitchRelay(commands.Cog):
             except asyncio.CancelledError:
                 pass
 
+    async def cog_load(self) -> None:
+        # 只有 relay 頻道嘅訊息先會交過嚟，唔再逐條 guild 訊息行 listener
+        router = get_message_router(self.bot)
+        if router is None:
+            log.warning("⚠️ 冇 message router，Discord → Twitch 唔會生效")
+            return
+        for channel_id in self.d2t_map:
+            router.add_channel_route(channel_id, ROUTER_OWNER, self._discord_to_twitch)
+
+    # ========== Twitch → Discord ==========
+    async def _twitch_to_discord(self, message, nick: Optional[str]):
+        if getattr(message, "echo", False):
+            return
+        try:
+            if (message.author and message.author.name and nick and
+                    message.author.name.lower() == nick.lower()):
+                return
+        except Exception:
+            pass
+
+        text = _norm_text(message.content or "")
+        if text.startswith(TAG_DISCORD):
+            return
+
+        try:
+            ch_name = (getattr(message.channel, "name", "") or "").lower()
+        except Exception:
+            ch_name = ""
+        if ch_name not in self.t2d_map:
+            return
+        count(T2D, RECEIVED)
+
+        msg_id = None
+        try:
+            tags = getattr(message, "tags", {}) or {}
+            msg_id = str(tags.get("id")) if "id" in tags else None
+        except Exception:
+            msg_id = None
+        if _seen_recent_tw(msg_id or f"{ch_name}:{message.author.name}:{text}"):
+            log.info("⏩ [T→D] duplicate skipped (tw)")
+            count(T2D, DEDUPED)
+            return
+
+        dch_id = self.t2d_map.get(ch_name)
+        author = message.author.display_name or message.author.name
+        content = f"{TAG_TWITCH} {author}: {text}"
+
+        if _seen_recent_td(dch_id, content):
+            log.info("⏩ [T→D] duplicate skipped (td)")
+            count(T2D, DEDUPED)
+            return
+
+        self.coalescer.submit(dch_id, content)
+
     # ========== Discord → Twitch ==========
-    @commands.Cog.listener("on_message")
     async def _discord_to_twitch(self, message: discord.Message):
         if message.author.bot or not message.guild or not message.content:
             return
@@ -216,11 +269,14 @@ class TwitchRelay(commands.Cog):
             return
 
         if message.content.startswith(TAG_TWITCH):
+            # relay 自己轉發過嚟嘅內容，唔好再送返去
+            count(D2T, DEDUPED)
             return
 
         text = _norm_text(message.content)
         if not text:
             return
+        count(D2T, RECEIVED)
 
         log.info("📥 [D→T recv] ch=%s(id=%s) | %s",
                  getattr(message.channel, 'name', 'unknown'),
@@ -231,36 +287,22 @@ class TwitchRelay(commands.Cog):
             return
 
         payload = f"{TAG_DISCORD} {message.author.name}: {text}"
+        self.outbound.submit(twitch_channel, payload)
+
+    # ========== Admin ==========
+    @app_commands.command(name="relay_stats", description="Admin/Helper：查看 Twitch relay 流量同延遲")
+    @app_commands.guilds(discord.Object(id=config.GUILD_ID))
+    async def relay_stats(self, inter: discord.Interaction):
+        if not is_admin_or_helper(inter.user):
+            await inter.response.send_message("❌ 只限 Admin / Helper 使用。", ephemeral=True)
+            return
 
-        try:
-            # 確保 WS 可用
-            ws = getattr(self.twitch_bot, "_websocket", None)
-            if ws is None or ws.closed or getattr(ws, "_closing", False):
-                log.warning("⚠️ [D→T] Twitch WS 關閉中，嘗試重連…")
-                await self.twitch_bot.connect()
-                await asyncio.sleep(2)
-
-            # 找對應 Twitch channel
-            chan = next((c for c in getattr(self.twitch_bot, "connected_channels", [])
-                         if getattr(c, "name", "").lower() == twitch_channel.lower()), None)
-            if chan is None:
-                await self.twitch_bot.join_channels([twitch_channel])
-                log.info("🔁 [D→T] join_channels -> #%s", twitch_channel)
-                await asyncio.sleep(1)
-                chan = next((c for c in getattr(self.twitch_bot, "connected_channels", [])
-                             if getattr(c, "name", "").lower() == twitch_channel.lower()), None)
-
-            if not chan:
-                log.error("❌ [D→T] 找不到 Twitch #%s（檢查 token 是否含 chat:edit）", twitch_channel)
-                return
-
-            await chan.send(payload)
-            log.info("✅ [D→T send] #%s | %s", twitch_channel, payload)
-
-        except aiohttp.client_exceptions.ClientConnectionResetError:
-            log.warning("⚠️ [D→T] Twitch 重連中，略過訊息。")
-        except Exception as e:
-            log.exception("❌ [D→T] send 失敗：%s", e)
+        embed = build_relay_stats_embed(
+            METRICS.snapshot(METRIC_PREFIX),
+            joined=len(self.joins.index),
+            configured=len(self.t2d_map),
+        )
+        await inter.response.send_message(embed=embed, ephemeral=True)
 
 
 async def _safe_get_messageable_channel(bot: commands.Bot, channel_id: int) -> Optional[Messageable]:
@@ -25,6 +25,15 @@ TEMP_VC_HUB_NAME: str = "開一個小隊 call"
 TEMP_VC_PREFIX: str = "小隊call •"   # 👈 有空格 + 點
 TEMP_VC_SWEEP_SECONDS: int = 300
 TEMP_VC_DEFAULT_USER_LIMIT: int = 32
+# 預先喺 hub 所在分區建立隱藏小隊 call，入 hub 時直接改名 + 搬人（0 = 關閉）
+TEMP_VC_POOL_SIZE: int = 0
+TEMP_VC_POOL_MAX: int = 4                  # 按最近入 hub 人數自動加大，但唔會超過呢個數
+TEMP_VC_POOL_RATE_WINDOW_SECONDS: int = 300
+TEMP_VC_POOL_REFILL_INTERVAL_SECONDS: float = 3.0  # 補房之間最少相隔，避開 channel create rate limit
+# 入 hub 開房排隊：每個伺服器同時最多幾多個建立中；同一瞬間入 hub 嘅人可以合併入同一間房（0 = 唔合併）
+TEMP_VC_HUB_CONCURRENCY: int = 2
+TEMP_VC_HUB_GROUP_WINDOW_SECONDS: float = 0
+TEMP_VC_HUB_GROUP_MAX: int = 0             # 0 = 跟房間人數上限
 
 VC_LIMIT_LEVEL_ROLE_IDS = {
     1322902894269435946,  # Lv 15 活躍會員
@@ -43,6 +52,20 @@ VC_LIMIT_CHANNEL_COOLDOWN_SECONDS = 30
 VC_LIMIT_MIN = 1
 VC_LIMIT_MAX = 99
 
+# 活動提醒：bot 停機期間錯過嘅提醒，重啟後喺呢段時間之內仍然會補發（0 = 唔補發）
+ACTIVITY_REMINDER_CATCH_UP_MINUTES: int = 10
+
+# Twitch relay（Discord → Twitch）：發送速度同排隊上限
+# 普通帳號 20 條 / 30 秒；bot 喺所有 relay 頻道都係 mod 先好調高到 100
+TWITCH_SEND_RATE: int = 20
+TWITCH_SEND_PER_SECONDS: float = 30.0
+TWITCH_SEND_QUEUE_MAX: int = 20            # 每個 Twitch 頻道最多排隊幾多條，爆咗就合併 / 丟最舊嗰條
+# Twitch join 頻道速度（普通帳號 20 個 / 10 秒），超過就分批慢慢 join
+TWITCH_JOIN_RATE: int = 20
+TWITCH_JOIN_PER_SECONDS: float = 10.0
+# Twitch → Discord：同一個 Discord 頻道喺呢段時間內收到嘅 chat 合併成一條訊息（最多 2000 字）
+TWITCH_RELAY_COALESCE_SECONDS: float = 1.0
+
 #social media link
 SOCIAL_INSTAGRAM_URL = "https://www.instagram.com/con9sole/"
 SOCIAL_THREADS_URL = "https://threads.net/con9sole"
@@ -58,5 +81,8 @@ INVITE_CHANNEL_ID: int = 1278976821710426133
 # Logging 頻道
 LOG_CHANNEL_ID: int = 1401346745346297966
 
+# 存放 bot 圖片素材嘅私人頻道（上傳一次，之後用 CDN URL）；None = 每次直接附上圖片
+ASSET_STORAGE_CHANNEL_ID: Optional[int] = None
+
 # Token（由環境變數注入）
 TOKEN = os.getenv("DISCORD_BOT_TOKEN")
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import logging
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import discord
+
+from core.json_storage import atomic_write_json, load_json_object
+
+
+log = logging.getLogger("con9sole-bartender.assets")
+
+# Discord CDN attachment URL 有簽名同 `ex=` 到期時間；到期前預留少少時間先刷新
+URL_REFRESH_MARGIN_SECONDS = 3600.0
+
+
+def cdn_url_expires_at(url: str) -> float | None:
+    """Return the expiry timestamp encoded in a signed Discord CDN URL, if any."""
+    values = parse_qs(urlparse(url).query).get("ex")
+    if not values:
+        return None
+    try:
+        return float(int(values[0], 16))
+    except ValueError:
+        return None
+
+
+class AssetCache:
+    """Keep one static image in memory and, once uploaded, serve it by CDN URL.
+
+    Until a usable URL exists (no storage channel, upload failed, URL expiring),
+    callers fall back to attaching the in-memory bytes.
+    """
+
+    def __init__(self, source: Path, *, filename: str, state_path: Path, key: str) -> None:
+        self.source = source
+        self.filename = filename
+        self.state_path = state_path
+        self.key = key
+        self._data: bytes | None = None
+        self._loaded = False
+        self._url: str | None = None
+        self._expires_at: float | None = None
+        self._client: Any = None
+        self._channel_id: int | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    def data(self) -> bytes | None:
+        if not self._loaded:
+            self._loaded = True
+            try:
+                self._data = self.source.read_bytes()
+            except OSError:
+                log.warning("Asset not readable: path=%s", self.source)
+                self._data = None
+        return self._data
+
+    def digest(self) -> str | None:
+        data = self.data()
+        return hashlib.sha256(data).hexdigest() if data is not None else None
+
+    def url(self, now: float | None = None) -> str | None:
+        """Return the CDN URL while it is safely valid; schedule a refresh otherwise."""
+        if self._url is None:
+            return None
+        now = time.time() if now is None else now
+        if self._expires_at is not None and now >= self._expires_at - URL_REFRESH_MARGIN_SECONDS:
+            self._schedule_refresh()
+            return None
+        return self._url
+
+    def file(self) -> discord.File | None:
+        data = self.data()
+        if data is None:
+            return None
+        return discord.File(io.BytesIO(data), filename=self.filename)
+
+    def thumbnail_url(self) -> str | None:
+        url = self.url()
+        if url is not None:
+            return url
+        return f"attachment://{self.filename}" if self.data() is not None else None
+
+    def attach_thumbnail(self, embed: discord.Embed) -> discord.File | None:
+        """Point the embed thumbnail at the asset; return a file only if it must be attached."""
+        url = self.url()
+        if url is not None:
+            embed.set_thumbnail(url=url)
+            return None
+        file = self.file()
+        if file is not None:
+            embed.set_thumbnail(url=f"attachment://{self.filename}")
+        return file
+
+    def _remember(self, url: str) -> None:
+        self._url = url
+        self._expires_at = cdn_url_expires_at(url)
+
+    def _load_state(self) -> dict[str, Any]:
+        entry = load_json_object(self.state_path, dict).get(self.key)
+        return entry if isinstance(entry, dict) else {}
+
+    def _save_state(self, entry: dict[str, Any]) -> None:
+        state = load_json_object(self.state_path, dict)
+        state[self.key] = entry
+        atomic_write_json(self.state_path, state)
+
+    async def ensure_uploaded(self, client: Any, channel_id: int | None) -> str | None:
+        """Reuse the stored upload when it still matches the asset, otherwise upload once."""
+        self._client = client
+        self._channel_id = channel_id
+        digest = self.digest()
+        if not channel_id or digest is None:
+            return None
+
+        channel = client.get_channel(channel_id)
+        if channel is None:
+            try:
+                channel = await client.fetch_channel(channel_id)
+            except discord.HTTPException:
+                log.warning("Asset storage channel unavailable: channel=%s", channel_id)
+                return None
+
+        entry = self._load_state()
+        if entry.get("sha256") == digest and entry.get("channel_id") == channel_id and entry.get("message_id"):
+            try:
+                # 重新 fetch message 會攞到新簽名嘅 URL，唔使再上傳
+                message = await channel.fetch_message(int(entry["message_id"]))
+                if message.attachments:
+                    self._remember(message.attachments[0].url)
+                    return self._url
+            except discord.NotFound:
+                pass
+            except discord.HTTPException:
+                log.warning("Failed to refresh stored asset: key=%s", self.key, exc_info=True)
+                return None
+
+        try:
+            message = await channel.send(file=self.file())
+        except discord.HTTPException:
+            log.warning("Failed to upload asset: key=%s channel=%s", self.key, channel_id, exc_info=True)
+            return None
+        if not message.attachments:
+            return None
+
+        self._remember(message.attachments[0].url)
+        self._save_state({"sha256": digest, "channel_id": channel_id, "message_id": message.id})
+        log.info("Uploaded asset: key=%s message=%s", self.key, message.id)
+        return self._url
+
+    async def _refresh(self) -> None:
+        self._url = None
+        self._expires_at = None
+        try:
+            await self.ensure_uploaded(self._client, self._channel_id)
+        except Exception:
+            log.exception("Asset refresh failed: key=%s", self.key)
+
+    def _schedule_refresh(self) -> None:
+        if self._client is None or (self._refresh_task is not None and not self._refresh_task.done()):
+            return
+        try:
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh())
+        except RuntimeError:
+            return
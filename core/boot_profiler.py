@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+log = logging.getLogger("con9sole-bartender.boot")
+
+MAX_BOOT_REPORTS = 200
+SLOWEST_EXTENSIONS_SHOWN = 3
+EXTENSION_PHASE_PREFIX = "extension:"
+
+# 主要 phase 嘅顯示次序；其他 phase 照樣記錄，但 admin 報告唔逐個列出
+SUMMARY_PHASES: tuple[str, ...] = (
+    "imports",
+    "validate_config",
+    "extensions_eager",
+    "gateway_connect",
+    "extensions_lazy",
+    "command_sync",
+    "tempvc_bootstrap",
+)
+
+
+class BootProfiler:
+    """Collect startup phase durations for one process and persist them once."""
+
+    def __init__(self, started_at: float | None = None) -> None:
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.phases: dict[str, float] = {}
+        self.milestones: dict[str, float] = {}
+        self._expected: set[str] = set()
+        self._expected_done = asyncio.Event()
+        self._expected_done.set()
+        self.written = False
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def record(self, name: str, seconds: float) -> None:
+        self.phases[name] = round(seconds, 4)
+        self._expected.discard(name)
+        if not self._expected:
+            self._expected_done.set()
+
+    def mark(self, name: str) -> float:
+        """Record a milestone as seconds since process start."""
+        at = round(self.elapsed(), 4)
+        self.milestones[name] = at
+        return at
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def expect(self, name: str) -> None:
+        """Delay the boot report until a phase recorded elsewhere (e.g. a cog) completes."""
+        if name in self.phases:
+            return
+        self._expected.add(name)
+        self._expected_done.clear()
+
+    async def wait_for_expected(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._expected_done.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            log.warning("Boot report written before phases completed: %s", ", ".join(sorted(self._expected)))
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "booted_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "release": os.getenv("FLY_IMAGE_REF") or os.getenv("FLY_MACHINE_VERSION") or "",
+            "total_seconds": round(self.elapsed(), 4),
+            "milestones": dict(self.milestones),
+            "phases": dict(self.phases),
+        }
+
+
+def append_boot_report(path: str | Path, report: dict[str, Any], *, keep: int = MAX_BOOT_REPORTS) -> None:
+    """Append one report line and trim the file to the most recent `keep` boots."""
+    destination = Path(path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(report, ensure_ascii=False, sort_keys=True)
+
+    lines: list[str] = []
+    if destination.exists():
+        lines = [raw for raw in destination.read_text(encoding="utf-8").splitlines() if raw.strip()]
+    lines.append(line)
+
+    if len(lines) > keep:
+        temp_path = destination.with_suffix(destination.suffix + ".tmp")
+        temp_path.write_text("\n".join(lines[-keep:]) + "\n", encoding="utf-8")
+        temp_path.replace(destination)
+        return
+
+    with destination.open("a", encoding="utf-8") as handle:
+        handle.write(line + "\n")
+
+
+def load_boot_reports(path: str | Path, limit: int) -> list[dict[str, Any]]:
+    """Return up to `limit` most recent reports, oldest first; bad lines are skipped."""
+    source = Path(path)
+    if limit <= 0 or not source.exists():
+        return []
+
+    reports: list[dict[str, Any]] = []
+    for raw in source.read_text(encoding="utf-8").splitlines():
+        if not raw.strip():
+            continue
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            log.warning("Skipped malformed boot report line: path=%s", source)
+            continue
+        if isinstance(parsed, dict):
+            reports.append(parsed)
+    return reports[-limit:]
+
+
+def _format_delta(current: float, previous: float | None) -> str:
+    if previous is None:
+        return ""
+    return f" ({current - previous:+.2f})"
+
+
+def format_boot_reports(reports: list[dict[str, Any]], *, limit: int | None = None) -> list[str]:
+    """Format the newest `limit` reports newest first, each compared with the boot before it."""
+    lines: list[str] = []
+    oldest = 0 if limit is None else max(0, len(reports) - limit)
+    for index in range(len(reports) - 1, oldest - 1, -1):
+        report = reports[index]
+        previous = reports[index - 1] if index > 0 else None
+        milestones = report.get("milestones", {})
+        phases = report.get("phases", {})
+        previous_milestones = previous.get("milestones", {}) if previous else {}
+        previous_phases = previous.get("phases", {}) if previous else {}
+
+        ready = milestones.get("on_ready")
+        header = f"**{report.get('booted_at', '?')}**"
+        if report.get("release"):
+            header += f" · `{str(report['release'])[-24:]}`"
+        if isinstance(ready, (int, float)):
+            header += f" · on_ready `{ready:.2f}s`{_format_delta(ready, previous_milestones.get('on_ready'))}"
+
+        parts = [
+            f"{name} `{phases[name]:.2f}s`{_format_delta(phases[name], previous_phases.get(name))}"
+            for name in SUMMARY_PHASES
+            if isinstance(phases.get(name), (int, float))
+        ]
+
+        extensions = sorted(
+            (
+                (name.removeprefix(EXTENSION_PHASE_PREFIX), seconds)
+                for name, seconds in phases.items()
+                if name.startswith(EXTENSION_PHASE_PREFIX)
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:SLOWEST_EXTENSIONS_SHOWN]
+
+        lines.append(header)
+        if parts:
+            lines.append("　" + " · ".join(parts))
+        if extensions:
+            lines.append("　slowest: " + ", ".join(f"{name} `{seconds:.2f}s`" for name, seconds in extensions))
+    return lines
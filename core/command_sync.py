@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+import discord
+from discord import app_commands
+
+from core.json_storage import atomic_write_json, load_json_object
+
+
+log = logging.getLogger("con9sole-bartender.command-sync")
+
+FORCE_SYNC_ENV = "FORCE_COMMAND_SYNC"
+
+
+def _payload_for(tree: app_commands.CommandTree, guild: discord.abc.Snowflake | None) -> list[dict[str, Any]]:
+    commands = tree.get_commands(guild=guild)
+    return sorted((command.to_dict(tree) for command in commands), key=lambda item: (item["type"], item["name"]))
+
+
+def command_tree_payload(
+    tree: app_commands.CommandTree,
+    *,
+    application_id: int | None,
+    guild_id: int | None,
+) -> dict[str, Any]:
+    guild = discord.Object(id=guild_id) if guild_id else None
+    return {
+        "application_id": application_id,
+        "guild_id": guild_id,
+        "global": _payload_for(tree, None),
+        "guild": _payload_for(tree, guild) if guild is not None else [],
+    }
+
+
+def command_tree_hash(payload: dict[str, Any]) -> str:
+    """Hash the sync payload independently of dict ordering."""
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def force_sync_requested(raw_value: str | None = None) -> bool:
+    value = os.getenv(FORCE_SYNC_ENV) if raw_value is None else raw_value
+    return (value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def load_synced_hash(path: str | Path) -> str | None:
+    value = load_json_object(path, dict).get("hash")
+    return value if isinstance(value, str) else None
+
+
+async def sync_command_tree(
+    tree: app_commands.CommandTree,
+    *,
+    application_id: int | None,
+    guild_id: int | None,
+    state_path: str | Path,
+    force: bool = False,
+) -> bool:
+    """Sync slash commands only when the tree differs from the last successful sync.
+
+    Returns True when Discord was called, False when the stored hash matched.
+    """
+    # 重要：清走舊 global commands，避免舊 /ping 或其他歷史 global command 留喺 Discord UI。
+    # 呢步只改本地 tree，唔使 REST；hash 亦以清走後嘅 tree 計算。
+    tree.clear_commands(guild=None)
+
+    digest = command_tree_hash(
+        command_tree_payload(tree, application_id=application_id, guild_id=guild_id)
+    )
+    if not force and load_synced_hash(state_path) == digest:
+        log.info("App commands unchanged; skipping sync: hash=%s", digest[:12])
+        return False
+
+    global_synced = True
+    try:
+        await tree.sync()
+        log.info("Global app commands cleared")
+    except Exception as e:
+        global_synced = False
+        log.exception("Global app command clear failed: %r", e)
+
+    if guild_id:
+        await tree.sync(guild=discord.Object(id=guild_id))
+        log.info("App commands synced to guild %s", guild_id)
+    else:
+        await tree.sync()
+        log.info("App commands synced globally")
+
+    # 全部成功先記低 hash，下次 boot 先會重試失敗嘅同步
+    if global_synced:
+        atomic_write_json(state_path, {"hash": digest})
+    return True
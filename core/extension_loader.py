@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import ast
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from discord.ext import commands
+
+
+log = logging.getLogger("con9sole-bartender.extensions")
+
+# Cog module 可以喺頂層宣告以下常數（只讀 AST，唔會 import 個 module）：
+#   EXTENSION_DEPENDS = ("cogs.menu",)         依賴嘅 extension，會喺之後嘅批次先載入
+#   EXTENSION_REQUIRED_ENV = ("TWITCH_BOT_OAUTH",)  環境變數未設定就唔載入
+#   EXTENSION_LAZY = True                       on_ready 之後或第一次用到先載入
+METADATA_NAMES = frozenset({"EXTENSION_DEPENDS", "EXTENSION_REQUIRED_ENV", "EXTENSION_LAZY"})
+
+
+@dataclass(frozen=True)
+class ExtensionSpec:
+    name: str
+    depends: tuple[str, ...] = ()
+    required_env: tuple[str, ...] = ()
+    lazy: bool = False
+
+    def enabled(self, environ: Mapping[str, str] = os.environ) -> bool:
+        return all((environ.get(key) or "").strip() for key in self.required_env)
+
+
+def _read_metadata(source: str) -> dict[str, Any]:
+    metadata: dict[str, Any] = {}
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+            continue
+        target = node.targets[0]
+        if isinstance(target, ast.Name) and target.id in METADATA_NAMES:
+            metadata[target.id] = ast.literal_eval(node.value)
+    return metadata
+
+
+def read_extension_spec(path: Path, *, package: str = "cogs") -> ExtensionSpec:
+    """Read a cog's loader metadata without importing the module."""
+    name = f"{package}.{path.stem}"
+    try:
+        metadata = _read_metadata(path.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, ValueError):
+        # 讀唔到就當普通 cog，等 load_extension 報真正錯誤
+        log.warning("Could not read extension metadata: extension=%s", name, exc_info=True)
+        metadata = {}
+
+    return ExtensionSpec(
+        name=name,
+        depends=tuple(metadata.get("EXTENSION_DEPENDS", ())),
+        required_env=tuple(metadata.get("EXTENSION_REQUIRED_ENV", ())),
+        lazy=bool(metadata.get("EXTENSION_LAZY", False)),
+    )
+
+
+def discover_extensions(cogs_dir: Path, *, package: str = "cogs") -> list[ExtensionSpec]:
+    """Return specs for real cog modules only, skipping private and backup files."""
+    specs: list[ExtensionSpec] = []
+    for path in sorted(cogs_dir.glob("*.py")):
+        stem = path.stem
+        if stem.startswith("_"):
+            continue
+        # 防止 message_audit.py.old / xxx.bak.py 呢類帶點號檔名被誤讀
+        if "." in stem:
+            continue
+        specs.append(read_extension_spec(path, package=package))
+    return specs
+
+
+def plan_load_waves(
+    specs: Iterable[ExtensionSpec],
+    *,
+    loaded: Iterable[str] = (),
+) -> tuple[list[list[ExtensionSpec]], list[ExtensionSpec]]:
+    """Group specs into batches whose dependencies are satisfied by earlier batches.
+
+    Returns (waves, unresolved); unresolved specs depend on something that is
+    neither already loaded nor part of this plan, or sit in a dependency cycle.
+    """
+    available = set(loaded)
+    pending = list(specs)
+    waves: list[list[ExtensionSpec]] = []
+
+    while pending:
+        wave = [spec for spec in pending if all(dep in available for dep in spec.depends)]
+        if not wave:
+            break
+        waves.append(wave)
+        available.update(spec.name for spec in wave)
+        pending = [spec for spec in pending if spec not in wave]
+
+    return waves, pending
+
+
+class ExtensionLoader:
+    """Load independent cogs concurrently and defer lazy ones until needed."""
+
+    def __init__(self, bot: commands.Bot, specs: Iterable[ExtensionSpec]) -> None:
+        self.bot = bot
+        self.specs = list(specs)
+        self.failed: dict[str, str] = {}
+        self.durations: dict[str, float] = {}
+        self._deferred: list[ExtensionSpec] = []
+        self._lazy_lock = asyncio.Lock()
+
+    def _enabled_specs(self) -> list[ExtensionSpec]:
+        enabled: list[ExtensionSpec] = []
+        for spec in self.specs:
+            if spec.enabled():
+                enabled.append(spec)
+            else:
+                log.info(
+                    "Skipped extension: %s (missing %s)",
+                    spec.name,
+                    ", ".join(spec.required_env),
+                )
+        return enabled
+
+    async def _load_one(self, spec: ExtensionSpec) -> bool:
+        started = time.perf_counter()
+        try:
+            await self.bot.load_extension(spec.name)
+        except commands.ExtensionAlreadyLoaded:
+            return True
+        except Exception as e:
+            self.failed[spec.name] = f"{type(e).__name__}: {e}"
+            log.exception("Failed loading %s: %r", spec.name, e)
+            return False
+        finally:
+            self.durations[spec.name] = time.perf_counter() - started
+        log.info("Loaded extension: %s", spec.name)
+        return True
+
+    async def _load_waves(self, specs: list[ExtensionSpec]) -> list[str]:
+        loaded: list[str] = []
+        remaining = specs
+        while remaining:
+            waves, unresolved = plan_load_waves(remaining, loaded=self.bot.extensions.keys())
+            if not waves:
+                for spec in unresolved:
+                    log.warning(
+                        "Skipped extension with unmet dependencies: %s (needs %s)",
+                        spec.name,
+                        ", ".join(spec.depends),
+                    )
+                break
+            # 只行第一批：如果有 extension 載入失敗，依賴佢嘅會喺下一輪被判定為 unresolved
+            wave = waves[0]
+            results = await asyncio.gather(*(self._load_one(spec) for spec in wave))
+            loaded.extend(spec.name for spec, ok in zip(wave, results) if ok)
+            remaining = [spec for spec in remaining if spec not in wave]
+        return loaded
+
+    async def load_eager(self) -> list[str]:
+        enabled = self._enabled_specs()
+        # 依賴 lazy extension（包括間接依賴）嘅都要一齊延後
+        lazy_names = {spec.name for spec in enabled if spec.lazy}
+        changed = True
+        while changed:
+            changed = False
+            for spec in enabled:
+                if spec.name not in lazy_names and any(dep in lazy_names for dep in spec.depends):
+                    lazy_names.add(spec.name)
+                    changed = True
+
+        self._deferred.extend(spec for spec in enabled if spec.name in lazy_names)
+        return await self._load_waves([spec for spec in enabled if spec.name not in lazy_names])
+
+    async def load_lazy(self) -> list[str]:
+        """Load deferred extensions once; concurrent callers share the same work."""
+        async with self._lazy_lock:
+            pending = [spec for spec in self._deferred if spec.name not in self.bot.extensions]
+            self._deferred = []
+            if not pending:
+                return []
+            return await self._load_waves(pending)
+
+
+async def get_or_load_cog(client: Any, name: str) -> commands.Cog | None:
+    """Return a cog, loading deferred extensions first if it is not loaded yet."""
+    cog = client.get_cog(name)
+    if cog is not None:
+        return cog
+
+    loader = getattr(client, "extension_loader", None)
+    if not isinstance(loader, ExtensionLoader):
+        return None
+
+    await loader.load_lazy()
+    return client.get_cog(name)
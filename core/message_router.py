@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import discord
+
+
+log = logging.getLogger("con9sole-bartender.router")
+
+MessageHandler = Callable[[discord.Message], Awaitable[None]]
+ReplyCallback = Callable[[discord.Message], None]
+
+
+def is_pure_mention(content: str, bot_id: int) -> bool:
+    """True when the message is nothing but one or more mentions of the bot."""
+    stripped = (content or "").strip()
+    if not stripped.startswith("<@"):
+        return False
+    cleaned = stripped.replace(f"<@{bot_id}>", "").replace(f"<@!{bot_id}>", "")
+    return cleaned != stripped and not cleaned.strip()
+
+
+@dataclass
+class RouteDecision:
+    """Handlers interested in one message, decided once per message."""
+
+    handlers: list[MessageHandler] = field(default_factory=list)
+    reply: ReplyCallback | None = None
+    mention: bool = False
+
+
+class MessageRouter:
+    """Route each guild message only to the features that asked for it.
+
+    Routes are looked up by key, so per-message cost stays flat as channel relays
+    and pending replies grow:
+    - channel routes: every message in a channel (e.g. the Twitch relay)
+    - mention handler: messages that only mention the bot (the Quick Bar menu)
+    - reply routes: the next message from one user in one channel, keyed by (channel_id, user_id)
+    """
+
+    def __init__(self) -> None:
+        self._channel_routes: dict[int, dict[str, MessageHandler]] = {}
+        self._reply_routes: dict[tuple[int, int], ReplyCallback] = {}
+        self._mention_handler: MessageHandler | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    # ---------- registration ----------
+    def add_channel_route(self, channel_id: int, owner: str, handler: MessageHandler) -> None:
+        self._channel_routes.setdefault(channel_id, {})[owner] = handler
+
+    def remove_channel_routes(self, owner: str) -> None:
+        for channel_id in list(self._channel_routes):
+            handlers = self._channel_routes[channel_id]
+            handlers.pop(owner, None)
+            if not handlers:
+                del self._channel_routes[channel_id]
+
+    def set_mention_handler(self, handler: MessageHandler | None) -> None:
+        self._mention_handler = handler
+
+    def add_reply_route(self, channel_id: int, user_id: int, callback: ReplyCallback) -> bool:
+        """Claim the next message from `user_id` in `channel_id`; False if already claimed."""
+        key = (channel_id, user_id)
+        if key in self._reply_routes:
+            return False
+        self._reply_routes[key] = callback
+        return True
+
+    def remove_reply_route(self, channel_id: int, user_id: int) -> None:
+        self._reply_routes.pop((channel_id, user_id), None)
+
+    def has_reply_route(self, channel_id: int, user_id: int) -> bool:
+        return (channel_id, user_id) in self._reply_routes
+
+    # ---------- routing ----------
+    def classify(self, message: discord.Message, bot_id: int | None) -> RouteDecision:
+        decision = RouteDecision()
+        if message.author.bot or message.guild is None:
+            return decision
+
+        channel_id = message.channel.id
+        channel_handlers = self._channel_routes.get(channel_id)
+        if channel_handlers:
+            decision.handlers.extend(channel_handlers.values())
+
+        decision.reply = self._reply_routes.get((channel_id, message.author.id))
+
+        if self._mention_handler is not None and bot_id is not None and is_pure_mention(message.content, bot_id):
+            decision.mention = True
+            decision.handlers.append(self._mention_handler)
+        return decision
+
+    def dispatch(self, message: discord.Message, bot_id: int | None) -> RouteDecision:
+        """Resolve a pending reply inline and schedule interested handlers as tasks."""
+        decision = self.classify(message, bot_id)
+
+        if decision.reply is not None:
+            try:
+                decision.reply(message)
+            except Exception:
+                log.exception("Reply callback failed: channel=%s user=%s", message.channel.id, message.author.id)
+
+        for handler in decision.handlers:
+            task = asyncio.create_task(self._run(handler, message))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return decision
+
+    @staticmethod
+    async def _run(handler: MessageHandler, message: discord.Message) -> None:
+        try:
+            await handler(message)
+        except Exception:
+            log.exception(
+                "Message handler failed: handler=%s message=%s",
+                getattr(handler, "__qualname__", handler),
+                message.id,
+            )
+
+
+def get_message_router(client: Any) -> MessageRouter | None:
+    router = getattr(client, "message_router", None)
+    return router if isinstance(router, MessageRouter) else None
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+import discord
+
+from core.message_router import MessageRouter
+
+
+log = logging.getLogger("con9sole-bartender.pending")
+
+ReplyOutcome = Literal["pending", "reply", "timeout", "cancelled"]
+ReplyKey = tuple[int, int]
+
+# 同一個 (channel, user) 只可以等一樣嘢，提示要講清楚係邊一樣擋住咗
+PENDING_KIND_LABELS: dict[str, str] = {"gift": "賜酒", "cheer": "幫人打氣"}
+
+
+def pending_busy_message(kind: str) -> str:
+    label = PENDING_KIND_LABELS.get(kind, "")
+    return f"⏳ 你已經有一個等待 tag 對象嘅{label}操作。請先完成，或者撳該訊息嘅取消按鈕。"
+
+
+@dataclass(eq=False)
+class PendingReply:
+    """One prompt waiting for the next message from a user in a channel."""
+
+    key: ReplyKey
+    kind: str
+    deadline: float
+    future: asyncio.Future[discord.Message | None]
+    outcome: ReplyOutcome = "pending"
+    _registry: PendingReplyRegistry | None = field(default=None, repr=False)
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def cancel(self) -> bool:
+        """Stop waiting; returns False if the reply already arrived or timed out."""
+        if self._registry is None or self.done():
+            return False
+        return self._registry._resolve(self, "cancelled", None)
+
+    async def wait(self) -> discord.Message | None:
+        """Return the reply, or None on timeout / cancel (see `outcome`)."""
+        return await self.future
+
+
+class PendingReplyRegistry:
+    """Keyed (channel_id, user_id) waits resolved by the message router.
+
+    Replies are matched with one dict lookup per message, and all deadlines share
+    one loop timer armed for the earliest expiry instead of a task per request.
+    """
+
+    def __init__(self, router: MessageRouter) -> None:
+        self.router = router
+        self._pending: dict[ReplyKey, PendingReply] = {}
+        self._deadlines: list[tuple[float, int, PendingReply]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def get(self, channel_id: int, user_id: int) -> PendingReply | None:
+        return self._pending.get((channel_id, user_id))
+
+    def expect(self, channel_id: int, user_id: int, *, timeout: float, kind: str) -> PendingReply | None:
+        """Start waiting for the user's next message; None if one is already pending."""
+        key = (channel_id, user_id)
+        if key in self._pending:
+            return None
+
+        loop = asyncio.get_running_loop()
+        pending = PendingReply(
+            key=key,
+            kind=kind,
+            deadline=loop.time() + timeout,
+            future=loop.create_future(),
+            _registry=self,
+        )
+        if not self.router.add_reply_route(channel_id, user_id, lambda message: self._resolve(pending, "reply", message)):
+            return None
+
+        self._pending[key] = pending
+        heapq.heappush(self._deadlines, (pending.deadline, next(self._sequence), pending))
+        self._arm(loop)
+        return pending
+
+    def _resolve(self, pending: PendingReply, outcome: ReplyOutcome, message: discord.Message | None) -> bool:
+        if self._pending.get(pending.key) is not pending:
+            return False
+        del self._pending[pending.key]
+        self.router.remove_reply_route(*pending.key)
+        if not self._pending and self._timer is not None:
+            # 冇嘢再等就唔使留住 timer
+            self._timer.cancel()
+            self._timer = None
+            self._deadlines.clear()
+        if pending.future.done():
+            return False
+        pending.outcome = outcome
+        pending.future.set_result(message)
+        return True
+
+    def _arm(self, loop: asyncio.AbstractEventLoop) -> None:
+        # 已完成（回覆 / 取消）嘅 entry 留喺 heap 頂就順手清走
+        while self._deadlines and self._pending.get(self._deadlines[0][2].key) is not self._deadlines[0][2]:
+            heapq.heappop(self._deadlines)
+        if not self._deadlines:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            return
+
+        earliest = self._deadlines[0][0]
+        if self._timer is not None:
+            if self._timer.when() <= earliest:
+                return
+            self._timer.cancel()
+        self._timer = loop.call_at(earliest, self._expire, loop)
+
+    def _expire(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._timer = None
+        now = loop.time()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, pending = heapq.heappop(self._deadlines)
+            self._resolve(pending, "timeout", None)
+        self._arm(loop)
+
+    def cancel_all(self) -> None:
+        for pending in list(self._pending.values()):
+            pending.cancel()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._deadlines.clear()
+
+
+def get_pending_replies(client: Any) -> PendingReplyRegistry | None:
+    registry = getattr(client, "pending_replies", None)
+    return registry if isinstance(registry, PendingReplyRegistry) else None
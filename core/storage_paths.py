@@ -18,3 +18,9 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 STATS_DB = Path(os.getenv("STATS_DB_PATH", str(DATA_DIR / "community_stats.sqlite3")))
 STATS_DB.parent.mkdir(parents=True, exist_ok=True)
 DRINK_STATE_PATH = Path(os.getenv("DRINK_STATE_PATH", str(DATA_DIR / "drink_state.json")))
+COMMAND_SYNC_STATE_PATH = Path(os.getenv("COMMAND_SYNC_STATE_PATH", str(DATA_DIR / "command_sync.json")))
+ASSET_CACHE_PATH = Path(os.getenv("ASSET_CACHE_PATH", str(DATA_DIR / "asset_cache.json")))
+BOOT_REPORTS_PATH = Path(os.getenv("BOOT_REPORTS_PATH", str(DATA_DIR / "boot_reports.jsonl")))
+TEMP_VC_REGISTRY_PATH = Path(os.getenv("TEMP_VC_REGISTRY_PATH", str(DATA_DIR / "temp_vc_registry.json")))
+# 舊版活動提醒 JSON，只會喺第一次啟動時匯入 SQLite
+ACTIVITY_REMINDER_JSON_PATH = Path(os.getenv("ACTIVITY_REMINDER_PATH", str(DATA_DIR / "activity_reminders.json")))
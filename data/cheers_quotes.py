@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -17,1176 +18,1187 @@ CHEERS_COOLDOWN_SECONDS = 30.0
 BARTENDER_ATTACHMENT_NAME = "bartender.png"
 
 
-CHEERS_QUOTES: List[CheerQuote] = [
+# 每條係 (english, chinese, author, category, source)。全部都係常數，compiler 會摺成一個
+# tuple，import 時唔使逐個起 dataclass；用到先由 cheer_quote() 變做 CheerQuote
+QUOTE_ROWS: tuple[tuple[str, str, str, str, str], ...] = (
     # --- Sports / Competition ---
-    CheerQuote(
-        english="Talent wins games, but teamwork and intelligence win championships.",
-        chinese="天賦能贏比賽，但團隊合作與智慧才能贏得冠軍。",
-        author="Michael Jordan",
-        category="sports",
-        source="Widely attributed interview / motivational compilation",
-    ),
-    CheerQuote(
-        english="I've failed over and over and over again in my life and that is why I succeed.",
-        chinese="我一生中一次又一次失敗，因此我才成功。",
-        author="Michael Jordan",
-        category="sports",
-        source="Nike campaign / widely documented attribution",
-    ),
-    CheerQuote(
-        english="I always believed that if you put in the work, the results will come.",
-        chinese="我一直相信，只要付出努力，成果自然會來。",
-        author="Michael Jordan",
-        category="sports",
-        source="Michael Jordan attribution",
-    ),
-    CheerQuote(
-        english="You miss 100% of the shots you don’t take.",
-        chinese="你不出手，就錯過了百分之百的機會。",
-        author="Wayne Gretzky",
-        category="sports",
-        source="Wayne Gretzky attribution",
-    ),
-    CheerQuote(
-        english="The only way to prove that you’re a good sport is to lose.",
-        chinese="證明自己有運動家精神的唯一方式，就是面對失敗。",
-        author="Ernie Banks",
-        category="sports",
-        source="Ernie Banks attribution",
-    ),
-    CheerQuote(
-        english="It’s not whether you get knocked down; it’s whether you get up.",
-        chinese="被擊倒並不重要，重要的是你會不會再站起來。",
-        author="Vince Lombardi",
-        category="resilience",
-        source="Vince Lombardi attribution",
-    ),
-    CheerQuote(
-        english="Winning isn’t everything, but wanting to win is.",
-        chinese="勝利不是一切，但渴望勝利很重要。",
-        author="Vince Lombardi",
-        category="sports",
-        source="Vince Lombardi attribution",
-    ),
-    CheerQuote(
-        english="Perfection is not attainable, but if we chase perfection we can catch excellence.",
-        chinese="完美不可及，但追求完美時，我們可以抓住卓越。",
-        author="Vince Lombardi",
-        category="excellence",
-        source="Vince Lombardi attribution",
-    ),
-    CheerQuote(
-        english="The will to win is important, but the will to prepare is vital.",
-        chinese="求勝的意志很重要，但準備的意志更關鍵。",
-        author="Joe Paterno",
-        category="preparation",
-        source="Joe Paterno attribution",
-    ),
-    CheerQuote(
-        english="Do not let what you cannot do interfere with what you can do.",
-        chinese="不要讓你做不到的事，妨礙你能做到的事。",
-        author="John Wooden",
-        category="mindset",
-        source="John Wooden attribution",
-    ),
-    CheerQuote(
-        english="Make each day your masterpiece.",
-        chinese="讓每一天都成為你的代表作。",
-        author="John Wooden",
-        category="excellence",
-        source="John Wooden attribution",
-    ),
-    CheerQuote(
-        english="Success comes from knowing that you did your best to become the best that you are capable of becoming.",
-        chinese="成功來自知道自己已盡力，成為自己能成為的最好版本。",
-        author="John Wooden",
-        category="excellence",
-        source="John Wooden attribution",
-    ),
-    CheerQuote(
-        english="Champions keep playing until they get it right.",
-        chinese="冠軍會一直打下去，直到做對為止。",
-        author="Billie Jean King",
-        category="persistence",
-        source="Billie Jean King attribution",
-    ),
-    CheerQuote(
-        english="Pressure is a privilege.",
-        chinese="壓力是一種特權。",
-        author="Billie Jean King",
-        category="sports",
-        source="Billie Jean King attribution",
-    ),
-    CheerQuote(
-        english="You can’t put a limit on anything. The more you dream, the farther you get.",
-        chinese="任何事都不能設限；夢想越大，走得越遠。",
-        author="Michael Phelps",
-        category="dream",
-        source="Michael Phelps attribution",
-    ),
-    CheerQuote(
-        english="Hard days are the best because that’s when champions are made.",
-        chinese="艱難的日子最寶貴，因為冠軍就是在那些日子誕生。",
-        author="Gabby Douglas",
-        category="sports",
-        source="Gabby Douglas attribution",
-    ),
-    CheerQuote(
-        english="Set your goals high, and don’t stop till you get there.",
-        chinese="把目標訂得高一點，達成前不要停。",
-        author="Bo Jackson",
-        category="sports",
-        source="Bo Jackson attribution",
-    ),
-    CheerQuote(
-        english="Gold medals aren’t really made of gold. They’re made of sweat, determination, and guts.",
-        chinese="金牌不只是金子造的，而是由汗水、決心與膽識鑄成的。",
-        author="Dan Gable",
-        category="sports",
-        source="Dan Gable attribution",
-    ),
-    CheerQuote(
-        english="Age is no barrier. It’s a limitation you put on your mind.",
-        chinese="年齡不是障礙，那只是你放在心裡的限制。",
-        author="Jackie Joyner-Kersee",
-        category="mindset",
-        source="Jackie Joyner-Kersee attribution",
-    ),
-    CheerQuote(
-        english="Excellence is the gradual result of always striving to do better.",
-        chinese="卓越是持續努力追求更好的漸進結果。",
-        author="Pat Riley",
-        category="excellence",
-        source="Pat Riley attribution",
-    ),
-    CheerQuote(
-        english="The difference between the impossible and the possible lies in a person’s determination.",
-        chinese="不可能與可能的差別，在於一個人的決心。",
-        author="Tommy Lasorda",
-        category="determination",
-        source="Tommy Lasorda attribution",
-    ),
-    CheerQuote(
-        english="Run when you can, walk if you have to, crawl if you must; just never give up.",
-        chinese="能跑就跑，必須時就走，必要時就爬；只是永遠不要放棄。",
-        author="Dean Karnazes",
-        category="persistence",
-        source="Dean Karnazes attribution",
-    ),
-    CheerQuote(
-        english="Victory is in having done your best. If you’ve done your best, you’ve won.",
-        chinese="勝利在於盡力；如果你已盡力，你就已經贏了。",
-        author="Bill Bowerman",
-        category="sports",
-        source="Bill Bowerman attribution",
-    ),
-    CheerQuote(
-        english="The harder the battle, the sweeter the victory.",
-        chinese="戰鬥越艱難，勝利越甜美。",
-        author="Les Brown",
-        category="resilience",
-        source="Les Brown attribution",
-    ),
-    CheerQuote(
-        english="Never let the fear of striking out keep you from playing the game.",
-        chinese="別因害怕出局而不敢上場。",
-        author="Babe Ruth",
-        category="courage",
-        source="Babe Ruth attribution",
-    ),
-    CheerQuote(
-        english="You just can’t beat the person who never gives up.",
-        chinese="你永遠打不倒一個從不放棄的人。",
-        author="Babe Ruth",
-        category="persistence",
-        source="Babe Ruth attribution",
-    ),
-    CheerQuote(
-        english="There may be people that have more talent than you, but there’s no excuse for anyone to work harder than you do.",
-        chinese="也許有人比你更有天賦，但沒有人有藉口比你更努力。",
-        author="Derek Jeter",
-        category="work",
-        source="Derek Jeter attribution",
-    ),
-    CheerQuote(
-        english="Success is where preparation and opportunity meet.",
-        chinese="成功，是準備與機會相遇的地方。",
-        author="Bobby Unser",
-        category="opportunity",
-        source="Bobby Unser attribution",
-    ),
-    CheerQuote(
-        english="I hated every minute of training, but I said, ‘Don’t quit.’",
-        chinese="我討厭訓練的每一分鐘，但我告訴自己：不要放棄。",
-        author="Muhammad Ali",
-        category="sports",
-        source="Muhammad Ali attribution",
-    ),
-    CheerQuote(
-        english="The man who has no imagination has no wings.",
-        chinese="沒有想像力的人，就沒有翅膀。",
-        author="Muhammad Ali",
-        category="dream",
-        source="Muhammad Ali attribution",
-    ),
-    CheerQuote(
-        english="He who is not courageous enough to take risks will accomplish nothing in life.",
-        chinese="沒有勇氣冒險的人，一生將一事無成。",
-        author="Muhammad Ali",
-        category="courage",
-        source="Muhammad Ali attribution",
-    ),
-    CheerQuote(
-        english="You have to fight to reach your dream. You have to sacrifice and work hard for it.",
-        chinese="你要為夢想奮鬥，為它犧牲，為它努力。",
-        author="Lionel Messi",
-        category="sports",
-        source="Lionel Messi attribution",
-    ),
-    CheerQuote(
-        english="Everything negative — pressure, challenges — is all an opportunity for me to rise.",
-        chinese="所有負面的壓力與挑戰，都是讓我提升自己的機會。",
-        author="Kobe Bryant",
-        category="sports",
-        source="Kobe Bryant attribution",
-    ),
-    CheerQuote(
-        english="The most important thing is to try and inspire people so that they can be great in whatever they want to do.",
-        chinese="最重要的是嘗試啟發別人，讓他們在自己想做的事情上變得偉大。",
-        author="Kobe Bryant",
-        category="inspiration",
-        source="Kobe Bryant attribution",
-    ),
-    CheerQuote(
-        english="Success is not an accident. Success is actually a choice.",
-        chinese="成功不是偶然，成功其實是一種選擇。",
-        author="Stephen Curry",
-        category="sports",
-        source="Stephen Curry attribution",
-    ),
-    CheerQuote(
-        english="Be the best version of yourself in anything that you do.",
-        chinese="無論做什麼，都成為最好的自己。",
-        author="Stephen Curry",
-        category="growth",
-        source="Stephen Curry attribution",
-    ),
-    CheerQuote(
-        english="I’d rather regret the risks that didn’t work out than the chances I didn’t take.",
-        chinese="我寧願後悔失敗的冒險，也不想後悔沒有把握的機會。",
-        author="Simone Biles",
-        category="courage",
-        source="Simone Biles attribution",
-    ),
-    CheerQuote(
-        english="A champion is defined not by their wins but by how they can recover when they fall.",
-        chinese="冠軍不是由勝利定義，而是由跌倒後如何重新站起來定義。",
-        author="Serena Williams",
-        category="sports",
-        source="Serena Williams attribution",
+    (
+        "Talent wins games, but teamwork and intelligence win championships.",
+        "天賦能贏比賽，但團隊合作與智慧才能贏得冠軍。",
+        "Michael Jordan",
+        "sports",
+        "Widely attributed interview / motivational compilation",
+    ),
+    (
+        "I've failed over and over and over again in my life and that is why I succeed.",
+        "我一生中一次又一次失敗，因此我才成功。",
+        "Michael Jordan",
+        "sports",
+        "Nike campaign / widely documented attribution",
+    ),
+    (
+        "I always believed that if you put in the work, the results will come.",
+        "我一直相信，只要付出努力，成果自然會來。",
+        "Michael Jordan",
+        "sports",
+        "Michael Jordan attribution",
+    ),
+    (
+        "You miss 100% of the shots you don’t take.",
+        "你不出手，就錯過了百分之百的機會。",
+        "Wayne Gretzky",
+        "sports",
+        "Wayne Gretzky attribution",
+    ),
+    (
+        "The only way to prove that you’re a good sport is to lose.",
+        "證明自己有運動家精神的唯一方式，就是面對失敗。",
+        "Ernie Banks",
+        "sports",
+        "Ernie Banks attribution",
+    ),
+    (
+        "It’s not whether you get knocked down; it’s whether you get up.",
+        "被擊倒並不重要，重要的是你會不會再站起來。",
+        "Vince Lombardi",
+        "resilience",
+        "Vince Lombardi attribution",
+    ),
+    (
+        "Winning isn’t everything, but wanting to win is.",
+        "勝利不是一切，但渴望勝利很重要。",
+        "Vince Lombardi",
+        "sports",
+        "Vince Lombardi attribution",
+    ),
+    (
+        "Perfection is not attainable, but if we chase perfection we can catch excellence.",
+        "完美不可及，但追求完美時，我們可以抓住卓越。",
+        "Vince Lombardi",
+        "excellence",
+        "Vince Lombardi attribution",
+    ),
+    (
+        "The will to win is important, but the will to prepare is vital.",
+        "求勝的意志很重要，但準備的意志更關鍵。",
+        "Joe Paterno",
+        "preparation",
+        "Joe Paterno attribution",
+    ),
+    (
+        "Do not let what you cannot do interfere with what you can do.",
+        "不要讓你做不到的事，妨礙你能做到的事。",
+        "John Wooden",
+        "mindset",
+        "John Wooden attribution",
+    ),
+    (
+        "Make each day your masterpiece.",
+        "讓每一天都成為你的代表作。",
+        "John Wooden",
+        "excellence",
+        "John Wooden attribution",
+    ),
+    (
+        "Success comes from knowing that you did your best to become the best that you are capable of becoming.",
+        "成功來自知道自己已盡力，成為自己能成為的最好版本。",
+        "John Wooden",
+        "excellence",
+        "John Wooden attribution",
+    ),
+    (
+        "Champions keep playing until they get it right.",
+        "冠軍會一直打下去，直到做對為止。",
+        "Billie Jean King",
+        "persistence",
+        "Billie Jean King attribution",
+    ),
+    (
+        "Pressure is a privilege.",
+        "壓力是一種特權。",
+        "Billie Jean King",
+        "sports",
+        "Billie Jean King attribution",
+    ),
+    (
+        "You can’t put a limit on anything. The more you dream, the farther you get.",
+        "任何事都不能設限；夢想越大，走得越遠。",
+        "Michael Phelps",
+        "dream",
+        "Michael Phelps attribution",
+    ),
+    (
+        "Hard days are the best because that’s when champions are made.",
+        "艱難的日子最寶貴，因為冠軍就是在那些日子誕生。",
+        "Gabby Douglas",
+        "sports",
+        "Gabby Douglas attribution",
+    ),
+    (
+        "Set your goals high, and don’t stop till you get there.",
+        "把目標訂得高一點，達成前不要停。",
+        "Bo Jackson",
+        "sports",
+        "Bo Jackson attribution",
+    ),
+    (
+        "Gold medals aren’t really made of gold. They’re made of sweat, determination, and guts.",
+        "金牌不只是金子造的，而是由汗水、決心與膽識鑄成的。",
+        "Dan Gable",
+        "sports",
+        "Dan Gable attribution",
+    ),
+    (
+        "Age is no barrier. It’s a limitation you put on your mind.",
+        "年齡不是障礙，那只是你放在心裡的限制。",
+        "Jackie Joyner-Kersee",
+        "mindset",
+        "Jackie Joyner-Kersee attribution",
+    ),
+    (
+        "Excellence is the gradual result of always striving to do better.",
+        "卓越是持續努力追求更好的漸進結果。",
+        "Pat Riley",
+        "excellence",
+        "Pat Riley attribution",
+    ),
+    (
+        "The difference between the impossible and the possible lies in a person’s determination.",
+        "不可能與可能的差別，在於一個人的決心。",
+        "Tommy Lasorda",
+        "determination",
+        "Tommy Lasorda attribution",
+    ),
+    (
+        "Run when you can, walk if you have to, crawl if you must; just never give up.",
+        "能跑就跑，必須時就走，必要時就爬；只是永遠不要放棄。",
+        "Dean Karnazes",
+        "persistence",
+        "Dean Karnazes attribution",
+    ),
+    (
+        "Victory is in having done your best. If you’ve done your best, you’ve won.",
+        "勝利在於盡力；如果你已盡力，你就已經贏了。",
+        "Bill Bowerman",
+        "sports",
+        "Bill Bowerman attribution",
+    ),
+    (
+        "The harder the battle, the sweeter the victory.",
+        "戰鬥越艱難，勝利越甜美。",
+        "Les Brown",
+        "resilience",
+        "Les Brown attribution",
+    ),
+    (
+        "Never let the fear of striking out keep you from playing the game.",
+        "別因害怕出局而不敢上場。",
+        "Babe Ruth",
+        "courage",
+        "Babe Ruth attribution",
+    ),
+    (
+        "You just can’t beat the person who never gives up.",
+        "你永遠打不倒一個從不放棄的人。",
+        "Babe Ruth",
+        "persistence",
+        "Babe Ruth attribution",
+    ),
+    (
+        "There may be people that have more talent than you, but there’s no excuse for anyone to work harder than you do.",
+        "也許有人比你更有天賦，但沒有人有藉口比你更努力。",
+        "Derek Jeter",
+        "work",
+        "Derek Jeter attribution",
+    ),
+    (
+        "Success is where preparation and opportunity meet.",
+        "成功，是準備與機會相遇的地方。",
+        "Bobby Unser",
+        "opportunity",
+        "Bobby Unser attribution",
+    ),
+    (
+        "I hated every minute of training, but I said, ‘Don’t quit.’",
+        "我討厭訓練的每一分鐘，但我告訴自己：不要放棄。",
+        "Muhammad Ali",
+        "sports",
+        "Muhammad Ali attribution",
+    ),
+    (
+        "The man who has no imagination has no wings.",
+        "沒有想像力的人，就沒有翅膀。",
+        "Muhammad Ali",
+        "dream",
+        "Muhammad Ali attribution",
+    ),
+    (
+        "He who is not courageous enough to take risks will accomplish nothing in life.",
+        "沒有勇氣冒險的人，一生將一事無成。",
+        "Muhammad Ali",
+        "courage",
+        "Muhammad Ali attribution",
+    ),
+    (
+        "You have to fight to reach your dream. You have to sacrifice and work hard for it.",
+        "你要為夢想奮鬥，為它犧牲，為它努力。",
+        "Lionel Messi",
+        "sports",
+        "Lionel Messi attribution",
+    ),
+    (
+        "Everything negative — pressure, challenges — is all an opportunity for me to rise.",
+        "所有負面的壓力與挑戰，都是讓我提升自己的機會。",
+        "Kobe Bryant",
+        "sports",
+        "Kobe Bryant attribution",
+    ),
+    (
+        "The most important thing is to try and inspire people so that they can be great in whatever they want to do.",
+        "最重要的是嘗試啟發別人，讓他們在自己想做的事情上變得偉大。",
+        "Kobe Bryant",
+        "inspiration",
+        "Kobe Bryant attribution",
+    ),
+    (
+        "Success is not an accident. Success is actually a choice.",
+        "成功不是偶然，成功其實是一種選擇。",
+        "Stephen Curry",
+        "sports",
+        "Stephen Curry attribution",
+    ),
+    (
+        "Be the best version of yourself in anything that you do.",
+        "無論做什麼，都成為最好的自己。",
+        "Stephen Curry",
+        "growth",
+        "Stephen Curry attribution",
+    ),
+    (
+        "I’d rather regret the risks that didn’t work out than the chances I didn’t take.",
+        "我寧願後悔失敗的冒險，也不想後悔沒有把握的機會。",
+        "Simone Biles",
+        "courage",
+        "Simone Biles attribution",
+    ),
+    (
+        "A champion is defined not by their wins but by how they can recover when they fall.",
+        "冠軍不是由勝利定義，而是由跌倒後如何重新站起來定義。",
+        "Serena Williams",
+        "sports",
+        "Serena Williams attribution",
     ),
 
     # --- Stoic / Classical / Public-domain sources ---
-    CheerQuote(
-        english="The impediment to action advances action. What stands in the way becomes the way.",
-        chinese="阻礙行動的事，反而推動行動；擋在路上的東西，會成為道路本身。",
-        author="Marcus Aurelius",
-        category="stoic",
-        source="Meditations, Book V.20",
-    ),
-    CheerQuote(
-        english="You have power over your mind — not outside events. Realize this, and you will find strength.",
-        chinese="你能掌控的是自己的心，而不是外在事件；明白這點，你就會找到力量。",
-        author="Marcus Aurelius",
-        category="stoic",
-        source="Meditations",
-    ),
-    CheerQuote(
-        english="Waste no more time arguing what a good person should be. Be one.",
-        chinese="不要再浪費時間爭論好人應該是怎樣；成為那樣的人。",
-        author="Marcus Aurelius",
-        category="action",
-        source="Meditations, Book X.16",
-    ),
-    CheerQuote(
-        english="The universe is change; our life is what our thoughts make it.",
-        chinese="宇宙即變化；人生則由我們的思想塑造。",
-        author="Marcus Aurelius",
-        category="mindset",
-        source="Meditations, Book IV.3",
-    ),
-    CheerQuote(
-        english="If it is not right, do not do it; if it is not true, do not say it.",
-        chinese="若不是正確的事，就不要做；若不是真實的話，就不要說。",
-        author="Marcus Aurelius",
-        category="discipline",
-        source="Meditations, Book XII.17",
-    ),
-    CheerQuote(
-        english="The best revenge is not to be like your enemy.",
-        chinese="最好的復仇，就是不要變得像你的敵人。",
-        author="Marcus Aurelius",
-        category="discipline",
-        source="Meditations, Book VI.6",
-    ),
-    CheerQuote(
-        english="The happiness of your life depends upon the quality of your thoughts.",
-        chinese="你人生的幸福，取決於你思想的品質。",
-        author="Marcus Aurelius",
-        category="mindset",
-        source="Meditations",
-    ),
-    CheerQuote(
-        english="We suffer more often in imagination than in reality.",
-        chinese="我們更多時候是在想像中受苦，而不是在現實中受苦。",
-        author="Seneca",
-        category="stoic",
-        source="Letters to Lucilius, Letter 13",
-    ),
-    CheerQuote(
-        english="Difficulties strengthen the mind, as labor does the body.",
-        chinese="困難能鍛鍊心智，就像勞動能鍛鍊身體。",
-        author="Seneca",
-        category="resilience",
-        source="Letters to Lucilius",
-    ),
-    CheerQuote(
-        english="No man was ever wise by chance.",
-        chinese="沒有人是偶然變得有智慧的。",
-        author="Seneca",
-        category="growth",
-        source="Letters to Lucilius",
-    ),
-    CheerQuote(
-        english="While we wait for life, life passes.",
-        chinese="當我們等待人生開始時，人生已經悄悄流逝。",
-        author="Seneca",
-        category="action",
-        source="Letters to Lucilius",
-    ),
-    CheerQuote(
-        english="It is a rough road that leads to the heights of greatness.",
-        chinese="通往偉大的高處，往往是一條崎嶇的路。",
-        author="Seneca",
-        category="resilience",
-        source="Seneca attribution",
-    ),
-    CheerQuote(
-        english="He who is brave is free.",
-        chinese="勇敢的人是自由的。",
-        author="Seneca",
-        category="courage",
-        source="Seneca attribution",
-    ),
-    CheerQuote(
-        english="First say to yourself what you would be; and then do what you have to do.",
-        chinese="先告訴自己你想成為怎樣的人，然後做你該做的事。",
-        author="Epictetus",
-        category="action",
-        source="Discourses / Enchiridion attribution",
-    ),
-    CheerQuote(
-        english="It’s not what happens to you, but how you react to it that matters.",
-        chinese="重要的不是發生了什麼，而是你如何回應。",
-        author="Epictetus",
-        category="mindset",
-        source="Enchiridion paraphrase",
-    ),
-    CheerQuote(
-        english="No great thing is created suddenly.",
-        chinese="偉大的事物不會突然被創造出來。",
-        author="Epictetus",
-        category="persistence",
-        source="Discourses",
-    ),
-    CheerQuote(
-        english="Make the best use of what is in your power, and take the rest as it happens.",
-        chinese="善用你能掌控的事，其他的就按它發生的樣子接受。",
-        author="Epictetus",
-        category="stoic",
-        source="Discourses / Enchiridion attribution",
-    ),
-    CheerQuote(
-        english="A journey of a thousand miles starts with a single step.",
-        chinese="千里之行，始於足下。",
-        author="Laozi",
-        category="persistence",
-        source="Tao Te Ching, Chapter 64",
-    ),
-    CheerQuote(
-        english="Knowing others is intelligence; knowing yourself is true wisdom.",
-        chinese="知人者智，自知者明。",
-        author="Laozi",
-        category="wisdom",
-        source="Tao Te Ching, Chapter 33",
-    ),
-    CheerQuote(
-        english="Mastering others is strength; mastering yourself is true power.",
-        chinese="勝人者有力，自勝者強。",
-        author="Laozi",
-        category="discipline",
-        source="Tao Te Ching, Chapter 33",
-    ),
-    CheerQuote(
-        english="Great acts are made up of small deeds.",
-        chinese="偉大的行動，是由微小的行動累積而成。",
-        author="Laozi",
-        category="persistence",
-        source="Tao Te Ching attribution",
-    ),
-    CheerQuote(
-        english="Nature does not hurry, yet everything is accomplished.",
-        chinese="自然從不匆忙，卻完成一切。",
-        author="Laozi",
-        category="patience",
-        source="Laozi attribution",
-    ),
-    CheerQuote(
-        english="It does not matter how slowly you go as long as you do not stop.",
-        chinese="走得慢不要緊，最重要是不要停下來。",
-        author="Confucius",
-        category="persistence",
-        source="Confucius attribution",
-    ),
-    CheerQuote(
-        english="Our greatest glory is not in never falling, but in rising every time we fall.",
-        chinese="最大的榮耀不在於從不跌倒，而在於每次跌倒後都能再站起來。",
-        author="Confucius",
-        category="resilience",
-        source="Commonly attributed to Confucius",
-    ),
-    CheerQuote(
-        english="Everything has beauty, but not everyone sees it.",
-        chinese="萬物皆有美，但不是人人都看見。",
-        author="Confucius",
-        category="mindset",
-        source="Confucius attribution",
-    ),
-    CheerQuote(
-        english="The superior man is modest in his speech, but exceeds in his actions.",
-        chinese="君子言語謙遜，但行動超越言語。",
-        author="Confucius",
-        category="action",
-        source="Analects attribution",
-    ),
-    CheerQuote(
-        english="We are what we repeatedly do.",
-        chinese="我們反覆做什麼，就會成為什麼。",
-        author="Aristotle",
-        category="habit",
-        source="Aristotle attribution / summarized tradition",
-    ),
-    CheerQuote(
-        english="Well begun is half done.",
-        chinese="好的開始，已是成功的一半。",
-        author="Aristotle",
-        category="action",
-        source="Aristotle attribution",
-    ),
-    CheerQuote(
-        english="Knowing yourself is the beginning of all wisdom.",
-        chinese="認識自己，是一切智慧的開端。",
-        author="Aristotle",
-        category="wisdom",
-        source="Aristotle attribution",
-    ),
-    CheerQuote(
-        english="Happiness depends upon ourselves.",
-        chinese="幸福取決於我們自己。",
-        author="Aristotle",
-        category="mindset",
-        source="Aristotle attribution",
-    ),
-    CheerQuote(
-        english="There is nothing impossible to him who will try.",
-        chinese="願意嘗試的人，沒有不可能。",
-        author="Alexander the Great",
-        category="courage",
-        source="Alexander attribution",
-    ),
-    CheerQuote(
-        english="Fortune favors the bold.",
-        chinese="幸運偏愛勇者。",
-        author="Virgil",
-        category="courage",
-        source="Aeneid tradition",
-    ),
-    CheerQuote(
-        english="Perseverance, secret of all triumphs.",
-        chinese="堅持，是所有勝利的祕密。",
-        author="Victor Hugo",
-        category="persistence",
-        source="Victor Hugo attribution",
-    ),
-    CheerQuote(
-        english="Even the darkest night will end and the sun will rise.",
-        chinese="最黑暗的夜也會過去，太陽終會升起。",
-        author="Victor Hugo",
-        category="hope",
-        source="Les Misérables / Victor Hugo attribution",
-    ),
-    CheerQuote(
-        english="Hope is a waking dream.",
-        chinese="希望是醒著的夢。",
-        author="Aristotle",
-        category="hope",
-        source="Aristotle attribution",
+    (
+        "The impediment to action advances action. What stands in the way becomes the way.",
+        "阻礙行動的事，反而推動行動；擋在路上的東西，會成為道路本身。",
+        "Marcus Aurelius",
+        "stoic",
+        "Meditations, Book V.20",
+    ),
+    (
+        "You have power over your mind — not outside events. Realize this, and you will find strength.",
+        "你能掌控的是自己的心，而不是外在事件；明白這點，你就會找到力量。",
+        "Marcus Aurelius",
+        "stoic",
+        "Meditations",
+    ),
+    (
+        "Waste no more time arguing what a good person should be. Be one.",
+        "不要再浪費時間爭論好人應該是怎樣；成為那樣的人。",
+        "Marcus Aurelius",
+        "action",
+        "Meditations, Book X.16",
+    ),
+    (
+        "The universe is change; our life is what our thoughts make it.",
+        "宇宙即變化；人生則由我們的思想塑造。",
+        "Marcus Aurelius",
+        "mindset",
+        "Meditations, Book IV.3",
+    ),
+    (
+        "If it is not right, do not do it; if it is not true, do not say it.",
+        "若不是正確的事，就不要做；若不是真實的話，就不要說。",
+        "Marcus Aurelius",
+        "discipline",
+        "Meditations, Book XII.17",
+    ),
+    (
+        "The best revenge is not to be like your enemy.",
+        "最好的復仇，就是不要變得像你的敵人。",
+        "Marcus Aurelius",
+        "discipline",
+        "Meditations, Book VI.6",
+    ),
+    (
+        "The happiness of your life depends upon the quality of your thoughts.",
+        "你人生的幸福，取決於你思想的品質。",
+        "Marcus Aurelius",
+        "mindset",
+        "Meditations",
+    ),
+    (
+        "We suffer more often in imagination than in reality.",
+        "我們更多時候是在想像中受苦，而不是在現實中受苦。",
+        "Seneca",
+        "stoic",
+        "Letters to Lucilius, Letter 13",
+    ),
+    (
+        "Difficulties strengthen the mind, as labor does the body.",
+        "困難能鍛鍊心智，就像勞動能鍛鍊身體。",
+        "Seneca",
+        "resilience",
+        "Letters to Lucilius",
+    ),
+    (
+        "No man was ever wise by chance.",
+        "沒有人是偶然變得有智慧的。",
+        "Seneca",
+        "growth",
+        "Letters to Lucilius",
+    ),
+    (
+        "While we wait for life, life passes.",
+        "當我們等待人生開始時，人生已經悄悄流逝。",
+        "Seneca",
+        "action",
+        "Letters to Lucilius",
+    ),
+    (
+        "It is a rough road that leads to the heights of greatness.",
+        "通往偉大的高處，往往是一條崎嶇的路。",
+        "Seneca",
+        "resilience",
+        "Seneca attribution",
+    ),
+    (
+        "He who is brave is free.",
+        "勇敢的人是自由的。",
+        "Seneca",
+        "courage",
+        "Seneca attribution",
+    ),
+    (
+        "First say to yourself what you would be; and then do what you have to do.",
+        "先告訴自己你想成為怎樣的人，然後做你該做的事。",
+        "Epictetus",
+        "action",
+        "Discourses / Enchiridion attribution",
+    ),
+    (
+        "It’s not what happens to you, but how you react to it that matters.",
+        "重要的不是發生了什麼，而是你如何回應。",
+        "Epictetus",
+        "mindset",
+        "Enchiridion paraphrase",
+    ),
+    (
+        "No great thing is created suddenly.",
+        "偉大的事物不會突然被創造出來。",
+        "Epictetus",
+        "persistence",
+        "Discourses",
+    ),
+    (
+        "Make the best use of what is in your power, and take the rest as it happens.",
+        "善用你能掌控的事，其他的就按它發生的樣子接受。",
+        "Epictetus",
+        "stoic",
+        "Discourses / Enchiridion attribution",
+    ),
+    (
+        "A journey of a thousand miles starts with a single step.",
+        "千里之行，始於足下。",
+        "Laozi",
+        "persistence",
+        "Tao Te Ching, Chapter 64",
+    ),
+    (
+        "Knowing others is intelligence; knowing yourself is true wisdom.",
+        "知人者智，自知者明。",
+        "Laozi",
+        "wisdom",
+        "Tao Te Ching, Chapter 33",
+    ),
+    (
+        "Mastering others is strength; mastering yourself is true power.",
+        "勝人者有力，自勝者強。",
+        "Laozi",
+        "discipline",
+        "Tao Te Ching, Chapter 33",
+    ),
+    (
+        "Great acts are made up of small deeds.",
+        "偉大的行動，是由微小的行動累積而成。",
+        "Laozi",
+        "persistence",
+        "Tao Te Ching attribution",
+    ),
+    (
+        "Nature does not hurry, yet everything is accomplished.",
+        "自然從不匆忙，卻完成一切。",
+        "Laozi",
+        "patience",
+        "Laozi attribution",
+    ),
+    (
+        "It does not matter how slowly you go as long as you do not stop.",
+        "走得慢不要緊，最重要是不要停下來。",
+        "Confucius",
+        "persistence",
+        "Confucius attribution",
+    ),
+    (
+        "Our greatest glory is not in never falling, but in rising every time we fall.",
+        "最大的榮耀不在於從不跌倒，而在於每次跌倒後都能再站起來。",
+        "Confucius",
+        "resilience",
+        "Commonly attributed to Confucius",
+    ),
+    (
+        "Everything has beauty, but not everyone sees it.",
+        "萬物皆有美，但不是人人都看見。",
+        "Confucius",
+        "mindset",
+        "Confucius attribution",
+    ),
+    (
+        "The superior man is modest in his speech, but exceeds in his actions.",
+        "君子言語謙遜，但行動超越言語。",
+        "Confucius",
+        "action",
+        "Analects attribution",
+    ),
+    (
+        "We are what we repeatedly do.",
+        "我們反覆做什麼，就會成為什麼。",
+        "Aristotle",
+        "habit",
+        "Aristotle attribution / summarized tradition",
+    ),
+    (
+        "Well begun is half done.",
+        "好的開始，已是成功的一半。",
+        "Aristotle",
+        "action",
+        "Aristotle attribution",
+    ),
+    (
+        "Knowing yourself is the beginning of all wisdom.",
+        "認識自己，是一切智慧的開端。",
+        "Aristotle",
+        "wisdom",
+        "Aristotle attribution",
+    ),
+    (
+        "Happiness depends upon ourselves.",
+        "幸福取決於我們自己。",
+        "Aristotle",
+        "mindset",
+        "Aristotle attribution",
+    ),
+    (
+        "There is nothing impossible to him who will try.",
+        "願意嘗試的人，沒有不可能。",
+        "Alexander the Great",
+        "courage",
+        "Alexander attribution",
+    ),
+    (
+        "Fortune favors the bold.",
+        "幸運偏愛勇者。",
+        "Virgil",
+        "courage",
+        "Aeneid tradition",
+    ),
+    (
+        "Perseverance, secret of all triumphs.",
+        "堅持，是所有勝利的祕密。",
+        "Victor Hugo",
+        "persistence",
+        "Victor Hugo attribution",
+    ),
+    (
+        "Even the darkest night will end and the sun will rise.",
+        "最黑暗的夜也會過去，太陽終會升起。",
+        "Victor Hugo",
+        "hope",
+        "Les Misérables / Victor Hugo attribution",
+    ),
+    (
+        "Hope is a waking dream.",
+        "希望是醒著的夢。",
+        "Aristotle",
+        "hope",
+        "Aristotle attribution",
     ),
 
     # --- Roosevelt / Public speeches ---
-    CheerQuote(
-        english="It is not the critic who counts.",
-        chinese="真正重要的，不是旁觀批評的人。",
-        author="Theodore Roosevelt",
-        category="courage",
-        source="Citizenship in a Republic, 1910",
-    ),
-    CheerQuote(
-        english="The credit belongs to the man who is actually in the arena.",
-        chinese="榮耀屬於真正站在競技場中的人。",
-        author="Theodore Roosevelt",
-        category="courage",
-        source="Citizenship in a Republic, 1910",
-    ),
-    CheerQuote(
-        english="Far and away the best prize that life offers is the chance to work hard at work worth doing.",
-        chinese="人生所能給予最好的獎賞，是有機會為值得做的事努力工作。",
-        author="Theodore Roosevelt",
-        category="work",
-        source="Theodore Roosevelt attribution",
-    ),
-    CheerQuote(
-        english="Do what you can, with what you have, where you are.",
-        chinese="在你所在之處，用你擁有的東西，做你能做的事。",
-        author="Theodore Roosevelt",
-        category="action",
-        source="Theodore Roosevelt attribution",
-    ),
-    CheerQuote(
-        english="Believe you can and you’re halfway there.",
-        chinese="相信自己做得到，你已經走了一半。",
-        author="Theodore Roosevelt",
-        category="mindset",
-        source="Theodore Roosevelt attribution",
-    ),
-    CheerQuote(
-        english="Courage is not having the strength to go on; it is going on when you don’t have the strength.",
-        chinese="勇氣不是仍有力氣前進，而是在沒有力氣時仍繼續前進。",
-        author="Theodore Roosevelt",
-        category="courage",
-        source="Theodore Roosevelt attribution",
+    (
+        "It is not the critic who counts.",
+        "真正重要的，不是旁觀批評的人。",
+        "Theodore Roosevelt",
+        "courage",
+        "Citizenship in a Republic, 1910",
+    ),
+    (
+        "The credit belongs to the man who is actually in the arena.",
+        "榮耀屬於真正站在競技場中的人。",
+        "Theodore Roosevelt",
+        "courage",
+        "Citizenship in a Republic, 1910",
+    ),
+    (
+        "Far and away the best prize that life offers is the chance to work hard at work worth doing.",
+        "人生所能給予最好的獎賞，是有機會為值得做的事努力工作。",
+        "Theodore Roosevelt",
+        "work",
+        "Theodore Roosevelt attribution",
+    ),
+    (
+        "Do what you can, with what you have, where you are.",
+        "在你所在之處，用你擁有的東西，做你能做的事。",
+        "Theodore Roosevelt",
+        "action",
+        "Theodore Roosevelt attribution",
+    ),
+    (
+        "Believe you can and you’re halfway there.",
+        "相信自己做得到，你已經走了一半。",
+        "Theodore Roosevelt",
+        "mindset",
+        "Theodore Roosevelt attribution",
+    ),
+    (
+        "Courage is not having the strength to go on; it is going on when you don’t have the strength.",
+        "勇氣不是仍有力氣前進，而是在沒有力氣時仍繼續前進。",
+        "Theodore Roosevelt",
+        "courage",
+        "Theodore Roosevelt attribution",
     ),
 
     # --- Writers / Thinkers / Creators ---
-    CheerQuote(
-        english="The secret of getting ahead is getting started.",
-        chinese="前進的祕訣，就是先開始。",
-        author="Mark Twain",
-        category="action",
-        source="Mark Twain attribution",
-    ),
-    CheerQuote(
-        english="The man who does not read has no advantage over the man who cannot read.",
-        chinese="不讀書的人，並不比不識字的人有優勢。",
-        author="Mark Twain",
-        category="growth",
-        source="Mark Twain attribution",
-    ),
-    CheerQuote(
-        english="Courage is resistance to fear, mastery of fear — not absence of fear.",
-        chinese="勇氣是抵抗恐懼、駕馭恐懼，而不是沒有恐懼。",
-        author="Mark Twain",
-        category="courage",
-        source="Mark Twain attribution",
-    ),
-    CheerQuote(
-        english="It is not in the stars to hold our destiny but in ourselves.",
-        chinese="掌握命運的不是星辰，而是我們自己。",
-        author="William Shakespeare",
-        category="mindset",
-        source="Julius Caesar",
-    ),
-    CheerQuote(
-        english="Our doubts are traitors, and make us lose the good we oft might win.",
-        chinese="懷疑是叛徒，常令我們錯失原本能贏得的美好。",
-        author="William Shakespeare",
-        category="courage",
-        source="Measure for Measure",
-    ),
-    CheerQuote(
-        english="To thine own self be true.",
-        chinese="忠於你自己。",
-        author="William Shakespeare",
-        category="integrity",
-        source="Hamlet",
-    ),
-    CheerQuote(
-        english="We know what we are, but know not what we may be.",
-        chinese="我們知道自己現在是誰，卻不知道自己可以成為誰。",
-        author="William Shakespeare",
-        category="growth",
-        source="Hamlet",
-    ),
-    CheerQuote(
-        english="If music be the food of love, play on.",
-        chinese="若音樂是愛的食糧，那就繼續奏下去。",
-        author="William Shakespeare",
-        category="hope",
-        source="Twelfth Night",
-    ),
-    CheerQuote(
-        english="Knowing is not enough; we must apply. Willing is not enough; we must do.",
-        chinese="知道還不夠，必須實踐；願意還不夠，必須行動。",
-        author="Johann Wolfgang von Goethe",
-        category="action",
-        source="Goethe attribution",
-    ),
-    CheerQuote(
-        english="Whatever you can do or dream you can, begin it.",
-        chinese="凡是你能做或夢想能做的事，開始吧。",
-        author="Johann Wolfgang von Goethe",
-        category="action",
-        source="Goethe attribution",
-    ),
-    CheerQuote(
-        english="He who has a why to live can bear almost any how.",
-        chinese="知道為何而活的人，幾乎能承受任何困難。",
-        author="Friedrich Nietzsche",
-        category="purpose",
-        source="Twilight of the Idols / Nietzsche attribution",
-    ),
-    CheerQuote(
-        english="That which does not kill us makes us stronger.",
-        chinese="殺不死我們的，會使我們更強大。",
-        author="Friedrich Nietzsche",
-        category="strength",
-        source="Twilight of the Idols",
-    ),
-    CheerQuote(
-        english="One must still have chaos in oneself to be able to give birth to a dancing star.",
-        chinese="人內心仍須有混沌，才能誕生一顆會跳舞的星。",
-        author="Friedrich Nietzsche",
-        category="creativity",
-        source="Thus Spoke Zarathustra",
-    ),
-    CheerQuote(
-        english="Everything you can imagine is real.",
-        chinese="凡你能想像的，都是真實的。",
-        author="Pablo Picasso",
-        category="creativity",
-        source="Picasso attribution",
-    ),
-    CheerQuote(
-        english="Action is the foundational key to all success.",
-        chinese="行動是一切成功的基礎鑰匙。",
-        author="Pablo Picasso",
-        category="action",
-        source="Picasso attribution",
-    ),
-    CheerQuote(
-        english="Great things are done by a series of small things brought together.",
-        chinese="偉大的事，由一連串小事累積而成。",
-        author="Vincent van Gogh",
-        category="persistence",
-        source="Van Gogh attribution",
-    ),
-    CheerQuote(
-        english="What would life be if we had no courage to attempt anything?",
-        chinese="如果沒有勇氣嘗試任何事，人生會變成什麼？",
-        author="Vincent van Gogh",
-        category="courage",
-        source="Van Gogh letter attribution",
-    ),
-    CheerQuote(
-        english="If you hear a voice within you say you cannot paint, then by all means paint.",
-        chinese="如果你內心有聲音說你不能畫，那就更要去畫。",
-        author="Vincent van Gogh",
-        category="courage",
-        source="Van Gogh attribution",
-    ),
-    CheerQuote(
-        english="You are never too old to set another goal or to dream a new dream.",
-        chinese="無論年紀多大，都可以再設目標，或做一個新的夢。",
-        author="C. S. Lewis",
-        category="dream",
-        source="C. S. Lewis attribution",
-    ),
-    CheerQuote(
-        english="Hardships often prepare ordinary people for an extraordinary destiny.",
-        chinese="艱難常常為普通人準備非凡的命運。",
-        author="C. S. Lewis",
-        category="resilience",
-        source="C. S. Lewis attribution",
-    ),
-    CheerQuote(
-        english="You are never too old to be another goal-setter or to dream a new dream.",
-        chinese="你永遠不會老到不能重新設定目標，或做新的夢。",
-        author="C. S. Lewis",
-        category="dream",
-        source="C. S. Lewis attribution",
-    ),
-    CheerQuote(
-        english="The future belongs to those who believe in the beauty of their dreams.",
-        chinese="未來屬於相信夢想之美的人。",
-        author="Eleanor Roosevelt",
-        category="dream",
-        source="Eleanor Roosevelt attribution",
-    ),
-    CheerQuote(
-        english="Do one thing every day that scares you.",
-        chinese="每天做一件讓你害怕的事。",
-        author="Eleanor Roosevelt",
-        category="courage",
-        source="Eleanor Roosevelt attribution",
-    ),
-    CheerQuote(
-        english="No one can make you feel inferior without your consent.",
-        chinese="沒有你的同意，沒有人能讓你感到低人一等。",
-        author="Eleanor Roosevelt",
-        category="mindset",
-        source="Eleanor Roosevelt attribution",
-    ),
-    CheerQuote(
-        english="It takes as much energy to wish as it does to plan.",
-        chinese="空想所消耗的能量，與計劃一樣多。",
-        author="Eleanor Roosevelt",
-        category="action",
-        source="Eleanor Roosevelt attribution",
-    ),
-    CheerQuote(
-        english="Be yourself; everyone else is already taken.",
-        chinese="做你自己，因為其他人都已經有人做了。",
-        author="Oscar Wilde",
-        category="identity",
-        source="Oscar Wilde attribution",
-    ),
-    CheerQuote(
-        english="Experience is simply the name we give our mistakes.",
-        chinese="經驗，只是我們給錯誤起的名字。",
-        author="Oscar Wilde",
-        category="growth",
-        source="Oscar Wilde attribution",
-    ),
-    CheerQuote(
-        english="What seems to us as bitter trials are often blessings in disguise.",
-        chinese="看似苦澀的考驗，往往是偽裝的祝福。",
-        author="Oscar Wilde",
-        category="resilience",
-        source="Oscar Wilde attribution",
-    ),
-    CheerQuote(
-        english="The way to get started is to quit talking and begin doing.",
-        chinese="開始的方法，就是停止空談，開始行動。",
-        author="Walt Disney",
-        category="action",
-        source="Walt Disney attribution",
-    ),
-    CheerQuote(
-        english="If you can dream it, you can do it.",
-        chinese="如果你能夢想到它，你就能做到它。",
-        author="Walt Disney",
-        category="dream",
-        source="Walt Disney attribution",
-    ),
-    CheerQuote(
-        english="All our dreams can come true, if we have the courage to pursue them.",
-        chinese="只要有勇氣追尋，所有夢想都有可能成真。",
-        author="Walt Disney",
-        category="dream",
-        source="Walt Disney attribution",
-    ),
-    CheerQuote(
-        english="The only way to do great work is to love what you do.",
-        chinese="成就偉大工作的唯一方法，是熱愛你正在做的事。",
-        author="Steve Jobs",
-        category="work",
-        source="Stanford commencement address, 2005",
-    ),
-    CheerQuote(
-        english="Stay hungry, stay foolish.",
-        chinese="求知若飢，虛懷若愚。",
-        author="Steve Jobs",
-        category="growth",
-        source="Stanford commencement address, 2005",
-    ),
-    CheerQuote(
-        english="Innovation distinguishes between a leader and a follower.",
-        chinese="創新區分領導者與追隨者。",
-        author="Steve Jobs",
-        category="creativity",
-        source="Steve Jobs attribution",
-    ),
-    CheerQuote(
-        english="Your time is limited, so don’t waste it living someone else’s life.",
-        chinese="你的時間有限，不要浪費在過別人的人生。",
-        author="Steve Jobs",
-        category="identity",
-        source="Stanford commencement address, 2005",
-    ),
-    CheerQuote(
-        english="The biggest adventure you can take is to live the life of your dreams.",
-        chinese="你能展開最大的冒險，就是活出夢想中的人生。",
-        author="Oprah Winfrey",
-        category="dream",
-        source="Oprah Winfrey attribution",
-    ),
-    CheerQuote(
-        english="Turn your wounds into wisdom.",
-        chinese="把傷口轉化成智慧。",
-        author="Oprah Winfrey",
-        category="growth",
-        source="Oprah Winfrey attribution",
-    ),
-    CheerQuote(
-        english="Doing the best at this moment puts you in the best place for the next moment.",
-        chinese="此刻盡力，會讓你站在迎接下一刻的最好位置。",
-        author="Oprah Winfrey",
-        category="action",
-        source="Oprah Winfrey attribution",
-    ),
-    CheerQuote(
-        english="It always seems impossible until it is done.",
-        chinese="事情在完成之前，總是看似不可能。",
-        author="Nelson Mandela",
-        category="resilience",
-        source="Nelson Mandela attribution",
-    ),
-    CheerQuote(
-        english="May your choices reflect your hopes, not your fears.",
-        chinese="願你的選擇反映你的希望，而不是你的恐懼。",
-        author="Nelson Mandela",
-        category="courage",
-        source="Nelson Mandela attribution",
-    ),
-    CheerQuote(
-        english="After climbing a great hill, one only finds that there are many more hills to climb.",
-        chinese="登上一座高山後，才發現還有更多山要攀登。",
-        author="Nelson Mandela",
-        category="growth",
-        source="Long Walk to Freedom",
-    ),
-    CheerQuote(
-        english="Education is the most powerful weapon which you can use to change the world.",
-        chinese="教育是你可以用來改變世界的最強大武器。",
-        author="Nelson Mandela",
-        category="growth",
-        source="Nelson Mandela attribution",
-    ),
-    CheerQuote(
-        english="The greatest glory in living lies not in never falling, but in rising every time we fall.",
-        chinese="人生最大的榮耀，不在於從不跌倒，而在於每次跌倒後都能再站起來。",
-        author="Nelson Mandela",
-        category="resilience",
-        source="Commonly attributed to Nelson Mandela",
-    ),
-    CheerQuote(
-        english="In the middle of difficulty lies opportunity.",
-        chinese="困難之中，往往藏著機會。",
-        author="Albert Einstein",
-        category="opportunity",
-        source="Einstein attribution",
-    ),
-    CheerQuote(
-        english="Life is like riding a bicycle. To keep your balance, you must keep moving.",
-        chinese="人生就像騎單車；要保持平衡，就必須前進。",
-        author="Albert Einstein",
-        category="persistence",
-        source="Einstein letter attribution",
-    ),
-    CheerQuote(
-        english="Try not to become a person of success, but rather try to become a person of value.",
-        chinese="不要只追求成功，而要努力成為有價值的人。",
-        author="Albert Einstein",
-        category="values",
-        source="Einstein attribution",
-    ),
-    CheerQuote(
-        english="I have not failed. I’ve just found 10,000 ways that won’t work.",
-        chinese="我沒有失敗，我只是找到了一萬種行不通的方法。",
-        author="Thomas Edison",
-        category="resilience",
-        source="Thomas Edison attribution",
-    ),
-    CheerQuote(
-        english="Genius is one percent inspiration and ninety-nine percent perspiration.",
-        chinese="天才是一分靈感，九十九分汗水。",
-        author="Thomas Edison",
-        category="work",
-        source="Thomas Edison attribution",
-    ),
-    CheerQuote(
-        english="Opportunity is missed by most people because it is dressed in overalls and looks like work.",
-        chinese="多數人錯過機會，是因為它穿著工裝，看起來像工作。",
-        author="Thomas Edison",
-        category="work",
-        source="Thomas Edison attribution",
-    ),
-    CheerQuote(
-        english="Whether you think you can, or you think you can’t — you’re right.",
-        chinese="無論你認為自己做得到，還是做不到，你都是對的。",
-        author="Henry Ford",
-        category="mindset",
-        source="Henry Ford attribution",
-    ),
-    CheerQuote(
-        english="Quality means doing it right when no one is looking.",
-        chinese="品質是無人注視時仍把事情做對。",
-        author="Henry Ford",
-        category="excellence",
-        source="Henry Ford attribution",
-    ),
-    CheerQuote(
-        english="Failure is simply the opportunity to begin again, this time more intelligently.",
-        chinese="失敗只是重新開始的機會，這次更聰明地開始。",
-        author="Henry Ford",
-        category="resilience",
-        source="Henry Ford attribution",
-    ),
-    CheerQuote(
-        english="If everyone is moving forward together, then success takes care of itself.",
-        chinese="如果大家一起向前，成功自然會照顧自己。",
-        author="Henry Ford",
-        category="teamwork",
-        source="Henry Ford attribution",
-    ),
-    CheerQuote(
-        english="The best way to predict your future is to create it.",
-        chinese="預測未來最好的方法，就是親手創造它。",
-        author="Peter Drucker",
-        category="future",
-        source="Peter Drucker attribution",
-    ),
-    CheerQuote(
-        english="What gets measured gets managed.",
-        chinese="能被衡量的事，才會被管理。",
-        author="Peter Drucker",
-        category="work",
-        source="Peter Drucker attribution",
-    ),
-    CheerQuote(
-        english="The most effective way to do it, is to do it.",
-        chinese="完成一件事最有效的方法，就是去做。",
-        author="Amelia Earhart",
-        category="action",
-        source="Amelia Earhart attribution",
-    ),
-    CheerQuote(
-        english="Adventure is worthwhile in itself.",
-        chinese="冒險本身就值得。",
-        author="Amelia Earhart",
-        category="courage",
-        source="Amelia Earhart attribution",
-    ),
-    CheerQuote(
-        english="The most difficult thing is the decision to act, the rest is merely tenacity.",
-        chinese="最困難的是決定行動，其餘只是堅持。",
-        author="Amelia Earhart",
-        category="action",
-        source="Amelia Earhart attribution",
-    ),
-    CheerQuote(
-        english="What lies behind us and what lies before us are tiny matters compared to what lies within us.",
-        chinese="身後與眼前的事，比起我們內在的力量都很渺小。",
-        author="Ralph Waldo Emerson",
-        category="strength",
-        source="Emerson attribution",
-    ),
-    CheerQuote(
-        english="Always do what you are afraid to do.",
-        chinese="永遠去做你害怕做的事。",
-        author="Ralph Waldo Emerson",
-        category="courage",
-        source="Emerson attribution",
-    ),
-    CheerQuote(
-        english="The only person you are destined to become is the person you decide to be.",
-        chinese="你注定會成為的人，是你決定成為的人。",
-        author="Ralph Waldo Emerson",
-        category="identity",
-        source="Emerson attribution",
-    ),
-    CheerQuote(
-        english="Go confidently in the direction of your dreams. Live the life you have imagined.",
-        chinese="自信地朝夢想前進，活出你想像中的人生。",
-        author="Henry David Thoreau",
-        category="dream",
-        source="Walden / Thoreau attribution",
-    ),
-    CheerQuote(
-        english="Success usually comes to those who are too busy to be looking for it.",
-        chinese="成功通常會來到那些忙到沒空尋找成功的人身上。",
-        author="Henry David Thoreau",
-        category="work",
-        source="Thoreau attribution",
-    ),
-    CheerQuote(
-        english="You cannot swim for new horizons until you have courage to lose sight of the shore.",
-        chinese="若沒有離岸的勇氣，就無法游向新的地平線。",
-        author="William Faulkner",
-        category="courage",
-        source="William Faulkner attribution",
-    ),
-    CheerQuote(
-        english="Don’t bother just to be better than others. Try to be better than yourself.",
-        chinese="不要只想比別人好，要努力比昨天的自己更好。",
-        author="William Faulkner",
-        category="growth",
-        source="William Faulkner attribution",
-    ),
-    CheerQuote(
-        english="Not all those who wander are lost.",
-        chinese="並非所有徘徊的人都迷失了。",
-        author="J. R. R. Tolkien",
-        category="journey",
-        source="The Fellowship of the Ring",
-    ),
-    CheerQuote(
-        english="Little by little, one travels far.",
-        chinese="一點一點地，人能走得很遠。",
-        author="J. R. R. Tolkien",
-        category="persistence",
-        source="Tolkien attribution",
-    ),
-    CheerQuote(
-        english="It is our choices that show what we truly are, far more than our abilities.",
-        chinese="真正顯示我們是誰的，是選擇，而遠不只是能力。",
-        author="J. K. Rowling",
-        category="choices",
-        source="Harry Potter and the Chamber of Secrets",
-    ),
-    CheerQuote(
-        english="Rock bottom became the solid foundation on which I rebuilt my life.",
-        chinese="人生谷底，成了我重建人生的堅實地基。",
-        author="J. K. Rowling",
-        category="resilience",
-        source="Harvard commencement address, 2008",
-    ),
-    CheerQuote(
-        english="We do not need magic to transform our world. We carry all the power we need inside ourselves already.",
-        chinese="我們不需要魔法去改變世界；我們所需的力量，早已在自己內心。",
-        author="J. K. Rowling",
-        category="strength",
-        source="Harvard commencement address, 2008",
-    ),
-    CheerQuote(
-        english="If you want to lift yourself up, lift up someone else.",
-        chinese="想提升自己，先扶起他人。",
-        author="Booker T. Washington",
-        category="support",
-        source="Booker T. Washington attribution",
-    ),
-    CheerQuote(
-        english="Character is power.",
-        chinese="品格就是力量。",
-        author="Booker T. Washington",
-        category="values",
-        source="Booker T. Washington attribution",
-    ),
-    CheerQuote(
-        english="I have learned that success is to be measured not so much by the position one has reached in life as by the obstacles overcome.",
-        chinese="衡量成功，不在於一個人到達的位置，而在於他克服過多少障礙。",
-        author="Booker T. Washington",
-        category="resilience",
-        source="Up from Slavery",
-    ),
-    CheerQuote(
-        english="The future depends on what you do today.",
-        chinese="未來取決於你今天做什麼。",
-        author="Mahatma Gandhi",
-        category="action",
-        source="Gandhi attribution",
-    ),
-    CheerQuote(
-        english="Be the change that you wish to see in the world.",
-        chinese="成為你想在世界上看見的改變。",
-        author="Mahatma Gandhi",
-        category="action",
-        source="Gandhi attribution",
-    ),
-    CheerQuote(
-        english="Live as if you were to die tomorrow. Learn as if you were to live forever.",
-        chinese="像明天就會死去般生活，像永遠活著般學習。",
-        author="Mahatma Gandhi",
-        category="growth",
-        source="Gandhi attribution",
-    ),
-    CheerQuote(
-        english="Strength does not come from physical capacity. It comes from an indomitable will.",
-        chinese="力量不是來自身體能力，而是來自不屈的意志。",
-        author="Mahatma Gandhi",
-        category="strength",
-        source="Gandhi attribution",
+    (
+        "The secret of getting ahead is getting started.",
+        "前進的祕訣，就是先開始。",
+        "Mark Twain",
+        "action",
+        "Mark Twain attribution",
+    ),
+    (
+        "The man who does not read has no advantage over the man who cannot read.",
+        "不讀書的人，並不比不識字的人有優勢。",
+        "Mark Twain",
+        "growth",
+        "Mark Twain attribution",
+    ),
+    (
+        "Courage is resistance to fear, mastery of fear — not absence of fear.",
+        "勇氣是抵抗恐懼、駕馭恐懼，而不是沒有恐懼。",
+        "Mark Twain",
+        "courage",
+        "Mark Twain attribution",
+    ),
+    (
+        "It is not in the stars to hold our destiny but in ourselves.",
+        "掌握命運的不是星辰，而是我們自己。",
+        "William Shakespeare",
+        "mindset",
+        "Julius Caesar",
+    ),
+    (
+        "Our doubts are traitors, and make us lose the good we oft might win.",
+        "懷疑是叛徒，常令我們錯失原本能贏得的美好。",
+        "William Shakespeare",
+        "courage",
+        "Measure for Measure",
+    ),
+    (
+        "To thine own self be true.",
+        "忠於你自己。",
+        "William Shakespeare",
+        "integrity",
+        "Hamlet",
+    ),
+    (
+        "We know what we are, but know not what we may be.",
+        "我們知道自己現在是誰，卻不知道自己可以成為誰。",
+        "William Shakespeare",
+        "growth",
+        "Hamlet",
+    ),
+    (
+        "If music be the food of love, play on.",
+        "若音樂是愛的食糧，那就繼續奏下去。",
+        "William Shakespeare",
+        "hope",
+        "Twelfth Night",
+    ),
+    (
+        "Knowing is not enough; we must apply. Willing is not enough; we must do.",
+        "知道還不夠，必須實踐；願意還不夠，必須行動。",
+        "Johann Wolfgang von Goethe",
+        "action",
+        "Goethe attribution",
+    ),
+    (
+        "Whatever you can do or dream you can, begin it.",
+        "凡是你能做或夢想能做的事，開始吧。",
+        "Johann Wolfgang von Goethe",
+        "action",
+        "Goethe attribution",
+    ),
+    (
+        "He who has a why to live can bear almost any how.",
+        "知道為何而活的人，幾乎能承受任何困難。",
+        "Friedrich Nietzsche",
+        "purpose",
+        "Twilight of the Idols / Nietzsche attribution",
+    ),
+    (
+        "That which does not kill us makes us stronger.",
+        "殺不死我們的，會使我們更強大。",
+        "Friedrich Nietzsche",
+        "strength",
+        "Twilight of the Idols",
+    ),
+    (
+        "One must still have chaos in oneself to be able to give birth to a dancing star.",
+        "人內心仍須有混沌，才能誕生一顆會跳舞的星。",
+        "Friedrich Nietzsche",
+        "creativity",
+        "Thus Spoke Zarathustra",
+    ),
+    (
+        "Everything you can imagine is real.",
+        "凡你能想像的，都是真實的。",
+        "Pablo Picasso",
+        "creativity",
+        "Picasso attribution",
+    ),
+    (
+        "Action is the foundational key to all success.",
+        "行動是一切成功的基礎鑰匙。",
+        "Pablo Picasso",
+        "action",
+        "Picasso attribution",
+    ),
+    (
+        "Great things are done by a series of small things brought together.",
+        "偉大的事，由一連串小事累積而成。",
+        "Vincent van Gogh",
+        "persistence",
+        "Van Gogh attribution",
+    ),
+    (
+        "What would life be if we had no courage to attempt anything?",
+        "如果沒有勇氣嘗試任何事，人生會變成什麼？",
+        "Vincent van Gogh",
+        "courage",
+        "Van Gogh letter attribution",
+    ),
+    (
+        "If you hear a voice within you say you cannot paint, then by all means paint.",
+        "如果你內心有聲音說你不能畫，那就更要去畫。",
+        "Vincent van Gogh",
+        "courage",
+        "Van Gogh attribution",
+    ),
+    (
+        "You are never too old to set another goal or to dream a new dream.",
+        "無論年紀多大，都可以再設目標，或做一個新的夢。",
+        "C. S. Lewis",
+        "dream",
+        "C. S. Lewis attribution",
+    ),
+    (
+        "Hardships often prepare ordinary people for an extraordinary destiny.",
+        "艱難常常為普通人準備非凡的命運。",
+        "C. S. Lewis",
+        "resilience",
+        "C. S. Lewis attribution",
+    ),
+    (
+        "You are never too old to be another goal-setter or to dream a new dream.",
+        "你永遠不會老到不能重新設定目標，或做新的夢。",
+        "C. S. Lewis",
+        "dream",
+        "C. S. Lewis attribution",
+    ),
+    (
+        "The future belongs to those who believe in the beauty of their dreams.",
+        "未來屬於相信夢想之美的人。",
+        "Eleanor Roosevelt",
+        "dream",
+        "Eleanor Roosevelt attribution",
+    ),
+    (
+        "Do one thing every day that scares you.",
+        "每天做一件讓你害怕的事。",
+        "Eleanor Roosevelt",
+        "courage",
+        "Eleanor Roosevelt attribution",
+    ),
+    (
+        "No one can make you feel inferior without your consent.",
+        "沒有你的同意，沒有人能讓你感到低人一等。",
+        "Eleanor Roosevelt",
+        "mindset",
+        "Eleanor Roosevelt attribution",
+    ),
+    (
+        "It takes as much energy to wish as it does to plan.",
+        "空想所消耗的能量，與計劃一樣多。",
+        "Eleanor Roosevelt",
+        "action",
+        "Eleanor Roosevelt attribution",
+    ),
+    (
+        "Be yourself; everyone else is already taken.",
+        "做你自己，因為其他人都已經有人做了。",
+        "Oscar Wilde",
+        "identity",
+        "Oscar Wilde attribution",
+    ),
+    (
+        "Experience is simply the name we give our mistakes.",
+        "經驗，只是我們給錯誤起的名字。",
+        "Oscar Wilde",
+        "growth",
+        "Oscar Wilde attribution",
+    ),
+    (
+        "What seems to us as bitter trials are often blessings in disguise.",
+        "看似苦澀的考驗，往往是偽裝的祝福。",
+        "Oscar Wilde",
+        "resilience",
+        "Oscar Wilde attribution",
+    ),
+    (
+        "The way to get started is to quit talking and begin doing.",
+        "開始的方法，就是停止空談，開始行動。",
+        "Walt Disney",
+        "action",
+        "Walt Disney attribution",
+    ),
+    (
+        "If you can dream it, you can do it.",
+        "如果你能夢想到它，你就能做到它。",
+        "Walt Disney",
+        "dream",
+        "Walt Disney attribution",
+    ),
+    (
+        "All our dreams can come true, if we have the courage to pursue them.",
+        "只要有勇氣追尋，所有夢想都有可能成真。",
+        "Walt Disney",
+        "dream",
+        "Walt Disney attribution",
+    ),
+    (
+        "The only way to do great work is to love what you do.",
+        "成就偉大工作的唯一方法，是熱愛你正在做的事。",
+        "Steve Jobs",
+        "work",
+        "Stanford commencement address, 2005",
+    ),
+    (
+        "Stay hungry, stay foolish.",
+        "求知若飢，虛懷若愚。",
+        "Steve Jobs",
+        "growth",
+        "Stanford commencement address, 2005",
+    ),
+    (
+        "Innovation distinguishes between a leader and a follower.",
+        "創新區分領導者與追隨者。",
+        "Steve Jobs",
+        "creativity",
+        "Steve Jobs attribution",
+    ),
+    (
+        "Your time is limited, so don’t waste it living someone else’s life.",
+        "你的時間有限，不要浪費在過別人的人生。",
+        "Steve Jobs",
+        "identity",
+        "Stanford commencement address, 2005",
+    ),
+    (
+        "The biggest adventure you can take is to live the life of your dreams.",
+        "你能展開最大的冒險，就是活出夢想中的人生。",
+        "Oprah Winfrey",
+        "dream",
+        "Oprah Winfrey attribution",
+    ),
+    (
+        "Turn your wounds into wisdom.",
+        "把傷口轉化成智慧。",
+        "Oprah Winfrey",
+        "growth",
+        "Oprah Winfrey attribution",
+    ),
+    (
+        "Doing the best at this moment puts you in the best place for the next moment.",
+        "此刻盡力，會讓你站在迎接下一刻的最好位置。",
+        "Oprah Winfrey",
+        "action",
+        "Oprah Winfrey attribution",
+    ),
+    (
+        "It always seems impossible until it is done.",
+        "事情在完成之前，總是看似不可能。",
+        "Nelson Mandela",
+        "resilience",
+        "Nelson Mandela attribution",
+    ),
+    (
+        "May your choices reflect your hopes, not your fears.",
+        "願你的選擇反映你的希望，而不是你的恐懼。",
+        "Nelson Mandela",
+        "courage",
+        "Nelson Mandela attribution",
+    ),
+    (
+        "After climbing a great hill, one only finds that there are many more hills to climb.",
+        "登上一座高山後，才發現還有更多山要攀登。",
+        "Nelson Mandela",
+        "growth",
+        "Long Walk to Freedom",
+    ),
+    (
+        "Education is the most powerful weapon which you can use to change the world.",
+        "教育是你可以用來改變世界的最強大武器。",
+        "Nelson Mandela",
+        "growth",
+        "Nelson Mandela attribution",
+    ),
+    (
+        "The greatest glory in living lies not in never falling, but in rising every time we fall.",
+        "人生最大的榮耀，不在於從不跌倒，而在於每次跌倒後都能再站起來。",
+        "Nelson Mandela",
+        "resilience",
+        "Commonly attributed to Nelson Mandela",
+    ),
+    (
+        "In the middle of difficulty lies opportunity.",
+        "困難之中，往往藏著機會。",
+        "Albert Einstein",
+        "opportunity",
+        "Einstein attribution",
+    ),
+    (
+        "Life is like riding a bicycle. To keep your balance, you must keep moving.",
+        "人生就像騎單車；要保持平衡，就必須前進。",
+        "Albert Einstein",
+        "persistence",
+        "Einstein letter attribution",
+    ),
+    (
+        "Try not to become a person of success, but rather try to become a person of value.",
+        "不要只追求成功，而要努力成為有價值的人。",
+        "Albert Einstein",
+        "values",
+        "Einstein attribution",
+    ),
+    (
+        "I have not failed. I’ve just found 10,000 ways that won’t work.",
+        "我沒有失敗，我只是找到了一萬種行不通的方法。",
+        "Thomas Edison",
+        "resilience",
+        "Thomas Edison attribution",
+    ),
+    (
+        "Genius is one percent inspiration and ninety-nine percent perspiration.",
+        "天才是一分靈感，九十九分汗水。",
+        "Thomas Edison",
+        "work",
+        "Thomas Edison attribution",
+    ),
+    (
+        "Opportunity is missed by most people because it is dressed in overalls and looks like work.",
+        "多數人錯過機會，是因為它穿著工裝，看起來像工作。",
+        "Thomas Edison",
+        "work",
+        "Thomas Edison attribution",
+    ),
+    (
+        "Whether you think you can, or you think you can’t — you’re right.",
+        "無論你認為自己做得到，還是做不到，你都是對的。",
+        "Henry Ford",
+        "mindset",
+        "Henry Ford attribution",
+    ),
+    (
+        "Quality means doing it right when no one is looking.",
+        "品質是無人注視時仍把事情做對。",
+        "Henry Ford",
+        "excellence",
+        "Henry Ford attribution",
+    ),
+    (
+        "Failure is simply the opportunity to begin again, this time more intelligently.",
+        "失敗只是重新開始的機會，這次更聰明地開始。",
+        "Henry Ford",
+        "resilience",
+        "Henry Ford attribution",
+    ),
+    (
+        "If everyone is moving forward together, then success takes care of itself.",
+        "如果大家一起向前，成功自然會照顧自己。",
+        "Henry Ford",
+        "teamwork",
+        "Henry Ford attribution",
+    ),
+    (
+        "The best way to predict your future is to create it.",
+        "預測未來最好的方法，就是親手創造它。",
+        "Peter Drucker",
+        "future",
+        "Peter Drucker attribution",
+    ),
+    (
+        "What gets measured gets managed.",
+        "能被衡量的事，才會被管理。",
+        "Peter Drucker",
+        "work",
+        "Peter Drucker attribution",
+    ),
+    (
+        "The most effective way to do it, is to do it.",
+        "完成一件事最有效的方法，就是去做。",
+        "Amelia Earhart",
+        "action",
+        "Amelia Earhart attribution",
+    ),
+    (
+        "Adventure is worthwhile in itself.",
+        "冒險本身就值得。",
+        "Amelia Earhart",
+        "courage",
+        "Amelia Earhart attribution",
+    ),
+    (
+        "The most difficult thing is the decision to act, the rest is merely tenacity.",
+        "最困難的是決定行動，其餘只是堅持。",
+        "Amelia Earhart",
+        "action",
+        "Amelia Earhart attribution",
+    ),
+    (
+        "What lies behind us and what lies before us are tiny matters compared to what lies within us.",
+        "身後與眼前的事，比起我們內在的力量都很渺小。",
+        "Ralph Waldo Emerson",
+        "strength",
+        "Emerson attribution",
+    ),
+    (
+        "Always do what you are afraid to do.",
+        "永遠去做你害怕做的事。",
+        "Ralph Waldo Emerson",
+        "courage",
+        "Emerson attribution",
+    ),
+    (
+        "The only person you are destined to become is the person you decide to be.",
+        "你注定會成為的人，是你決定成為的人。",
+        "Ralph Waldo Emerson",
+        "identity",
+        "Emerson attribution",
+    ),
+    (
+        "Go confidently in the direction of your dreams. Live the life you have imagined.",
+        "自信地朝夢想前進，活出你想像中的人生。",
+        "Henry David Thoreau",
+        "dream",
+        "Walden / Thoreau attribution",
+    ),
+    (
+        "Success usually comes to those who are too busy to be looking for it.",
+        "成功通常會來到那些忙到沒空尋找成功的人身上。",
+        "Henry David Thoreau",
+        "work",
+        "Thoreau attribution",
+    ),
+    (
+        "You cannot swim for new horizons until you have courage to lose sight of the shore.",
+        "若沒有離岸的勇氣，就無法游向新的地平線。",
+        "William Faulkner",
+        "courage",
+        "William Faulkner attribution",
+    ),
+    (
+        "Don’t bother just to be better than others. Try to be better than yourself.",
+        "不要只想比別人好，要努力比昨天的自己更好。",
+        "William Faulkner",
+        "growth",
+        "William Faulkner attribution",
+    ),
+    (
+        "Not all those who wander are lost.",
+        "並非所有徘徊的人都迷失了。",
+        "J. R. R. Tolkien",
+        "journey",
+        "The Fellowship of the Ring",
+    ),
+    (
+        "Little by little, one travels far.",
+        "一點一點地，人能走得很遠。",
+        "J. R. R. Tolkien",
+        "persistence",
+        "Tolkien attribution",
+    ),
+    (
+        "It is our choices that show what we truly are, far more than our abilities.",
+        "真正顯示我們是誰的，是選擇，而遠不只是能力。",
+        "J. K. Rowling",
+        "choices",
+        "Harry Potter and the Chamber of Secrets",
+    ),
+    (
+        "Rock bottom became the solid foundation on which I rebuilt my life.",
+        "人生谷底，成了我重建人生的堅實地基。",
+        "J. K. Rowling",
+        "resilience",
+        "Harvard commencement address, 2008",
+    ),
+    (
+        "We do not need magic to transform our world. We carry all the power we need inside ourselves already.",
+        "我們不需要魔法去改變世界；我們所需的力量，早已在自己內心。",
+        "J. K. Rowling",
+        "strength",
+        "Harvard commencement address, 2008",
+    ),
+    (
+        "If you want to lift yourself up, lift up someone else.",
+        "想提升自己，先扶起他人。",
+        "Booker T. Washington",
+        "support",
+        "Booker T. Washington attribution",
+    ),
+    (
+        "Character is power.",
+        "品格就是力量。",
+        "Booker T. Washington",
+        "values",
+        "Booker T. Washington attribution",
+    ),
+    (
+        "I have learned that success is to be measured not so much by the position one has reached in life as by the obstacles overcome.",
+        "衡量成功，不在於一個人到達的位置，而在於他克服過多少障礙。",
+        "Booker T. Washington",
+        "resilience",
+        "Up from Slavery",
+    ),
+    (
+        "The future depends on what you do today.",
+        "未來取決於你今天做什麼。",
+        "Mahatma Gandhi",
+        "action",
+        "Gandhi attribution",
+    ),
+    (
+        "Be the change that you wish to see in the world.",
+        "成為你想在世界上看見的改變。",
+        "Mahatma Gandhi",
+        "action",
+        "Gandhi attribution",
+    ),
+    (
+        "Live as if you were to die tomorrow. Learn as if you were to live forever.",
+        "像明天就會死去般生活，像永遠活著般學習。",
+        "Mahatma Gandhi",
+        "growth",
+        "Gandhi attribution",
+    ),
+    (
+        "Strength does not come from physical capacity. It comes from an indomitable will.",
+        "力量不是來自身體能力，而是來自不屈的意志。",
+        "Mahatma Gandhi",
+        "strength",
+        "Gandhi attribution",
     ),
 
     # --- Gentle / Short modern encouragement, intentionally authorless ---
-    CheerQuote(
-        english="Small steps every day still move you forward.",
-        chinese="每天走一小步，也是在向前。",
-        author="Unknown",
-        category="gentle",
-        source="Original-style encouragement / no author attribution",
-    ),
-    CheerQuote(
-        english="Rest if you must, but don’t quit.",
-        chinese="累了可以休息，但不要放棄。",
-        author="Unknown",
-        category="gentle",
-        source="Traditional encouragement / no author attribution",
-    ),
-    CheerQuote(
-        english="You have survived every difficult day so far.",
-        chinese="到目前為止，你已經撐過了所有艱難的日子。",
-        author="Unknown",
-        category="gentle",
-        source="Original-style encouragement / no author attribution",
-    ),
-    CheerQuote(
-        english="Progress does not need to be loud to be real.",
-        chinese="進步不一定要轟烈，真實就已經足夠。",
-        author="Unknown",
-        category="gentle",
-        source="Original-style encouragement / no author attribution",
-    ),
-    CheerQuote(
-        english="One more try can change the whole story.",
-        chinese="再試一次，可能就會改寫整個故事。",
-        author="Unknown",
-        category="persistence",
-        source="Original-style encouragement / no author attribution",
-    ),
-    CheerQuote(
-        english="You do not need to be perfect to be proud of yourself.",
-        chinese="你不需要完美，也值得為自己感到驕傲。",
-        author="Unknown",
-        category="gentle",
-        source="Original-style encouragement / no author attribution",
-    ),
-    CheerQuote(
-        english="Your pace is still a pace.",
-        chinese="你的速度再慢，也仍然是在前進。",
-        author="Unknown",
-        category="gentle",
-        source="Original-style encouragement / no author attribution",
-    ),
-    CheerQuote(
-        english="Today’s effort is tomorrow’s confidence.",
-        chinese="今天的努力，會成為明天的底氣。",
-        author="Unknown",
-        category="motivation",
-        source="Original-style encouragement / no author attribution",
-    ),
-    CheerQuote(
-        english="Keep going. The version of you who started this is still counting on you.",
-        chinese="繼續走下去。當初開始的那個你，仍然在相信你。",
-        author="Unknown",
-        category="persistence",
-        source="Original-style encouragement / no author attribution",
-    ),
-    CheerQuote(
-        english="You are closer than you think.",
-        chinese="你比自己想像中更接近目標。",
-        author="Unknown",
-        category="motivation",
-        source="Original-style encouragement / no author attribution",
-    ),
-]
+    (
+        "Small steps every day still move you forward.",
+        "每天走一小步，也是在向前。",
+        "Unknown",
+        "gentle",
+        "Original-style encouragement / no author attribution",
+    ),
+    (
+        "Rest if you must, but don’t quit.",
+        "累了可以休息，但不要放棄。",
+        "Unknown",
+        "gentle",
+        "Traditional encouragement / no author attribution",
+    ),
+    (
+        "You have survived every difficult day so far.",
+        "到目前為止，你已經撐過了所有艱難的日子。",
+        "Unknown",
+        "gentle",
+        "Original-style encouragement / no author attribution",
+    ),
+    (
+        "Progress does not need to be loud to be real.",
+        "進步不一定要轟烈，真實就已經足夠。",
+        "Unknown",
+        "gentle",
+        "Original-style encouragement / no author attribution",
+    ),
+    (
+        "One more try can change the whole story.",
+        "再試一次，可能就會改寫整個故事。",
+        "Unknown",
+        "persistence",
+        "Original-style encouragement / no author attribution",
+    ),
+    (
+        "You do not need to be perfect to be proud of yourself.",
+        "你不需要完美，也值得為自己感到驕傲。",
+        "Unknown",
+        "gentle",
+        "Original-style encouragement / no author attribution",
+    ),
+    (
+        "Your pace is still a pace.",
+        "你的速度再慢，也仍然是在前進。",
+        "Unknown",
+        "gentle",
+        "Original-style encouragement / no author attribution",
+    ),
+    (
+        "Today’s effort is tomorrow’s confidence.",
+        "今天的努力，會成為明天的底氣。",
+        "Unknown",
+        "motivation",
+        "Original-style encouragement / no author attribution",
+    ),
+    (
+        "Keep going. The version of you who started this is still counting on you.",
+        "繼續走下去。當初開始的那個你，仍然在相信你。",
+        "Unknown",
+        "persistence",
+        "Original-style encouragement / no author attribution",
+    ),
+    (
+        "You are closer than you think.",
+        "你比自己想像中更接近目標。",
+        "Unknown",
+        "motivation",
+        "Original-style encouragement / no author attribution",
+    ),
+)
+
+
+@lru_cache(maxsize=None)
+def cheer_quote(index: int) -> CheerQuote:
+    return CheerQuote(*QUOTE_ROWS[index])
+
+
+def random_cheer_quote() -> CheerQuote:
+    return cheer_quote(random.randrange(len(QUOTE_ROWS)))
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Protocol
+
+import config
+
+
+KIND_PRE = "pre"
+KIND_START = "start"
+
+REMIND_BEFORE_MINUTES = 5
+
+
+class ScheduleLike(Protocol):
+    weekdays: list[int]
+    time_hhmm: str
+
+
+class ActivityLike(Protocol):
+    id: str
+    schedules: list[ScheduleLike]
+
+
+def get_catch_up_grace() -> timedelta:
+    try:
+        minutes = float(getattr(config, "ACTIVITY_REMINDER_CATCH_UP_MINUTES", 10))
+    except (TypeError, ValueError):
+        minutes = 10.0
+    return timedelta(minutes=max(0.0, minutes))
+
+
+def _at(day: date, time_hhmm: str, like: datetime) -> datetime:
+    hh, mm = map(int, time_hhmm.split(":"))
+    return datetime(day.year, day.month, day.day, hh, mm, tzinfo=like.tzinfo)
+
+
+def next_occurrence(weekdays: Sequence[int], time_hhmm: str, since: datetime) -> datetime | None:
+    """Earliest start time on one of `weekdays` at `time_hhmm` that is not before `since`."""
+    if not weekdays:
+        return None
+    for offset in range(8):
+        day = since.date() + timedelta(days=offset)
+        if day.weekday() not in weekdays:
+            continue
+        start = _at(day, time_hhmm, since)
+        if start >= since:
+            return start
+    return None
+
+
+def fire_offset(kind: str) -> timedelta:
+    return timedelta(minutes=REMIND_BEFORE_MINUTES) if kind == KIND_PRE else timedelta(0)
+
+
+@dataclass(frozen=True)
+class DueReminder:
+    activity_id: str
+    schedule_idx: int
+    kind: str
+    event_dt: datetime  # 活動開始時間（"pre" 都係用開始時間）
+    fire_at: datetime
+
+    @property
+    def sent_key(self) -> str:
+        return f"{self.activity_id}|{self.schedule_idx}|{self.event_dt.date().isoformat()}|{self.kind}"
+
+
+@dataclass(order=True)
+class _Entry:
+    fire_at: datetime
+    seq: int
+    activity_id: str = field(compare=False)
+    schedule_idx: int = field(compare=False)
+    kind: str = field(compare=False)
+    event_dt: datetime = field(compare=False)
+    schedule: ScheduleLike = field(compare=False)
+    version: int = field(compare=False)
+
+
+class ReminderIndex:
+    """Min-heap of the next "pre" / "start" fire time of every schedule.
+
+    Each (activity, schedule, kind) has exactly one live entry. Changing an
+    activity bumps its version, so its old entries are dropped lazily when they
+    reach the top of the heap.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[_Entry] = []
+        self._versions: dict[str, int] = {}
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self._heap if self._is_live(entry))
+
+    def _is_live(self, entry: _Entry) -> bool:
+        return self._versions.get(entry.activity_id) == entry.version
+
+    def _push(self, activity_id: str, schedule_idx: int, kind: str, schedule: ScheduleLike, since: datetime) -> None:
+        offset = fire_offset(kind)
+        event_dt = next_occurrence(schedule.weekdays, schedule.time_hhmm, since + offset)
+        if event_dt is None:
+            return
+        heapq.heappush(
+            self._heap,
+            _Entry(
+                fire_at=event_dt - offset,
+                seq=next(self._seq),
+                activity_id=activity_id,
+                schedule_idx=schedule_idx,
+                kind=kind,
+                event_dt=event_dt,
+                schedule=schedule,
+                version=self._versions[activity_id],
+            ),
+        )
+
+    def refresh(self, activity: ActivityLike, since: datetime) -> None:
+        """Recompute one activity's fire times from `since` onwards."""
+        self._versions[activity.id] = self._versions.get(activity.id, 0) + 1
+        for idx, schedule in enumerate(activity.schedules):
+            for kind in (KIND_PRE, KIND_START):
+                self._push(activity.id, idx, kind, schedule, since)
+        self._compact()
+
+    def remove(self, activity_id: str) -> None:
+        self._versions.pop(activity_id, None)
+        self._compact()
+
+    def rebuild(self, activities: Iterable[ActivityLike], since: datetime) -> None:
+        self._heap.clear()
+        self._versions.clear()
+        for activity in activities:
+            self.refresh(activity, since)
+
+    def _compact(self) -> None:
+        # 過期 entry 太多先重建，平時靠 pop 時順手丟棄
+        if len(self._heap) > 2 * max(16, sum(1 for e in self._heap if self._is_live(e))):
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+
+    def next_fire_at(self) -> datetime | None:
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0].fire_at if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[DueReminder]:
+        """Pop every reminder whose fire time is not after `now` and queue its next occurrence."""
+        due: list[DueReminder] = []
+        while (fire_at := self.next_fire_at()) is not None and fire_at <= now:
+            entry = heapq.heappop(self._heap)
+            due.append(
+                DueReminder(
+                    activity_id=entry.activity_id,
+                    schedule_idx=entry.schedule_idx,
+                    kind=entry.kind,
+                    event_dt=entry.event_dt,
+                    fire_at=entry.fire_at,
+                )
+            )
+            self._push(entry.activity_id, entry.schedule_idx, entry.kind, entry.schedule, fire_at + timedelta(minutes=1))
+        return due
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+
+from core.json_storage import load_json_object
+from core.sqlite_storage import connect_sqlite, enable_wal
+from core.storage_paths import ACTIVITY_REMINDER_JSON_PATH, STATS_DB
+
+log = logging.getLogger("con9sole-bartender.activity-reminder.storage")
+
+MIGRATED_SUFFIX = ".migrated"
+
+
+@dataclass
+class Schedule:
+    # weekdays: 0=Mon ... 6=Sun
+    weekdays: list[int]
+    time_hhmm: str  # "HH:MM"
+
+
+@dataclass
+class Activity:
+    id: str
+    name: str
+    channel_id: int
+    ping_role_id: int
+    schedules: list[Schedule]
+
+
+def init_activity_db(path: Path = STATS_DB) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with connect_sqlite(path) as conn:
+        enable_wal(conn)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS activities (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                channel_id INTEGER NOT NULL,
+                ping_role_id INTEGER NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS activity_schedules (
+                activity_id TEXT NOT NULL REFERENCES activities(id) ON DELETE CASCADE,
+                schedule_idx INTEGER NOT NULL,
+                weekdays TEXT NOT NULL,
+                time_hhmm TEXT NOT NULL,
+                PRIMARY KEY (activity_id, schedule_idx)
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS activity_reminders_sent (
+                activity_id TEXT NOT NULL REFERENCES activities(id) ON DELETE CASCADE,
+                schedule_idx INTEGER NOT NULL,
+                event_date TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                sent_at TEXT NOT NULL,
+                PRIMARY KEY (activity_id, schedule_idx, event_date, kind)
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_activity_reminders_sent_date
+            ON activity_reminders_sent(event_date)
+            """
+        )
+
+
+def _weekdays_to_text(weekdays: list[int]) -> str:
+    return ",".join(str(day) for day in weekdays)
+
+
+def _weekdays_from_text(raw: str) -> list[int]:
+    return [int(day) for day in raw.split(",") if day.strip()]
+
+
+class ActivityStore:
+    """SQLite storage for activities, their schedules and sent-reminder markers."""
+
+    def __init__(self, path: Path = STATS_DB) -> None:
+        self.path = path
+
+    def init(self) -> None:
+        init_activity_db(self.path)
+
+    # ---------- activities ----------
+    def load_activities(self) -> list[Activity]:
+        with connect_sqlite(self.path) as conn:
+            rows = conn.execute(
+                "SELECT id, name, channel_id, ping_role_id FROM activities ORDER BY rowid"
+            ).fetchall()
+            schedule_rows = conn.execute(
+                "SELECT activity_id, weekdays, time_hhmm FROM activity_schedules ORDER BY activity_id, schedule_idx"
+            ).fetchall()
+
+        schedules: dict[str, list[Schedule]] = {}
+        for activity_id, weekdays, time_hhmm in schedule_rows:
+            schedules.setdefault(activity_id, []).append(
+                Schedule(weekdays=_weekdays_from_text(weekdays), time_hhmm=time_hhmm)
+            )
+        return [
+            Activity(
+                id=activity_id,
+                name=name,
+                channel_id=int(channel_id),
+                ping_role_id=int(ping_role_id),
+                schedules=schedules.get(activity_id, []),
+            )
+            for activity_id, name, channel_id, ping_role_id in rows
+        ]
+
+    def save_activity(self, act: Activity) -> None:
+        with connect_sqlite(self.path) as conn:
+            self._save_activity(conn, act)
+
+    def _save_activity(self, conn, act: Activity) -> None:
+        # ON CONFLICT 保留原本 rowid，列表次序唔會變
+        conn.execute(
+            """
+            INSERT INTO activities (id, name, channel_id, ping_role_id)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                name = excluded.name,
+                channel_id = excluded.channel_id,
+                ping_role_id = excluded.ping_role_id
+            """,
+            (act.id, act.name, act.channel_id, act.ping_role_id),
+        )
+        conn.execute("DELETE FROM activity_schedules WHERE activity_id = ?", (act.id,))
+        conn.executemany(
+            "INSERT INTO activity_schedules (activity_id, schedule_idx, weekdays, time_hhmm) VALUES (?, ?, ?, ?)",
+            [
+                (act.id, idx, _weekdays_to_text(schedule.weekdays), schedule.time_hhmm)
+                for idx, schedule in enumerate(act.schedules)
+            ],
+        )
+
+    def delete_activity(self, activity_id: str) -> None:
+        # schedules 同 sent markers 會跟住 cascade 刪走
+        with connect_sqlite(self.path) as conn:
+            conn.execute("DELETE FROM activities WHERE id = ?", (activity_id,))
+
+    # ---------- sent markers ----------
+    def was_sent(self, activity_id: str, schedule_idx: int, event_date: date, kind: str) -> bool:
+        with connect_sqlite(self.path) as conn:
+            row = conn.execute(
+                """
+                SELECT 1 FROM activity_reminders_sent
+                WHERE activity_id = ? AND schedule_idx = ? AND event_date = ? AND kind = ?
+                """,
+                (activity_id, schedule_idx, event_date.isoformat(), kind),
+            ).fetchone()
+        return row is not None
+
+    def mark_sent(self, activity_id: str, schedule_idx: int, event_date: date, kind: str, *, sent_at: datetime) -> None:
+        with connect_sqlite(self.path) as conn:
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO activity_reminders_sent
+                    (activity_id, schedule_idx, event_date, kind, sent_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (activity_id, schedule_idx, event_date.isoformat(), kind, sent_at.isoformat()),
+            )
+
+    def prune_sent(self, before: date) -> int:
+        with connect_sqlite(self.path) as conn:
+            cursor = conn.execute(
+                "DELETE FROM activity_reminders_sent WHERE event_date < ?",
+                (before.isoformat(),),
+            )
+            return cursor.rowcount
+
+    # ---------- legacy JSON ----------
+    def import_legacy_json(self, json_path: Path = ACTIVITY_REMINDER_JSON_PATH) -> int:
+        """Import the old activity_reminders.json once, then rename it to `*.migrated`.
+
+        Returns how many activities were imported.
+        """
+        if not json_path.exists():
+            return 0
+
+        raw = load_json_object(json_path, lambda: {"activities": [], "sent_cache": {}})
+        activities: list[Activity] = []
+        for item in raw.get("activities", []):
+            try:
+                activities.append(
+                    Activity(
+                        id=item["id"],
+                        name=item["name"],
+                        channel_id=int(item["channel_id"]),
+                        ping_role_id=int(item["ping_role_id"]),
+                        schedules=[Schedule(**s) for s in item.get("schedules", [])],
+                    )
+                )
+            except Exception:
+                continue
+
+        known = {act.id for act in activities}
+        sent_rows = []
+        for key, sent_at in (raw.get("sent_cache") or {}).items():
+            # key: activity|idx|yyyy-mm-dd|kind
+            parts = key.split("|")
+            if len(parts) != 4 or parts[0] not in known:
+                continue
+            try:
+                sent_rows.append((parts[0], int(parts[1]), date.fromisoformat(parts[2]).isoformat(), parts[3], str(sent_at)))
+            except ValueError:
+                continue
+
+        with connect_sqlite(self.path) as conn:
+            for act in activities:
+                self._save_activity(conn, act)
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO activity_reminders_sent
+                    (activity_id, schedule_idx, event_date, kind, sent_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                sent_rows,
+            )
+
+        os.replace(json_path, json_path.with_name(json_path.name + MIGRATED_SUFFIX))
+        log.info(
+            "Imported activity reminders from JSON: path=%s activities=%s sent=%s",
+            json_path,
+            len(activities),
+            len(sent_rows),
+        )
+        return len(activities)
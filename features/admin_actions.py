@@ -7,7 +7,7 @@ import discord
 from core.safe_send import send_or_followup
 from features.menu_helpers import can_use_admin
 from features.menu_stats import build_admin_stats_embed, record_usage_sync
-from features.menu_views import AdminToolView
+from features.menu_views import menu_view
 from features.role_tools import RoleToolsView, build_role_tools_embed
 
 
@@ -24,7 +24,7 @@ async def admin_stats_from_button(menu_cog: object, interaction: discord.Interac
     await safe_defer(interaction, ephemeral=True)
     record_usage_sync("admin_stats", interaction.user.id, interaction.guild_id)
     embed = build_admin_stats_embed(guild_id=interaction.guild_id, days=7, title_scope="本週")
-    await send_or_followup(interaction, embed=embed, view=AdminToolView(menu_cog), ephemeral=True)
+    await send_or_followup(interaction, embed=embed, view=menu_view("admin", cog=menu_cog), ephemeral=True)
 
 
 async def admin_stats_command(interaction: discord.Interaction, *, scope_value: str) -> None:
@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import random
 import sqlite3
-from collections.abc import Mapping
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
 from typing import Any
 
 from data.drink_data import (
@@ -15,10 +20,121 @@ from data.drink_data import (
 )
 
 
-def drink_catalog() -> dict[str, DrinkEntry]:
+FRESH_DRINK_WEIGHT = 4
+RECENT_DRINK_WEIGHT = 1
+
+
+@dataclass(frozen=True)
+class WeightedPool:
+    """Drinks plus cumulative weights, ready for bisect sampling."""
+
+    drinks: tuple[DrinkEntry, ...]
+    cumulative: tuple[int, ...]
+    positions: Mapping[str, tuple[int, ...]]
+
+    @classmethod
+    def build(cls, drinks: Sequence[DrinkEntry], *, weight: int = FRESH_DRINK_WEIGHT) -> WeightedPool:
+        positions: dict[str, list[int]] = {}
+        for index, drink in enumerate(drinks):
+            positions.setdefault(drink.eng, []).append(index)
+        return cls(
+            drinks=tuple(drinks),
+            cumulative=tuple(accumulate(weight for _ in drinks)),
+            positions=MappingProxyType({name: tuple(indexes) for name, indexes in positions.items()}),
+        )
+
+    def total(self) -> int:
+        return self.cumulative[-1] if self.cumulative else 0
+
+    def weight_at(self, index: int) -> int:
+        return self.cumulative[index] - (self.cumulative[index - 1] if index else 0)
+
+    def sample(self, rng: random.Random | None = None, *, penalized: Iterable[str] = ()) -> DrinkEntry:
+        """Draw one drink; `penalized` names drop to RECENT_DRINK_WEIGHT without copying the pool.
+
+        The penalties shift the cumulative array by a step function with one step per
+        penalized index, so each segment between them is still searched with bisect.
+        """
+        if not self.drinks:
+            raise IndexError("cannot sample from an empty drink pool")
+
+        steps = sorted(
+            (index, self.weight_at(index) - RECENT_DRINK_WEIGHT)
+            for name in set(penalized)
+            for index in self.positions.get(name, ())
+        )
+        steps = [(index, delta) for index, delta in steps if delta > 0]
+        total = self.total() - sum(delta for _, delta in steps)
+
+        target = (rng or random).random() * total
+        offset = 0
+        low = 0
+        for index, delta in steps:
+            if target < self.cumulative[index] - offset - delta:
+                return self.drinks[bisect_right(self.cumulative, target + offset, low, index)]
+            offset += delta
+            low = index + 1
+        position = bisect_right(self.cumulative, target + offset, low, len(self.cumulative))
+        return self.drinks[min(position, len(self.drinks) - 1)]
+
+
+@dataclass(frozen=True)
+class DrawIndex:
+    """Immutable sampling tables for one season; rebuilt only when the season changes."""
+
+    season: tuple[int, ...] | None
+    rarity_labels: tuple[str, ...]
+    rarity_cumulative: tuple[int, ...]
+    pools: Mapping[str, WeightedPool]
+    fallback: WeightedPool
+
+
+def season_for_month(month: int) -> tuple[int, ...] | None:
+    for months in SEASONAL_DRINKS:
+        if month in months:
+            return months
+    return None
+
+
+def build_draw_index(season: tuple[int, ...] | None) -> DrawIndex:
+    seasonal = list(SEASONAL_DRINKS.get(season, [])) if season is not None else []
+    labels = tuple(RARITY_STYLE.keys())
+
+    pools = {
+        rarity: WeightedPool.build(
+            [drink for drink in ALL_DRINKS if drink.rarity == rarity]
+            + [drink for drink in seasonal if drink.rarity == rarity]
+        )
+        for rarity in labels
+    }
+    return DrawIndex(
+        season=season,
+        rarity_labels=labels,
+        rarity_cumulative=tuple(accumulate(int(RARITY_STYLE[label]["weight"]) for label in labels)),
+        pools=MappingProxyType(pools),
+        fallback=WeightedPool.build(ALL_DRINKS + seasonal),
+    )
+
+
+_DRAW_INDEX: DrawIndex | None = None
+
+
+def get_draw_index(month: int | None = None) -> DrawIndex:
+    global _DRAW_INDEX
+    season = season_for_month(datetime.now().month if month is None else month)
+    index = _DRAW_INDEX
+    if index is None or index.season != season:
+        index = build_draw_index(season)
+        _DRAW_INDEX = index
+    return index
+
+
+@lru_cache(maxsize=1)
+def drink_catalog() -> Mapping[str, DrinkEntry]:
     """Return every known drink keyed by English name.
 
     Seasonal drinks are included, but existing base-catalog names win if duplicated.
+    The catalog is static, so it is built once and shared read-only.
     """
     catalog: dict[str, DrinkEntry] = {}
     for drink in ALL_DRINKS:
@@ -28,47 +144,52 @@ def drink_catalog() -> dict[str, DrinkEntry]:
         for drink in pool:
             catalog.setdefault(drink.eng, drink)
 
-    return catalog
+    return MappingProxyType(catalog)
 
 
-def catalog_by_rarity() -> dict[str, list[DrinkEntry]]:
+@lru_cache(maxsize=1)
+def catalog_by_rarity() -> Mapping[str, tuple[DrinkEntry, ...]]:
     """Group all catalog drinks by rarity and sort each group consistently."""
     grouped: dict[str, list[DrinkEntry]] = {rarity: [] for rarity in RARITY_STYLE.keys()}
     for drink in drink_catalog().values():
         grouped.setdefault(drink.rarity, []).append(drink)
 
-    for drinks in grouped.values():
-        drinks.sort(key=lambda item: (item.eng.casefold(), item.zh.casefold()))
-    return grouped
+    return MappingProxyType(
+        {
+            rarity: tuple(sorted(drinks, key=lambda item: (item.eng.casefold(), item.zh.casefold())))
+            for rarity, drinks in grouped.items()
+        }
+    )
 
 
 def current_seasonal_pool() -> list[DrinkEntry]:
-    month = datetime.now().month
-    for months, pool in SEASONAL_DRINKS.items():
-        if month in months:
-            return list(pool)
-    return []
+    season = get_draw_index().season
+    return list(SEASONAL_DRINKS.get(season, [])) if season is not None else []
 
 
-def pick_rarity() -> str:
-    labels = list(RARITY_STYLE.keys())
-    weights = [RARITY_STYLE[label]["weight"] for label in labels]
-    return random.choices(labels, weights=weights, k=1)[0]
+def pick_rarity(rng: random.Random | None = None) -> str:
+    index = get_draw_index()
+    target = (rng or random).random() * index.rarity_cumulative[-1]
+    return index.rarity_labels[bisect_right(index.rarity_cumulative, target)]
 
 
 def build_pool_for_rarity(rarity: str) -> list[DrinkEntry]:
-    pool = [drink for drink in ALL_DRINKS if drink.rarity == rarity]
-    seasonal = [drink for drink in current_seasonal_pool() if drink.rarity == rarity]
-    return pool + seasonal
-
-
-def pick_weighted_drink(*, rarity: str, recent_drink_names: set[str]) -> DrinkEntry:
-    pool = build_pool_for_rarity(rarity)
-    if not pool:
-        pool = ALL_DRINKS + current_seasonal_pool()
-
-    weights = [1 if drink.eng in recent_drink_names else 4 for drink in pool]
-    return random.choices(pool, weights=weights, k=1)[0]
+    pool = get_draw_index().pools.get(rarity)
+    return list(pool.drinks) if pool is not None else []
+
+
+def pick_weighted_drink(
+    *,
+    rarity: str,
+    recent_drink_names: Iterable[str],
+    rng: random.Random | None = None,
+) -> DrinkEntry:
+    index = get_draw_index()
+    pool = index.pools.get(rarity)
+    if pool is None or not pool.drinks:
+        pool = index.fallback
+
+    return pool.sample(rng, penalized=recent_drink_names)
 
 
 def progress_bar(current: int, total: int, *, size: int = 10) -> str:
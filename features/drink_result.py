@@ -2,15 +2,13 @@ from __future__ import annotations
 
 import discord
 
-from features.menu_helpers import build_menu_file
+from features.menu_helpers import attach_bartender_thumbnail
 from features.menu_views import build_full_menu_view
 
 
 def build_bartender_result_payload(
     interaction: discord.Interaction,
     result_embed: discord.Embed,
-    *,
-    attachment_name: str,
 ) -> dict[str, object]:
     """Build a standard bartender result payload.
 
@@ -23,9 +21,8 @@ def build_bartender_result_payload(
     if menu_view is not None:
         payload["view"] = menu_view
 
-    menu_file = build_menu_file()
+    menu_file = attach_bartender_thumbnail(result_embed)
     if menu_file is not None:
-        result_embed.set_thumbnail(url=f"attachment://{attachment_name}")
         payload["file"] = menu_file
 
     return payload
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import asyncio
-
 import discord
 
+from core.pending_replies import PendingReply
 from data.drink_data import RARITY_STYLE
 from features.drink_constants import GIFT_DRINK_TARGET_TIMEOUT_SECONDS
 from features.drink_embeds import (
@@ -86,10 +85,10 @@ class DrinkCollectionSummaryButton(discord.ui.Button):
 
 
 class GiftDrinkCancelView(discord.ui.View):
-    def __init__(self, *, owner_id: int, cancel_event: asyncio.Event) -> None:
+    def __init__(self, *, owner_id: int, pending: PendingReply) -> None:
         super().__init__(timeout=GIFT_DRINK_TARGET_TIMEOUT_SECONDS)
         self.owner_id = owner_id
-        self.cancel_event = cancel_event
+        self.pending = pending
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.owner_id:
@@ -99,11 +98,10 @@ class GiftDrinkCancelView(discord.ui.View):
 
     @discord.ui.button(label="取消", emoji="❌", style=discord.ButtonStyle.secondary)
     async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
-        if self.cancel_event.is_set():
+        if not self.pending.cancel():
             await interaction.response.send_message("賜酒操作已經取消或逾時。", ephemeral=True)
             return
 
-        self.cancel_event.set()
         for item in self.children:
             if isinstance(item, discord.ui.Button):
                 item.disabled = True
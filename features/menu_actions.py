@@ -14,7 +14,7 @@ from features.menu_embeds import (
 )
 from features.menu_helpers import build_menu_file, can_use_admin, get_retry_after, touch_cooldown
 from features.menu_stats import record_usage_sync
-from features.menu_views import AdminToolView, HelpMenuView, HomeMenuView, QuickBarView
+from features.menu_views import menu_view
 from features.social_tools import (
     open_instagram_from_button as run_open_instagram_from_button,
     open_threads_from_button as run_open_threads_from_button,
@@ -40,7 +40,7 @@ async def open_quick_bar_menu(
     await send_or_followup(
         interaction,
         embed=build_quick_bar_embed(interaction.user),
-        view=QuickBarView(cog),
+        view=menu_view("quick", cog=cog),
         ephemeral=ephemeral,
         file=build_menu_file(),
     )
@@ -52,7 +52,7 @@ async def open_home_menu(cog: object, interaction: discord.Interaction) -> None:
         await send_or_followup(
             interaction,
             embed=build_home_menu_embed(interaction.user),
-            view=HomeMenuView(cog),
+            view=menu_view("home", cog=cog),
             ephemeral=True,
             file=build_menu_file(),
         )
@@ -63,7 +63,7 @@ async def open_home_menu(cog: object, interaction: discord.Interaction) -> None:
     await send_or_followup(
         interaction,
         embed=build_home_menu_embed(interaction.user, include_thumbnail=False),
-        view=HomeMenuView(cog, include_external_links=False),
+        view=menu_view("home", cog=cog, include_external_links=False),
         ephemeral=True,
     )
 
@@ -73,7 +73,7 @@ async def open_help_menu(cog: object, interaction: discord.Interaction) -> None:
     await send_or_followup(
         interaction,
         embed=build_help_embed(interaction.user),
-        view=HelpMenuView(cog),
+        view=menu_view("quick", cog=cog),
         ephemeral=True,
         file=build_menu_file(),
     )
@@ -84,7 +84,7 @@ async def open_admin_tool_menu(cog: object, interaction: discord.Interaction) ->
     await send_or_followup(
         interaction,
         embed=build_admin_tool_embed(interaction.user),
-        view=AdminToolView(cog),
+        view=menu_view("admin", cog=cog),
         ephemeral=True,
     )
 
@@ -116,7 +116,7 @@ async def send_mention_quick_bar(cog: object, message: discord.Message) -> None:
     try:
         kwargs = safe_message_kwargs(
             embed=build_quick_bar_embed(message.author),
-            view=QuickBarView(cog),
+            view=menu_view("quick", cog=cog),
             file=build_menu_file(),
         )
         kwargs["mention_author"] = False
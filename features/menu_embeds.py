@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import random
+from collections.abc import Callable
+from dataclasses import dataclass
 
 import discord
 
@@ -17,19 +19,56 @@ PUBLIC_DISCUSSION_TIPS = (
 )
 
 
-def _public_discussion_tip() -> str:
-    return random.choice(PUBLIC_DISCUSSION_TIPS)
-
-
-def build_quick_bar_embed(user: discord.abc.User) -> discord.Embed:
-    embed = discord.Embed(
-        title="🍸 Con9sole Bartender",
-        description=(
-            f"歡迎回來，{user.mention}。\n\n"
-            "**想快速做些甚麼？**"
-        ),
-        color=MENU_COLOR,
-    )
+QUICK_BAR_FOOTERS = tuple(f"💡 {tip} 前往 Menu → 探索公海看看吧。" for tip in PUBLIC_DISCUSSION_TIPS)
+HOME_MENU_FOOTERS = tuple(f"💡 {tip} 可由「探索公海」開始。" for tip in PUBLIC_DISCUSSION_TIPS)
+
+
+@dataclass(frozen=True)
+class EmbedTemplate:
+    """Static embed parts kept as plain values; stamp() builds a fresh Embed from them."""
+
+    title: str | None
+    description: str | None
+    colour: discord.Colour | None
+    footer: str | None
+    fields: tuple[tuple[str, str, bool], ...]
+
+    @classmethod
+    def from_embed(cls, embed: discord.Embed) -> EmbedTemplate:
+        return cls(
+            title=embed.title,
+            description=embed.description,
+            colour=embed.colour,
+            footer=embed.footer.text,
+            fields=tuple((field.name, field.value, field.inline) for field in embed.fields),
+        )
+
+    def stamp(
+        self,
+        *,
+        description: str | None = None,
+        footer: str | None = None,
+        thumbnail: bool = False,
+    ) -> discord.Embed:
+        embed = discord.Embed(
+            title=self.title,
+            description=self.description if description is None else description,
+            colour=self.colour,
+        )
+        for name, value, inline in self.fields:
+            embed.add_field(name=name, value=value, inline=inline)
+
+        footer = self.footer if footer is None else footer
+        if footer is not None:
+            embed.set_footer(text=footer)
+        if thumbnail:
+            # thumbnail 可能係 CDN URL（會刷新），所以唔放入 template
+            apply_bartender_thumbnail(embed)
+        return embed
+
+
+def _quick_bar_template() -> discord.Embed:
+    embed = discord.Embed(title="🍸 Con9sole Bartender", color=MENU_COLOR)
     embed.add_field(
         name="⚡ Quick Bar",
         value="常用功能已放在下面。想查看完整入口，可以按「Menu」。",
@@ -40,25 +79,26 @@ def build_quick_bar_embed(user: discord.abc.User) -> discord.Embed:
         value="進入「Menu」後按「探索公海」，即可了解如何瀏覽及參與遊戲以外的話題。",
         inline=False,
     )
-    apply_bartender_thumbnail(embed)
-    embed.set_footer(text=f"💡 {_public_discussion_tip()} 前往 Menu → 探索公海看看吧。")
     return embed
 
 
-def build_main_menu_embed(user: discord.abc.User) -> discord.Embed:
-    return build_quick_bar_embed(user)
-
-
-def build_home_menu_embed(user: discord.abc.User, *, include_thumbnail: bool = True) -> discord.Embed:
-    embed = discord.Embed(
-        title="🍸 Con9sole Bartender",
+def build_quick_bar_embed(user: discord.abc.User) -> discord.Embed:
+    return get_embed_template("quick_bar").stamp(
         description=(
             f"歡迎回來，{user.mention}。\n\n"
-            "完整餐牌已打開。\n"
-            "**你想由哪裏開始？**"
+            "**想快速做些甚麼？**"
         ),
-        color=MENU_COLOR,
+        footer=random.choice(QUICK_BAR_FOOTERS),
+        thumbnail=True,
     )
+
+
+def build_main_menu_embed(user: discord.abc.User) -> discord.Embed:
+    return build_quick_bar_embed(user)
+
+
+def _home_menu_template() -> discord.Embed:
+    embed = discord.Embed(title="🍸 Con9sole Bartender", color=MENU_COLOR)
     embed.add_field(
         name="🥃 吧枱服務",
         value="組隊、開 call、打氣、調酒、匿名投稿，都可以在下面使用。",
@@ -74,13 +114,22 @@ def build_home_menu_embed(user: discord.abc.User, *, include_thumbnail: bool = T
         value="按「幫助」查看完整用法。",
         inline=False,
     )
-    if include_thumbnail:
-        apply_bartender_thumbnail(embed)
-    embed.set_footer(text=f"💡 {_public_discussion_tip()} 可由「探索公海」開始。")
     return embed
 
 
-def build_help_embed(user: discord.abc.User) -> discord.Embed:
+def build_home_menu_embed(user: discord.abc.User, *, include_thumbnail: bool = True) -> discord.Embed:
+    return get_embed_template("home_menu").stamp(
+        description=(
+            f"歡迎回來，{user.mention}。\n\n"
+            "完整餐牌已打開。\n"
+            "**你想由哪裏開始？**"
+        ),
+        footer=random.choice(HOME_MENU_FOOTERS),
+        thumbnail=include_thumbnail,
+    )
+
+
+def _help_template() -> discord.Embed:
     embed = discord.Embed(
         title="ℹ️ 幫助",
         description=(
@@ -106,12 +155,15 @@ def build_help_embed(user: discord.abc.User) -> discord.Embed:
         ),
         color=MENU_COLOR,
     )
-    apply_bartender_thumbnail(embed)
     embed.set_footer(text="⬅️ Menu 返回吧枱主頁")
     return embed
 
 
-def build_admin_tool_embed(user: discord.abc.User) -> discord.Embed:
+def build_help_embed(user: discord.abc.User) -> discord.Embed:
+    return get_embed_template("help").stamp(thumbnail=True)
+
+
+def _admin_tool_template() -> discord.Embed:
     embed = discord.Embed(
         title="🛠️ Admin Tool",
         description=(
@@ -127,3 +179,30 @@ def build_admin_tool_embed(user: discord.abc.User) -> discord.Embed:
     )
     embed.set_footer(text="Admin 工具只限授權成員使用。")
     return embed
+
+
+def build_admin_tool_embed(user: discord.abc.User) -> discord.Embed:
+    return get_embed_template("admin_tool").stamp()
+
+
+_TEMPLATE_BUILDERS: dict[str, Callable[[], discord.Embed]] = {
+    "quick_bar": _quick_bar_template,
+    "home_menu": _home_menu_template,
+    "help": _help_template,
+    "admin_tool": _admin_tool_template,
+}
+
+_EMBED_TEMPLATES: dict[str, EmbedTemplate] = {}
+
+
+def get_embed_template(name: str) -> EmbedTemplate:
+    template = _EMBED_TEMPLATES.get(name)
+    if template is None:
+        template = EmbedTemplate.from_embed(_TEMPLATE_BUILDERS[name]())
+        _EMBED_TEMPLATES[name] = template
+    return template
+
+
+def reset_embed_templates() -> None:
+    """Drop cached templates so the next request rebuilds them (e.g. after a reload)."""
+    _EMBED_TEMPLATES.clear()
@@ -5,7 +5,9 @@ from pathlib import Path
 
 import discord
 
+from core.asset_cache import AssetCache
 from core.permissions import is_admin_or_helper
+from core.storage_paths import ASSET_CACHE_PATH
 
 MENU_COLOR = 0x2B2D31
 COOLDOWN_SECONDS = 3.0
@@ -15,6 +17,14 @@ ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
 BARTENDER_IMAGE = ASSETS_DIR / "bartender.png"
 BARTENDER_ATTACHMENT_NAME = "bartender.png"
 
+# 圖片只讀一次入記憶體；上傳到素材頻道之後就改用 CDN URL，唔再逐次附件上傳
+BARTENDER_ASSET = AssetCache(
+    BARTENDER_IMAGE,
+    filename=BARTENDER_ATTACHMENT_NAME,
+    state_path=ASSET_CACHE_PATH,
+    key="bartender",
+)
+
 USER_MENU_COOLDOWNS: dict[int, float] = {}
 MENTION_MESSAGE_DEDUPE: dict[int, float] = {}
 
@@ -28,14 +38,20 @@ can_use_admin_stats = can_use_admin
 
 
 def build_menu_file() -> discord.File | None:
-    if not BARTENDER_IMAGE.exists():
+    """Return the bartender attachment, or None when the thumbnail uses the CDN URL."""
+    if BARTENDER_ASSET.url() is not None:
         return None
-    return discord.File(BARTENDER_IMAGE, filename=BARTENDER_ATTACHMENT_NAME)
+    return BARTENDER_ASSET.file()
 
 
 def apply_bartender_thumbnail(embed: discord.Embed) -> None:
-    if BARTENDER_IMAGE.exists():
-        embed.set_thumbnail(url=f"attachment://{BARTENDER_ATTACHMENT_NAME}")
+    url = BARTENDER_ASSET.thumbnail_url()
+    if url is not None:
+        embed.set_thumbnail(url=url)
+
+
+def attach_bartender_thumbnail(embed: discord.Embed) -> discord.File | None:
+    return BARTENDER_ASSET.attach_thumbnail(embed)
 
 
 async def safe_defer(interaction: discord.Interaction, *, ephemeral: bool = True) -> None:
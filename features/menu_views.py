@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import inspect
 import logging
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Iterator
 
 import discord
+from discord.ext import commands
 
 import config
+from core.extension_loader import get_or_load_cog
 from core.safe_send import send_or_followup
 from data.menu_registry import MenuItem, get_menu_items
 from features.menu_embeds import build_home_menu_embed
@@ -301,7 +303,7 @@ class RegistryMenuView(BaseMenuView):
             await send_or_followup(
                 interaction,
                 embed=embed,
-                view=HomeMenuView(self.cog),
+                view=menu_view("home", cog=self.cog),
                 ephemeral=True,
             )
             return
@@ -311,7 +313,7 @@ class RegistryMenuView(BaseMenuView):
         await send_or_followup(
             interaction,
             embed=embed,
-            view=HomeMenuView(self.cog, include_external_links=False),
+            view=menu_view("home", cog=self.cog, include_external_links=False),
             ephemeral=True,
         )
 
@@ -346,23 +348,27 @@ class RegistryMenuView(BaseMenuView):
             )
             return
 
-        target = self.cog if item.cog == "Menu" else interaction.client.get_cog(item.cog)
-        if target is None:
-            await send_or_followup(
-                interaction,
-                content=f"❌ `{item.cog}` 功能未載入。",
-                ephemeral=True,
-            )
-            return
-
-        method = _get_method(target, item)
+        method = MENU_DISPATCH.get(item.id)
         if method is None:
-            await send_or_followup(
-                interaction,
-                content=f"❌ `{item.cog}` 未提供 `{item.method}` 入口。",
-                ephemeral=True,
-            )
-            return
+            # 第一次用 lazy cog：載入之後先行一次 reflection 再寫返入 dispatch table
+            target = self.cog if item.cog == "Menu" else await get_or_load_cog(interaction.client, item.cog)
+            if target is None:
+                await send_or_followup(
+                    interaction,
+                    content=f"❌ `{item.cog}` 功能未載入。",
+                    ephemeral=True,
+                )
+                return
+
+            method = _get_method(target, item)
+            if method is None:
+                await send_or_followup(
+                    interaction,
+                    content=f"❌ `{item.cog}` 未提供 `{item.method}` 入口。",
+                    ephemeral=True,
+                )
+                return
+            MENU_DISPATCH[item.id] = method
 
         try:
             await _call_method_safely(method, interaction)
@@ -435,8 +441,89 @@ class MainMenuView(HomeMenuView):
     pass
 
 
-def build_full_menu_view(interaction: discord.Interaction) -> QuickBarView | None:
+# item id -> bound entry coroutine；Menu cog 載入 / on_ready 時預先解析，click 時唔使再 reflection。
+# 其他 cog add / remove（包括 /reload）由 Bot 經 bind_menu_cog / unbind_menu_cog 即時更新
+MENU_DISPATCH: dict[str, Callable[..., Awaitable[None]]] = {}
+
+# 已 stop 嘅 view 只用嚟 serialize components：discord.py 唔會逐個 message 記住佢，
+# click 會交返畀 Menu cog 用 add_view 註冊嘅 persistent view 處理
+_MENU_TEMPLATES: dict[tuple[str, bool], discord.ui.View] = {}
+
+_LAYER_VIEW_CLASSES: dict[str, type[RegistryMenuView]] = {
+    "quick": QuickBarView,
+    "home": HomeMenuView,
+    "admin": AdminToolView,
+}
+
+
+def _menu_target(client: discord.Client, menu_cog: object, item: MenuItem) -> object | None:
+    if item.cog == "Menu":
+        return menu_cog
+    return client.get_cog(item.cog) if item.cog else None
+
+
+def _dispatch_items(cog_name: str | None = None) -> Iterator[MenuItem]:
+    for layer in _LAYER_VIEW_CLASSES:
+        for item in get_menu_items(layer):  # type: ignore[arg-type]
+            if item.url or item.cog is None:
+                continue
+            if cog_name is None or item.cog == cog_name:
+                yield item
+
+
+def build_menu_dispatch(client: discord.Client, menu_cog: object) -> dict[str, Callable[..., Awaitable[None]]]:
+    """Resolve every loaded menu entry once; unloaded (lazy) cogs are filled in on first click."""
+    MENU_DISPATCH.clear()
+    for item in _dispatch_items():
+        target = _menu_target(client, menu_cog, item)
+        method = _get_method(target, item) if target is not None else None
+        if method is not None:
+            MENU_DISPATCH[item.id] = method
+    return MENU_DISPATCH
+
+
+def bind_menu_cog(cog: commands.Cog) -> None:
+    """Point a freshly added cog's menu entries at its new bound methods (see Bot.add_cog)."""
+    for item in _dispatch_items(cog.qualified_name):
+        method = _get_method(cog, item)
+        if method is not None:
+            MENU_DISPATCH[item.id] = method
+        else:
+            MENU_DISPATCH.pop(item.id, None)
+
+
+def unbind_menu_cog(cog_name: str) -> None:
+    """Drop a removed cog's menu entries so the next click loads it again."""
+    for item in _dispatch_items(cog_name):
+        MENU_DISPATCH.pop(item.id, None)
+
+
+def menu_view(layer: str, *, cog: object = None, include_external_links: bool = True) -> discord.ui.View:
+    """Return the prebuilt view for a menu layer, for sending only."""
+    key = (layer, include_external_links)
+    template = _MENU_TEMPLATES.get(key)
+    if template is not None:
+        return template
+
+    view_class = _LAYER_VIEW_CLASSES[layer]
+    if view_class is HomeMenuView:
+        view = HomeMenuView(cog, include_external_links=include_external_links)
+    else:
+        view = view_class(cog)
+    view.stop()
+    # 冇 running loop 時 stop() 唔會生效，呢個 view 就照舊畀 discord.py 追蹤，唔好 cache
+    if view.is_finished():
+        _MENU_TEMPLATES[key] = view
+    return view
+
+
+def reset_menu_views() -> None:
+    MENU_DISPATCH.clear()
+    _MENU_TEMPLATES.clear()
+
+
+def build_full_menu_view(interaction: discord.Interaction) -> discord.ui.View | None:
     menu_cog = interaction.client.get_cog("Menu")
     if menu_cog is None:
         return None
-    return QuickBarView(menu_cog)
+    return menu_view("quick", cog=menu_cog)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import heapq
+import logging
+from collections.abc import Iterable
+from typing import Optional
+
+import discord
+
+from features.tempvc_settings import (
+    format_temp_channel_name,
+    get_temp_channel_base_name,
+    parse_temp_channel_number,
+)
+
+
+log = logging.getLogger("con9sole-bartender.tempvc.names")
+
+AllocatorKey = tuple[int, Optional[int]]
+
+
+class CategoryNameAllocator:
+    """Hand out the lowest free "<base> N" number in one category.
+
+    Numbers are held either by an existing channel or by a reservation made in
+    `allocate()`. Allocation is synchronous, so concurrent creations in the same
+    loop never receive the same number.
+    """
+
+    def __init__(self, base: str) -> None:
+        self.base = base
+        self._channel_numbers: dict[int, int] = {}
+        self._holders: dict[int, int] = {}
+        self._reserved: set[int] = set()
+        self._free: list[int] = []
+        self._next = 1
+
+    def _is_taken(self, number: int) -> bool:
+        return number in self._reserved or self._holders.get(number, 0) > 0
+
+    def _release(self, number: int) -> None:
+        if not self._is_taken(number):
+            heapq.heappush(self._free, number)
+
+    def allocate(self) -> int:
+        # heap 入面可能有已被重新佔用嘅號碼，順手清走
+        while self._free and self._is_taken(self._free[0]):
+            heapq.heappop(self._free)
+        while self._is_taken(self._next):
+            self._next += 1
+
+        if self._free and self._free[0] < self._next:
+            number = heapq.heappop(self._free)
+        else:
+            number = self._next
+            self._next += 1
+        self._reserved.add(number)
+        return number
+
+    def cancel(self, number: int) -> None:
+        """Give back a reservation whose channel was never created."""
+        self._reserved.discard(number)
+        self._release(number)
+
+    def observe(self, channel_id: int, name: str) -> None:
+        """Record a channel's current name (create or rename); idempotent per channel."""
+        number = parse_temp_channel_number(name, base=self.base)
+        previous = self._channel_numbers.get(channel_id)
+        if previous == number:
+            return
+        if previous is not None:
+            self.forget(channel_id)
+        if number is None:
+            return
+
+        self._channel_numbers[channel_id] = number
+        self._holders[number] = self._holders.get(number, 0) + 1
+        self._reserved.discard(number)
+
+    def forget(self, channel_id: int) -> None:
+        number = self._channel_numbers.pop(channel_id, None)
+        if number is None:
+            return
+        remaining = self._holders.get(number, 0) - 1
+        if remaining > 0:
+            self._holders[number] = remaining
+        else:
+            self._holders.pop(number, None)
+            self._release(number)
+
+
+class TempVCNameAllocator:
+    """Per-(guild, category) allocators, seeded once from the cache and then kept current by channel events."""
+
+    def __init__(self) -> None:
+        self._allocators: dict[AllocatorKey, CategoryNameAllocator] = {}
+
+    def reset(self) -> None:
+        self._allocators.clear()
+
+    def _get(self, guild_id: int, category_id: Optional[int]) -> CategoryNameAllocator | None:
+        allocator = self._allocators.get((guild_id, category_id))
+        if allocator is not None and allocator.base != get_temp_channel_base_name():
+            # 改咗 TEMP_VC_PREFIX 就由頭再 seed
+            del self._allocators[(guild_id, category_id)]
+            return None
+        return allocator
+
+    def allocator_for(
+        self,
+        guild: discord.Guild,
+        category: Optional[discord.CategoryChannel],
+    ) -> CategoryNameAllocator:
+        category_id = category.id if category else None
+        allocator = self._get(guild.id, category_id)
+        if allocator is None:
+            allocator = CategoryNameAllocator(get_temp_channel_base_name())
+            channels: Iterable[discord.abc.GuildChannel] = (
+                category.channels if category else (ch for ch in guild.channels if ch.category_id is None)
+            )
+            for channel in channels:
+                if isinstance(channel, discord.VoiceChannel):
+                    allocator.observe(channel.id, channel.name)
+            self._allocators[(guild.id, category_id)] = allocator
+        return allocator
+
+    def reserve_name(
+        self,
+        guild: discord.Guild,
+        category: Optional[discord.CategoryChannel],
+    ) -> tuple[str, int]:
+        allocator = self.allocator_for(guild, category)
+        number = allocator.allocate()
+        return format_temp_channel_name(number, base=allocator.base), number
+
+    def cancel(self, guild: discord.Guild, category: Optional[discord.CategoryChannel], number: int) -> None:
+        allocator = self._get(guild.id, category.id if category else None)
+        if allocator is not None:
+            allocator.cancel(number)
+
+    # ---------- channel events ----------
+    def on_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        if not isinstance(channel, discord.VoiceChannel):
+            return
+        allocator = self._get(channel.guild.id, channel.category_id)
+        if allocator is not None:
+            allocator.observe(channel.id, channel.name)
+
+    def on_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        if not isinstance(channel, discord.VoiceChannel):
+            return
+        allocator = self._get(channel.guild.id, channel.category_id)
+        if allocator is not None:
+            allocator.forget(channel.id)
+
+    def on_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel) -> None:
+        if not isinstance(after, discord.VoiceChannel):
+            return
+        if before.name == after.name and before.category_id == after.category_id:
+            return
+        if before.category_id != after.category_id:
+            self.on_channel_delete(before)
+        self.on_channel_create(after)
+
+
+TEMP_VC_NAMES = TempVCNameAllocator()
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Optional
+
+import discord
+
+from features.tempvc_registry import TEMP_VC_REGISTRY, TempVCRegistry
+from features.tempvc_settings import (
+    get_auto_vc_user_limit,
+    get_pool_max,
+    get_pool_rate_window_seconds,
+    get_pool_refill_interval_seconds,
+    get_pool_size,
+    get_temp_channel_base_name,
+)
+
+
+log = logging.getLogger("con9sole-bartender.tempvc.pool")
+
+PoolKey = tuple[int, Optional[int]]
+
+POOL_CHANNEL_SUFFIX = "待命"
+
+
+def pool_key(guild: discord.Guild, category: Optional[discord.CategoryChannel]) -> PoolKey:
+    return (guild.id, category.id if category else None)
+
+
+class TempVCPool:
+    """Hidden, pre-created temp VCs per hub category so a hub join only renames and moves.
+
+    The target size is `TEMP_VC_POOL_SIZE`, raised up to `TEMP_VC_POOL_MAX` when
+    more members than that joined the hub within the rate window. One background
+    worker refills pools one channel at a time, spaced by the refill interval.
+    """
+
+    def __init__(self, registry: TempVCRegistry) -> None:
+        self.registry = registry
+        self._ready: dict[PoolKey, deque[int]] = {}
+        self._joins: dict[PoolKey, deque[float]] = {}
+        self._client: Any = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def enabled() -> bool:
+        return get_pool_size() > 0
+
+    def __len__(self) -> int:
+        return sum(len(ready) for ready in self._ready.values())
+
+    def ready_count(self, key: PoolKey) -> int:
+        return len(self._ready.get(key, ()))
+
+    # ---------- sizing ----------
+    def record_join(self, key: PoolKey, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        joins = self._joins.setdefault(key, deque())
+        joins.append(now)
+        self._trim_joins(joins, now)
+
+    def _trim_joins(self, joins: deque[float], now: float) -> None:
+        cutoff = now - get_pool_rate_window_seconds()
+        while joins and joins[0] < cutoff:
+            joins.popleft()
+
+    def target_size(self, key: PoolKey, now: float | None = None) -> int:
+        if not self.enabled():
+            return 0
+        now = time.monotonic() if now is None else now
+        joins = self._joins.get(key)
+        recent = 0
+        if joins:
+            self._trim_joins(joins, now)
+            recent = len(joins)
+        return min(get_pool_max(), max(get_pool_size(), recent))
+
+    def deficits(self, now: float | None = None) -> list[tuple[PoolKey, int]]:
+        return [
+            (key, missing)
+            for key in self._ready
+            if (missing := self.target_size(key, now) - len(self._ready[key])) > 0
+        ]
+
+    # ---------- channel bookkeeping ----------
+    def watch(self, guild: discord.Guild, category: Optional[discord.CategoryChannel]) -> None:
+        """Keep a pool for a hub's category."""
+        if not self.enabled():
+            return
+        self._ready.setdefault(pool_key(guild, category), deque())
+        self.wake()
+
+    def adopt(self, guild: discord.Guild) -> int:
+        """Put pooled channels that survived a restart back into their pools."""
+        adopted = 0
+        for channel_id in self.registry.pooled_ids(guild.id):
+            channel = guild.get_channel(channel_id)
+            if not isinstance(channel, discord.VoiceChannel):
+                self.registry.discard(channel_id)
+                continue
+            ready = self._ready.setdefault(pool_key(guild, channel.category), deque())
+            if channel_id not in ready:
+                ready.append(channel_id)
+                adopted += 1
+        return adopted
+
+    def forget(self, channel_id: int) -> None:
+        for ready in self._ready.values():
+            if channel_id in ready:
+                ready.remove(channel_id)
+                self.wake()
+                return
+
+    def take(self, guild: discord.Guild, category: Optional[discord.CategoryChannel]) -> discord.VoiceChannel | None:
+        ready = self._ready.get(pool_key(guild, category))
+        while ready:
+            channel = guild.get_channel(ready.popleft())
+            if isinstance(channel, discord.VoiceChannel) and not channel.members:
+                self.wake()
+                return channel
+        return None
+
+    async def claim(
+        self,
+        channel: discord.VoiceChannel,
+        *,
+        name: str,
+        creator_id: int,
+        user_limit: int | None,
+        reason: str,
+    ) -> discord.VoiceChannel:
+        """Rename and unhide a pooled channel; the caller then moves the member in."""
+        kwargs: dict[str, Any] = {"name": name, "reason": reason}
+        if user_limit is not None:
+            kwargs["user_limit"] = user_limit
+        if channel.category is not None:
+            kwargs["sync_permissions"] = True
+        else:
+            kwargs["overwrites"] = {}
+
+        edited = await channel.edit(**kwargs)
+        claimed = edited if isinstance(edited, discord.VoiceChannel) else channel
+        self.registry.claim(claimed.id, creator_id=creator_id, user_limit=user_limit)
+        return claimed
+
+    async def scrap(self, guild: discord.Guild, channel: discord.VoiceChannel) -> None:
+        """Delete a pooled channel that failed to be claimed, or put it back if that fails too."""
+        try:
+            await channel.delete(reason="Pooled temp VC could not be claimed")
+        except discord.NotFound:
+            pass
+        except discord.HTTPException:
+            log.warning("Failed to delete unclaimed pooled temp VC; returning it to the pool: channel=%s", channel.id, exc_info=True)
+            self._ready.setdefault(pool_key(guild, channel.category), deque()).appendleft(channel.id)
+            return
+        self.registry.discard(channel.id)
+
+    # ---------- refill worker ----------
+    def wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def start(self, client: Any) -> None:
+        if not self.enabled() or (self._task is not None and not self._task.done()):
+            return
+        self._client = client
+        self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        self._task = asyncio.create_task(self._refill_loop())
+        log.info("Temp VC pool started: size=%s max=%s", get_pool_size(), get_pool_max())
+
+    def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self._wakeup = None
+
+    def reset(self) -> None:
+        self.stop()
+        self._ready.clear()
+        self._joins.clear()
+
+    async def _create_pooled(self, guild: discord.Guild, category: Optional[discord.CategoryChannel]) -> discord.VoiceChannel:
+        overwrites = dict(category.overwrites) if category else {}
+        hidden = overwrites.get(guild.default_role, discord.PermissionOverwrite())
+        hidden.view_channel = False
+        overwrites[guild.default_role] = hidden
+
+        kwargs: dict[str, Any] = {"bitrate": guild.bitrate_limit, "overwrites": overwrites}
+        default_limit = get_auto_vc_user_limit()
+        if default_limit is not None:
+            kwargs["user_limit"] = default_limit
+
+        channel = await guild.create_voice_channel(
+            f"{get_temp_channel_base_name()} {POOL_CHANNEL_SUFFIX}",
+            category=category,
+            reason="Pre-create pooled temp VC (bartender)",
+            **kwargs,
+        )
+        self.registry.add(channel.id, guild_id=guild.id, creator_id=None, user_limit=default_limit, pooled=True)
+        return channel
+
+    async def _refill_loop(self) -> None:
+        wakeup = self._wakeup
+        if wakeup is None:
+            return
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            for key, missing in self.deficits():
+                guild = self._client.get_guild(key[0]) if self._client is not None else None
+                if guild is None:
+                    continue
+                category = guild.get_channel(key[1]) if key[1] is not None else None
+                if key[1] is not None and not isinstance(category, discord.CategoryChannel):
+                    continue
+
+                for _ in range(missing):
+                    try:
+                        channel = await self._create_pooled(guild, category)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        log.warning("Failed to pre-create pooled temp VC: guild=%s category=%s", key[0], key[1], exc_info=True)
+                        break
+                    self._ready.setdefault(key, deque()).append(channel.id)
+                    log.debug("Pooled temp VC ready: channel=%s category=%s", channel.id, key[1])
+                    # 逐間慢慢補，唔好同 hub join 爭 channel create rate limit
+                    await asyncio.sleep(get_pool_refill_interval_seconds())
+
+
+TEMP_VC_POOL = TempVCPool(TEMP_VC_REGISTRY)
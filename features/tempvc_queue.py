@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import discord
+
+from core.metrics import METRICS
+from features.tempvc_settings import (
+    get_hub_concurrency,
+    get_hub_group_max,
+    get_hub_group_window_seconds,
+)
+
+
+log = logging.getLogger("con9sole-bartender.tempvc.queue")
+
+QUEUE_WAIT_METRIC = "tempvc.hub_queue_wait_seconds"
+QUEUE_DEPTH_METRIC = "tempvc.hub_queue_depth"
+GROUPED_METRIC = "tempvc.hub_members_grouped"
+
+HubGroupHandler = Callable[[list[discord.Member], discord.VoiceChannel], Awaitable[None]]
+
+
+@dataclass
+class HubJoinRequest:
+    member: discord.Member
+    hub: discord.VoiceChannel
+    enqueued_at: float
+
+
+class HubCreationQueue:
+    """FIFO queue of hub joins per guild, drained by at most `TEMP_VC_HUB_CONCURRENCY` workers.
+
+    With a group window configured, joins to the same hub within the window of
+    the oldest waiting join are handed to the handler together, so they can
+    share one channel.
+    """
+
+    def __init__(self, handler: HubGroupHandler) -> None:
+        self.handler = handler
+        self._queues: dict[int, deque[HubJoinRequest]] = {}
+        self._workers: dict[int, set[asyncio.Task[None]]] = {}
+        self._members: set[int] = set()
+
+    def __contains__(self, member_id: object) -> bool:
+        return member_id in self._members
+
+    def depth(self, guild_id: int | None = None) -> int:
+        if guild_id is not None:
+            return len(self._queues.get(guild_id, ()))
+        return sum(len(queue) for queue in self._queues.values())
+
+    def submit(self, member: discord.Member, hub: discord.VoiceChannel) -> bool:
+        """Queue a hub join; False if the member is already queued or being served."""
+        if member.id in self._members:
+            return False
+
+        guild_id = member.guild.id
+        self._members.add(member.id)
+        self._queues.setdefault(guild_id, deque()).append(
+            HubJoinRequest(member=member, hub=hub, enqueued_at=time.monotonic())
+        )
+        METRICS.gauge(QUEUE_DEPTH_METRIC).set(self.depth())
+
+        workers = self._workers.setdefault(guild_id, set())
+        # 做完嘅 worker 要等下一輪 loop 先會 discard，唔好當佢仲喺度做嘢
+        if sum(not task.done() for task in workers) < get_hub_concurrency():
+            task = asyncio.create_task(self._drain(guild_id))
+            workers.add(task)
+            task.add_done_callback(workers.discard)
+        return True
+
+    def _next_group(self, queue: deque[HubJoinRequest]) -> list[HubJoinRequest]:
+        head = queue.popleft()
+        group = [head]
+        window = get_hub_group_window_seconds()
+        if window <= 0:
+            return group
+
+        limit = get_hub_group_max()
+        cutoff = head.enqueued_at + window
+        remaining: deque[HubJoinRequest] = deque()
+        while queue:
+            request = queue.popleft()
+            if len(group) < limit and request.hub.id == head.hub.id and request.enqueued_at <= cutoff:
+                group.append(request)
+            else:
+                remaining.append(request)
+        queue.extend(remaining)
+        return group
+
+    async def _drain(self, guild_id: int) -> None:
+        queue = self._queues.get(guild_id)
+        while queue:
+            window = get_hub_group_window_seconds()
+            if window > 0:
+                # 等埋同一瞬間入 hub 嘅人，先一齊開房
+                delay = queue[0].enqueued_at + window - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+
+            group = self._next_group(queue)
+            started = time.monotonic()
+            wait_metric = METRICS.histogram(QUEUE_WAIT_METRIC)
+            for request in group:
+                wait_metric.observe(started - request.enqueued_at)
+            METRICS.gauge(QUEUE_DEPTH_METRIC).set(self.depth())
+            if len(group) > 1:
+                METRICS.counter(GROUPED_METRIC).inc(len(group))
+
+            # 排隊期間已經離開 hub 嘅人就唔使再開房
+            members = [
+                request.member
+                for request in group
+                if request.member.voice is not None and request.member.voice.channel == request.hub
+            ]
+            try:
+                if members:
+                    await self.handler(members, group[0].hub)
+            except Exception:
+                log.exception("Hub creation failed: guild=%s members=%s", guild_id, [m.id for m in members])
+            finally:
+                for request in group:
+                    self._members.discard(request.member.id)
+
+    def cancel_all(self) -> None:
+        for workers in self._workers.values():
+            for task in workers:
+                task.cancel()
+        self._workers.clear()
+        self._queues.clear()
+        self._members.clear()
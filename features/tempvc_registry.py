@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from core.json_storage import atomic_write_json, load_json_object
+from core.storage_paths import TEMP_VC_REGISTRY_PATH
+from utils import track_temp_vc, untrack_temp_vc
+
+
+log = logging.getLogger("con9sole-bartender.tempvc.registry")
+
+REGISTRY_VERSION = 1
+
+
+@dataclass(frozen=True)
+class TempVCRecord:
+    channel_id: int
+    guild_id: int
+    creator_id: int | None
+    created_at: float
+    user_limit: int | None
+    pooled: bool = False
+
+
+def _default_state() -> dict[str, Any]:
+    return {"version": REGISTRY_VERSION, "channels": {}, "reconciled_guilds": []}
+
+
+def _parse_record(channel_id: str, raw: Any) -> TempVCRecord | None:
+    if not isinstance(raw, dict):
+        return None
+    try:
+        creator_id = raw.get("creator_id")
+        user_limit = raw.get("user_limit")
+        return TempVCRecord(
+            channel_id=int(channel_id),
+            guild_id=int(raw["guild_id"]),
+            creator_id=int(creator_id) if creator_id is not None else None,
+            created_at=float(raw.get("created_at", 0.0)),
+            user_limit=int(user_limit) if user_limit is not None else None,
+            pooled=bool(raw.get("pooled", False)),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class TempVCRegistry:
+    """Source of truth for bot-created temp VCs, kept current by create / delete events.
+
+    `is_temp_vc_id` stays the hot-path check; this registry keeps that set in sync
+    and persists ownership so restarts don't have to rediscover channels by name.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._records: dict[int, TempVCRecord] = {}
+        self._reconciled_guilds: set[int] = set()
+        self._loaded = False
+
+    def __contains__(self, channel_id: object) -> bool:
+        return channel_id in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+
+        state = load_json_object(self.path, _default_state)
+        channels = state.get("channels")
+        for channel_id, raw in (channels.items() if isinstance(channels, dict) else ()):
+            record = _parse_record(channel_id, raw)
+            if record is None:
+                log.warning("Skipped malformed temp VC record: channel=%s", channel_id)
+                continue
+            self._records[record.channel_id] = record
+            if not record.pooled:
+                track_temp_vc(record.channel_id)
+
+        reconciled = state.get("reconciled_guilds")
+        if isinstance(reconciled, list):
+            self._reconciled_guilds = {int(guild_id) for guild_id in reconciled if str(guild_id).isdigit()}
+
+        if self._records:
+            log.info("Loaded temp VC registry: channels=%s", len(self._records))
+
+    def _save(self) -> None:
+        atomic_write_json(
+            self.path,
+            {
+                "version": REGISTRY_VERSION,
+                "channels": {
+                    str(record.channel_id): {key: value for key, value in asdict(record).items() if key != "channel_id"}
+                    for record in self._records.values()
+                },
+                "reconciled_guilds": sorted(self._reconciled_guilds),
+            },
+        )
+
+    def get(self, channel_id: int) -> TempVCRecord | None:
+        return self._records.get(channel_id)
+
+    def channel_ids(self, guild_id: int) -> list[int]:
+        """Temp VCs in use; hidden pool channels are listed by `pooled_ids`."""
+        return [
+            record.channel_id
+            for record in self._records.values()
+            if record.guild_id == guild_id and not record.pooled
+        ]
+
+    def pooled_ids(self, guild_id: int) -> list[int]:
+        return [record.channel_id for record in self._records.values() if record.guild_id == guild_id and record.pooled]
+
+    def add(
+        self,
+        channel_id: int,
+        *,
+        guild_id: int,
+        creator_id: int | None,
+        user_limit: int | None,
+        created_at: float | None = None,
+        pooled: bool = False,
+    ) -> TempVCRecord:
+        self.load()
+        record = TempVCRecord(
+            channel_id=channel_id,
+            guild_id=guild_id,
+            creator_id=creator_id,
+            created_at=time.time() if created_at is None else created_at,
+            user_limit=user_limit,
+            pooled=pooled,
+        )
+        self._records[channel_id] = record
+        # 預留池入面嘅房未有人用，唔當 temp VC 處理（唔會被自動刪除）
+        if not pooled:
+            track_temp_vc(channel_id)
+        self._save()
+        return record
+
+    def claim(self, channel_id: int, *, creator_id: int | None, user_limit: int | None) -> TempVCRecord | None:
+        """Turn a pooled channel into a live temp VC."""
+        self.load()
+        record = self._records.get(channel_id)
+        if record is None or not record.pooled:
+            return None
+        return self.add(channel_id, guild_id=record.guild_id, creator_id=creator_id, user_limit=user_limit)
+
+    def discard(self, channel_id: int) -> TempVCRecord | None:
+        self.load()
+        untrack_temp_vc(channel_id)
+        record = self._records.pop(channel_id, None)
+        if record is not None:
+            self._save()
+        return record
+
+    def needs_reconcile(self, guild_id: int) -> bool:
+        self.load()
+        return guild_id not in self._reconciled_guilds
+
+    def reconcile(
+        self,
+        guild_id: int,
+        *,
+        existing_channel_ids: Iterable[int],
+        legacy_channel_ids: Iterable[int] = (),
+    ) -> tuple[list[int], list[int]]:
+        """Drop records whose channel is gone; adopt legacy name-matched channels once.
+
+        Returns `(adopted, removed)` channel ids.
+        """
+        self.load()
+        existing = set(existing_channel_ids)
+        removed = [
+            channel_id
+            for channel_id, record in self._records.items()
+            if record.guild_id == guild_id and channel_id not in existing
+        ]
+        for channel_id in removed:
+            self._records.pop(channel_id, None)
+            untrack_temp_vc(channel_id)
+
+        adopted: list[int] = []
+        if guild_id not in self._reconciled_guilds:
+            # 舊版只靠名稱前綴辨認 temp VC；第一次啟動時收編，之後以 registry 為準
+            now = time.time()
+            for channel_id in legacy_channel_ids:
+                if channel_id in self._records or channel_id not in existing:
+                    continue
+                self._records[channel_id] = TempVCRecord(channel_id, guild_id, None, now, None)
+                track_temp_vc(channel_id)
+                adopted.append(channel_id)
+            self._reconciled_guilds.add(guild_id)
+            self._save()
+        elif removed:
+            self._save()
+
+        if adopted or removed:
+            log.info(
+                "Reconciled temp VC registry: guild=%s adopted=%s removed=%s",
+                guild_id,
+                len(adopted),
+                len(removed),
+            )
+        return adopted, removed
+
+
+TEMP_VC_REGISTRY = TempVCRegistry(TEMP_VC_REGISTRY_PATH)
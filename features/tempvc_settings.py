@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Iterable
+from functools import lru_cache
 
 import config
 
@@ -43,6 +44,59 @@ def get_auto_vc_user_limit() -> int | None:
         return None
 
 
+def get_pool_size() -> int:
+    try:
+        return max(0, int(getattr(config, "TEMP_VC_POOL_SIZE", 0)))
+    except (TypeError, ValueError):
+        return 0
+
+
+def get_pool_max() -> int:
+    try:
+        return max(get_pool_size(), int(getattr(config, "TEMP_VC_POOL_MAX", 4)))
+    except (TypeError, ValueError):
+        return get_pool_size()
+
+
+def get_pool_rate_window_seconds() -> float:
+    try:
+        return max(1.0, float(getattr(config, "TEMP_VC_POOL_RATE_WINDOW_SECONDS", 300)))
+    except (TypeError, ValueError):
+        return 300.0
+
+
+def get_pool_refill_interval_seconds() -> float:
+    try:
+        return max(0.0, float(getattr(config, "TEMP_VC_POOL_REFILL_INTERVAL_SECONDS", 3.0)))
+    except (TypeError, ValueError):
+        return 3.0
+
+
+def get_hub_concurrency() -> int:
+    try:
+        return max(1, int(getattr(config, "TEMP_VC_HUB_CONCURRENCY", 2)))
+    except (TypeError, ValueError):
+        return 2
+
+
+def get_hub_group_window_seconds() -> float:
+    try:
+        return max(0.0, float(getattr(config, "TEMP_VC_HUB_GROUP_WINDOW_SECONDS", 0)))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def get_hub_group_max() -> int:
+    """Most members grouped into one hub-created channel; falls back to the auto VC limit."""
+    try:
+        configured = int(getattr(config, "TEMP_VC_HUB_GROUP_MAX", 0))
+    except (TypeError, ValueError):
+        configured = 0
+    if configured > 0:
+        return configured
+    return get_auto_vc_user_limit() or 99
+
+
 def get_vc_limit_user_cooldown_seconds() -> float:
     try:
         return float(getattr(config, "VC_LIMIT_USER_COOLDOWN_SECONDS", 30))
@@ -100,17 +154,32 @@ def format_seconds(seconds: float) -> str:
     return f"{minutes} 分 {sec} 秒"
 
 
+@lru_cache(maxsize=8)
+def _temp_channel_name_pattern(base: str) -> re.Pattern[str]:
+    return re.compile(rf"^{re.escape(base)}\s+(\d+)$")
+
+
+def parse_temp_channel_number(name: str, *, base: str | None = None) -> int | None:
+    """Return N for names like "<base> N", otherwise None."""
+    normalized_base = (base or get_temp_channel_base_name()).strip()
+    match = _temp_channel_name_pattern(normalized_base).fullmatch(name.strip())
+    return int(match.group(1)) if match else None
+
+
+def format_temp_channel_name(number: int, *, base: str | None = None) -> str:
+    return f"{(base or get_temp_channel_base_name()).strip()} {number}"
+
+
 def next_temp_channel_name(existing_names: Iterable[str], *, base: str | None = None) -> str:
     normalized_base = (base or get_temp_channel_base_name()).strip()
-    pattern = re.compile(rf"^{re.escape(normalized_base)}\s+(\d+)$")
     used_numbers: set[int] = set()
 
     for name in existing_names:
-        match = pattern.fullmatch(name.strip())
-        if match:
-            used_numbers.add(int(match.group(1)))
+        number = parse_temp_channel_number(name, base=normalized_base)
+        if number is not None:
+            used_numbers.add(number)
 
     number = 1
     while number in used_numbers:
         number += 1
-    return f"{normalized_base} {number}"
+    return format_temp_channel_name(number, base=normalized_base)
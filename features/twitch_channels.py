@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from core.metrics import METRICS
+from features.twitch_metrics import JOIN_PENDING_METRIC
+from features.twitch_outbound import SlidingWindowLimiter
+from features.twitch_settings import get_join_per_seconds, get_join_rate
+
+
+log = logging.getLogger("con9sole-bartender.twitch.channels")
+
+MAX_JOIN_ATTEMPTS = 5
+JOIN_RETRY_BASE_SECONDS = 5.0
+JOIN_RETRY_MAX_SECONDS = 300.0
+
+
+def normalize_channel_name(name: str) -> str:
+    return (name or "").strip().lstrip("#").lower()
+
+
+class TwitchChannelIndex:
+    """Joined Twitch channels by lowercase name, kept current from join / part events."""
+
+    def __init__(self) -> None:
+        self._channels: dict[str, Any] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and normalize_channel_name(name) in self._channels
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def get(self, name: str) -> Any:
+        return self._channels.get(normalize_channel_name(name))
+
+    def add(self, channel: Any) -> None:
+        self._channels[normalize_channel_name(getattr(channel, "name", ""))] = channel
+
+    def discard(self, name: str) -> None:
+        self._channels.pop(normalize_channel_name(name), None)
+
+    def clear(self) -> None:
+        self._channels.clear()
+
+
+class TwitchJoinScheduler:
+    """Joins wanted Twitch channels in batches that stay within the join rate limit.
+
+    A sliding window caps JOINs at `TWITCH_JOIN_RATE` per
+    `TWITCH_JOIN_PER_SECONDS`, and each batch is as large as the window still
+    allows. Failed joins are retried with exponential backoff, up to
+    `MAX_JOIN_ATTEMPTS` times per channel.
+    """
+
+    def __init__(self, client_getter: Callable[[], Any], *, limiter: SlidingWindowLimiter | None = None) -> None:
+        self.client_getter = client_getter
+        self.index = TwitchChannelIndex()
+        self.limiter = limiter or SlidingWindowLimiter(get_join_rate(), get_join_per_seconds())
+        self._wanted: set[str] = set()
+        self._pending: deque[str] = deque()
+        self._queued: set[str] = set()
+        # 已經送出 JOIN，等緊 joined / join failure event
+        self._joining: set[str] = set()
+        self._attempts: dict[str, int] = {}
+        self._retries: dict[str, asyncio.TimerHandle] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def is_pending(self, name: str) -> bool:
+        """True while a join for `name` is queued, in flight or waiting to retry."""
+        name = normalize_channel_name(name)
+        return name in self._queued or name in self._joining or name in self._retries
+
+    def request(self, names: Iterable[str]) -> None:
+        """Make sure these channels get joined; already joined or queued ones are skipped."""
+        for raw in names:
+            name = normalize_channel_name(raw)
+            if not name:
+                continue
+            self._wanted.add(name)
+            if name in self.index or name in self._queued or name in self._retries:
+                continue
+            self._queued.add(name)
+            self._pending.append(name)
+        METRICS.gauge(JOIN_PENDING_METRIC).set(len(self._pending))
+        if self._pending and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while self._pending:
+            await self.limiter.acquire()
+            batch = [self._pending.popleft()]
+            while self._pending and self.limiter.try_take() == 0:
+                batch.append(self._pending.popleft())
+            self._queued.difference_update(batch)
+            METRICS.gauge(JOIN_PENDING_METRIC).set(len(self._pending))
+            # 排隊期間已經 join 咗嘅就唔使再 join
+            batch = [name for name in batch if name not in self.index]
+            if not batch:
+                continue
+
+            client = self.client_getter()
+            if client is None:
+                return
+            self._joining.update(batch)
+            try:
+                await client.join_channels(batch)
+                log.info("🔁 join_channels：%s", ",".join(batch))
+            except Exception:
+                log.warning("⚠️ join_channels 失敗：%s", ",".join(batch), exc_info=True)
+                for name in batch:
+                    self.on_join_failed(name)
+
+    # ---------- events from the Twitch client ----------
+    def on_ready(self, names: Iterable[str] = ()) -> None:
+        """A fresh connection has no joined channels; join `names` and everything wanted before."""
+        self.index.clear()
+        self._joining.clear()
+        self._attempts.clear()
+        for handle in self._retries.values():
+            handle.cancel()
+        self._retries.clear()
+        self.request([*names, *self._wanted])
+
+    def on_joined(self, channel: Any) -> None:
+        name = normalize_channel_name(getattr(channel, "name", ""))
+        self.index.add(channel)
+        self._joining.discard(name)
+        self._attempts.pop(name, None)
+        handle = self._retries.pop(name, None)
+        if handle is not None:
+            handle.cancel()
+
+    def on_parted(self, name: str) -> None:
+        name = normalize_channel_name(name)
+        self.index.discard(name)
+        if name in self._wanted:
+            log.warning("⚠️ 被踢出 / 離開咗 #%s，重新 join", name)
+            self.request([name])
+
+    def on_join_failed(self, name: str) -> None:
+        name = normalize_channel_name(name)
+        self._joining.discard(name)
+        if name not in self._wanted or name in self.index or name in self._retries:
+            return
+        attempts = self._attempts.get(name, 0) + 1
+        self._attempts[name] = attempts
+        if attempts >= MAX_JOIN_ATTEMPTS:
+            log.error("❌ join #%s 失敗 %s 次，放棄（檢查頻道名同 token）", name, attempts)
+            return
+        delay = min(JOIN_RETRY_MAX_SECONDS, JOIN_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+        log.warning("⚠️ join #%s 失敗，%.0f 秒後重試（第 %s 次）", name, delay, attempts)
+        self._retries[name] = asyncio.get_running_loop().call_later(delay, self._retry, name)
+
+    def _retry(self, name: str) -> None:
+        self._retries.pop(name, None)
+        self.request([name])
+
+    def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        for handle in self._retries.values():
+            handle.cancel()
+        self._retries.clear()
+        self._pending.clear()
+        self._queued.clear()
+        self._joining.clear()
+        self.index.clear()
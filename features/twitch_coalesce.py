@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from core.metrics import METRICS
+from features.twitch_metrics import FAILED, SENT, T2D, count, relay_metric, set_depth
+from features.twitch_settings import DISCORD_MESSAGE_MAX_CHARS, get_coalesce_seconds
+
+
+log = logging.getLogger("con9sole-bartender.twitch.coalesce")
+
+LAG_METRIC = relay_metric(T2D, "lag_seconds")
+MERGED_METRIC = relay_metric(T2D, "merged")
+BATCH_SIZE_METRIC = relay_metric(T2D, "lines_per_message")
+
+BATCH_SIZE_BUCKETS: tuple[float, ...] = (1, 2, 3, 5, 10, 20, 50)
+
+ChannelResolver = Callable[[int], Awaitable[Any]]
+
+
+@dataclass
+class RelayLine:
+    text: str
+    received_at: float
+
+
+def pack_lines(buffer: deque[RelayLine], limit: int = DISCORD_MESSAGE_MAX_CHARS) -> list[RelayLine]:
+    """Pop as many leading lines as fit in one Discord message, joined by newlines."""
+    lines: list[RelayLine] = []
+    size = 0
+    while buffer:
+        text = buffer[0].text
+        extra = len(text) + (1 if lines else 0)
+        if lines and size + extra > limit:
+            break
+        line = buffer.popleft()
+        if len(text) > limit:
+            line.text = text[: limit - 1] + "…"
+        lines.append(line)
+        size += min(extra, limit)
+    return lines
+
+
+class DiscordCoalescer:
+    """Buffers Twitch chat per Discord channel and sends it in packed messages.
+
+    The first line of a burst waits `TWITCH_RELAY_COALESCE_SECONDS`, then every
+    buffered line is packed into as few messages as the 2,000-character limit
+    allows. While Discord rate-limits a send, new lines keep accumulating, so
+    one backlog becomes one message instead of minutes of single lines.
+    """
+
+    def __init__(self, resolve_channel: ChannelResolver) -> None:
+        self.resolve_channel = resolve_channel
+        self._buffers: dict[int, deque[RelayLine]] = {}
+        self._workers: dict[int, asyncio.Task[None]] = {}
+
+    def depth(self, channel_id: int | None = None) -> int:
+        if channel_id is not None:
+            return len(self._buffers.get(channel_id, ()))
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    def submit(self, channel_id: int, text: str, *, received_at: float | None = None) -> None:
+        self._buffers.setdefault(channel_id, deque()).append(
+            RelayLine(text=text, received_at=time.monotonic() if received_at is None else received_at)
+        )
+        set_depth(T2D, self.depth())
+        worker = self._workers.get(channel_id)
+        if worker is None or worker.done():
+            self._workers[channel_id] = asyncio.create_task(self._drain(channel_id))
+
+    async def _drain(self, channel_id: int) -> None:
+        buffer = self._buffers[channel_id]
+        while buffer:
+            delay = buffer[0].received_at + get_coalesce_seconds() - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            lines = pack_lines(buffer)
+            set_depth(T2D, self.depth())
+            channel = await self.resolve_channel(channel_id)
+            if channel is None:
+                log.error("❌ [T→D] 找不到 Discord 頻道 id=%s", channel_id)
+                count(T2D, FAILED, len(lines))
+                continue
+
+            content = "\n".join(line.text for line in lines)
+            try:
+                await channel.send(content)
+            except Exception:
+                log.exception("❌ [T→D] send 失敗：channel=%s lines=%s", channel_id, len(lines))
+                count(T2D, FAILED, len(lines))
+                continue
+
+            sent_at = time.monotonic()
+            count(T2D, SENT, len(lines))
+            lag = METRICS.histogram(LAG_METRIC)
+            for line in lines:
+                lag.observe(sent_at - line.received_at)
+            METRICS.histogram(BATCH_SIZE_METRIC, BATCH_SIZE_BUCKETS).observe(len(lines))
+            if len(lines) > 1:
+                METRICS.counter(MERGED_METRIC).inc(len(lines) - 1)
+            log.info(
+                "✅ [T→D] -> %s(id=%s): %s line(s), lag=%.2fs",
+                getattr(channel, "name", "unknown"),
+                channel_id,
+                len(lines),
+                sent_at - lines[0].received_at,
+            )
+
+    def stop(self) -> None:
+        for task in self._workers.values():
+            task.cancel()
+        self._workers.clear()
+        self._buffers.clear()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import Any
+
+import discord
+
+from core.metrics import METRICS
+
+
+METRIC_PREFIX = "twitch_relay."
+
+T2D = "t2d"
+D2T = "d2t"
+
+RECEIVED = "received"
+DEDUPED = "deduped"
+SENT = "sent"
+FAILED = "failed"
+
+JOIN_PENDING_METRIC = "twitch_relay.join_pending"
+
+
+def relay_metric(direction: str, name: str) -> str:
+    return f"{METRIC_PREFIX}{direction}_{name}"
+
+
+def count(direction: str, event: str, amount: int = 1) -> None:
+    METRICS.counter(relay_metric(direction, event)).inc(amount)
+
+
+def observe_lag(direction: str, seconds: float) -> None:
+    METRICS.histogram(relay_metric(direction, "lag_seconds")).observe(seconds)
+
+
+def set_depth(direction: str, depth: int) -> None:
+    METRICS.gauge(relay_metric(direction, "queue_depth")).set(depth)
+
+
+def _value(snapshot: dict[str, dict[str, Any]], name: str, key: str = "value") -> float:
+    return snapshot.get(name, {}).get(key, 0)
+
+
+def _direction_field(snapshot: dict[str, dict[str, Any]], direction: str) -> str:
+    def metric(name: str, key: str = "value") -> float:
+        return _value(snapshot, relay_metric(direction, name), key)
+
+    return (
+        f"收到：`{metric(RECEIVED):.0f}` · 去重：`{metric(DEDUPED):.0f}`\n"
+        f"送出：`{metric(SENT):.0f}` · 失敗：`{metric(FAILED):.0f}`\n"
+        f"合併：`{metric('merged'):.0f}` · 丟棄：`{metric('dropped'):.0f}`\n"
+        f"延遲 p50 / p95：`{metric('lag_seconds', 'p50'):.2f}s` / `{metric('lag_seconds', 'p95'):.2f}s`\n"
+        f"排隊中：`{metric('queue_depth'):.0f}`"
+    )
+
+
+def build_relay_stats_embed(
+    snapshot: dict[str, dict[str, Any]],
+    *,
+    joined: int,
+    configured: int,
+) -> discord.Embed:
+    embed = discord.Embed(
+        title="📡 Twitch Relay",
+        description=(
+            f"**已 join 頻道：** `{joined}` / `{configured}`\n"
+            f"**等待 join：** `{_value(snapshot, JOIN_PENDING_METRIC):.0f}`"
+        ),
+        color=0x9146FF,
+    )
+    embed.add_field(name="Twitch → Discord", value=_direction_field(snapshot, T2D), inline=True)
+    embed.add_field(name="Discord → Twitch", value=_direction_field(snapshot, D2T), inline=True)
+    embed.set_footer(text="自 bot 啟動起計")
+    return embed
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from core.metrics import METRICS
+from features.twitch_metrics import D2T, FAILED, SENT, count, observe_lag, relay_metric, set_depth
+from features.twitch_settings import (
+    TWITCH_MESSAGE_MAX_CHARS,
+    get_send_per_seconds,
+    get_send_queue_max,
+    get_send_rate,
+)
+
+if TYPE_CHECKING:
+    from features.twitch_channels import TwitchJoinScheduler
+
+
+log = logging.getLogger("con9sole-bartender.twitch.outbound")
+
+MERGE_SEPARATOR = " | "
+MAX_MESSAGE_AGE_SECONDS = 60.0
+MAX_SEND_ATTEMPTS = 3
+RECONNECT_WAIT_SECONDS = 10.0
+WAIT_POLL_SECONDS = 0.25
+MAX_BACKOFF_SECONDS = 60.0
+
+MERGED_METRIC = relay_metric(D2T, "merged")
+DROPPED_METRIC = relay_metric(D2T, "dropped")
+
+
+class SlidingWindowLimiter:
+    """At most `limit` sends in any `per_seconds` window, tracked by send timestamps.
+
+    Nothing is banked up front, so a full burst at the start cannot be followed
+    by refilled capacity inside the same window.
+    """
+
+    def __init__(self, limit: int, per_seconds: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.limit = limit
+        self.per_seconds = per_seconds
+        self.clock = clock
+        self._sent: deque[float] = deque()
+
+    def try_take(self) -> float:
+        """Record a send and return 0, or return how many seconds until the oldest one leaves the window."""
+        now = self.clock()
+        while self._sent and now - self._sent[0] >= self.per_seconds:
+            self._sent.popleft()
+        if len(self._sent) < self.limit:
+            self._sent.append(now)
+            return 0.0
+        return self._sent[0] + self.per_seconds - now
+
+    async def acquire(self) -> None:
+        while (delay := self.try_take()) > 0:
+            await asyncio.sleep(delay)
+
+
+@dataclass
+class OutboundMessage:
+    text: str
+    enqueued_at: float
+    attempts: int = 0
+    merged: int = 1
+
+
+def is_connected(client: Any) -> bool:
+    connection = getattr(client, "_connection", None)
+    if connection is not None and hasattr(connection, "is_alive"):
+        return bool(connection.is_alive)
+    ws = getattr(client, "_websocket", None)
+    return ws is not None and not ws.closed and not getattr(ws, "_closing", False)
+
+
+class TwitchOutbound:
+    """Per-Twitch-channel send queues for the Discord → Twitch relay.
+
+    `submit` never awaits, so Discord message handling cannot stall on Twitch.
+    A worker per channel reconnects and asks the join scheduler for the channel
+    when needed, then sends through a sliding-window limiter shared by all
+    channels, so no `TWITCH_SEND_PER_SECONDS` window holds more than
+    `TWITCH_SEND_RATE` messages. When a queue is full, new lines are merged
+    into the last queued message, or the oldest message is dropped.
+    """
+
+    def __init__(
+        self,
+        client_getter: Callable[[], Any],
+        joins: TwitchJoinScheduler,
+        *,
+        limiter: SlidingWindowLimiter | None = None,
+    ) -> None:
+        self.client_getter = client_getter
+        self.joins = joins
+        self.limiter = limiter or SlidingWindowLimiter(get_send_rate(), get_send_per_seconds())
+        self._queues: dict[str, deque[OutboundMessage]] = {}
+        self._workers: dict[str, asyncio.Task[None]] = {}
+        self._failures: dict[str, int] = {}
+        self._connect_lock = asyncio.Lock()
+
+    def depth(self, channel_name: str | None = None) -> int:
+        if channel_name is not None:
+            return len(self._queues.get(channel_name.lower(), ()))
+        return sum(len(queue) for queue in self._queues.values())
+
+    def submit(self, channel_name: str, text: str) -> bool:
+        """Queue a line for a Twitch channel; False if the oldest queued line had to be dropped."""
+        name = channel_name.lower()
+        queue = self._queues.setdefault(name, deque())
+        accepted = True
+        if len(queue) >= get_send_queue_max():
+            last = queue[-1]
+            merged = f"{last.text}{MERGE_SEPARATOR}{text}"
+            if len(merged) <= TWITCH_MESSAGE_MAX_CHARS:
+                last.text = merged
+                last.merged += 1
+                METRICS.counter(MERGED_METRIC).inc()
+                return True
+            dropped = queue.popleft()
+            METRICS.counter(DROPPED_METRIC).inc(dropped.merged)
+            log.warning("Twitch send queue full, dropped oldest line: channel=%s", name)
+            accepted = False
+
+        queue.append(OutboundMessage(text=text, enqueued_at=time.monotonic()))
+        set_depth(D2T, self.depth())
+        worker = self._workers.get(name)
+        if worker is None or worker.done():
+            self._workers[name] = asyncio.create_task(self._drain(name))
+        return accepted
+
+    # ---------- worker ----------
+    def _backoff(self, name: str) -> float:
+        failures = self._failures.get(name, 0) + 1
+        self._failures[name] = failures
+        return min(MAX_BACKOFF_SECONDS, 2.0 ** failures)
+
+    def _drop_stale(self, name: str, queue: deque[OutboundMessage]) -> None:
+        cutoff = time.monotonic() - MAX_MESSAGE_AGE_SECONDS
+        while queue and queue[0].enqueued_at < cutoff:
+            dropped = queue.popleft()
+            METRICS.counter(DROPPED_METRIC).inc(dropped.merged)
+            set_depth(D2T, self.depth())
+            log.warning("Dropped stale Twitch line: channel=%s", name)
+
+    async def _drain(self, name: str) -> None:
+        queue = self._queues[name]
+        while queue:
+            client = self.client_getter()
+            if client is None:
+                queue.clear()
+                return
+
+            channel = await self._ready_channel(client, name)
+            if channel is None:
+                await asyncio.sleep(self._backoff(name))
+                self._drop_stale(name, queue)
+                continue
+
+            await self.limiter.acquire()
+            self._drop_stale(name, queue)
+            if not queue:
+                return
+            message = queue.popleft()
+            set_depth(D2T, self.depth())
+            try:
+                await channel.send(message.text)
+            except Exception:
+                message.attempts += 1
+                if message.attempts < MAX_SEND_ATTEMPTS:
+                    queue.appendleft(message)
+                    set_depth(D2T, self.depth())
+                    log.warning("Twitch send failed, will retry: channel=%s", name, exc_info=True)
+                    await asyncio.sleep(self._backoff(name))
+                else:
+                    log.exception("Twitch send failed, giving up: channel=%s", name)
+                    count(D2T, FAILED, message.merged)
+                continue
+
+            self._failures.pop(name, None)
+            count(D2T, SENT, message.merged)
+            observe_lag(D2T, time.monotonic() - message.enqueued_at)
+            log.info("✅ [D→T send] #%s | %s", name, message.text)
+
+    async def _ensure_connected(self, client: Any) -> bool:
+        if is_connected(client):
+            return True
+        async with self._connect_lock:
+            if is_connected(client):
+                return True
+            log.warning("⚠️ [D→T] Twitch WS 關閉中，嘗試重連…")
+            try:
+                await client.connect()
+            except Exception:
+                log.warning("Twitch reconnect failed", exc_info=True)
+                return False
+            return await _wait_for(lambda: is_connected(client), RECONNECT_WAIT_SECONDS)
+
+    async def _ready_channel(self, client: Any, name: str) -> Any:
+        if not await self._ensure_connected(client):
+            return None
+        channel = self.joins.index.get(name)
+        if channel is not None:
+            return channel
+
+        self.joins.request([name])
+        # 排緊 join rate limit / 等緊 Twitch 回覆都唔算失敗，等 scheduler 有結果先講
+        while self.joins.is_pending(name):
+            await asyncio.sleep(WAIT_POLL_SECONDS)
+        channel = self.joins.index.get(name)
+        if channel is None:
+            log.error("❌ [D→T] join 唔到 Twitch #%s（檢查頻道名同 token 是否含 chat:edit）", name)
+        return channel
+
+    def stop(self) -> None:
+        for task in self._workers.values():
+            task.cancel()
+        self._workers.clear()
+        self._queues.clear()
+        self._failures.clear()
+
+
+async def _wait_for(predicate: Callable[[], bool], timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(WAIT_POLL_SECONDS)
+    return True
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import config
+
+
+# 單條訊息字數上限
+TWITCH_MESSAGE_MAX_CHARS = 500
+DISCORD_MESSAGE_MAX_CHARS = 2000
+
+
+def get_send_rate() -> int:
+    try:
+        return max(1, int(getattr(config, "TWITCH_SEND_RATE", 20)))
+    except (TypeError, ValueError):
+        return 20
+
+
+def get_send_per_seconds() -> float:
+    try:
+        return max(1.0, float(getattr(config, "TWITCH_SEND_PER_SECONDS", 30.0)))
+    except (TypeError, ValueError):
+        return 30.0
+
+
+def get_send_queue_max() -> int:
+    try:
+        return max(1, int(getattr(config, "TWITCH_SEND_QUEUE_MAX", 20)))
+    except (TypeError, ValueError):
+        return 20
+
+
+def get_join_rate() -> int:
+    try:
+        return max(1, int(getattr(config, "TWITCH_JOIN_RATE", 20)))
+    except (TypeError, ValueError):
+        return 20
+
+
+def get_join_per_seconds() -> float:
+    try:
+        return max(1.0, float(getattr(config, "TWITCH_JOIN_PER_SECONDS", 10.0)))
+    except (TypeError, ValueError):
+        return 10.0
+
+
+def get_coalesce_seconds() -> float:
+    try:
+        return max(0.0, float(getattr(config, "TWITCH_RELAY_COALESCE_SECONDS", 1.0)))
+    except (TypeError, ValueError):
+        return 1.0
@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import discord
+
+from core.sqlite_storage import connect_sqlite, enable_wal
+from core.storage_paths import STATS_DB
+from features.tempvc_settings import format_seconds
+
+log = logging.getLogger("con9sole-bartender.voice.sessions")
+
+FLUSH_INTERVAL_SECONDS = 5.0
+FLUSH_BATCH_SIZE = 200
+# 冇 worker 寫入（例如 unload 咗）時最多留幾多 op 喺記憶體
+MAX_PENDING_OPS = 10_000
+
+CLOSE_LEAVE = "leave"
+CLOSE_MOVE = "move"
+CLOSE_RESTART = "restart"
+
+# 每個 op：(kind, params)；同一批次入面保持先後次序
+LedgerOp = tuple[str, tuple[Any, ...]]
+
+_OP_SQL: dict[str, str] = {
+    "open": """
+        INSERT INTO voice_sessions (guild_id, user_id, channel_id, is_temp_vc, joined_at)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+    "close": """
+        UPDATE voice_sessions
+        SET left_at = ?, close_reason = ?
+        WHERE guild_id = ? AND user_id = ? AND left_at IS NULL
+    """,
+    "vc_create": """
+        INSERT OR REPLACE INTO temp_vc_channels (channel_id, guild_id, hub_id, creator_id, created_at)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+    "vc_delete": """
+        UPDATE temp_vc_channels SET deleted_at = ?
+        WHERE channel_id = ? AND deleted_at IS NULL
+    """,
+}
+
+
+def init_voice_sessions_db(path: Path = STATS_DB) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with connect_sqlite(path) as conn:
+        enable_wal(conn)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS voice_sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                is_temp_vc INTEGER NOT NULL DEFAULT 0,
+                joined_at REAL NOT NULL,
+                left_at REAL,
+                close_reason TEXT
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_voice_sessions_guild_joined
+            ON voice_sessions(guild_id, joined_at)
+            """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_voice_sessions_open
+            ON voice_sessions(guild_id, user_id) WHERE left_at IS NULL
+            """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_voice_sessions_channel
+            ON voice_sessions(channel_id)
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS temp_vc_channels (
+                channel_id INTEGER PRIMARY KEY,
+                guild_id INTEGER NOT NULL,
+                hub_id INTEGER,
+                creator_id INTEGER,
+                created_at REAL NOT NULL,
+                deleted_at REAL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_temp_vc_channels_guild_created
+            ON temp_vc_channels(guild_id, created_at)
+            """
+        )
+
+
+class VoiceSessionLedger:
+    """Write-behind ledger of voice sessions and temp VC lifetimes.
+
+    Event handlers only append to an in-memory batch; a background task writes
+    each batch in one transaction on a worker thread.
+    """
+
+    def __init__(self, path: Path = STATS_DB) -> None:
+        self.path = path
+        self._pending: list[LedgerOp] = []
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+        self._initialized = False
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    # ---------- recording (sync, event loop only) ----------
+    def _append(self, kind: str, params: tuple[Any, ...]) -> None:
+        self._pending.append((kind, params))
+        if self._wakeup is not None:
+            if len(self._pending) >= FLUSH_BATCH_SIZE:
+                self._wakeup.set()
+        elif len(self._pending) > MAX_PENDING_OPS:
+            # 唔可以自己 flush：boot 期間 open 要排喺 close_open_sessions 之後先寫
+            del self._pending[:FLUSH_BATCH_SIZE]
+            log.warning("Voice ledger has no writer; dropped the oldest ops: dropped=%s", FLUSH_BATCH_SIZE)
+
+    def open_session(
+        self,
+        guild_id: int,
+        user_id: int,
+        channel_id: int,
+        *,
+        is_temp_vc: bool,
+        at: float | None = None,
+    ) -> None:
+        self._append("open", (guild_id, user_id, channel_id, int(is_temp_vc), time.time() if at is None else at))
+
+    def close_session(self, guild_id: int, user_id: int, *, reason: str, at: float | None = None) -> None:
+        self._append("close", (time.time() if at is None else at, reason, guild_id, user_id))
+
+    def record_transition(
+        self,
+        member: discord.Member,
+        before: Optional[discord.abc.Connectable],
+        after: Optional[discord.abc.Connectable],
+        *,
+        after_is_temp_vc: bool,
+    ) -> None:
+        now = time.time()
+        guild_id = member.guild.id
+        if before is not None:
+            self.close_session(guild_id, member.id, reason=CLOSE_MOVE if after is not None else CLOSE_LEAVE, at=now)
+        if after is not None:
+            self.open_session(guild_id, member.id, after.id, is_temp_vc=after_is_temp_vc, at=now)
+
+    def record_temp_vc_created(
+        self,
+        channel_id: int,
+        *,
+        guild_id: int,
+        hub_id: int | None,
+        creator_id: int | None,
+        at: float | None = None,
+    ) -> None:
+        self._append("vc_create", (channel_id, guild_id, hub_id, creator_id, time.time() if at is None else at))
+
+    def record_temp_vc_deleted(self, channel_id: int, *, at: float | None = None) -> None:
+        self._append("vc_delete", (time.time() if at is None else at, channel_id))
+
+    # ---------- writing (worker thread) ----------
+    def _ensure_schema(self) -> None:
+        if not self._initialized:
+            init_voice_sessions_db(self.path)
+            self._initialized = True
+
+    def write_batch(self, ops: list[LedgerOp]) -> None:
+        self._ensure_schema()
+        with connect_sqlite(self.path) as conn:
+            for kind, params in ops:
+                conn.execute(_OP_SQL[kind], params)
+
+    def close_open_sessions(self, *, reason: str = CLOSE_RESTART, at: float | None = None) -> int:
+        """Close sessions left open by a restart or crash; returns how many were closed."""
+        self._ensure_schema()
+        with connect_sqlite(self.path) as conn:
+            cursor = conn.execute(
+                "UPDATE voice_sessions SET left_at = ?, close_reason = ? WHERE left_at IS NULL",
+                (time.time() if at is None else at, reason),
+            )
+            return cursor.rowcount
+
+    async def flush(self) -> int:
+        # 一次只寫一批，確保 open / close 嘅先後次序
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            ops, self._pending = self._pending, []
+            try:
+                await asyncio.to_thread(self.write_batch, ops)
+            except Exception:
+                # 寫唔到就放返入隊頭，下次再試
+                self._pending[:0] = ops
+                log.exception("Failed to write voice session batch: ops=%s", len(ops))
+                return 0
+            return len(ops)
+
+    # ---------- lifecycle ----------
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        wakeup = self._wakeup
+        if wakeup is None:
+            return
+        while True:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=FLUSH_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            await self.flush()
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self._wakeup = None
+        await self.flush()
+
+
+# ---------- rollups ----------
+@dataclass(frozen=True)
+class VoiceRollup:
+    temp_vc_count: int
+    temp_vc_avg_lifetime_seconds: float
+    sessions: int
+    member_seconds: float
+    peak_concurrent: int
+    peak_at: float | None
+    hubs: list[tuple[int | None, int, int, float]]
+
+
+def build_voice_rollup(guild_id: int, *, since: float, now: float | None = None, path: Path = STATS_DB) -> VoiceRollup:
+    init_voice_sessions_db(path)
+    now = time.time() if now is None else now
+    with connect_sqlite(path) as conn:
+        temp_count, avg_lifetime = conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(AVG(deleted_at - created_at), 0)
+            FROM temp_vc_channels
+            WHERE guild_id = ? AND deleted_at IS NOT NULL AND created_at >= ?
+            """,
+            (guild_id, since),
+        ).fetchone()
+
+        sessions, member_seconds = conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(SUM(COALESCE(left_at, ?) - joined_at), 0)
+            FROM voice_sessions
+            WHERE guild_id = ? AND joined_at >= ?
+            """,
+            (now, guild_id, since),
+        ).fetchone()
+
+        # 將 join / leave 變成 +1 / -1 再累加，最高點就係同時在線人數
+        peak_row = conn.execute(
+            """
+            WITH edges AS (
+                SELECT joined_at AS at, 1 AS delta FROM voice_sessions
+                WHERE guild_id = ? AND COALESCE(left_at, ?) >= ?
+                UNION ALL
+                SELECT left_at AS at, -1 AS delta FROM voice_sessions
+                WHERE guild_id = ? AND left_at IS NOT NULL AND left_at >= ?
+            ),
+            running AS (
+                SELECT at, SUM(delta) OVER (ORDER BY at, delta ROWS UNBOUNDED PRECEDING) AS online
+                FROM edges
+            )
+            SELECT online, at FROM running WHERE at >= ? ORDER BY online DESC, at ASC LIMIT 1
+            """,
+            (guild_id, now, since, guild_id, since, since),
+        ).fetchone()
+
+        hubs = conn.execute(
+            """
+            SELECT c.hub_id,
+                   COUNT(DISTINCT c.channel_id),
+                   COUNT(s.id),
+                   COALESCE(SUM(COALESCE(s.left_at, ?) - s.joined_at), 0)
+            FROM temp_vc_channels AS c
+            LEFT JOIN voice_sessions AS s ON s.channel_id = c.channel_id
+            WHERE c.guild_id = ? AND c.created_at >= ?
+            GROUP BY c.hub_id
+            ORDER BY COUNT(s.id) DESC
+            """,
+            (now, guild_id, since),
+        ).fetchall()
+
+    return VoiceRollup(
+        temp_vc_count=int(temp_count),
+        temp_vc_avg_lifetime_seconds=float(avg_lifetime),
+        sessions=int(sessions),
+        member_seconds=float(member_seconds),
+        peak_concurrent=int(peak_row[0]) if peak_row else 0,
+        peak_at=float(peak_row[1]) if peak_row else None,
+        hubs=[(hub_id, int(channels), int(count), float(seconds)) for hub_id, channels, count, seconds in hubs],
+    )
+
+
+def build_voice_stats_embed(rollup: VoiceRollup, *, guild: discord.Guild, days: int) -> discord.Embed:
+    peak_text = f"`{rollup.peak_concurrent}` 人"
+    if rollup.peak_at is not None:
+        peak_text += f"（<t:{int(rollup.peak_at)}:f>）"
+
+    embed = discord.Embed(
+        title=f"🎧 Voice Insights｜最近 {days} 日",
+        description=(
+            f"**語音 session：** `{rollup.sessions}`\n"
+            f"**總在線時數：** `{rollup.member_seconds / 3600:.1f}` 小時\n"
+            f"**最高同時在線：** {peak_text}"
+        ),
+        color=0x2B2D31,
+    )
+    embed.add_field(
+        name="小隊 call",
+        value=(
+            f"已關閉：`{rollup.temp_vc_count}` 間\n"
+            f"平均壽命：`{format_seconds(rollup.temp_vc_avg_lifetime_seconds)}`"
+        ),
+        inline=False,
+    )
+
+    lines: list[str] = []
+    for hub_id, channels, sessions, seconds in rollup.hubs[:10]:
+        hub = guild.get_channel(hub_id) if hub_id is not None else None
+        label = hub.mention if hub is not None else ("手動開房" if hub_id is None else f"`{hub_id}`")
+        lines.append(f"{label}：`{channels}` 間 · `{sessions}` 次入房 · `{seconds / 3600:.1f}` 小時")
+    embed.add_field(name="各 Hub 使用量", value="\n".join(lines) or "暫時未有紀錄。", inline=False)
+    return embed
+
+
+VOICE_LEDGER = VoiceSessionLedger()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import Literal, Optional
+
+import discord
+
+
+VoiceTransition = Literal["join", "leave", "move", "in_place"]
+
+# Audit log embed 嘅標題同顏色
+TRANSITION_LOG_STYLE: dict[str, tuple[str, int]] = {
+    "join": ("Voice Join", 0x57F287),
+    "leave": ("Voice Leave", 0xED4245),
+    "move": ("Voice Move", 0x5865F2),
+}
+
+
+def _channel_id(channel: Optional[discord.abc.Connectable]) -> int | None:
+    return getattr(channel, "id", None) if channel is not None else None
+
+
+def classify_voice_update(
+    before: Optional[discord.abc.Connectable],
+    after: Optional[discord.abc.Connectable],
+) -> VoiceTransition:
+    """Classify a voice state update by channel change.
+
+    Mute / deafen / stream / video toggles keep the same channel and come back as
+    "in_place", so callers can skip deletion timers and audit logs for them.
+    """
+    before_id = _channel_id(before)
+    after_id = _channel_id(after)
+    if before_id == after_id:
+        return "in_place"
+    if before_id is None:
+        return "join"
+    if after_id is None:
+        return "leave"
+    return "move"
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import discord
+
+from cogs import activity_reminder
+from cogs.activity_reminder import SEND_LAG_METRIC, ActivityReminder
+from core.metrics import METRICS
+from features.activity_schedule import KIND_START, DueReminder
+from features.activity_storage import Activity, Schedule
+
+
+def _channel(channel_id: int, gate: asyncio.Event | None = None) -> Mock:
+    channel = Mock(spec=discord.TextChannel)
+    channel.id = channel_id
+    channel.sent = []
+
+    async def send(content: str) -> None:
+        if gate is not None:
+            await gate.wait()
+        channel.sent.append(content)
+
+    channel.send = AsyncMock(side_effect=send)
+    return channel
+
+
+class ReminderFanOutTests(unittest.IsolatedAsyncioTestCase):
+    async def test_channels_send_concurrently_in_order(self) -> None:
+        self.addCleanup(METRICS.reset)
+        now = datetime(2024, 1, 1, 20, 0)
+        gate = asyncio.Event()
+        slow, fast = _channel(10, gate), _channel(11)
+        role = Mock(spec=discord.Role)
+        role.mention = "@raid"
+
+        guild = SimpleNamespace(get_channel={10: slow, 11: fast}.get, get_role=Mock(return_value=role))
+        cog = ActivityReminder.__new__(ActivityReminder)
+        cog.bot = SimpleNamespace(get_guild=lambda _: guild)
+        cog.store = Mock()
+        cog.store.was_sent.return_value = False
+        cog.activities = {
+            "a": Activity("a", "First", 10, 20, [Schedule([0], "20:00")]),
+            "b": Activity("b", "Second", 10, 20, [Schedule([0], "20:00")]),
+            "c": Activity("c", "Other", 11, 20, [Schedule([0], "20:00")]),
+        }
+        due = [DueReminder(act_id, 0, KIND_START, now, now) for act_id in ("a", "b", "c")]
+
+        with patch.object(activity_reminder, "_now", return_value=now):
+            task = asyncio.create_task(cog._fire_due(due))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            # 慢嘅頻道仲未送，其他頻道唔使等佢
+            self.assertEqual(len(fast.sent), 1)
+            self.assertEqual(slow.sent, [])
+
+            gate.set()
+            await task
+
+        self.assertIn("First", slow.sent[0])
+        self.assertIn("Second", slow.sent[1])
+        guild.get_role.assert_called_once_with(20)
+        self.assertEqual(METRICS.histogram(SEND_LAG_METRIC).count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import unittest
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from features.activity_schedule import KIND_PRE, KIND_START, ReminderIndex, next_occurrence
+
+
+@dataclass
+class _Schedule:
+    weekdays: list[int]
+    time_hhmm: str
+
+
+@dataclass
+class _Activity:
+    id: str
+    schedules: list[_Schedule] = field(default_factory=list)
+
+
+# 2024-01-01 係星期一
+MONDAY = datetime(2024, 1, 1, 12, 0)
+
+
+class NextOccurrenceTests(unittest.TestCase):
+    def test_same_day_when_not_yet_passed(self) -> None:
+        self.assertEqual(next_occurrence([0], "20:00", MONDAY), datetime(2024, 1, 1, 20, 0))
+
+    def test_wraps_to_next_week(self) -> None:
+        self.assertEqual(next_occurrence([0], "11:00", MONDAY), datetime(2024, 1, 8, 11, 0))
+
+    def test_no_weekdays_never_fires(self) -> None:
+        self.assertIsNone(next_occurrence([], "11:00", MONDAY))
+
+
+class ReminderIndexTests(unittest.TestCase):
+    def test_pre_fires_before_start_and_requeues_next_week(self) -> None:
+        index = ReminderIndex()
+        index.rebuild([_Activity("a", [_Schedule([0], "20:00")])], since=MONDAY)
+
+        self.assertEqual(index.next_fire_at(), datetime(2024, 1, 1, 19, 55))
+        self.assertEqual([d.kind for d in index.pop_due(datetime(2024, 1, 1, 19, 55))], [KIND_PRE])
+        due = index.pop_due(datetime(2024, 1, 1, 20, 0))
+        self.assertEqual([(d.kind, d.event_dt) for d in due], [(KIND_START, datetime(2024, 1, 1, 20, 0))])
+        self.assertEqual(due[0].sent_key, "a|0|2024-01-01|start")
+        self.assertEqual(index.next_fire_at(), datetime(2024, 1, 8, 19, 55))
+
+    def test_refresh_replaces_only_the_edited_activity(self) -> None:
+        edited = _Activity("a", [_Schedule([0], "20:00")])
+        index = ReminderIndex()
+        index.rebuild([edited, _Activity("b", [_Schedule([0], "22:00")])], since=MONDAY)
+
+        edited.schedules.pop()
+        index.refresh(edited, since=MONDAY)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.next_fire_at(), datetime(2024, 1, 1, 21, 55))
+
+        index.remove("b")
+        self.assertIsNone(index.next_fire_at())
+
+    def test_rebuild_from_earlier_time_returns_missed_reminders(self) -> None:
+        index = ReminderIndex()
+        index.rebuild([_Activity("a", [_Schedule([0], "12:00")])], since=datetime(2024, 1, 1, 11, 50))
+
+        due = index.pop_due(MONDAY)
+        self.assertEqual([d.kind for d in due], [KIND_PRE, KIND_START])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from datetime import date, datetime
+from pathlib import Path
+
+from features.activity_storage import MIGRATED_SUFFIX, Activity, ActivityStore, Schedule
+
+
+class ActivityStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        self.store = ActivityStore(self.root / "stats.sqlite3")
+        self.store.init()
+
+    def test_activity_round_trip_keeps_order_and_schedules(self) -> None:
+        first = Activity("a1", "Raid", 10, 20, [Schedule([4, 5], "23:00"), Schedule([6], "21:30")])
+        self.store.save_activity(first)
+        self.store.save_activity(Activity("a2", "Quiz", 11, 21, []))
+
+        first.name = "Raid night"
+        first.schedules.pop(0)
+        self.store.save_activity(first)
+
+        loaded = self.store.load_activities()
+        self.assertEqual([act.id for act in loaded], ["a1", "a2"])
+        self.assertEqual(loaded[0].name, "Raid night")
+        self.assertEqual(loaded[0].schedules, [Schedule([6], "21:30")])
+
+    def test_sent_markers_are_pruned_by_date_and_cascade_on_delete(self) -> None:
+        self.store.save_activity(Activity("a1", "Raid", 10, 20, [Schedule([0], "20:00")]))
+        sent_at = datetime(2024, 1, 8, 20, 0)
+        self.store.mark_sent("a1", 0, date(2024, 1, 1), "start", sent_at=sent_at)
+        self.store.mark_sent("a1", 0, date(2024, 1, 8), "start", sent_at=sent_at)
+        self.store.mark_sent("a1", 0, date(2024, 1, 8), "start", sent_at=sent_at)
+
+        self.assertEqual(self.store.prune_sent(before=date(2024, 1, 5)), 1)
+        self.assertFalse(self.store.was_sent("a1", 0, date(2024, 1, 1), "start"))
+        self.assertTrue(self.store.was_sent("a1", 0, date(2024, 1, 8), "start"))
+
+        self.store.delete_activity("a1")
+        self.assertFalse(self.store.was_sent("a1", 0, date(2024, 1, 8), "start"))
+        self.assertEqual(self.store.load_activities(), [])
+
+    def test_legacy_json_is_imported_once(self) -> None:
+        json_path = self.root / "activity_reminders.json"
+        json_path.write_text(
+            json.dumps(
+                {
+                    "activities": [
+                        {
+                            "id": "a1",
+                            "name": "Raid",
+                            "channel_id": 10,
+                            "ping_role_id": 20,
+                            "schedules": [{"weekdays": [4], "time_hhmm": "23:00"}],
+                        },
+                        {"id": "broken"},
+                    ],
+                    "sent_cache": {
+                        "a1|0|2024-01-05|pre": "2024-01-05T22:55:00",
+                        "gone|0|2024-01-05|pre": "2024-01-05T22:55:00",
+                        "bad-key": "x",
+                    },
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        self.assertEqual(self.store.import_legacy_json(json_path), 1)
+        self.assertFalse(json_path.exists())
+        self.assertTrue(json_path.with_name(json_path.name + MIGRATED_SUFFIX).exists())
+        self.assertEqual(self.store.import_legacy_json(json_path), 0)
+
+        self.assertEqual([act.id for act in self.store.load_activities()], ["a1"])
+        self.assertTrue(self.store.was_sent("a1", 0, date(2024, 1, 5), "pre"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import asyncio
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import discord
+
+from core.asset_cache import AssetCache, cdn_url_expires_at
+
+
+def _cdn_url(expires_at: float) -> str:
+    return f"https://cdn.discordapp.com/attachments/1/2/bartender.png?ex={int(expires_at):x}&is=0&hm=abc"
+
+
+def _message(message_id: int, url: str) -> Mock:
+    message = Mock(id=message_id)
+    message.attachments = [Mock(url=url)]
+    return message
+
+
+class AssetCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        root = Path(self.temp_dir.name)
+        self.image = root / "bartender.png"
+        self.image.write_bytes(b"\x89PNG fake image")
+        self.state_path = root / "asset_cache.json"
+        self.url = _cdn_url(time.time() + 86400)
+
+        self.channel = Mock()
+        self.channel.send = AsyncMock(return_value=_message(55, self.url))
+        self.channel.fetch_message = AsyncMock(return_value=_message(55, self.url))
+        self.client = Mock()
+        self.client.get_channel.return_value = self.channel
+
+    def _cache(self) -> AssetCache:
+        return AssetCache(self.image, filename="bartender.png", state_path=self.state_path, key="bartender")
+
+    def test_cdn_expiry_is_parsed_from_url(self) -> None:
+        self.assertEqual(cdn_url_expires_at(_cdn_url(1700000000)), 1700000000.0)
+        self.assertIsNone(cdn_url_expires_at("https://example.com/a.png"))
+
+    async def test_without_storage_channel_attaches_in_memory_bytes(self) -> None:
+        cache = self._cache()
+        self.assertIsNone(await cache.ensure_uploaded(self.client, None))
+
+        embed = discord.Embed()
+        file = cache.attach_thumbnail(embed)
+        self.assertIsNotNone(file)
+        self.assertEqual(embed.thumbnail.url, "attachment://bartender.png")
+
+        # 之後唔再讀 disk
+        self.image.unlink()
+        self.assertIsNotNone(cache.file())
+
+    async def test_uploads_once_and_reuses_url(self) -> None:
+        cache = self._cache()
+        self.assertEqual(await cache.ensure_uploaded(self.client, 10), self.url)
+
+        embed = discord.Embed()
+        self.assertIsNone(cache.attach_thumbnail(embed))
+        self.assertEqual(embed.thumbnail.url, self.url)
+
+        restarted = self._cache()
+        self.assertEqual(await restarted.ensure_uploaded(self.client, 10), self.url)
+        self.channel.send.assert_awaited_once()
+        self.channel.fetch_message.assert_awaited_once_with(55)
+
+    async def test_changed_image_is_uploaded_again(self) -> None:
+        await self._cache().ensure_uploaded(self.client, 10)
+        self.image.write_bytes(b"\x89PNG new image")
+
+        await self._cache().ensure_uploaded(self.client, 10)
+        self.assertEqual(self.channel.send.await_count, 2)
+        self.channel.fetch_message.assert_not_awaited()
+
+    async def test_expiring_url_falls_back_and_refreshes(self) -> None:
+        expiring = _cdn_url(time.time() + 60)
+        self.channel.send.return_value = _message(55, expiring)
+        cache = self._cache()
+        await cache.ensure_uploaded(self.client, 10)
+
+        self.assertIsNone(cache.url())
+        embed = discord.Embed()
+        self.assertIsNotNone(cache.attach_thumbnail(embed))
+
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.channel.fetch_message.assert_awaited_once_with(55)
+        self.assertEqual(cache.url(), self.url)
+
+
+if __name__ == "__main__":
+    unittest.main()
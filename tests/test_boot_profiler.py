@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.boot_profiler import (
+    BootProfiler,
+    append_boot_report,
+    format_boot_reports,
+    load_boot_reports,
+)
+
+
+def make_report(booted_at: str, on_ready: float, imports: float) -> dict[str, object]:
+    return {
+        "booted_at": booted_at,
+        "release": "",
+        "total_seconds": on_ready,
+        "milestones": {"on_ready": on_ready},
+        "phases": {"imports": imports, "extension:cogs.menu": 0.2},
+    }
+
+
+class BootProfilerTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "boot_reports.jsonl"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_measure_records_phase(self) -> None:
+        profiler = BootProfiler()
+
+        with profiler.measure("validate_config"):
+            pass
+
+        self.assertIn("validate_config", profiler.report()["phases"])
+
+    async def test_expected_phase_releases_waiter(self) -> None:
+        profiler = BootProfiler()
+        profiler.expect("tempvc_bootstrap")
+
+        waiter = asyncio.create_task(profiler.wait_for_expected(timeout=1.0))
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+
+        profiler.record("tempvc_bootstrap", 0.1)
+        await waiter
+
+    async def test_wait_times_out_with_warning(self) -> None:
+        profiler = BootProfiler()
+        profiler.expect("never")
+
+        with self.assertLogs("con9sole-bartender.boot", level="WARNING"):
+            await profiler.wait_for_expected(timeout=0.01)
+
+    def test_reports_are_appended_and_trimmed(self) -> None:
+        for index in range(5):
+            append_boot_report(self.path, make_report(f"boot-{index}", 1.0, 0.1), keep=3)
+
+        reports = load_boot_reports(self.path, 10)
+
+        self.assertEqual([report["booted_at"] for report in reports], ["boot-2", "boot-3", "boot-4"])
+        self.assertEqual(load_boot_reports(self.path, 1)[0]["booted_at"], "boot-4")
+
+    def test_malformed_lines_are_skipped(self) -> None:
+        append_boot_report(self.path, make_report("boot-1", 1.0, 0.1))
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write("{broken\n")
+
+        with self.assertLogs("con9sole-bartender.boot", level="WARNING"):
+            reports = load_boot_reports(self.path, 5)
+
+        self.assertEqual(len(reports), 1)
+
+    def test_format_shows_newest_first_with_deltas(self) -> None:
+        reports = [make_report("old", 5.0, 1.0), make_report("new", 6.5, 0.75)]
+
+        lines = format_boot_reports(reports, limit=1)
+
+        self.assertIn("new", lines[0])
+        self.assertIn("(+1.50)", lines[0])
+        self.assertIn("(-0.25)", lines[1])
+        self.assertNotIn("old", "\n".join(lines))
+        self.assertIn("menu", lines[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import unittest
+
+from data.cheers_quotes import QUOTE_ROWS, CheerQuote, cheer_quote, random_cheer_quote
+
+
+class CheerQuoteRowTests(unittest.TestCase):
+    def test_rows_have_every_field(self) -> None:
+        self.assertGreater(len(QUOTE_ROWS), 0)
+        for row in QUOTE_ROWS:
+            self.assertEqual(len(row), 5, row)
+            self.assertTrue(all(isinstance(value, str) and value for value in row[:4]), row)
+
+    def test_quotes_are_built_once_on_demand(self) -> None:
+        quote = cheer_quote(0)
+        self.assertIsInstance(quote, CheerQuote)
+        self.assertEqual(quote.english, QUOTE_ROWS[0][0])
+        self.assertIs(cheer_quote(0), quote)
+        self.assertIn(random_cheer_quote(), [cheer_quote(index) for index in range(len(QUOTE_ROWS))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import discord
+from discord import app_commands
+
+from core.command_sync import (
+    command_tree_hash,
+    command_tree_payload,
+    force_sync_requested,
+    sync_command_tree,
+)
+
+
+GUILD_ID = 1234
+
+
+def make_tree() -> app_commands.CommandTree:
+    client = Mock()
+    client._connection = Mock(_command_tree=None)
+    tree = app_commands.CommandTree(client)
+
+    @app_commands.command(name="ping", description="Ping")
+    async def ping(interaction: discord.Interaction) -> None:
+        pass
+
+    tree.add_command(ping, guild=discord.Object(id=GUILD_ID))
+    tree.sync = AsyncMock(return_value=[])  # type: ignore[method-assign]
+    return tree
+
+
+class CommandSyncTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.state_path = Path(self.temp_dir.name) / "command_sync.json"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_hash_ignores_dict_ordering(self) -> None:
+        self.assertEqual(command_tree_hash({"a": 1, "b": [2]}), command_tree_hash({"b": [2], "a": 1}))
+
+    def test_payload_separates_guild_commands(self) -> None:
+        payload = command_tree_payload(make_tree(), application_id=1, guild_id=GUILD_ID)
+
+        self.assertEqual(payload["global"], [])
+        self.assertEqual([command["name"] for command in payload["guild"]], ["ping"])
+
+    async def test_unchanged_tree_skips_second_sync(self) -> None:
+        tree = make_tree()
+        kwargs = {"application_id": 1, "guild_id": GUILD_ID, "state_path": self.state_path}
+
+        self.assertTrue(await sync_command_tree(tree, **kwargs))
+        self.assertFalse(await sync_command_tree(tree, **kwargs))
+        self.assertEqual(tree.sync.await_count, 2)
+
+    async def test_force_sync_ignores_stored_hash(self) -> None:
+        tree = make_tree()
+        kwargs = {"application_id": 1, "guild_id": GUILD_ID, "state_path": self.state_path}
+
+        await sync_command_tree(tree, **kwargs)
+        self.assertTrue(await sync_command_tree(tree, force=True, **kwargs))
+
+    async def test_failed_global_sync_is_retried_next_boot(self) -> None:
+        tree = make_tree()
+        tree.sync.side_effect = [discord.HTTPException(Mock(status=500), "boom"), []]
+        kwargs = {"application_id": 1, "guild_id": GUILD_ID, "state_path": self.state_path}
+
+        with self.assertLogs("con9sole-bartender.command-sync", level="ERROR"):
+            await sync_command_tree(tree, **kwargs)
+
+        self.assertFalse(self.state_path.exists())
+
+    def test_force_flag_parsing(self) -> None:
+        self.assertTrue(force_sync_requested("1"))
+        self.assertTrue(force_sync_requested(" Yes "))
+        self.assertFalse(force_sync_requested(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import random
+import unittest
+from collections import Counter
+
+from data.drink_data import ALL_DRINKS, RARITY_STYLE, SEASONAL_DRINKS
+from features import drink_catalog
+from features.drink_catalog import (
+    FRESH_DRINK_WEIGHT,
+    RECENT_DRINK_WEIGHT,
+    WeightedPool,
+    build_draw_index,
+    get_draw_index,
+    season_for_month,
+)
+
+
+def _linear_pick(pool: WeightedPool, target: float, penalized: set[str]):
+    # 舊做法：逐個累加權重，用嚟對照 bisect 結果
+    running = 0
+    for drink in pool.drinks:
+        running += RECENT_DRINK_WEIGHT if drink.eng in penalized else FRESH_DRINK_WEIGHT
+        if target < running:
+            return drink
+    return pool.drinks[-1]
+
+
+class _FixedRandom:
+    def __init__(self, value: float) -> None:
+        self.value = value
+
+    def random(self) -> float:
+        return self.value
+
+
+class WeightedPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = WeightedPool.build(ALL_DRINKS[:40])
+
+    def test_penalized_sampling_matches_linear_scan(self) -> None:
+        penalized = {self.pool.drinks[i].eng for i in (0, 7, 8, 21, 39)}
+        total = (len(self.pool.drinks) - len(penalized)) * FRESH_DRINK_WEIGHT + len(penalized) * RECENT_DRINK_WEIGHT
+
+        for step in range(total * 4):
+            target = step / 4
+            rng = _FixedRandom(target / total)
+            expected = _linear_pick(self.pool, target, penalized)
+            self.assertEqual(self.pool.sample(rng, penalized=penalized), expected, msg=f"target={target}")
+
+    def test_unknown_penalized_names_are_ignored(self) -> None:
+        rng = _FixedRandom(0.5)
+        self.assertEqual(
+            self.pool.sample(rng, penalized={"Not A Drink"}),
+            self.pool.sample(_FixedRandom(0.5)),
+        )
+
+    def test_empty_pool_raises(self) -> None:
+        with self.assertRaises(IndexError):
+            WeightedPool.build([]).sample()
+
+
+class DrawIndexTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        drink_catalog._DRAW_INDEX = None
+
+    def test_index_is_reused_within_a_season_and_rebuilt_across(self) -> None:
+        seasons = list(SEASONAL_DRINKS)
+        first, second = seasons[0], seasons[1]
+
+        index = get_draw_index(first[0])
+        self.assertIs(get_draw_index(first[-1]), index)
+        self.assertEqual(index.season, first)
+
+        rebuilt = get_draw_index(second[0])
+        self.assertIsNot(rebuilt, index)
+        self.assertEqual(rebuilt.season, second)
+
+    def test_pools_include_seasonal_drinks(self) -> None:
+        season = season_for_month(next(iter(SEASONAL_DRINKS))[0])
+        index = build_draw_index(season)
+        for rarity in RARITY_STYLE:
+            expected = [drink for drink in ALL_DRINKS if drink.rarity == rarity]
+            expected += [drink for drink in SEASONAL_DRINKS[season] if drink.rarity == rarity]
+            self.assertEqual(list(index.pools[rarity].drinks), expected)
+
+    def test_rarity_distribution_follows_weights(self) -> None:
+        rng = random.Random(1234)
+        counts = Counter(drink_catalog.pick_rarity(rng) for _ in range(20000))
+        total_weight = sum(int(style["weight"]) for style in RARITY_STYLE.values())
+        for rarity, style in RARITY_STYLE.items():
+            expected = int(style["weight"]) / total_weight
+            self.assertAlmostEqual(counts[rarity] / 20000, expected, delta=0.02)
+
+    def test_catalog_views_are_cached_and_read_only(self) -> None:
+        self.assertIs(drink_catalog.drink_catalog(), drink_catalog.drink_catalog())
+        with self.assertRaises(TypeError):
+            drink_catalog.drink_catalog()["x"] = ALL_DRINKS[0]  # type: ignore[index]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import discord
+
+import config
+from cogs import duplicate
+
+
+def make_text_channel(channel_id: int, *, category_id: int, position: int) -> Mock:
+    channel = Mock(spec=discord.TextChannel)
+    channel.__class__ = discord.TextChannel
+    channel.id = channel_id
+    channel.name = f"text-{channel_id}"
+    channel.category_id = category_id
+    channel.position = position
+    channel.topic = "topic"
+    channel.nsfw = False
+    channel.rate_limit_per_user = 0
+    channel.default_auto_archive_duration = 1440
+    channel.overwrites = {}
+    return channel
+
+
+class TemplateSnapshotTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        duplicate.invalidate_template_snapshot()
+        self.category = Mock(spec=discord.CategoryChannel)
+        self.category.id = config.TEMPLATE_CATEGORY_ID
+        self.guild = Mock(spec=discord.Guild)
+        self.guild.id = config.GUILD_ID
+        self.guild.get_channel.return_value = self.category
+        self.guild.fetch_channels = AsyncMock(
+            return_value=[
+                make_text_channel(2, category_id=config.TEMPLATE_CATEGORY_ID, position=1),
+                make_text_channel(1, category_id=config.TEMPLATE_CATEGORY_ID, position=0),
+                make_text_channel(3, category_id=999, position=0),
+            ]
+        )
+
+    def tearDown(self) -> None:
+        duplicate.invalidate_template_snapshot()
+
+    async def test_snapshot_is_fetched_once_and_reused(self) -> None:
+        with patch.object(duplicate, "_get_template_category", AsyncMock(return_value=self.category)):
+            first = await duplicate.get_template_snapshot(Mock(), self.guild)
+            second = await duplicate.get_template_snapshot(Mock(), self.guild)
+
+        self.assertIs(first, second)
+        self.guild.fetch_channels.assert_awaited_once()
+        self.assertEqual([entry.name for entry in first.channels], ["text-1", "text-2"])
+        self.assertEqual(first.channels[0].kwargs["topic"], "topic")
+
+    async def test_invalidation_forces_a_fresh_fetch(self) -> None:
+        with patch.object(duplicate, "_get_template_category", AsyncMock(return_value=self.category)):
+            await duplicate.get_template_snapshot(Mock(), self.guild)
+            duplicate.invalidate_template_snapshot(self.guild.id)
+            await duplicate.get_template_snapshot(Mock(), self.guild)
+
+        self.assertEqual(self.guild.fetch_channels.await_count, 2)
+
+    def test_template_children_and_category_are_detected(self) -> None:
+        child = make_text_channel(5, category_id=config.TEMPLATE_CATEGORY_ID, position=0)
+        other = make_text_channel(6, category_id=999, position=0)
+
+        self.assertTrue(duplicate._touches_template(child))
+        self.assertTrue(duplicate._touches_template(self.category))
+        self.assertFalse(duplicate._touches_template(other))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core.extension_loader import (
+    ExtensionLoader,
+    ExtensionSpec,
+    discover_extensions,
+    plan_load_waves,
+)
+
+
+class FakeBot:
+    def __init__(self) -> None:
+        self.extensions: dict[str, object] = {}
+        self.load_order: list[str] = []
+
+    async def load_extension(self, name: str) -> None:
+        if name == "cogs.broken":
+            raise RuntimeError("boom")
+        self.load_order.append(name)
+        self.extensions[name] = object()
+
+
+class ExtensionLoaderTests(unittest.IsolatedAsyncioTestCase):
+    def test_metadata_is_read_without_importing_module(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cogs_dir = Path(temp_dir)
+            (cogs_dir / "relay.py").write_text(
+                'raise RuntimeError("must not import")\n'
+                'EXTENSION_REQUIRED_ENV = ("TOKEN",)\n'
+                'EXTENSION_DEPENDS = ("cogs.menu",)\n'
+                "EXTENSION_LAZY = True\n",
+                encoding="utf-8",
+            )
+            (cogs_dir / "menu.py").write_text("", encoding="utf-8")
+            (cogs_dir / "_private.py").write_text("", encoding="utf-8")
+            (cogs_dir / "old.bak.py").write_text("", encoding="utf-8")
+
+            specs = discover_extensions(cogs_dir)
+
+        self.assertEqual(
+            specs,
+            [
+                ExtensionSpec(name="cogs.menu"),
+                ExtensionSpec(
+                    name="cogs.relay",
+                    depends=("cogs.menu",),
+                    required_env=("TOKEN",),
+                    lazy=True,
+                ),
+            ],
+        )
+
+    def test_required_env_must_be_non_blank(self) -> None:
+        spec = ExtensionSpec(name="cogs.relay", required_env=("TOKEN",))
+
+        self.assertTrue(spec.enabled({"TOKEN": "abc"}))
+        self.assertFalse(spec.enabled({"TOKEN": "  "}))
+        self.assertFalse(spec.enabled({}))
+
+    def test_waves_follow_dependencies_and_report_unresolved(self) -> None:
+        menu = ExtensionSpec(name="cogs.menu")
+        drink = ExtensionSpec(name="cogs.drink", depends=("cogs.menu",))
+        ping = ExtensionSpec(name="cogs.ping")
+        orphan = ExtensionSpec(name="cogs.orphan", depends=("cogs.missing",))
+
+        waves, unresolved = plan_load_waves([drink, menu, ping, orphan])
+
+        self.assertEqual(waves, [[menu, ping], [drink]])
+        self.assertEqual(unresolved, [orphan])
+
+    async def test_lazy_and_dependent_extensions_are_deferred(self) -> None:
+        bot = FakeBot()
+        specs = [
+            ExtensionSpec(name="cogs.menu"),
+            ExtensionSpec(name="cogs.cheers", lazy=True),
+            ExtensionSpec(name="cogs.daily_bar", depends=("cogs.cheers",)),
+        ]
+        loader = ExtensionLoader(bot, specs)  # type: ignore[arg-type]
+
+        self.assertEqual(await loader.load_eager(), ["cogs.menu"])
+        self.assertEqual(await loader.load_lazy(), ["cogs.cheers", "cogs.daily_bar"])
+        self.assertEqual(await loader.load_lazy(), [])
+
+    async def test_failed_dependency_skips_dependents(self) -> None:
+        bot = FakeBot()
+        specs = [
+            ExtensionSpec(name="cogs.broken"),
+            ExtensionSpec(name="cogs.child", depends=("cogs.broken",)),
+            ExtensionSpec(name="cogs.ping"),
+        ]
+        loader = ExtensionLoader(bot, specs)  # type: ignore[arg-type]
+
+        with self.assertLogs("con9sole-bartender.extensions", level="WARNING"):
+            loaded = await loader.load_eager()
+
+        self.assertEqual(loaded, ["cogs.ping"])
+        self.assertIn("cogs.broken", loader.failed)
+
+    async def test_disabled_extension_is_not_loaded(self) -> None:
+        bot = FakeBot()
+        loader = ExtensionLoader(bot, [ExtensionSpec(name="cogs.relay", required_env=("TWITCH_TOKEN",))])  # type: ignore[arg-type]
+
+        with patch.dict("os.environ", {}, clear=True):
+            self.assertEqual(await loader.load_eager(), [])
+
+        self.assertEqual(bot.load_order, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
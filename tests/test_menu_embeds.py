@@ -0,0 +1,55 @@
+import unittest
+from types import SimpleNamespace
+
+from features import menu_embeds
+from features.menu_embeds import (
+    HOME_MENU_FOOTERS,
+    QUICK_BAR_FOOTERS,
+    build_admin_tool_embed,
+    build_help_embed,
+    build_home_menu_embed,
+    build_quick_bar_embed,
+    get_embed_template,
+    reset_embed_templates,
+)
+
+
+class MenuEmbedTemplateTests(unittest.TestCase):
+    def setUp(self) -> None:
+        reset_embed_templates()
+        self.addCleanup(reset_embed_templates)
+        self.user = SimpleNamespace(mention="<@42>")
+
+    def test_stamped_embeds_carry_user_and_static_parts(self) -> None:
+        quick = build_quick_bar_embed(self.user)
+        self.assertTrue(quick.description.startswith("歡迎回來，<@42>。"))
+        self.assertIn(quick.footer.text, QUICK_BAR_FOOTERS)
+        self.assertEqual([field.name for field in quick.fields], ["⚡ Quick Bar", "🌊 探索公海區"])
+
+        home = build_home_menu_embed(self.user, include_thumbnail=False)
+        self.assertIn(home.footer.text, HOME_MENU_FOOTERS)
+        self.assertIsNone(home.thumbnail.url)
+        self.assertEqual(len(home.fields), 3)
+
+        self.assertEqual(build_help_embed(self.user).title, "ℹ️ 幫助")
+        self.assertEqual(build_admin_tool_embed(self.user).footer.text, "Admin 工具只限授權成員使用。")
+
+    def test_changes_to_a_stamped_embed_do_not_leak_into_the_template(self) -> None:
+        first = build_quick_bar_embed(self.user)
+        first.add_field(name="extra", value="x")
+        first.set_field_at(0, name="changed", value="y")
+
+        second = build_quick_bar_embed(SimpleNamespace(mention="<@7>"))
+        self.assertEqual([field.name for field in second.fields], ["⚡ Quick Bar", "🌊 探索公海區"])
+        self.assertTrue(second.description.startswith("歡迎回來，<@7>。"))
+
+    def test_templates_are_built_once_until_reset(self) -> None:
+        template = get_embed_template("help")
+        self.assertIs(get_embed_template("help"), template)
+        reset_embed_templates()
+        self.assertIsNot(get_embed_template("help"), template)
+        self.assertEqual(set(menu_embeds._EMBED_TEMPLATES), {"help"})
+
+
+if __name__ == "__main__":
+    unittest.main()
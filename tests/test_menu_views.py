@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from data.menu_registry import get_menu_items
+from features import menu_views
+from features.menu_views import (
+    QuickBarView,
+    bind_menu_cog,
+    build_menu_dispatch,
+    menu_view,
+    reset_menu_views,
+    unbind_menu_cog,
+)
+
+
+class _DrinkCog:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def stats_entry(self, interaction) -> None:
+        self.calls += 1
+
+
+class _Client:
+    def __init__(self, cogs: dict[str, object]) -> None:
+        self.cogs = cogs
+
+    def get_cog(self, name: str) -> object | None:
+        return self.cogs.get(name)
+
+
+def _drink_stats_item():
+    return next(item for item in get_menu_items("home") if item.id == "drink_stats")
+
+
+class MenuViewTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        reset_menu_views()
+        self.addCleanup(reset_menu_views)
+
+    async def test_templates_are_prebuilt_and_not_tracked_per_message(self) -> None:
+        quick = menu_view("quick")
+        self.assertIs(menu_view("quick"), quick)
+        self.assertTrue(quick.is_finished())
+        self.assertIsNot(menu_view("home"), menu_view("home", include_external_links=False))
+
+        custom_ids = {item.custom_id for item in quick.children}
+        self.assertEqual(custom_ids, {f"bartender:quick:{item.id}" for item in get_menu_items("quick")})
+        self.assertEqual(custom_ids, {item.custom_id for item in QuickBarView(None).children})
+
+    async def test_dispatch_table_skips_reflection_per_click(self) -> None:
+        drink = _DrinkCog()
+        client = _Client({"Drink": drink})
+        menu_cog = Mock()
+        dispatch = build_menu_dispatch(client, menu_cog)
+        self.assertEqual(dispatch["drink_stats"], drink.stats_entry)
+        self.assertNotIn("team", dispatch)
+
+        view = QuickBarView(menu_cog)
+        interaction = Mock(client=client)
+        with patch.object(menu_views, "_get_method", wraps=menu_views._get_method) as get_method:
+            await view.handle_item(interaction, _drink_stats_item())
+        self.assertEqual(drink.calls, 1)
+        get_method.assert_not_called()
+
+    async def test_reloaded_cog_replaces_stale_entry(self) -> None:
+        old, new = _DrinkCog(), _DrinkCog()
+        client = _Client({"Drink": old})
+        build_menu_dispatch(client, Mock())
+
+        # /reload：remove_cog 之後 add_cog
+        unbind_menu_cog("Drink")
+        self.assertNotIn("drink_stats", menu_views.MENU_DISPATCH)
+        new.qualified_name = "Drink"
+        bind_menu_cog(new)
+        client.cogs["Drink"] = new
+
+        view = QuickBarView(Mock())
+        with patch.object(menu_views, "get_or_load_cog", AsyncMock()) as load:
+            await view.handle_item(Mock(client=client), _drink_stats_item())
+
+        load.assert_not_awaited()
+        self.assertEqual((old.calls, new.calls), (0, 1))
+        self.assertEqual(menu_views.MENU_DISPATCH["drink_stats"], new.stats_entry)
+
+    async def test_unloaded_cog_is_loaded_on_click(self) -> None:
+        drink = _DrinkCog()
+        build_menu_dispatch(_Client({}), Mock())
+        self.assertNotIn("drink_stats", menu_views.MENU_DISPATCH)
+
+        view = QuickBarView(Mock())
+        with patch.object(menu_views, "get_or_load_cog", AsyncMock(return_value=drink)):
+            await view.handle_item(Mock(client=_Client({})), _drink_stats_item())
+
+        self.assertEqual(drink.calls, 1)
+        self.assertEqual(menu_views.MENU_DISPATCH["drink_stats"], drink.stats_entry)
+
+
+if __name__ == "__main__":
+    unittest.main()
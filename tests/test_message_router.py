@@ -0,0 +1,92 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from core.message_router import MessageRouter, is_pure_mention
+
+BOT_ID = 999
+
+
+def _message(content: str = "hi", *, channel_id: int = 1, author_id: int = 5, bot: bool = False, guild: bool = True):
+    return SimpleNamespace(
+        id=77,
+        content=content,
+        channel=SimpleNamespace(id=channel_id),
+        author=SimpleNamespace(id=author_id, bot=bot),
+        guild=object() if guild else None,
+    )
+
+
+class PureMentionTests(unittest.TestCase):
+    def test_detects_only_bare_bot_mentions(self) -> None:
+        self.assertTrue(is_pure_mention(f"<@{BOT_ID}>", BOT_ID))
+        self.assertTrue(is_pure_mention(f"  <@!{BOT_ID}> <@{BOT_ID}> ", BOT_ID))
+        self.assertFalse(is_pure_mention(f"<@{BOT_ID}> hello", BOT_ID))
+        self.assertFalse(is_pure_mention("<@123>", BOT_ID))
+        self.assertFalse(is_pure_mention("", BOT_ID))
+
+
+class MessageRouterTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.router = MessageRouter()
+
+    async def _drain(self) -> None:
+        for task in list(self.router._tasks):
+            await task
+
+    async def test_routes_only_to_interested_handlers(self) -> None:
+        relay = AsyncMock()
+        mention = AsyncMock()
+        self.router.add_channel_route(1, "relay", relay)
+        self.router.set_mention_handler(mention)
+
+        decision = self.router.dispatch(_message(channel_id=2), BOT_ID)
+        self.assertEqual(decision.handlers, [])
+
+        self.router.dispatch(_message(channel_id=1), BOT_ID)
+        decision = self.router.dispatch(_message(f"<@{BOT_ID}>", channel_id=2), BOT_ID)
+        await self._drain()
+
+        self.assertTrue(decision.mention)
+        relay.assert_awaited_once()
+        mention.assert_awaited_once()
+
+    async def test_bot_and_dm_messages_are_ignored(self) -> None:
+        relay = AsyncMock()
+        self.router.add_channel_route(1, "relay", relay)
+        self.router.dispatch(_message(bot=True), BOT_ID)
+        self.router.dispatch(_message(guild=False), BOT_ID)
+        await self._drain()
+        relay.assert_not_awaited()
+
+    async def test_reply_route_is_keyed_by_channel_and_user(self) -> None:
+        callback = Mock()
+        self.assertTrue(self.router.add_reply_route(1, 5, callback))
+        self.assertFalse(self.router.add_reply_route(1, 5, Mock()))
+
+        self.router.dispatch(_message(channel_id=1, author_id=6), BOT_ID)
+        self.router.dispatch(_message(channel_id=2, author_id=5), BOT_ID)
+        callback.assert_not_called()
+
+        message = _message(channel_id=1, author_id=5)
+        self.router.dispatch(message, BOT_ID)
+        callback.assert_called_once_with(message)
+
+        self.router.remove_reply_route(1, 5)
+        self.assertFalse(self.router.has_reply_route(1, 5))
+
+    async def test_handler_errors_are_logged_not_raised(self) -> None:
+        self.router.add_channel_route(1, "relay", AsyncMock(side_effect=RuntimeError("boom")))
+        with self.assertLogs("con9sole-bartender.router", level="ERROR"):
+            self.router.dispatch(_message(), BOT_ID)
+            await self._drain()
+
+    def test_remove_channel_routes_by_owner(self) -> None:
+        self.router.add_channel_route(1, "relay", AsyncMock())
+        self.router.add_channel_route(1, "other", AsyncMock())
+        self.router.remove_channel_routes("relay")
+        self.assertEqual(list(self.router._channel_routes[1]), ["other"])
+
+
+if __name__ == "__main__":
+    unittest.main()
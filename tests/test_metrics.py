@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import unittest
+
+from core.metrics import MetricsRegistry
+
+
+class MetricsRegistryTests(unittest.TestCase):
+    def test_histogram_summarises_observations(self) -> None:
+        registry = MetricsRegistry()
+        histogram = registry.histogram("relay.latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.05, 0.5, 2.0):
+            histogram.observe(value)
+
+        snapshot = registry.snapshot("relay.")["relay.latency"]
+        self.assertEqual(snapshot["count"], 4)
+        self.assertAlmostEqual(snapshot["mean"], 0.65)
+        self.assertEqual(snapshot["max"], 2.0)
+        self.assertLessEqual(snapshot["p50"], 0.1)
+        self.assertGreater(snapshot["p95"], 1.0)
+
+    def test_names_are_bound_to_one_metric_type(self) -> None:
+        registry = MetricsRegistry()
+        registry.counter("tempvc.created").inc(2)
+        self.assertIs(registry.counter("tempvc.created"), registry.counter("tempvc.created"))
+        self.assertEqual(registry.counter("tempvc.created").value, 2)
+        with self.assertRaises(TypeError):
+            registry.gauge("tempvc.created")
+
+
+if __name__ == "__main__":
+    unittest.main()
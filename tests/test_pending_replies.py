@@ -0,0 +1,82 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from core.message_router import MessageRouter
+from core.pending_replies import PendingReplyRegistry, pending_busy_message
+
+
+def _message(channel_id: int, user_id: int, content: str = "<@3>") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=1,
+        content=content,
+        author=SimpleNamespace(id=user_id, bot=False),
+        channel=SimpleNamespace(id=channel_id),
+        guild=object(),
+    )
+
+
+class PendingReplyRegistryTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.router = MessageRouter()
+        self.registry = PendingReplyRegistry(self.router)
+
+    async def test_reply_is_delivered_by_router_key(self) -> None:
+        pending = self.registry.expect(10, 20, timeout=5, kind="gift")
+        self.router.dispatch(_message(10, 99), bot_id=None)
+        self.router.dispatch(_message(11, 20), bot_id=None)
+        self.assertFalse(pending.done())
+
+        message = _message(10, 20)
+        self.router.dispatch(message, bot_id=None)
+        self.assertIs(await pending.wait(), message)
+        self.assertEqual(pending.outcome, "reply")
+        self.assertFalse(self.router.has_reply_route(10, 20))
+        self.assertEqual(len(self.registry), 0)
+
+    async def test_one_pending_prompt_per_user_and_channel(self) -> None:
+        first = self.registry.expect(10, 20, timeout=5, kind="gift")
+        self.assertIsNone(self.registry.expect(10, 20, timeout=5, kind="cheer"))
+        self.assertIsNotNone(self.registry.expect(11, 20, timeout=5, kind="cheer"))
+
+        self.assertTrue(first.cancel())
+        self.assertIsNone(await first.wait())
+        self.assertEqual(first.outcome, "cancelled")
+        self.assertFalse(first.cancel())
+        self.assertIsNotNone(self.registry.expect(10, 20, timeout=5, kind="gift"))
+        self.registry.cancel_all()
+
+    async def test_deadlines_share_one_timer(self) -> None:
+        slow = self.registry.expect(10, 20, timeout=5, kind="gift")
+        timer = self.registry._timer
+        fast = self.registry.expect(10, 21, timeout=0.01, kind="cheer")
+        self.assertIsNot(self.registry._timer, timer)
+        self.assertTrue(timer.cancelled())
+
+        self.assertIsNone(await asyncio.wait_for(fast.wait(), 1))
+        self.assertEqual(fast.outcome, "timeout")
+        self.assertFalse(self.router.has_reply_route(10, 21))
+
+        # 剩返嘅 wait 由同一個 timer 重新排期
+        self.assertFalse(slow.done())
+        self.assertEqual(self.registry._timer.when(), slow.deadline)
+        slow.cancel()
+        self.assertIsNone(self.registry._timer)
+
+    async def test_reply_after_cancel_is_ignored(self) -> None:
+        pending = self.registry.expect(10, 20, timeout=5, kind="gift")
+        pending.cancel()
+        self.router.dispatch(_message(10, 20), bot_id=None)
+        self.assertEqual(pending.outcome, "cancelled")
+
+    async def test_busy_message_names_blocking_kind(self) -> None:
+        self.registry.expect(10, 20, timeout=5, kind="gift")
+        existing = self.registry.get(10, 20)
+        self.assertIn("賜酒", pending_busy_message(existing.kind))
+        self.assertNotIn("打氣", pending_busy_message(existing.kind))
+        self.assertIn("幫人打氣", pending_busy_message("cheer"))
+        self.registry.cancel_all()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+import discord
+
+from cogs.role_channel_factory import (
+    READ_ONLY,
+    RoleChannelFactory,
+    build_version_overwrites,
+    find_sample_role,
+    parse_version_names,
+)
+
+
+def make_role(role_id: int, name: str, *, default: bool = False, administrator: bool = False) -> Mock:
+    role = Mock(spec=discord.Role)
+    role.id = role_id
+    role.name = name
+    role.is_default.return_value = default
+    role.permissions = Mock(administrator=administrator)
+    return role
+
+
+class RoleChannelFactoryTests(unittest.TestCase):
+    def test_version_names_are_trimmed_and_deduplicated(self) -> None:
+        self.assertEqual(parse_version_names(" FC26 , FC27,,FC26 "), ["FC26", "FC27"])
+
+    def test_sample_role_ignores_everyone_and_admin_roles(self) -> None:
+        everyone = make_role(1, "@everyone", default=True)
+        admin = make_role(2, "Admin", administrator=True)
+        sample = make_role(3, "FC25 Player")
+        channel = Mock(overwrites={everyone: Mock(), admin: Mock(), sample: Mock()})
+
+        self.assertIs(find_sample_role(channel), sample)
+
+    def test_multiple_version_roles_are_rejected(self) -> None:
+        channel = Mock(overwrites={make_role(3, "FC24"): Mock(), make_role(4, "FC25"): Mock()})
+
+        with self.assertRaises(ValueError):
+            find_sample_role(channel)
+
+    def test_overwrites_move_sample_access_to_new_role(self) -> None:
+        sample = make_role(3, "FC25 Player")
+        legacy = make_role(4, "FC24 Player")
+        new_role = make_role(5, "FC26 Player")
+        full_access = discord.PermissionOverwrite(view_channel=True, send_messages=True)
+        base = {sample: full_access}
+
+        overwrites = build_version_overwrites(
+            base,
+            sample_role=sample,
+            new_role=new_role,
+            legacy_roles=[legacy, new_role],
+        )
+
+        self.assertNotIn(sample, overwrites)
+        self.assertIs(overwrites[new_role], full_access)
+        self.assertIs(overwrites[legacy], READ_ONLY)
+        self.assertIn(sample, base)
+
+
+class RoleChannelBatchTests(unittest.IsolatedAsyncioTestCase):
+    async def test_failed_clone_is_rolled_back_after_every_sibling(self) -> None:
+        sample = make_role(3, "FC25 Player")
+        legacy = make_role(4, "FC25 Legacy")
+        guild = Mock(roles=[sample, legacy])
+        events: list[str] = []
+        created: dict[str, Mock] = {}
+        channels: dict[str, Mock] = {}
+
+        async def create_role(*, name: str, reason: str) -> Mock:
+            role = make_role(100 + len(created), name)
+
+            async def delete(*, reason: str) -> None:
+                events.append(f"delete {name}")
+                raise RuntimeError("already gone")
+
+            role.delete = delete
+            created[name] = role
+            return role
+
+        async def clone(*, name: str, reason: str) -> Mock:
+            channel = Mock(mention=f"#{name}", delete=AsyncMock())
+
+            async def edit(*, overwrites) -> None:
+                channel.overwrites = overwrites
+                events.append(f"edit {name}")
+                if name == "fc25-alpha":
+                    raise RuntimeError("boom")
+
+            channel.edit = edit
+            channels[name] = channel
+            return channel
+
+        guild.create_role = create_role
+        full_access = discord.PermissionOverwrite(view_channel=True, send_messages=True)
+        source = Mock(type=discord.ChannelType.text, overwrites={sample: full_access}, clone=clone)
+        interaction = Mock(guild=guild)
+        interaction.response.defer = AsyncMock()
+        interaction.followup.send = AsyncMock()
+
+        with self.assertLogs("con9sole-bartender.role-channel-factory", "WARNING"):
+            await RoleChannelFactory.role_channel_batch.callback(
+                RoleChannelFactory(Mock()), interaction, source, "FC25 Alpha, Beta, FC25 Gamma"
+            )
+
+        # The failed role is deleted only after every clone has been edited
+        self.assertEqual(events[-1], "delete FC25 Alpha")
+        self.assertEqual(events.count("delete FC25 Alpha"), 1)
+        gamma_overwrites = channels["fc25-gamma"].overwrites
+        self.assertIs(gamma_overwrites[legacy], READ_ONLY)
+        self.assertNotIn(created["Beta"], gamma_overwrites)
+        summary = interaction.followup.send.await_args.args[0]
+        self.assertIn("2/3 versions created", summary)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import unittest
+
+from features.tempvc_names import CategoryNameAllocator
+
+BASE = "小隊call •"
+
+
+class CategoryNameAllocatorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.allocator = CategoryNameAllocator(BASE)
+        for channel_id, name in ((1, f"{BASE} 1"), (3, f"{BASE} 3"), (9, "開一個小隊 call")):
+            self.allocator.observe(channel_id, name)
+
+    def test_concurrent_allocations_are_unique_and_fill_gaps(self) -> None:
+        self.assertEqual([self.allocator.allocate() for _ in range(3)], [2, 4, 5])
+
+    def test_deleted_and_cancelled_numbers_are_reused_lowest_first(self) -> None:
+        reserved = self.allocator.allocate()
+        self.allocator.forget(3)
+        self.allocator.cancel(reserved)
+
+        self.assertEqual(self.allocator.allocate(), 2)
+        self.assertEqual(self.allocator.allocate(), 3)
+
+    def test_create_event_confirms_reservation_once(self) -> None:
+        number = self.allocator.allocate()
+        self.allocator.observe(20, f"{BASE} {number}")
+        self.allocator.observe(20, f"{BASE} {number}")
+        self.allocator.forget(20)
+
+        self.assertEqual(self.allocator.allocate(), number)
+
+    def test_rename_moves_the_held_number(self) -> None:
+        self.allocator.observe(1, f"{BASE} Apex")
+        self.allocator.observe(3, f"{BASE} 2")
+
+        self.assertEqual(self.allocator.allocate(), 1)
+        self.assertEqual(self.allocator.allocate(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
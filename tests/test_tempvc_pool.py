@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import discord
+
+import config
+from cogs import tempvc
+from features.tempvc_pool import TempVCPool
+from features.tempvc_registry import TempVCRegistry
+from utils import TEMP_VC_IDS, is_temp_vc_id
+
+
+def _voice_channel(channel_id: int) -> Mock:
+    channel = Mock(spec=discord.VoiceChannel)
+    channel.id = channel_id
+    channel.members = []
+    channel.category = None
+    channel.edit = AsyncMock(return_value=channel)
+    return channel
+
+
+class _Guild:
+    def __init__(self) -> None:
+        self.id = 1
+        self.bitrate_limit = 96000
+        self.default_role = object()
+        self.channels: dict[int, Mock] = {}
+        ids = itertools.count(500)
+
+        async def create_voice_channel(name, **kwargs):
+            channel = _voice_channel(next(ids))
+            self.channels[channel.id] = channel
+            return channel
+
+        self.create_voice_channel = AsyncMock(side_effect=create_voice_channel)
+
+    def get_channel(self, channel_id: int) -> Mock | None:
+        return self.channels.get(channel_id)
+
+
+class TempVCPoolTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.addCleanup(TEMP_VC_IDS.clear)
+        self.registry = TempVCRegistry(Path(temp_dir.name) / "temp_vc_registry.json")
+        self.pool = TempVCPool(self.registry)
+        self.addCleanup(self.pool.reset)
+
+        for name, value in (
+            ("TEMP_VC_POOL_SIZE", 2),
+            ("TEMP_VC_POOL_MAX", 4),
+            ("TEMP_VC_POOL_RATE_WINDOW_SECONDS", 60),
+            ("TEMP_VC_POOL_REFILL_INTERVAL_SECONDS", 0),
+        ):
+            patcher = patch.object(config, name, value, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_target_grows_with_recent_joins_up_to_max(self) -> None:
+        key = (1, None)
+        self.assertEqual(self.pool.target_size(key, now=100.0), 2)
+        for offset in range(6):
+            self.pool.record_join(key, now=100.0 + offset)
+        self.assertEqual(self.pool.target_size(key, now=106.0), 4)
+        self.assertEqual(self.pool.target_size(key, now=500.0), 2)
+
+    async def test_refill_then_claim_turns_pooled_channel_live(self) -> None:
+        guild = _Guild()
+        client = Mock()
+        client.get_guild.return_value = guild
+
+        self.pool.watch(guild, None)
+        self.pool.start(client)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        self.assertEqual(self.pool.ready_count((1, None)), 2)
+        self.assertEqual(sorted(self.registry.pooled_ids(1)), [500, 501])
+        self.assertEqual(self.registry.channel_ids(1), [])
+        self.assertFalse(is_temp_vc_id(500))
+
+        pooled = self.pool.take(guild, None)
+        claimed = await self.pool.claim(pooled, name="小隊call • 1", creator_id=42, user_limit=32, reason="test")
+        pooled.edit.assert_awaited_once_with(name="小隊call • 1", reason="test", user_limit=32, overwrites={})
+        self.assertTrue(is_temp_vc_id(claimed.id))
+        self.assertEqual(self.registry.get(claimed.id).creator_id, 42)
+
+        # take() 會喚醒 worker 補返個位
+        for _ in range(10):
+            await asyncio.sleep(0)
+        self.assertEqual(self.pool.ready_count((1, None)), 2)
+
+    async def test_unclaimed_channel_is_deleted_or_returned_to_the_pool(self) -> None:
+        guild = _Guild()
+        pooled = await self.pool._create_pooled(guild, None)
+        stuck = await self.pool._create_pooled(guild, None)
+        pooled.delete = AsyncMock()
+        stuck.delete = AsyncMock(side_effect=discord.HTTPException(Mock(status=500), "boom"))
+
+        await self.pool.scrap(guild, pooled)
+        pooled.delete.assert_awaited_once()
+        self.assertIsNone(self.registry.get(pooled.id))
+
+        with self.assertLogs("con9sole-bartender.tempvc.pool", "WARNING"):
+            await self.pool.scrap(guild, stuck)
+        self.assertEqual(self.registry.pooled_ids(1), [stuck.id])
+        self.assertIs(self.pool.take(guild, None), stuck)
+
+    async def test_reloaded_cog_restarts_the_worker_and_readopts_channels(self) -> None:
+        guild = _Guild()
+        guild.voice_channels = []
+        pooled = await self.pool._create_pooled(guild, None)
+        # /reload tempvc：unload 清咗個 pool，之後唔會再有 on_ready
+        self.pool.reset()
+
+        bot = SimpleNamespace(guilds=[guild], is_ready=lambda: True, get_guild=lambda guild_id: guild)
+        ledger = Mock(stop=AsyncMock(), close_open_sessions=Mock(return_value=0))
+        with patch.object(tempvc, "TEMP_VC_POOL", self.pool), patch.object(tempvc, "VOICE_LEDGER", ledger), patch.object(
+            tempvc, "TEMP_VC_REGISTRY", Mock(channel_ids=Mock(return_value=[]))
+        ), patch.object(tempvc, "get_sweep_interval_seconds", return_value=0):
+            cog = tempvc.TempVC(bot)
+            await cog.cog_load()
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+            self.assertFalse(self.pool._task.done())
+            ledger.start.assert_called_once()
+            self.assertEqual(self.pool.ready_count((1, None)), 2)
+            self.assertIs(self.pool.take(guild, None), pooled)
+            await cog.cog_unload()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import config
+from core.metrics import METRICS
+from features.tempvc_queue import QUEUE_WAIT_METRIC, HubCreationQueue
+
+
+HUB = SimpleNamespace(id=900)
+
+
+def _member(member_id: int) -> SimpleNamespace:
+    return SimpleNamespace(id=member_id, guild=SimpleNamespace(id=1), voice=SimpleNamespace(channel=HUB))
+
+
+class HubCreationQueueTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.addCleanup(METRICS.reset)
+        self.served: list[list[int]] = []
+        self.active = 0
+        self.peak = 0
+
+    async def _handler(self, members, hub) -> None:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.served.append([member.id for member in members])
+        self.active -= 1
+
+    def _patch(self, **values) -> None:
+        for name, value in values.items():
+            patcher = patch.object(config, name, value, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_storm_is_served_in_order_with_bounded_concurrency(self) -> None:
+        self._patch(TEMP_VC_HUB_CONCURRENCY=2, TEMP_VC_HUB_GROUP_WINDOW_SECONDS=0)
+        queue = HubCreationQueue(self._handler)
+        members = [_member(n) for n in range(6)]
+        for member in members:
+            self.assertTrue(queue.submit(member, HUB))
+        self.assertFalse(queue.submit(members[0], HUB))
+
+        await asyncio.sleep(0.1)
+        self.assertEqual(self.peak, 2)
+        self.assertEqual(sorted(ids[0] for ids in self.served), list(range(6)))
+        self.assertEqual([ids[0] for ids in self.served[:2]], [0, 1])
+        self.assertNotIn(0, queue)
+        self.assertEqual(METRICS.histogram(QUEUE_WAIT_METRIC).count, 6)
+
+    async def test_simultaneous_joins_are_grouped(self) -> None:
+        self._patch(TEMP_VC_HUB_CONCURRENCY=1, TEMP_VC_HUB_GROUP_WINDOW_SECONDS=0.02, TEMP_VC_HUB_GROUP_MAX=3)
+        queue = HubCreationQueue(self._handler)
+        for member_id in range(4):
+            queue.submit(_member(member_id), HUB)
+        left = _member(9)
+        queue.submit(left, HUB)
+        left.voice = None
+
+        await asyncio.sleep(0.15)
+        self.assertEqual(self.served, [[0, 1, 2], [3]])
+
+    async def test_finished_worker_awaiting_discard_does_not_block_joins(self) -> None:
+        self._patch(TEMP_VC_HUB_CONCURRENCY=1, TEMP_VC_HUB_GROUP_WINDOW_SECONDS=0)
+        queue = HubCreationQueue(self._handler)
+        # _drain 已經返咗，但 done callback 未跑：task 仲喺 set 入面
+        finished = asyncio.get_running_loop().create_future()
+        finished.set_result(None)
+        queue._workers[1] = {finished}
+
+        self.assertTrue(queue.submit(_member(0), HUB))
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.served, [[0]])
+        self.assertNotIn(0, queue)
+
+
+if __name__ == "__main__":
+    unittest.main()
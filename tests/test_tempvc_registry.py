@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from features.tempvc_registry import TempVCRegistry
+from utils import TEMP_VC_IDS, is_temp_vc_id
+
+
+class TempVCRegistryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.addCleanup(TEMP_VC_IDS.clear)
+        self.path = Path(temp_dir.name) / "temp_vc_registry.json"
+
+    def test_records_survive_restart(self) -> None:
+        registry = TempVCRegistry(self.path)
+        registry.add(101, guild_id=1, creator_id=7, user_limit=5, created_at=1000.0)
+        registry.add(102, guild_id=2, creator_id=8, user_limit=None)
+        self.assertTrue(is_temp_vc_id(101))
+
+        TEMP_VC_IDS.clear()
+        restarted = TempVCRegistry(self.path)
+        restarted.load()
+        self.assertTrue(is_temp_vc_id(101))
+        self.assertEqual(restarted.get(101).creator_id, 7)
+        self.assertEqual(restarted.get(101).user_limit, 5)
+        self.assertEqual(restarted.channel_ids(1), [101])
+
+        restarted.discard(101)
+        self.assertFalse(is_temp_vc_id(101))
+        reloaded = TempVCRegistry(self.path)
+        reloaded.load()
+        self.assertNotIn(101, reloaded)
+        self.assertIn(102, reloaded)
+
+    def test_legacy_scan_runs_once_per_guild(self) -> None:
+        registry = TempVCRegistry(self.path)
+        self.assertTrue(registry.needs_reconcile(1))
+        adopted, removed = registry.reconcile(1, existing_channel_ids=[201, 202, 300], legacy_channel_ids=[201, 202])
+        self.assertEqual((adopted, removed), ([201, 202], []))
+        self.assertFalse(registry.needs_reconcile(1))
+
+        # 之後重啟：名稱相似嘅新 channel 唔會再被收編，已刪除嘅 channel 會被清走
+        restarted = TempVCRegistry(self.path)
+        restarted.load()
+        self.assertFalse(restarted.needs_reconcile(1))
+        adopted, removed = restarted.reconcile(1, existing_channel_ids=[202, 300], legacy_channel_ids=[300])
+        self.assertEqual((adopted, removed), ([], [201]))
+        self.assertEqual(restarted.channel_ids(1), [202])
+        self.assertFalse(is_temp_vc_id(201))
+
+
+if __name__ == "__main__":
+    unittest.main()
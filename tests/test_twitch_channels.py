@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+import types
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from features import twitch_channels
+from features.twitch_channels import TwitchJoinScheduler
+from features.twitch_outbound import SlidingWindowLimiter
+
+
+async def _settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TwitchJoinSchedulerTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.client = types.SimpleNamespace(join_channels=AsyncMock())
+        self.now = [0.0]
+        self.joins = TwitchJoinScheduler(
+            lambda: self.client,
+            limiter=SlidingWindowLimiter(2, 10.0, clock=lambda: self.now[0]),
+        )
+        self.addCleanup(self.joins.stop)
+
+    async def test_joins_are_batched_within_the_rate_limit(self) -> None:
+        self.joins.on_ready(["A", "b", "c", "d", "e"])
+        await _settle()
+
+        self.client.join_channels.assert_awaited_once()
+        self.assertEqual(len(self.client.join_channels.await_args.args[0]), 2)
+        self.assertEqual(self.joins.pending(), 3)
+
+        # window 未過，就算有頻道 join 完都唔會提早送下一批
+        self.now[0] = 9.9
+        self.joins.on_joined(types.SimpleNamespace(name="a"))
+        await _settle()
+        self.client.join_channels.assert_awaited_once()
+        self.assertTrue(self.joins.is_pending("c"))
+        self.assertFalse(self.joins.is_pending("a"))
+
+    async def test_index_follows_join_and_part_and_failed_joins_retry(self) -> None:
+        self.joins.request(["streamer"])
+        await _settle()
+        self.joins.on_joined(types.SimpleNamespace(name="Streamer"))
+        self.assertIsNotNone(self.joins.index.get("#streamer"))
+
+        with patch.object(twitch_channels, "JOIN_RETRY_BASE_SECONDS", 0), self.assertLogs(
+            "con9sole-bartender.twitch.channels", "WARNING"
+        ):
+            self.now[0] += 10
+            self.joins.on_parted("streamer")
+            self.assertNotIn("streamer", self.joins.index)
+            await _settle()
+            self.assertEqual(self.client.join_channels.await_count, 2)
+
+            self.now[0] += 10
+            self.joins.on_join_failed("streamer")
+            await _settle()
+            self.assertEqual(self.client.join_channels.await_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from collections import deque
+from unittest.mock import AsyncMock, patch
+
+import config
+from core.metrics import METRICS
+from features.twitch_coalesce import LAG_METRIC, MERGED_METRIC, DiscordCoalescer, RelayLine, pack_lines
+
+
+class PackLinesTests(unittest.TestCase):
+    def test_packs_up_to_limit_and_truncates_oversized_line(self) -> None:
+        buffer = deque(RelayLine(text, 0.0) for text in ("aaaa", "bbbb", "cccc", "x" * 20))
+        self.assertEqual([line.text for line in pack_lines(buffer, limit=10)], ["aaaa", "bbbb"])
+        self.assertEqual([line.text for line in pack_lines(buffer, limit=10)], ["cccc"])
+        self.assertEqual([line.text for line in pack_lines(buffer, limit=10)], ["x" * 9 + "…"])
+        self.assertFalse(buffer)
+
+
+class DiscordCoalescerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_burst_is_sent_as_one_message(self) -> None:
+        self.addCleanup(METRICS.reset)
+        patcher = patch.object(config, "TWITCH_RELAY_COALESCE_SECONDS", 0.01, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        channel = AsyncMock()
+        coalescer = DiscordCoalescer(AsyncMock(return_value=channel))
+        self.addCleanup(coalescer.stop)
+        for index in range(3):
+            coalescer.submit(10, f"[Twitch] viewer: hi {index}")
+        self.assertEqual(coalescer.depth(10), 3)
+
+        await asyncio.wait_for(asyncio.gather(*coalescer._workers.values()), timeout=1)
+
+        channel.send.assert_awaited_once_with(
+            "[Twitch] viewer: hi 0\n[Twitch] viewer: hi 1\n[Twitch] viewer: hi 2"
+        )
+        self.assertEqual(METRICS.counter(MERGED_METRIC).value, 2)
+        self.assertEqual(METRICS.histogram(LAG_METRIC).count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ import asyncio
 import sys
 import types
 import unittest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 try:
     import twitchio  # noqa: F401
@@ -19,13 +19,19 @@ except ModuleNotFoundError:
     sys.modules["twitchio.ext"] = twitchio_ext_module
     sys.modules["twitchio.ext.commands"] = twitchio_commands_module
 
-from cogs.twitch_relay import TwitchRelay
+from cogs.twitch_relay import ROUTER_OWNER, TwitchRelay
+from core.message_router import MessageRouter
 
 
 class TwitchLifecycleTests(unittest.IsolatedAsyncioTestCase):
     async def test_cog_unload_closes_client_and_cancels_connect_task(self) -> None:
         relay = object.__new__(TwitchRelay)
+        relay.bot = types.SimpleNamespace(message_router=MessageRouter())
+        relay.bot.message_router.add_channel_route(123, ROUTER_OWNER, AsyncMock())
         relay.twitch_bot = AsyncMock()
+        relay.outbound = Mock()
+        relay.coalescer = Mock()
+        relay.joins = Mock()
         relay._connect_task = asyncio.create_task(asyncio.sleep(60))
         connect_task = relay._connect_task
         twitch_bot = relay.twitch_bot
@@ -33,9 +39,13 @@ class TwitchLifecycleTests(unittest.IsolatedAsyncioTestCase):
         await relay.cog_unload()
 
         twitch_bot.close.assert_awaited_once()
+        relay.outbound.stop.assert_called_once()
+        relay.coalescer.stop.assert_called_once()
+        relay.joins.stop.assert_called_once()
         self.assertTrue(connect_task.cancelled())
         self.assertIsNone(relay.twitch_bot)
         self.assertIsNone(relay._connect_task)
+        self.assertEqual(relay.bot.message_router._channel_routes, {})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import types
+import unittest
+from unittest.mock import Mock
+
+from cogs import twitch_relay
+from cogs.twitch_relay import TwitchRelay
+from core.metrics import METRICS
+from features.twitch_metrics import (
+    D2T,
+    DEDUPED,
+    METRIC_PREFIX,
+    RECEIVED,
+    T2D,
+    build_relay_stats_embed,
+    relay_metric,
+)
+
+
+def _twitch_message(content: str, msg_id: str) -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        echo=False,
+        content=content,
+        author=types.SimpleNamespace(name="viewer", display_name="Viewer"),
+        channel=types.SimpleNamespace(name="streamer"),
+        tags={"id": msg_id},
+    )
+
+
+class RelayMetricsTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.addCleanup(METRICS.reset)
+        self.addCleanup(twitch_relay._recent_tw_ids.clear)
+        self.addCleanup(twitch_relay._recent_td.clear)
+        self.relay = object.__new__(TwitchRelay)
+        self.relay.t2d_map = {"streamer": 10}
+        self.relay.d2t_map = {10: "streamer"}
+        self.relay.twitch_bot = object()
+        self.relay.coalescer = Mock()
+        self.relay.outbound = Mock()
+
+    async def test_received_and_deduped_are_counted_per_direction(self) -> None:
+        await self.relay._twitch_to_discord(_twitch_message("gg", "m1"), "bartender")
+        await self.relay._twitch_to_discord(_twitch_message("gg", "m1"), "bartender")
+        self.relay.coalescer.submit.assert_called_once_with(10, "[Twitch] Viewer: gg")
+
+        discord_message = types.SimpleNamespace(
+            content="[Twitch] Viewer: gg",
+            author=types.SimpleNamespace(bot=False, name="member"),
+            guild=object(),
+            channel=types.SimpleNamespace(id=10, name="relay"),
+        )
+        await self.relay._discord_to_twitch(discord_message)
+        self.relay.outbound.submit.assert_not_called()
+
+        self.assertEqual(METRICS.counter(relay_metric(T2D, RECEIVED)).value, 2)
+        self.assertEqual(METRICS.counter(relay_metric(T2D, DEDUPED)).value, 1)
+        self.assertEqual(METRICS.counter(relay_metric(D2T, DEDUPED)).value, 1)
+
+    def test_embed_shows_both_directions(self) -> None:
+        METRICS.counter(relay_metric(T2D, RECEIVED)).inc(7)
+        METRICS.histogram(relay_metric(D2T, "lag_seconds")).observe(0.2)
+
+        embed = build_relay_stats_embed(METRICS.snapshot(METRIC_PREFIX), joined=1, configured=2)
+
+        self.assertIn("`1` / `2`", embed.description)
+        self.assertEqual([field.name for field in embed.fields], ["Twitch → Discord", "Discord → Twitch"])
+        self.assertIn("收到：`7`", embed.fields[0].value)
+
+
+if __name__ == "__main__":
+    unittest.main()
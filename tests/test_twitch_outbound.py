@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import types
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import config
+from core.metrics import METRICS
+from features import twitch_channels, twitch_outbound
+from features.twitch_channels import TwitchJoinScheduler
+from features.twitch_outbound import DROPPED_METRIC, MERGED_METRIC, SlidingWindowLimiter, TwitchOutbound
+
+
+class _Channel:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.sent: list[str] = []
+
+    async def send(self, text: str) -> None:
+        self.sent.append(text)
+
+
+class _Client:
+    def __init__(self, *, alive: bool) -> None:
+        self._connection = types.SimpleNamespace(is_alive=alive)
+        self.joins = TwitchJoinScheduler(lambda: self)
+        self.connect = AsyncMock(side_effect=self._connect)
+        self.join_channels = AsyncMock(side_effect=self._join)
+
+    async def _connect(self) -> None:
+        self._connection.is_alive = True
+
+    async def _join(self, names: list[str]) -> None:
+        for name in names:
+            self.joins.on_joined(_Channel(name))
+
+
+class SlidingWindowLimiterTests(unittest.TestCase):
+    def test_no_window_holds_more_than_limit(self) -> None:
+        now = [0.0]
+        limiter = SlidingWindowLimiter(20, 30.0, clock=lambda: now[0])
+        sent: list[float] = []
+        # 一直有嘢排隊，每次都等到 limiter 放行先送
+        while now[0] < 120.0:
+            delay = limiter.try_take()
+            if delay:
+                now[0] += delay
+            else:
+                sent.append(now[0])
+
+        self.assertEqual(sum(1 for at in sent if at < 30.0), 20)
+        for start in sent:
+            self.assertLessEqual(sum(1 for at in sent if start <= at < start + 30.0), 20)
+
+    def test_wait_is_until_oldest_send_leaves_the_window(self) -> None:
+        now = [0.0]
+        limiter = SlidingWindowLimiter(2, 10.0, clock=lambda: now[0])
+        self.assertEqual(limiter.try_take(), 0.0)
+        now[0] = 4.0
+        self.assertEqual(limiter.try_take(), 0.0)
+        self.assertEqual(limiter.try_take(), 6.0)
+        now[0] = 10.0
+        self.assertEqual(limiter.try_take(), 0.0)
+        self.assertEqual(limiter.try_take(), 4.0)
+
+
+class TwitchOutboundTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.addCleanup(METRICS.reset)
+        for name, value in (("TWITCH_SEND_QUEUE_MAX", 2), ("TWITCH_SEND_RATE", 100)):
+            patcher = patch.object(config, name, value, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(twitch_outbound, "WAIT_POLL_SECONDS", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _drain(self, outbound: TwitchOutbound) -> None:
+        for _ in range(20):
+            await asyncio.sleep(0)
+        await asyncio.gather(*outbound._workers.values())
+
+    async def test_worker_reconnects_and_joins_off_the_submit_path(self) -> None:
+        client = _Client(alive=False)
+        outbound = TwitchOutbound(lambda: client, client.joins)
+        self.addCleanup(outbound.stop)
+
+        self.assertTrue(outbound.submit("Streamer", "hello"))
+        client.connect.assert_not_awaited()
+        with self.assertLogs("con9sole-bartender.twitch.outbound", "WARNING"):
+            await self._drain(outbound)
+
+        client.connect.assert_awaited_once()
+        client.join_channels.assert_awaited_once_with(["streamer"])
+        self.assertEqual(client.joins.index.get("streamer").sent, ["hello"])
+
+    async def test_full_queue_merges_then_drops_oldest(self) -> None:
+        client = _Client(alive=True)
+        outbound = TwitchOutbound(lambda: client, client.joins)
+        self.addCleanup(outbound.stop)
+
+        outbound.submit("streamer", "a")
+        outbound.submit("streamer", "b")
+        outbound.submit("streamer", "c")
+        self.assertEqual([m.text for m in outbound._queues["streamer"]], ["a", "b | c"])
+        self.assertEqual(METRICS.counter(MERGED_METRIC).value, 1)
+
+        with self.assertLogs("con9sole-bartender.twitch.outbound", "WARNING"):
+            self.assertFalse(outbound.submit("streamer", "x" * 500))
+        self.assertEqual([m.text for m in outbound._queues["streamer"]], ["b | c", "x" * 500])
+        self.assertEqual(METRICS.counter(DROPPED_METRIC).value, 1)
+
+    async def test_channel_waiting_on_the_join_scheduler_is_not_reported_missing(self) -> None:
+        client = _Client(alive=True)
+        client.join_channels = AsyncMock()
+        outbound = TwitchOutbound(lambda: client, client.joins)
+        self.addCleanup(outbound.stop)
+        self.addCleanup(client.joins.stop)
+
+        outbound.submit("streamer", "hello")
+        with self.assertNoLogs("con9sole-bartender.twitch.outbound", "ERROR"):
+            for _ in range(50):
+                await asyncio.sleep(0)
+        self.assertTrue(client.joins.is_pending("streamer"))
+
+        channel = _Channel("streamer")
+        client.joins.on_joined(channel)
+        await self._drain(outbound)
+        self.assertEqual(channel.sent, ["hello"])
+
+    async def test_join_that_gives_up_is_reported(self) -> None:
+        client = _Client(alive=True)
+        client.join_channels = AsyncMock()
+        outbound = TwitchOutbound(lambda: client, client.joins)
+        self.addCleanup(outbound.stop)
+        self.addCleanup(client.joins.stop)
+
+        outbound.submit("streamer", "hello")
+        for _ in range(10):
+            await asyncio.sleep(0)
+        client.joins._attempts["streamer"] = twitch_channels.MAX_JOIN_ATTEMPTS
+        with self.assertLogs("con9sole-bartender.twitch.outbound", "ERROR") as logs:
+            with self.assertLogs("con9sole-bartender.twitch.channels", "ERROR"):
+                client.joins.on_join_failed("streamer")
+                for _ in range(10):
+                    await asyncio.sleep(0)
+        self.assertIn("chat:edit", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
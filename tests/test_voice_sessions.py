@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from cogs import tempvc
+from features import voice_sessions
+from features.voice_sessions import CLOSE_RESTART, VoiceSessionLedger, build_voice_rollup
+from core.sqlite_storage import connect_sqlite
+
+
+def _member(user_id: int) -> SimpleNamespace:
+    return SimpleNamespace(id=user_id, guild=SimpleNamespace(id=1))
+
+
+class VoiceSessionLedgerTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / "stats.sqlite3"
+        self.ledger = VoiceSessionLedger(self.path)
+
+    async def test_events_are_batched_and_rolled_up(self) -> None:
+        self.ledger.record_temp_vc_created(10, guild_id=1, hub_id=99, creator_id=7, at=100.0)
+        self.ledger.open_session(1, 7, 10, is_temp_vc=True, at=100.0)
+        self.ledger.open_session(1, 8, 10, is_temp_vc=True, at=110.0)
+        self.ledger.open_session(1, 9, 20, is_temp_vc=False, at=120.0)
+        self.ledger.close_session(1, 7, reason="leave", at=130.0)
+        self.ledger.close_session(1, 8, reason="leave", at=150.0)
+        self.ledger.record_temp_vc_deleted(10, at=160.0)
+        self.assertEqual(len(self.ledger), 7)
+
+        self.assertEqual(await self.ledger.flush(), 7)
+        self.assertEqual(len(self.ledger), 0)
+
+        rollup = build_voice_rollup(1, since=0.0, now=200.0, path=self.path)
+        self.assertEqual(rollup.temp_vc_count, 1)
+        self.assertEqual(rollup.temp_vc_avg_lifetime_seconds, 60.0)
+        self.assertEqual(rollup.sessions, 3)
+        self.assertEqual((rollup.peak_concurrent, rollup.peak_at), (3, 120.0))
+        self.assertEqual(rollup.hubs, [(99, 1, 2, 70.0)])
+        self.assertEqual(rollup.member_seconds, 30.0 + 40.0 + 80.0)
+
+    async def test_open_sessions_are_closed_on_boot(self) -> None:
+        self.ledger.record_transition(_member(7), None, SimpleNamespace(id=10), after_is_temp_vc=False)
+        await self.ledger.flush()
+
+        restarted = VoiceSessionLedger(self.path)
+        self.assertEqual(restarted.close_open_sessions(at=500.0), 1)
+        with connect_sqlite(self.path) as conn:
+            row = conn.execute("SELECT left_at, close_reason FROM voice_sessions").fetchone()
+        self.assertEqual(row, (500.0, CLOSE_RESTART))
+
+    async def test_join_during_boot_is_opened_once(self) -> None:
+        channel = SimpleNamespace(id=10, members=[SimpleNamespace(id=7, bot=False)])
+        cog = object.__new__(tempvc.TempVC)
+        cog.bot = SimpleNamespace(guilds=[SimpleNamespace(id=1, voice_channels=[channel])])
+        joiner = SimpleNamespace(id=8, bot=False, guild=SimpleNamespace(id=1))
+
+        def close_open_sessions() -> int:
+            # 期間有人入房：voice state event 已經處理咗，member list 亦已更新
+            channel.members.append(joiner)
+            self.ledger.record_transition(joiner, None, channel, after_is_temp_vc=False)
+            return 0
+
+        with patch.object(tempvc, "VOICE_LEDGER", self.ledger), patch.object(
+            self.ledger, "close_open_sessions", close_open_sessions
+        ):
+            await cog._bootstrap_voice_ledger()
+        await self.ledger.stop()
+
+        with connect_sqlite(self.path) as conn:
+            rows = conn.execute("SELECT user_id, COUNT(*) FROM voice_sessions GROUP BY user_id").fetchall()
+        self.assertEqual(sorted(rows), [(7, 1), (8, 1)])
+
+    async def test_backlog_is_capped_without_a_writer(self) -> None:
+        with patch.object(voice_sessions, "MAX_PENDING_OPS", 250), self.assertLogs(
+            "con9sole-bartender.voice.sessions", "WARNING"
+        ):
+            for user_id in range(251):
+                self.ledger.open_session(1, user_id, 10, is_temp_vc=False, at=100.0)
+        self.assertEqual(len(self.ledger), 51)
+        self.assertEqual(self.ledger._pending[0][1][1], 200)
+
+        self.ledger.start()
+        self.addAsyncCleanup(self.ledger.stop)
+        with patch.object(voice_sessions, "MAX_PENDING_OPS", 250):
+            for user_id in range(300):
+                self.ledger.close_session(1, user_id, reason="leave", at=110.0)
+        self.assertEqual(len(self.ledger), 351)
+
+    async def test_unload_stops_the_writer_and_closes_open_sessions(self) -> None:
+        cog = tempvc.TempVC(SimpleNamespace())
+        self.ledger.start()
+        self.ledger.record_transition(_member(7), None, SimpleNamespace(id=10), after_is_temp_vc=False)
+
+        with patch.object(tempvc, "VOICE_LEDGER", self.ledger):
+            await cog.cog_unload()
+
+        self.assertIsNone(self.ledger._task)
+        with connect_sqlite(self.path) as conn:
+            row = conn.execute("SELECT user_id, close_reason FROM voice_sessions").fetchone()
+        self.assertEqual(row, (7, CLOSE_RESTART))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+
+from features.voice_transitions import classify_voice_update
+
+
+class VoiceTransitionTests(unittest.TestCase):
+    def test_channel_changes_are_classified(self) -> None:
+        room_a, room_b = SimpleNamespace(id=1), SimpleNamespace(id=2)
+
+        self.assertEqual(classify_voice_update(None, room_a), "join")
+        self.assertEqual(classify_voice_update(room_a, None), "leave")
+        self.assertEqual(classify_voice_update(room_a, room_b), "move")
+
+    def test_toggles_in_same_channel_are_in_place(self) -> None:
+        # mute / stream toggle 時 before / after 可能係唔同 object，但係同一間房
+        self.assertEqual(classify_voice_update(SimpleNamespace(id=1), SimpleNamespace(id=1)), "in_place")
+        self.assertEqual(classify_voice_update(None, None), "in_place")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -104,15 +104,10 @@ def make_private_overwrites(
 # Forum Tags 複製
 # =============================
 
-async def copy_forum_tags(src_forum: discord.ForumChannel, dst_forum: discord.ForumChannel) -> None:
-    """將來源 Forum 的可用 Tags 完整複製到目標 Forum。
-    - 會嘗試複製 emoji；如果有跨伺服器自訂 emoji 失敗，會 fallback 無 emoji。
+def clone_forum_tags(tags: Iterable[discord.ForumTag]) -> List[discord.ForumTag]:
+    """建立可以套用到其他 Forum 嘅 Tag 副本。
+    - 如果 emoji 無法複製，會 fallback 無 emoji。
     """
-    tags = src_forum.available_tags
-    if not tags:
-        log.info("Source forum has no tags; nothing to copy")
-        return
-
     new_tags: List[discord.ForumTag] = []
     for t in tags:
         try:
@@ -120,9 +115,24 @@ async def copy_forum_tags(src_forum: discord.ForumChannel, dst_forum: discord.Fo
         except Exception:
             # emoji 無法複製時，去除 emoji
             new_tags.append(discord.ForumTag(name=t.name, moderated=t.moderated))
+    return new_tags
+
+
+async def apply_forum_tags(dst_forum: discord.ForumChannel, tags: List[discord.ForumTag]) -> None:
+    await dst_forum.edit(available_tags=tags, reason="Clone forum tags")
+    log.info("Copied %s forum tags to channel=%s", len(tags), dst_forum.id)
+
+
+async def copy_forum_tags(src_forum: discord.ForumChannel, dst_forum: discord.ForumChannel) -> None:
+    """將來源 Forum 的可用 Tags 完整複製到目標 Forum。
+    - 會嘗試複製 emoji；如果有跨伺服器自訂 emoji 失敗，會 fallback 無 emoji。
+    """
+    tags = src_forum.available_tags
+    if not tags:
+        log.info("Source forum has no tags; nothing to copy")
+        return
 
-    await dst_forum.edit(available_tags=new_tags, reason="Clone forum tags")
-    log.info("Copied %s forum tags to channel=%s", len(new_tags), dst_forum.id)
+    await apply_forum_tags(dst_forum, clone_forum_tags(tags))
 
 
 # =============================
@@ -197,31 +207,9 @@ async def schedule_delete_if_empty(
 
 
 # =============================
-# 啟動補償 / 清理工具
+# 清理工具
 # =============================
 
-async def bootstrap_track_temp_vcs(
-    guild: discord.Guild,
-    *,
-    name_prefixes: Iterable[str],
-) -> List[int]:
-    """Bot 重啟後，掃描現有語音房，以名稱前綴重建 TEMP_VC_IDS。
-    會返回被追蹤的 channel id 清單。
-    """
-    tracked: List[int] = []
-    prefixes = tuple(name_prefixes)
-    for ch in guild.voice_channels:
-        try:
-            if ch.name.startswith(prefixes):
-                track_temp_vc(ch.id)
-                tracked.append(ch.id)
-        except Exception:  # 極端情況：名稱是 None
-            continue
-    if tracked:
-        log.info("Restored tracking for %s temp VCs: sample=%s", len(tracked), tracked[:5])
-    return tracked
-
-
 def cancel_all_delete_tasks() -> None:
     """取消所有 pending 的自動刪除任務（例如關機前）。"""
     for cid, task in list(_PENDING_DELETE_TASKS.items()):